@@ -9,6 +9,12 @@ In order to try and avoid huge alignment objects with tons of functions,
 functions which return summary type information about alignments should
 be put into classes in this module.
 
+If NumPy is available, the SummaryInfo class counts the letters in every
+column of the alignment in one go (using a character array of blocks of
+records), and works out the consensus sequences, position specific score
+matrix and information content from these count tables, rather than
+looping over each record for each column in Python.
+
 classes:
 o SummaryInfo
 o PSSM
@@ -19,8 +25,14 @@ from __future__ import print_function
 import math
 import sys
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from Bio import Alphabet
 from Bio.Alphabet import IUPAC
+from Bio.Align import _char_blocks
 from Bio.Seq import Seq
 from Bio.SubsMat import FreqTable
 
@@ -29,6 +41,9 @@ from Bio.SubsMat import FreqTable
 Protein20Random = 0.05
 Nucleotide4Random = 0.25
 
+#Number of letters (records times columns) counted at once
+_COUNT_CELLS = 2 ** 22
+
 
 class SummaryInfo(object):
     """Calculate summary info about the alignment.
@@ -44,6 +59,70 @@ class SummaryInfo(object):
         self.alignment = alignment
         self.ic_vector = {}
 
+    def _get_counts(self):
+        """Count the letters in each column of the alignment (PRIVATE).
+
+        Returns a string of the letters seen, an integer array of their
+        counts (one row per letter, one column per alignment column), and
+        a matching array of counts weighted by the 'weight' annotation of
+        each record. This needs NumPy.
+
+        The counts are worked out afresh on each call, so they follow any
+        changes to the records or their weights.
+        """
+        length = self.alignment.get_alignment_length()
+        #Code zero is the padding after the end of a short record, the
+        #other codes are given rows in the tables in the order seen.
+        letters = []
+        index = numpy.zeros(256, numpy.intp)
+        counts = numpy.zeros((1, length), int)
+        weighted = numpy.zeros((1, length))
+        offsets = numpy.arange(length)
+        step = max(1, _COUNT_CELLS // max(1, length))
+        for codes, weights in _char_blocks(self.alignment, step):
+            for code in numpy.flatnonzero(numpy.bincount(codes.ravel())):
+                if code and not index[code]:
+                    letters.append(chr(code))
+                    index[code] = len(letters)
+            size = len(letters) + 1
+            if len(counts) < size:
+                extra = size - len(counts)
+                counts = numpy.vstack([counts, numpy.zeros((extra, length), int)])
+                weighted = numpy.vstack([weighted, numpy.zeros((extra, length))])
+            cells = (index[codes] * length + offsets).ravel()
+            weights = numpy.repeat(weights, length)
+            counts += numpy.bincount(cells, minlength=size * length
+                                     ).reshape(size, length)
+            weighted += numpy.bincount(cells, weights, minlength=size * length
+                                       ).reshape(size, length)
+        return "".join(letters), counts[1:], weighted[1:]
+
+    def _count_consensus(self, threshold, ambiguous, require_multiple,
+                         skip_chars):
+        """Consensus string from the column count tables (PRIVATE).
+
+        This gives the same result as the loops in dumb_consensus and
+        gap_consensus, with the letters in skip_chars not counted.
+        """
+        letters, counts, weighted = self._get_counts()
+        keep = [i for i, letter in enumerate(letters)
+                if letter not in skip_chars]
+        if not keep:
+            return ambiguous * counts.shape[1]
+        letters = [letters[i] for i in keep]
+        counts = counts[keep]
+        total = counts.sum(axis=0).astype(float)
+        best = counts.max(axis=0)
+        top = counts.argmax(axis=0)
+        #Ties for the most common letter, or empty columns, are ambiguous
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            chosen = ((counts == best).sum(axis=0) == 1) & \
+                     (best / total >= threshold)
+        if require_multiple:
+            chosen &= (total != 1)
+        return "".join(letters[t] if c else ambiguous
+                       for t, c in zip(top.tolist(), chosen.tolist()))
+
     def dumb_consensus(self, threshold = .7, ambiguous = "X",
                        consensus_alpha = None, require_multiple = 0):
         """Output a fast consensus sequence of the alignment.
@@ -70,46 +149,50 @@ class SummaryInfo(object):
         not just 1 sequence and gaps).
         """
         # Iddo Friedberg, 1-JUL-2004: changed ambiguous default to "X"
-        consensus = ''
-
-        # find the length of the consensus we are creating
-        con_len = self.alignment.get_alignment_length()
-
-        # go through each seq item
-        for n in range(con_len):
-            # keep track of the counts of the different atoms we get
-            atom_dict = {}
-            num_atoms = 0
-
-            for record in self.alignment._records:
-                # make sure we haven't run past the end of any sequences
-                # if they are of different lengths
-                if n < len(record.seq):
-                    if record.seq[n] != '-' and record.seq[n] != '.':
-                        if record.seq[n] not in atom_dict:
-                            atom_dict[record.seq[n]] = 1
-                        else:
-                            atom_dict[record.seq[n]] += 1
-
-                        num_atoms = num_atoms + 1
-
-            max_atoms = []
-            max_size = 0
-
-            for atom in atom_dict:
-                if atom_dict[atom] > max_size:
-                    max_atoms = [atom]
-                    max_size = atom_dict[atom]
-                elif atom_dict[atom] == max_size:
-                    max_atoms.append(atom)
-
-            if require_multiple and num_atoms == 1:
-                consensus += ambiguous
-            elif (len(max_atoms) == 1) and ((float(max_size)/float(num_atoms))
-                                         >= threshold):
-                consensus += max_atoms[0]
-            else:
-                consensus += ambiguous
+        if numpy is not None:
+            consensus = self._count_consensus(threshold, ambiguous,
+                                              require_multiple, "-.")
+        else:
+            consensus = ''
+
+            # find the length of the consensus we are creating
+            con_len = self.alignment.get_alignment_length()
+
+            # go through each seq item
+            for n in range(con_len):
+                # keep track of the counts of the different atoms we get
+                atom_dict = {}
+                num_atoms = 0
+
+                for record in self.alignment._records:
+                    # make sure we haven't run past the end of any sequences
+                    # if they are of different lengths
+                    if n < len(record.seq):
+                        if record.seq[n] != '-' and record.seq[n] != '.':
+                            if record.seq[n] not in atom_dict:
+                                atom_dict[record.seq[n]] = 1
+                            else:
+                                atom_dict[record.seq[n]] += 1
+
+                            num_atoms = num_atoms + 1
+
+                max_atoms = []
+                max_size = 0
+
+                for atom in atom_dict:
+                    if atom_dict[atom] > max_size:
+                        max_atoms = [atom]
+                        max_size = atom_dict[atom]
+                    elif atom_dict[atom] == max_size:
+                        max_atoms.append(atom)
+
+                if require_multiple and num_atoms == 1:
+                    consensus += ambiguous
+                elif (len(max_atoms) == 1) and ((float(max_size)/float(num_atoms))
+                                             >= threshold):
+                    consensus += max_atoms[0]
+                else:
+                    consensus += ambiguous
 
         # we need to guess a consensus alphabet if one isn't specified
         if consensus_alpha is None:
@@ -126,45 +209,49 @@ class SummaryInfo(object):
         it takes the same is input.
         """
         # Iddo Friedberg, 1-JUL-2004: changed ambiguous default to "X"
-        consensus = ''
+        if numpy is not None:
+            consensus = self._count_consensus(threshold, ambiguous,
+                                              require_multiple, "")
+        else:
+            consensus = ''
 
-        # find the length of the consensus we are creating
-        con_len = self.alignment.get_alignment_length()
+            # find the length of the consensus we are creating
+            con_len = self.alignment.get_alignment_length()
 
-        # go through each seq item
-        for n in range(con_len):
-            # keep track of the counts of the different atoms we get
-            atom_dict = {}
-            num_atoms = 0
+            # go through each seq item
+            for n in range(con_len):
+                # keep track of the counts of the different atoms we get
+                atom_dict = {}
+                num_atoms = 0
 
-            for record in self.alignment._records:
-                # make sure we haven't run past the end of any sequences
-                # if they are of different lengths
-                if n < len(record.seq):
-                    if record.seq[n] not in atom_dict:
-                        atom_dict[record.seq[n]] = 1
-                    else:
-                        atom_dict[record.seq[n]] += 1
-
-                    num_atoms += 1
-
-            max_atoms = []
-            max_size = 0
-
-            for atom in atom_dict:
-                if atom_dict[atom] > max_size:
-                    max_atoms = [atom]
-                    max_size = atom_dict[atom]
-                elif atom_dict[atom] == max_size:
-                    max_atoms.append(atom)
-
-            if require_multiple and num_atoms == 1:
-                consensus += ambiguous
-            elif (len(max_atoms) == 1) and ((float(max_size)/float(num_atoms))
-                                         >= threshold):
-                consensus += max_atoms[0]
-            else:
-                consensus += ambiguous
+                for record in self.alignment._records:
+                    # make sure we haven't run past the end of any sequences
+                    # if they are of different lengths
+                    if n < len(record.seq):
+                        if record.seq[n] not in atom_dict:
+                            atom_dict[record.seq[n]] = 1
+                        else:
+                            atom_dict[record.seq[n]] += 1
+
+                        num_atoms += 1
+
+                max_atoms = []
+                max_size = 0
+
+                for atom in atom_dict:
+                    if atom_dict[atom] > max_size:
+                        max_atoms = [atom]
+                        max_size = atom_dict[atom]
+                    elif atom_dict[atom] == max_size:
+                        max_atoms.append(atom)
+
+                if require_multiple and num_atoms == 1:
+                    consensus += ambiguous
+                elif (len(max_atoms) == 1) and ((float(max_size)/float(num_atoms))
+                                             >= threshold):
+                    consensus += max_atoms[0]
+                else:
+                    consensus += ambiguous
 
         # we need to guess a consensus alphabet if one isn't specified
         if consensus_alpha is None:
@@ -397,6 +484,24 @@ class SummaryInfo(object):
             left_seq = self.dumb_consensus()
 
         pssm_info = []
+        if numpy is not None:
+            letters, counts, weighted = self._get_counts()
+            rows = []
+            for i, letter in enumerate(letters):
+                if letter in chars_to_ignore:
+                    continue
+                if letter not in all_letters:
+                    raise ValueError("Residue %s not found in alphabet %s"
+                                     % (letter, self.alignment._alphabet))
+                rows.append((letter, weighted[i].tolist()))
+            for residue_num in range(len(left_seq)):
+                score_dict = self._get_base_letters(all_letters)
+                for letter, values in rows:
+                    if values[residue_num]:
+                        score_dict[letter] = values[residue_num]
+                pssm_info.append((left_seq[residue_num], score_dict))
+            return PSSM(pssm_info)
+
         # now start looping through all of the sequences and getting info
         for residue_num in range(len(left_seq)):
             score_dict = self._get_base_letters(all_letters)
@@ -490,18 +595,24 @@ class SummaryInfo(object):
         for char in chars_to_ignore:
             all_letters = all_letters.replace(char, '')
 
-        info_content = {}
-        for residue_num in range(start, end):
-            freq_dict = self._get_letter_freqs(residue_num,
-                                               self.alignment._records,
-                                               all_letters, chars_to_ignore)
-            # print freq_dict,
-            column_score = self._get_column_info_content(freq_dict,
-                                                         e_freq_table,
-                                                         log_base,
-                                                         random_expected)
-
-            info_content[residue_num] = column_score
+        if numpy is not None:
+            info_content = self._count_info_content(start, end, all_letters,
+                                                    chars_to_ignore,
+                                                    e_freq_table, log_base,
+                                                    random_expected)
+        else:
+            info_content = {}
+            for residue_num in range(start, end):
+                freq_dict = self._get_letter_freqs(residue_num,
+                                                   self.alignment._records,
+                                                   all_letters, chars_to_ignore)
+                # print freq_dict,
+                column_score = self._get_column_info_content(freq_dict,
+                                                             e_freq_table,
+                                                             log_base,
+                                                             random_expected)
+
+                info_content[residue_num] = column_score
         # sum up the score
         total_info = sum(info_content.values())
         # fill in the ic_vector member: holds IC for each column
@@ -602,6 +713,52 @@ class SummaryInfo(object):
                 total_info += letter_info
         return total_info
 
+    def _count_info_content(self, start, end, letters, to_ignore,
+                            e_freq_table, log_base, random_expected):
+        """Information content of columns start to end from the counts (PRIVATE).
+
+        This gives the same result as the loops using _get_letter_freqs and
+        _get_column_info_content, as a dictionary of the information content
+        keyed by column number.
+        """
+        seen, counts, weighted = self._get_counts()
+        try:
+            gap_char = self.alignment._alphabet.gap_char
+        except AttributeError:
+            #As in _get_column_info_content
+            gap_char = "-"
+        #Check the letters in these columns before counting them
+        present = counts[:, start:end].any(axis=1)
+        for letter, found in zip(seen, present.tolist()):
+            if found and letter not in to_ignore and letter not in letters:
+                raise ValueError("Residue %s not found in alphabet %s"
+                                 % (letter, self.alignment._alphabet))
+        names = [letter for letter in letters if letter != gap_char]
+        if e_freq_table and end > start:
+            for letter in names:
+                if letter not in e_freq_table:
+                    raise ValueError("Expected frequency letters %s "
+                                     "do not match observed %s"
+                                     % (list(e_freq_table.keys()), names))
+        observed = numpy.zeros((len(names), end - start))
+        total = numpy.zeros(end - start)
+        for letter, values in zip(seen, weighted):
+            if letter in to_ignore:
+                continue
+            total += values[start:end]
+            if letter in names:
+                observed[names.index(letter)] = values[start:end]
+        if e_freq_table:
+            expected = [e_freq_table[letter] for letter in names]
+        else:
+            expected = [random_expected] * len(names)
+        #Columns of only ignored characters have zero frequencies
+        freqs = observed / numpy.where(total == 0, 1, total)
+        ratios = freqs / numpy.array(expected, float).reshape(-1, 1)
+        logs = numpy.log(numpy.where(ratios > 0, ratios, 1))
+        scores = (freqs * logs).sum(axis=0) / math.log(log_base)
+        return dict(zip(range(start, end), scores.tolist()))
+
     def get_column(self, col):
         return self.alignment.get_column(col)
 
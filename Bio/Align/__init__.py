@@ -13,6 +13,7 @@ from __future__ import print_function
 
 __docformat__ = "epytext en"  # Don't just use plain text in epydoc API pages!
 
+from Bio._py3k import _as_bytes, _as_string
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 from Bio import Alphabet
@@ -21,6 +22,56 @@ from Bio import Alphabet
 from Bio.Align.Generic import Alignment as _Alignment
 
 
+def _numpy():
+    """Import NumPy, or raise MissingPythonDependencyError (PRIVATE)."""
+    try:
+        import numpy
+    except ImportError:
+        from Bio import MissingPythonDependencyError
+        raise MissingPythonDependencyError(
+            "Install NumPy if you want to use alignment character arrays.")
+    return numpy
+
+
+def _char_array(records, length):
+    """Returns a uint8 array of the letters of some records (PRIVATE).
+
+    There is one row per record holding the ASCII codes of its sequence,
+    with any records shorter than the given length padded with zeros.
+    """
+    numpy = _numpy()
+    rows = []
+    for record in records:
+        seq = str(record.seq)
+        if len(seq) < length:
+            seq += "\0" * (length - len(seq))
+        rows.append(seq)
+    data = numpy.frombuffer(_as_bytes("".join(rows)), numpy.uint8)
+    return data.reshape(len(rows), length)
+
+
+def _char_blocks(alignment, size):
+    """Yields the letters and weights of blocks of alignment rows (PRIVATE).
+
+    For each block of up to size rows, this gives a uint8 array of the
+    letters (as from _char_array) and a list of the 'weight' annotation of
+    each row (default 1.0). For an ArrayAlignment the arrays are views of
+    its letters, otherwise they are built from the records.
+    """
+    if isinstance(alignment, ArrayAlignment):
+        for start in range(0, len(alignment), size):
+            yield (alignment._array[start:start + size],
+                   [row[3].get('weight', 1.0)
+                    for row in alignment._rows[start:start + size]])
+    else:
+        records = alignment._records
+        length = alignment.get_alignment_length()
+        for start in range(0, len(records), size):
+            block = records[start:start + size]
+            yield (_char_array(block, length),
+                   [record.annotations.get('weight', 1.0) for record in block])
+
+
 class MultipleSeqAlignment(_Alignment):
     """Represents a classical multiple sequence alignment (MSA).
 
@@ -608,6 +659,23 @@ class MultipleSeqAlignment(_Alignment):
         else:
             self._records.sort(key = key, reverse = reverse)
 
+    def get_char_array(self):
+        """Returns the letters of the alignment as a 2D NumPy array.
+
+        The array has one row per record and one column per alignment
+        column, holding the ASCII code of each letter (as unsigned bytes,
+        dtype uint8). This allows vectorised operations on the whole
+        alignment, for example with an alignment called align, the
+        number of gaps in each column would be::
+
+            (align.get_char_array() == ord("-")).sum(axis=0)
+
+        Any records shorter than the alignment are padded with zeros.
+        The array is read only, and is not updated if the alignment is
+        changed. Requires NumPy.
+        """
+        return _char_array(self._records, self.get_alignment_length())
+
     def get_column(self, col):
         """Returns a string containing a given column (DEPRECATED).
 
@@ -619,7 +687,7 @@ class MultipleSeqAlignment(_Alignment):
         import warnings
         import Bio
         warnings.warn("This method is deprecated and is provided for backwards compatibility with the old Bio.Align.Generic.Alignment object. Please use the slice notation instead, as get_column is likely to be removed in a future release of Biopython.", Bio.BiopythonDeprecationWarning)
-        return _Alignment.get_column(self, col)
+        return self[:, col]
 
     def add_sequence(self, descriptor, sequence, start = None, end = None,
                      weight = 1.0):
@@ -645,6 +713,258 @@ class MultipleSeqAlignment(_Alignment):
                               id = descriptor, description = descriptor))
 
 
+class _ArrayRecords(object):
+    """List like view of the rows of an ArrayAlignment as SeqRecords (PRIVATE).
+
+    This takes the place of the list of SeqRecord objects used by the
+    MultipleSeqAlignment class, with each record created on demand.
+    """
+    def __init__(self, alignment):
+        self._alignment = alignment
+
+    def __len__(self):
+        return len(self._alignment._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._alignment._record(i)
+                    for i in range(*index.indices(len(self)))]
+        return self._alignment._record(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._alignment._record(index)
+
+
+class ArrayAlignment(MultipleSeqAlignment):
+    """A multiple sequence alignment held as a 2D NumPy array of letters.
+
+    This behaves like a MultipleSeqAlignment, but rather than a list of
+    SeqRecord objects, the letters are held in a single array of unsigned
+    bytes (dtype uint8) with one row per sequence, along with a list of the
+    identifier, name, description and annotations dictionary of each row.
+    This needs much less memory for large alignments, and the array can be
+    memory mapped from a file (see the from_records method) so that it need
+    not be loaded into memory at all.
+
+    Taking rows or columns of the alignment as a sub-alignment, e.g.
+    align[:100] or align[:, 500:600], gives another ArrayAlignment using
+    a view of the same array (without copying the letters), and the array
+    itself is returned by get_char_array. A single column is returned as
+    a string. Individual rows are returned as new SeqRecord objects, which
+    share the annotations dictionary of the row, but otherwise changing the
+    record does not change the alignment. Per-letter annotations are not
+    kept. Requires NumPy.
+
+    For example, with the alignment records in a list (or iterator) called
+    records, this would hold the letters of the alignment in a file::
+
+        align = ArrayAlignment.from_records(records, filename="letters.bin")
+
+    To use this file again later, memory map it and give the identifiers::
+
+        letters = numpy.memmap("letters.bin", numpy.uint8, "r")
+        align = ArrayAlignment(letters.reshape(len(ids), -1), ids)
+
+    """
+    def __init__(self, array, ids=None, alphabet=None, annotations=None,
+                 descriptions=None):
+        """Initialize a new ArrayAlignment object.
+
+        Arguments:
+         - array - A 2D NumPy array of uint8 letter codes (e.g. ASCII), with
+                   one row per sequence. This is used as is, not copied.
+         - ids - A list of the identifiers of the rows (optional).
+         - alphabet - The alphabet for the whole alignment.
+         - annotations - Information about the whole alignment (dictionary).
+         - descriptions - A list of the descriptions of the rows (optional).
+        """
+        numpy = _numpy()
+        if not isinstance(array, numpy.ndarray) or array.ndim != 2 \
+        or array.dtype != numpy.uint8:
+            raise ValueError("Expected a 2D NumPy array of uint8 letters")
+        count = len(array)
+        if ids is None:
+            ids = ["<unknown id>"] * count
+        if descriptions is None:
+            descriptions = ["<unknown description>"] * count
+        if len(ids) != count or len(descriptions) != count:
+            raise ValueError("Need an identifier and description for each "
+                             "of the %i rows" % count)
+        if alphabet is None:
+            alphabet = Alphabet.single_letter_alphabet
+        elif not (isinstance(alphabet, Alphabet.Alphabet)
+        or isinstance(alphabet, Alphabet.AlphabetEncoder)):
+            raise ValueError("Invalid alphabet argument")
+        if annotations is None:
+            annotations = {}
+        elif not isinstance(annotations, dict):
+            raise TypeError("annotations argument should be a dict")
+        self._array = array
+        #The id, name, description and annotations dict of each row
+        self._rows = [(i, i, d, {}) for i, d in zip(ids, descriptions)]
+        self._records = _ArrayRecords(self)
+        self._alphabet = alphabet
+        self.annotations = annotations
+
+    @classmethod
+    def from_records(cls, records, alphabet=None, annotations=None,
+                     filename=None):
+        """Create an ArrayAlignment from SeqRecord objects.
+
+        Arguments:
+         - records - A list (or iterator) of SeqRecord objects, whose
+                     sequences are all the same length.
+         - alphabet - The alphabet for the whole alignment. If omitted, a
+                      consensus alphabet is used.
+         - annotations - Information about the whole alignment (dictionary).
+         - filename - Optional name of a file to write the letters to, one
+                      row after another, which is then memory mapped
+                      (read only). Any existing file is overwritten.
+
+        The identifier, name, description and annotations of each record
+        are kept. As only one record is held in memory at a time, using a
+        filename together with an iterator of records (e.g. from
+        Bio.SeqIO.parse) allows very large alignments to be loaded.
+        """
+        numpy = _numpy()
+        rows = []
+        alphabets = []
+        length = None
+        if filename is None:
+            letters = []
+            write = letters.append
+        else:
+            handle = open(filename, "wb")
+            write = handle.write
+        try:
+            for record in records:
+                if not isinstance(record, SeqRecord):
+                    raise TypeError("New sequence is not a SeqRecord object")
+                if length is None:
+                    length = len(record)
+                elif len(record) != length:
+                    raise ValueError("Sequences must all be the same length")
+                if alphabet is None:
+                    alphabets.append(record.seq.alphabet)
+                elif not Alphabet._check_type_compatible([alphabet,
+                                                          record.seq.alphabet]):
+                    raise ValueError("New sequence's alphabet is incompatible")
+                write(_as_bytes(str(record.seq)))
+                rows.append((record.id, record.name, record.description,
+                             record.annotations))
+        finally:
+            if filename is not None:
+                handle.close()
+        if not length:
+            #Can't memory map an empty file
+            array = numpy.zeros((len(rows), length or 0), numpy.uint8)
+        elif filename is None:
+            array = numpy.frombuffer(_as_bytes("").join(letters), numpy.uint8)
+            array = array.reshape(len(rows), length)
+        else:
+            array = numpy.memmap(filename, numpy.uint8, "r",
+                                 shape=(len(rows), length))
+        if alphabet is None:
+            alphabet = Alphabet._consensus_alphabet(alphabets)
+        align = cls(array, alphabet=alphabet, annotations=annotations)
+        align._rows = rows
+        return align
+
+    def _view(self, array, rows):
+        """New ArrayAlignment for some of the array and rows (PRIVATE)."""
+        align = self.__class__(array, alphabet=self._alphabet)
+        align._rows = rows
+        return align
+
+    def _record(self, index):
+        """Make a SeqRecord for a row of the alignment (PRIVATE)."""
+        id, name, description, annotations = self._rows[index]
+        seq = Seq(_as_string(self._array[index].tostring()), self._alphabet)
+        return SeqRecord(seq, id=id, name=name, description=description,
+                         annotations=annotations)
+
+    def get_alignment_length(self):
+        """Return the number of columns in the alignment."""
+        return self._array.shape[1]
+
+    def get_char_array(self):
+        """Returns the 2D NumPy array of the letters in the alignment.
+
+        This is the array holding the alignment, not a copy. It will be
+        read only if the alignment was loaded from a file.
+        """
+        return self._array
+
+    def extend(self, records):
+        """Add more SeqRecord objects to the alignment as rows.
+
+        They must all have the same length as the original alignment, and
+        have alphabets compatible with the alignment's alphabet. This copies
+        the letters of the whole alignment into a new (in memory) array.
+        """
+        numpy = _numpy()
+        other = ArrayAlignment.from_records(records, self._alphabet)
+        if not len(other):
+            return
+        if len(self) and \
+        other.get_alignment_length() != self.get_alignment_length():
+            raise ValueError("Sequences must all be the same length")
+        if len(self):
+            self._array = numpy.concatenate([self._array, other._array])
+        else:
+            self._array = other._array
+        self._rows = self._rows + other._rows
+
+    def append(self, record):
+        """Add one more SeqRecord object to the alignment as a new row.
+
+        This copies the letters of the whole alignment into a new array, so
+        to add many records, use the extend method instead.
+        """
+        self.extend([record])
+
+    def __getitem__(self, index):
+        """Access part of the alignment.
+
+        This follows the MultipleSeqAlignment, except that sub-alignments
+        are ArrayAlignment objects sharing the same array of letters.
+        """
+        if isinstance(index, int):
+            return self._record(index)
+        elif isinstance(index, slice):
+            return self._view(self._array[index], self._rows[index])
+        elif len(index) != 2:
+            raise TypeError("Invalid index type.")
+
+        row_index, col_index = index
+        if isinstance(row_index, int):
+            if isinstance(col_index, int):
+                return chr(self._array[row_index, col_index])
+            return self._record(row_index)[col_index]
+        elif isinstance(col_index, int):
+            return _as_string(self._array[row_index, col_index].tostring())
+        else:
+            return self._view(self._array[row_index, col_index],
+                              self._rows[row_index])
+
+    def sort(self, key=None, reverse=False):
+        """Sort the rows of the alignment in place.
+
+        As for the MultipleSeqAlignment, this sorts the rows using their
+        identifier by default, or the given key function applied to the
+        SeqRecord of each row. This copies the letters into a new array.
+        """
+        if key is None:
+            keys = [row[0] for row in self._rows]
+        else:
+            keys = [key(record) for record in self._records]
+        order = sorted(range(len(keys)), key=keys.__getitem__,
+                       reverse=reverse)
+        self._array = self._array[order]
+        self._rows = [self._rows[i] for i in order]
+
+
 if __name__ == "__main__":
     from Bio._utils import run_doctest
     run_doctest()
@@ -37,6 +37,7 @@ import string
 
 from Bio._py3k import range
 
+from Bio.Alphabet import single_letter_alphabet
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 from Bio.Align import MultipleSeqAlignment
@@ -405,13 +406,35 @@ class SequentialPhylipIterator(PhylipIterator):
 
         ids = []
         seqs = []
+        for sequence_id, s in self._rows(number_of_seqs, length_of_seqs):
+            ids.append(sequence_id)
+            seqs.append(s)
+        while True:
+            # Find other alignments in the file
+            line = handle.readline()
+            if not line:
+                break
+            if self._is_header(line):
+                self._header = line
+                break
 
+        records = (SeqRecord(Seq(s, self.alphabet),
+                             id=i, name=i, description=i)
+                   for (i, s) in zip(ids, seqs))
+        return MultipleSeqAlignment(records, self.alphabet)
+
+    def _rows(self, number_of_seqs, length_of_seqs):
+        """Iterate over the (identifier, sequence) of each row (PRIVATE).
+
+        The handle should be just after the header line, and is left at
+        the end of the last sequence.
+        """
+        handle = self.handle
         # By default, expects STRICT truncation / padding to 10 characters.
         # Does not require any whitespace between name and seq.
         for i in range(number_of_seqs):
             line = handle.readline().rstrip()
             sequence_id, s = self._split_id(line)
-            ids.append(sequence_id)
             while len(s) < length_of_seqs:
                 # The sequence may be split into multiple lines
                 line = handle.readline().strip()
@@ -425,20 +448,29 @@ class SequentialPhylipIterator(PhylipIterator):
                             % (len(s), length_of_seqs))
             if "." in s:
                 raise ValueError("PHYLIP format no longer allows dots in sequence")
-            seqs.append(s)
-        while True:
-            # Find other alignments in the file
-            line = handle.readline()
-            if not line:
-                break
-            if self._is_header(line):
-                self._header = line
-                break
+            yield sequence_id, s
 
-        records = (SeqRecord(Seq(s, self.alphabet),
-                             id=i, name=i, description=i)
-                   for (i, s) in zip(ids, seqs))
-        return MultipleSeqAlignment(records, self.alphabet)
+
+def SequentialPhylipRowIterator(handle, alphabet=single_letter_alphabet):
+    """Iterate over the rows of a sequential PHYLIP alignment as SeqRecords.
+
+    Unlike the SequentialPhylipIterator, this reads a single alignment one
+    sequence at a time without holding them all in memory. The handle is
+    left at the end of the alignment, so any following alignment can be
+    read by calling this again.
+    """
+    iterator = SequentialPhylipIterator(handle, alphabet=alphabet)
+    line = handle.readline()
+    while line and not line.strip():
+        line = handle.readline()
+    if not line:
+        return
+    if not iterator._is_header(line):
+        raise ValueError("First line should have two integers")
+    number_of_seqs, length_of_seqs = [int(x) for x in line.split()]
+    for sequence_id, s in iterator._rows(number_of_seqs, length_of_seqs):
+        yield SeqRecord(Seq(s, alphabet), id=sequence_id, name=sequence_id,
+                        description=sequence_id)
 
 
 if __name__ == "__main__":
@@ -132,6 +132,7 @@ secondary structure string here, are also sliced:
 from __future__ import print_function
 
 __docformat__ = "epytext en"  # not just plaintext
+from Bio.Alphabet import single_letter_alphabet
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 from Bio.Align import MultipleSeqAlignment
@@ -430,31 +431,102 @@ class StockholmIterator(AlignmentIterator):
                 seq = seqs[id]
                 if alignment_length != len(seq):
                     raise ValueError("Sequences have different lengths, or repeated identifier")
-                name, start, end = self._identifier_split(id)
-                record = SeqRecord(Seq(seq, self.alphabet),
-                                   id=id, name=name, description=id,
-                                   annotations={"accession": name})
-                #Accession will be overridden by _populate_meta_data if an explicit
-                #accession is provided:
-                record.annotations["accession"] = name
-
-                if start is not None:
-                    record.annotations["start"] = start
-                if end is not None:
-                    record.annotations["end"] = end
-
-                self._populate_meta_data(id, record)
-                records.append(record)
+                records.append(self._record(id, seq))
             alignment = MultipleSeqAlignment(records, self.alphabet)
 
             #TODO - Introduce an annotated alignment class?
             #For now, store the annotation a new private property:
             alignment._annotations = gr
 
+            #Record the accession and identifier of the whole alignment
+            #(e.g. the Pfam family), used as the key by Bio.AlignIO.index
+            if "AC" in gf:
+                alignment.annotations["accession"] = gf["AC"][0]
+            if "ID" in gf:
+                alignment.annotations["id"] = gf["ID"][0]
+
             return alignment
         else:
             raise StopIteration
 
+    def _record(self, id, seq):
+        """Returns a SeqRecord for this row, with its meta-data (PRIVATE)."""
+        name, start, end = self._identifier_split(id)
+        record = SeqRecord(Seq(seq, self.alphabet),
+                           id=id, name=name, description=id,
+                           annotations={"accession": name})
+        #Accession will be overridden by _populate_meta_data if an explicit
+        #accession is provided:
+        record.annotations["accession"] = name
+
+        if start is not None:
+            record.annotations["start"] = start
+        if end is not None:
+            record.annotations["end"] = end
+
+        self._populate_meta_data(id, record)
+        return record
+
+    def _rows(self):
+        """Iterate over the rows of one alignment as SeqRecords (PRIVATE).
+
+        Each row is returned once any #=GR lines following its sequence
+        have been read, so this requires each sequence to be on a single
+        line (as in the Pfam files), and any #=GS lines to come before
+        the sequences. The handle is left just after the "//" line.
+        """
+        handle = self.handle
+        line = handle.readline()
+        while line and not line.strip():
+            line = handle.readline()
+        if not line:
+            return
+        if not line.strip() == '# STOCKHOLM 1.0':
+            raise ValueError("Did not find STOCKHOLM header")
+        self.seq_annotation = gs = {}
+        self.seq_col_annotation = {}
+        seen = set()
+        pending = None
+        while True:
+            line = handle.readline()
+            if not line:
+                break  # end of file
+            line = line.strip()
+            if line == "//":
+                break
+            elif line == "":
+                pass
+            elif line == '# STOCKHOLM 1.0':
+                raise ValueError("Missing // at the end of the alignment")
+            elif line[0] != "#":
+                parts = [x.strip() for x in line.split(" ", 1)]
+                if len(parts) != 2:
+                    raise ValueError("Could not split line into identifier "
+                                      + "and sequence:\n" + line)
+                if pending is not None:
+                    yield self._record(*pending)
+                id, seq = parts
+                if id in seen:
+                    raise ValueError("Repeated identifier %s, interleaved "
+                                     "alignments cannot be read one row at "
+                                     "a time" % id)
+                seen.add(id)
+                pending = (id, seq.replace(".", "-"))
+                self.seq_col_annotation = {}
+            elif line[:5] == '#=GS ':
+                id, feature, text = line[5:].strip().split(None, 2)
+                gs.setdefault(id, {}).setdefault(feature, []).append(text)
+            elif line[:5] == "#=GR ":
+                id, feature, text = line[5:].strip().split(None, 2)
+                if pending is None or id != pending[0]:
+                    raise ValueError("The #=GR lines for %s do not follow its "
+                                     "sequence, so the alignment cannot be "
+                                     "read one row at a time" % id)
+                gr = self.seq_col_annotation.setdefault(id, {})
+                gr[feature] = gr.get(feature, "") + text.strip()
+        if pending is not None:
+            yield self._record(*pending)
+
     def _identifier_split(self, identifier):
         """Returns (name, start, end) string tuple from an identier."""
         if '/' in identifier:
@@ -534,6 +606,20 @@ class StockholmIterator(AlignmentIterator):
                 record.letter_annotations["GR:" + feature] = seq_col_data[feature]
 
 
+def StockholmRowIterator(handle, alphabet=single_letter_alphabet):
+    """Iterate over the rows of a Stockholm alignment as SeqRecords.
+
+    Unlike the StockholmIterator, this reads a single alignment one row at
+    a time without holding them all in memory, which is useful for the
+    very large alignments in the Pfam "full" files. The per-sequence meta
+    data is handled as in the StockholmIterator, but the sequences must
+    not be interleaved (see StockholmIterator._rows for details). The
+    handle is left at the end of the alignment, so any following alignment
+    can be read by calling this again.
+    """
+    return StockholmIterator(handle, alphabet=alphabet)._rows()
+
+
 if __name__ == "__main__":
     from Bio._utils import run_doctest
     run_doctest()
@@ -123,6 +123,8 @@ same length.
 from __future__ import print_function
 from Bio._py3k import basestring
 
+import functools
+
 __docformat__ = "epytext en"  # not just plaintext
 
 #TODO
@@ -175,6 +177,11 @@ _FormatToWriter = {  # "fasta" is done via Bio.SeqIO
                    "clustal": ClustalIO.ClustalWriter,
                    }
 
+#Formats which can be read one row at a time (as well as those in SeqIO)
+_FormatToRowIterator = {"phylip-sequential": PhylipIO.SequentialPhylipRowIterator,
+                        "stockholm": StockholmIO.StockholmRowIterator,
+                        }
+
 
 def write(alignments, handle, format):
     """Write complete set of alignments to a file.
@@ -436,6 +443,233 @@ def read(handle, format, seq_count=None, alphabet=None):
     return first
 
 
+def parse_rows(handle, format, alphabet=None):
+    """Iterate over the rows of a single alignment as SeqRecord objects.
+
+    Arguments:
+     - handle    - handle to the file, or the filename as a string.
+     - format    - string describing the file format.
+     - alphabet  - optional Alphabet object, useful when the sequence type
+                   cannot be automatically inferred from the file itself.
+
+    Unlike Bio.AlignIO.read(), this does not load the whole alignment into
+    memory, but returns the rows one by one as they are read (checking they
+    are all the same length). This is only possible where each row is
+    written in full before the next, which rules out interleaved formats
+    like "clustal" and "phylip". It is supported for "stockholm" files
+    with one line per sequence (as in the Pfam files), "phylip-sequential",
+    and the sequence file formats of Bio.SeqIO such as "fasta".
+
+    >>> from Bio import AlignIO
+    >>> rows = AlignIO.parse_rows("Stockholm/funny.sth", "stockholm")
+    >>> record = next(rows)
+    >>> print("%s %s %i" % (record.id, record.annotations["accession"], len(record)))
+    O83071/192-246 O83071 43
+    >>> sum(1 for record in rows)
+    5
+
+    For "stockholm" and "phylip-sequential" files holding more than one
+    alignment, only the rows of the first are returned. If you give a
+    handle, it is left at the end of that alignment, so calling this
+    again with the same handle reads the rows of the next alignment.
+
+    The rows can be written to a file as they are read, or stored in an
+    ArrayAlignment (see Bio.Align) which keeps the letters on disk:
+
+        rows = AlignIO.parse_rows("PF00571_full.sth", "stockholm")
+        alignment = ArrayAlignment.from_records(rows, filename="PF00571.dat")
+    """
+    from Bio import SeqIO
+
+    #Try and give helpful error messages:
+    if not isinstance(format, basestring):
+        raise TypeError("Need a string for the file format (lower case)")
+    if not format:
+        raise ValueError("Format required (lower case string)")
+    if format != format.lower():
+        raise ValueError("Format string '%s' should be lower case" % format)
+    if alphabet is not None and not (isinstance(alphabet, Alphabet) or
+                                     isinstance(alphabet, AlphabetEncoder)):
+        raise ValueError("Invalid alphabet, %s" % repr(alphabet))
+
+    with as_handle(handle, 'rU') as fp:
+        if format in _FormatToRowIterator:
+            if alphabet is None:
+                i = _FormatToRowIterator[format](fp)
+            else:
+                i = _FormatToRowIterator[format](fp, alphabet=alphabet)
+        elif format in _FormatToIterator:
+            raise ValueError("The %s format cannot be read one row at a time"
+                             % format)
+        elif format in SeqIO._FormatToIterator:
+            i = SeqIO.parse(fp, format, alphabet)
+        else:
+            raise ValueError("Unknown format '%s'" % format)
+
+        length = None
+        for record in i:
+            if length is None:
+                length = len(record)
+            elif length != len(record):
+                raise ValueError("Sequences must all be the same length")
+            yield record
+
+
+def index(filename, format, alphabet=None, key_function=None):
+    """Indexes an alignment file and returns a dictionary like object.
+
+     - filename - string giving name of file to be indexed
+     - format   - lower case string describing the file format
+     - alphabet - optional Alphabet object, useful when the sequence type
+                  cannot be automatically inferred from the file itself
+     - key_function - Optional callback function which when given the key
+                  of an alignment should return a unique key for the
+                  dictionary.
+
+    This is the alignment equivalent of Bio.SeqIO.index(). Only the offset
+    of each alignment in the file is held in memory, and the alignments are
+    parsed on demand, giving MultipleSeqAlignment objects as values. This
+    lets you pick out individual alignments from files far too large to
+    load, such as the Pfam-full Stockholm file.
+
+    For "stockholm" files, the alignments are keyed by their accession (the
+    "#=GF AC" line), or where this is missing, the identifier (the "#=GF ID"
+    line):
+
+    >>> from Bio import AlignIO
+    >>> alignments = AlignIO.index("Stockholm/funny.sth", "stockholm")
+    >>> len(alignments)
+    1
+    >>> alignment = alignments["PF00571"]
+    >>> print(alignment.annotations["id"])
+    CBS
+    >>> len(alignment)
+    6
+    >>> alignments.close()
+
+    Otherwise, as for the "clustal" and "phylip" formats, the alignments are
+    keyed by their position in the file (counting from zero, as a string),
+    i.e. the order they are given by Bio.AlignIO.parse():
+
+    >>> alignments = AlignIO.index("Phylip/horses.phy", "phylip")
+    >>> sorted(alignments)
+    ['0']
+    >>> print(alignments["0"].get_alignment_length())
+    40
+    >>> alignments.close()
+
+    The supported formats are "clustal", "phylip", "phylip-relaxed",
+    "phylip-sequential" and "stockholm".
+
+    See also: Bio.AlignIO.index_db() and Bio.AlignIO.parse_rows()
+    """
+    #Try and give helpful error messages:
+    if not isinstance(filename, basestring):
+        raise TypeError("Need a filename (not a handle)")
+    if not isinstance(format, basestring):
+        raise TypeError("Need a string for the file format (lower case)")
+    if not format:
+        raise ValueError("Format required (lower case string)")
+    if format != format.lower():
+        raise ValueError("Format string '%s' should be lower case" % format)
+    if alphabet is not None and not (isinstance(alphabet, Alphabet) or
+                                     isinstance(alphabet, AlphabetEncoder)):
+        raise ValueError("Invalid alphabet, %s" % repr(alphabet))
+
+    #Map the file format to a random access proxy:
+    from ._index import _FormatToRandomAccess  # Lazy import
+    from Bio.File import _IndexedSeqFileDict
+    try:
+        proxy_class = _FormatToRandomAccess[format]
+    except KeyError:
+        raise ValueError("Unsupported format %r" % format)
+    repr = "AlignIO.index(%r, %r, alphabet=%r, key_function=%r)" \
+        % (filename, format, alphabet, key_function)
+    return _IndexedSeqFileDict(proxy_class(filename, format, alphabet),
+                               key_function, repr, "MultipleSeqAlignment")
+
+
+def index_db(index_filename, filenames=None, format=None, alphabet=None,
+             key_function=None, processes=None, update=False):
+    """Index several alignment files and return a dictionary like object.
+
+    The index is stored in an SQLite database rather than in memory (as in the
+    Bio.AlignIO.index(...) function).
+
+     - index_filename - Where to store the SQLite index
+     - filenames - list of strings specifying file(s) to be indexed, or when
+                  indexing a single file this can be given as a string.
+                  (optional if reloading an existing index, but must match)
+     - format   - lower case string describing the file format
+                  (optional if reloading an existing index, but must match)
+     - alphabet - optional Alphabet object, useful when the sequence type
+                  cannot be automatically inferred from the file itself
+     - key_function - Optional callback function which when given the key
+                  of an alignment should return a unique key for the
+                  dictionary.
+     - processes - Optional number of worker processes to use when
+                  building a new index of several files.
+     - update   - Boolean, if reloading an existing index should it be
+                  brought up to date with the given filenames.
+
+    This works like Bio.SeqIO.index_db(), but gives MultipleSeqAlignment
+    objects as values, keyed as in Bio.AlignIO.index(). As alignments
+    without an accession are keyed by their position in the file, this is
+    mainly useful for Stockholm files (e.g. Pfam releases split over many
+    files):
+
+    >>> from Bio import AlignIO
+    >>> idx_name = ":memory:" #use an in memory SQLite DB for this test
+    >>> alignments = AlignIO.index_db(idx_name, "Stockholm/funny.sth", "stockholm")
+    >>> len(alignments)
+    1
+    >>> print(alignments["PF00571"].annotations["id"])
+    CBS
+    >>> alignments.close()
+
+    See also: Bio.AlignIO.index() and Bio.SeqIO.index_db()
+    """
+    #Try and give helpful error messages:
+    if not isinstance(index_filename, basestring):
+        raise TypeError("Need a string for the index filename")
+    if isinstance(filenames, basestring):
+        #Make the API a little more friendly, and more similar
+        #to Bio.AlignIO.index(...) for indexing just one file.
+        filenames = [filenames]
+    if filenames is not None and not isinstance(filenames, list):
+        raise TypeError(
+            "Need a list of filenames (as strings), or one filename")
+    if format is not None and not isinstance(format, basestring):
+        raise TypeError("Need a string for the file format (lower case)")
+    if format and format != format.lower():
+        raise ValueError("Format string '%s' should be lower case" % format)
+    if alphabet is not None and not (isinstance(alphabet, Alphabet) or
+                                     isinstance(alphabet, AlphabetEncoder)):
+        raise ValueError("Invalid alphabet, %s" % repr(alphabet))
+
+    from Bio.File import _SQLiteManySeqFilesDict
+    repr = "AlignIO.index_db(%r, filenames=%r, format=%r, alphabet=%r, key_function=%r)" \
+               % (index_filename, filenames, format, alphabet, key_function)
+
+    #Using a partial rather than a closure so that it can be pickled
+    #and sent to worker processes when indexing in parallel.
+    proxy_factory = functools.partial(_index_db_proxy_factory, alphabet)
+
+    return _SQLiteManySeqFilesDict(index_filename, filenames,
+                                   proxy_factory, format,
+                                   key_function, repr, processes=processes,
+                                   update=update)
+
+
+def _index_db_proxy_factory(alphabet, format, filename=None):
+    """Given a filename returns proxy object, else boolean if format OK (PRIVATE)."""
+    from ._index import _FormatToRandomAccess  # Lazy import
+    if filename:
+        return _FormatToRandomAccess[format](filename, format, alphabet)
+    else:
+        return format in _FormatToRandomAccess
+
+
 def convert(in_file, in_format, out_file, out_format, alphabet=None):
     """Convert between two alignment files, returns number of alignments.
 
@@ -0,0 +1,160 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Dictionary like indexing of alignment files (PRIVATE).
+
+You are not expected to access this module, or any of its code, directly. This
+is all handled internally by the Bio.AlignIO.index(...) and index_db(...)
+functions which are the public interface for this functionality.
+
+As in Bio.SeqIO, we scan over the file looking for the line which starts each
+alignment, and record its file offset. For Stockholm files (such as the Pfam
+alignments) the key is taken from the "#=GF AC" accession line, or failing
+that the "#=GF ID" identifier line. Otherwise the alignments are keyed by
+their position in the file (counting from zero, as a string), matching the
+order they are returned by Bio.AlignIO.parse(...).
+
+Only the offsets are held in memory, each alignment is parsed on demand.
+"""
+
+from __future__ import print_function
+
+import re
+from Bio._py3k import StringIO
+from Bio._py3k import _bytes_to_string, _as_bytes
+
+from Bio.File import _IndexedSeqFileProxy, _open_for_random_access
+
+
+class AlignmentFileRandomAccess(_IndexedSeqFileProxy):
+    """Random access to the alignments in a file, keyed by number."""
+
+    #Regular expression matching the first line of each alignment
+    marker = None
+
+    def __init__(self, filename, format, alphabet):
+        from Bio import AlignIO
+        self._handle = _open_for_random_access(filename)
+        self._alphabet = alphabet
+        self._format = format
+        self._marker_re = re.compile(_as_bytes(self.marker))
+        i = AlignIO._FormatToIterator[format]
+        #The following alphabet code duplicates logic in Bio.AlignIO.parse()
+        #(using iter as the iterator classes' Python 2 next is deprecated)
+        if alphabet is None:
+            def _parse(handle):
+                """Dynamically generated parser function (PRIVATE)."""
+                return next(iter(i(handle, None)))
+        else:
+            def _parse(handle):
+                """Dynamically generated parser function (PRIVATE)."""
+                try:
+                    return next(iter(i(handle, None, alphabet=alphabet)))
+                except TypeError:
+                    return next(AlignIO._force_alphabet(i(handle, None),
+                                                        alphabet))
+        self._parse = _parse
+
+    def __iter__(self):
+        """Returns (key, offset, length) tuples."""
+        marker_re = self._marker_re
+        handle = self._handle
+        handle.seek(0)
+        #Skip any header before the first alignment
+        while True:
+            start_offset = handle.tell()
+            line = handle.readline()
+            if marker_re.match(line) or not line:
+                break
+        number = 0
+        while marker_re.match(line):
+            length = len(line)
+            key = None
+            while True:
+                end_offset = handle.tell()
+                line = handle.readline()
+                if marker_re.match(line) or not line:
+                    if key is None:
+                        key = str(number)
+                    yield key, start_offset, length
+                    start_offset = end_offset
+                    number += 1
+                    break
+                #Track this explicitly as can't do file offset difference on BGZF
+                length += len(line)
+                key = self._key_from_line(line, key)
+        assert not line, repr(line)
+
+    def _key_from_line(self, line, key):
+        """Returns the key, updated from this line of the alignment (PRIVATE).
+
+        By default the alignments are keyed by number, so this returns the
+        key unchanged (i.e. None).
+        """
+        return key
+
+    def get_id(self, alignment):
+        """Returns the key recorded in a parsed alignment, or None."""
+        return None
+
+    def get(self, offset):
+        """Returns MultipleSeqAlignment."""
+        return self._parse(StringIO(_bytes_to_string(self.get_raw(offset))))
+
+    def get_raw(self, offset):
+        """Similar to the get method, but returns the alignment as a raw string."""
+        handle = self._handle
+        marker_re = self._marker_re
+        handle.seek(offset)
+        lines = [handle.readline()]
+        while True:
+            line = handle.readline()
+            if marker_re.match(line) or not line:
+                #End of file, or start of next alignment => end of this one
+                break
+            lines.append(line)
+        return _as_bytes("").join(lines)
+
+
+class StockholmRandomAccess(AlignmentFileRandomAccess):
+    """Random access to a Stockholm file, keyed by the accession."""
+
+    marker = "# STOCKHOLM 1.0"
+
+    def _key_from_line(self, line, key):
+        """Returns the key, updated from a #=GF AC or ID line (PRIVATE).
+
+        The accession is used in preference to the identifier, whichever
+        order the lines come in.
+        """
+        if line.startswith(_as_bytes("#=GF AC ")):
+            return _bytes_to_string(line[8:].strip())
+        elif key is None and line.startswith(_as_bytes("#=GF ID ")):
+            return _bytes_to_string(line[8:].strip())
+        return key
+
+    def get_id(self, alignment):
+        """Returns the accession or identifier of a parsed alignment, or None."""
+        annotations = alignment.annotations
+        return annotations.get("accession", annotations.get("id"))
+
+
+class ClustalRandomAccess(AlignmentFileRandomAccess):
+    """Random access to the alignments in a Clustal file."""
+
+    marker = "(CLUSTAL|PROBCONS|MUSCLE|MSAPROBS)\\b"
+
+
+class PhylipRandomAccess(AlignmentFileRandomAccess):
+    """Random access to the alignments in a PHYLIP file."""
+
+    #The header line giving the number of sequences and columns
+    marker = "\\s*\\d+\\s+\\d+\\s*$"
+
+
+_FormatToRandomAccess = {"clustal": ClustalRandomAccess,
+                         "phylip": PhylipRandomAccess,
+                         "phylip-relaxed": PhylipRandomAccess,
+                         "phylip-sequential": PhylipRandomAccess,
+                         "stockholm": StockholmRandomAccess,
+                         }
@@ -18,12 +18,17 @@ use.
 """
 from __future__ import print_function
 
+import array
 import codecs
 import os
 import sys
 import contextlib
+import hashlib
 import itertools
+import mmap
+import warnings
 
+from Bio import BiopythonWarning
 from Bio._py3k import basestring
 
 try:
@@ -82,11 +87,14 @@ def as_handle(handleish, mode='r', **kwargs):
     else:
         yield handleish
 
-def _open_for_random_access(filename):
+def _open_for_random_access(filename, use_mmap=False):
     """Open a file in binary mode, spot if it is BGZF format etc (PRIVATE).
 
     This funcationality is used by the Bio.SeqIO and Bio.SearchIO index
     and index_db functions.
+
+    With use_mmap=True an uncompressed (non-empty) file is memory mapped,
+    and returned wrapped as an _MmapHandle. BGZF files are not mapped.
     """
     handle = open(filename, "rb")
     from . import bgzf
@@ -96,9 +104,57 @@ def _open_for_random_access(filename):
         assert "BGZF" in str(e)
         #Not a BGZF file after all, rewind to start:
         handle.seek(0)
+    if use_mmap:
+        try:
+            mapped = _MmapHandle(handle)
+        except (ValueError, EnvironmentError):
+            #e.g. can't map an empty file, fall back on the plain handle
+            pass
+        else:
+            handle.close()
+            return mapped
     return handle
 
 
+class _MmapHandle(object):
+    """Read only handle onto a memory mapped file (PRIVATE).
+
+    The read, readline, seek and tell methods are those of the underlying
+    mmap object (so this can be used in place of a binary file handle by
+    the indexing code), plus len, slicing and find to scan the mapped data
+    directly, and view which returns a zero-copy slice (a memoryview on
+    Python 3, or a buffer object on Python 2).
+
+    Note that the file cannot be closed while any views are still in use.
+    """
+    def __init__(self, handle):
+        self.name = handle.name
+        self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.read = self._mmap.read
+        self.readline = self._mmap.readline
+        self.seek = self._mmap.seek
+        self.tell = self._mmap.tell
+        self.find = self._mmap.find
+
+    def __len__(self):
+        return len(self._mmap)
+
+    def __getitem__(self, index):
+        return self._mmap[index]
+
+    if sys.version_info[0] >= 3:
+        def view(self, start, end):
+            """Return a zero-copy memoryview of bytes start to end."""
+            return memoryview(self._mmap)[start:end]
+    else:
+        def view(self, start, end):
+            """Return a zero-copy buffer of bytes start to end."""
+            return buffer(self._mmap, start, end - start)
+
+    def close(self):
+        self._mmap.close()
+
+
 class UndoHandle(object):
     """A Python handle that adds functionality for saving lines.
 
@@ -187,6 +243,11 @@ class UndoHandle(object):
 #The rest of this file defines code used in Bio.SeqIO and Bio.SearchIO
 #for indexing
 
+#Number of keys looked up at a time by the get_many and get_raw_many
+#methods (unless returning the records in file order)
+_MANY_BATCH_SIZE = 10000
+
+
 class _IndexedSeqFileProxy(object):
     """Base class for file format specific random access (PRIVATE).
 
@@ -216,6 +277,137 @@ class _IndexedSeqFileProxy(object):
         #Should be done by each sub-class (if possible)
         raise NotImplementedError("Not available for this file format.")
 
+    def get_id(self, record):
+        """Returns the identifier of a parsed entry, used to check its key.
+
+        By default this is the record's id. Subclasses can return None
+        where the parsed object does not hold its key (for example, if
+        the entries are keyed by their position in the file), in which
+        case the key is not checked.
+        """
+        return record.id
+
+
+#Array type codes used by _CompactOffsetDict, four byte unsigned and
+#eight byte signed integers (falling back on a double, exact to 2**53)
+_UINT32 = "I"
+if sys.version_info[0] >= 3:
+    _INT64 = "q"
+elif array.array("l").itemsize == 8:
+    _INT64 = "l"
+else:
+    _INT64 = "d"
+
+
+class _CompactOffsetDict(object):
+    """Memory efficient dictionary of string keys to file offsets (PRIVATE).
+
+    An alternative to a Python dictionary for the offsets table of an
+    _IndexedSeqFileDict, supporting only what that needs (adding new keys,
+    membership tests, lookup, length, and iterating over the keys in the
+    order added).
+
+    All the keys are held (UTF-8 encoded) in a single packed buffer, with
+    the end position of each key and its file offset held in arrays of
+    four byte integers (switched to eight bytes only if the buffer or the
+    offsets grow too large). Lookups use an open addressing hash table, an
+    array of four byte entry numbers with a load factor of at most 3/4.
+    This means the memory footprint is the raw key bytes plus roughly 15
+    to 30 bytes per entry, rather than over 100 bytes with a dictionary.
+    """
+    def __init__(self):
+        self._keys = bytearray()
+        self._ends = array.array(_UINT32)
+        self._offsets = array.array(_UINT32)
+        self._slots = array.array("i", [-1]) * 8
+        self._mask = 7
+
+    def _encode(self, key):
+        if isinstance(key, bytes):
+            return key
+        elif isinstance(key, basestring):
+            return key.encode("utf-8")
+        raise TypeError("Compact index requires string keys, not %r" % key)
+
+    if sys.version_info[0] >= 3:
+        def _decode(self, key):
+            return key.decode("utf-8")
+    else:
+        def _decode(self, key):
+            return str(key)
+
+    def _key(self, i):
+        """Return entry i's key as a bytes string (PRIVATE)."""
+        start = self._ends[i - 1] if i else 0
+        return bytes(self._keys[start:self._ends[i]])
+
+    def _find(self, key):
+        """Return (slot, entry) for an encoded key, entry -1 if absent (PRIVATE)."""
+        slots = self._slots
+        mask = self._mask
+        slot = hash(key) & mask
+        while True:
+            i = slots[slot]
+            if i == -1 or self._key(i) == key:
+                return slot, i
+            slot = (slot + 1) & mask
+
+    def _grow(self):
+        """Double the size of the hash table (PRIVATE)."""
+        mask = self._mask * 2 + 1
+        slots = array.array("i", [-1]) * (mask + 1)
+        for i in range(len(self._ends)):
+            slot = hash(self._key(i)) & mask
+            while slots[slot] != -1:
+                slot = (slot + 1) & mask
+            slots[slot] = i
+        self._slots = slots
+        self._mask = mask
+
+    def __setitem__(self, key, offset):
+        """Add a new key and its offset (existing keys cannot be changed)."""
+        key = self._encode(key)
+        slot, i = self._find(key)
+        if i != -1:
+            raise ValueError("Duplicate key '%s'" % self._decode(key))
+        i = len(self._ends)
+        self._keys.extend(key)
+        if len(self._keys) > 0xFFFFFFFF and self._ends.typecode == _UINT32:
+            self._ends = array.array(_INT64, self._ends)
+        self._ends.append(len(self._keys))
+        if offset > 0xFFFFFFFF and self._offsets.typecode == _UINT32:
+            self._offsets = array.array(_INT64, self._offsets)
+        self._offsets.append(offset)
+        self._slots[slot] = i
+        if 4 * (i + 1) > 3 * (self._mask + 1):
+            self._grow()
+
+    def __getitem__(self, key):
+        try:
+            i = self._find(self._encode(key))[1]
+        except TypeError:
+            #Only string keys are stored, so as for __contains__
+            i = -1
+        if i == -1:
+            raise KeyError(key)
+        return int(self._offsets[i])
+
+    def __contains__(self, key):
+        try:
+            return self._find(self._encode(key))[1] != -1
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._ends)
+
+    def __iter__(self):
+        keys = self._keys
+        start = 0
+        for end in self._ends:
+            yield self._decode(bytes(keys[start:end]))
+            start = end
+
 
 class _IndexedSeqFileDict(_dict_base):
     """Read only dictionary interface to a sequential record file.
@@ -240,9 +432,14 @@ class _IndexedSeqFileDict(_dict_base):
 
     Note that this dictionary is essentially read only. You cannot
     add or change values, pop values, nor clear the dictionary.
+
+    With compact=True the keys and offsets are held in packed arrays (see
+    _CompactOffsetDict) rather than a Python dictionary. This takes a
+    fraction of the memory, at the cost of slightly slower lookups, and
+    requires the keys to be strings.
     """
     def __init__(self, random_access_proxy, key_function,
-                 repr, obj_repr):
+                 repr, obj_repr, compact=False):
         #Use key_function=None for default value
         self._proxy = random_access_proxy
         self._key_function = key_function
@@ -253,7 +450,10 @@ class _IndexedSeqFileDict(_dict_base):
                 (key_function(k), o, l) for (k, o, l) in random_access_proxy)
         else:
             offset_iter = random_access_proxy
-        offsets = {}
+        if compact:
+            offsets = _CompactOffsetDict()
+        else:
+            offsets = {}
         for key, offset, length in offset_iter:
             #Note - we don't store the length because I want to minimise the
             #memory requirements. With the SQLite backend the length is kept
@@ -338,12 +538,7 @@ class _IndexedSeqFileDict(_dict_base):
         """x.__getitem__(y) <==> x[y]"""
         #Pass the offset to the proxy
         record = self._proxy.get(self._offsets[key])
-        if self._key_function:
-            key2 = self._key_function(record.id)
-        else:
-            key2 = record.id
-        if key != key2:
-            raise ValueError("Key did not match (%s vs %s)" % (key, key2))
+        self._check_key(key, self._proxy, record)
         return record
 
     def get(self, k, d=None):
@@ -366,6 +561,86 @@ class _IndexedSeqFileDict(_dict_base):
         #Pass the offset to the proxy
         return self._proxy.get_raw(self._offsets[key])
 
+    def get_many(self, keys, file_order=False):
+        """Iterate over the (key, record) pairs for the given keys.
+
+        Rather than looking up, seeking to and parsing each record in turn
+        (as with repeated use of the get method), the keys are looked up in
+        batches, and the records in each batch are read in the order they
+        appear in the file(s). This avoids lots of random seeks.
+
+        By default the pairs are returned in the order the keys were given
+        (the keys are processed in batches to limit memory usage). With
+        file_order=True all the keys are looked up in one go, and the pairs
+        are returned in the order the records appear in the file(s).
+
+        If any key is not found, a KeyError exception is raised.
+        """
+        return self._iter_many(keys, file_order, self._fetch_record)
+
+    def get_raw_many(self, keys, file_order=False):
+        """Iterate over the (key, raw record) pairs for the given keys.
+
+        This is to the get_raw method as get_many is to the get method,
+        see get_many for details.
+
+        NOTE - This functionality is not supported for every file format.
+        """
+        return self._iter_many(keys, file_order, self._fetch_raw)
+
+    def _iter_many(self, keys, file_order, fetch):
+        """Batched lookup and retrieval used by get_many etc (PRIVATE)."""
+        if file_order:
+            batches = [list(keys)]
+        else:
+            keys = iter(keys)
+            batches = iter(lambda: list(itertools.islice(keys, _MANY_BATCH_SIZE)), [])
+        for batch in batches:
+            locations = self._lookup_many(batch)
+            order = sorted(range(len(batch)), key=locations.__getitem__)
+            if file_order:
+                for i in order:
+                    yield batch[i], fetch(batch[i], *locations[i])
+            else:
+                results = [None] * len(batch)
+                for i in order:
+                    results[i] = fetch(batch[i], *locations[i])
+                for i, key in enumerate(batch):
+                    yield key, results[i]
+
+    def _lookup_many(self, keys):
+        """Return list of (file_number, offset, length) for the keys (PRIVATE).
+
+        Raises a KeyError if any key is not found.
+        """
+        offsets = self._offsets
+        return [(0, offsets[key], 0) for key in keys]
+
+    def _get_proxy(self, file_number):
+        """Return the random access proxy for a file number (PRIVATE)."""
+        return self._proxy
+
+    def _fetch_record(self, key, file_number, offset, length):
+        """Parse the record at this location, checking the key (PRIVATE)."""
+        proxy = self._get_proxy(file_number)
+        record = proxy.get(offset)
+        self._check_key(key, proxy, record)
+        return record
+
+    def _check_key(self, key, proxy, record):
+        """Check a parsed record matches the key it was found under (PRIVATE)."""
+        key2 = proxy.get_id(record)
+        if key2 is None:
+            return
+        if self._key_function:
+            key2 = self._key_function(key2)
+        if key != key2:
+            raise ValueError("Key did not match (%s vs %s)" % (key, key2))
+
+    def _fetch_raw(self, key, file_number, offset, length):
+        """Return the raw record at this location (PRIVATE)."""
+        return self._get_proxy(file_number).get_raw(offset)
+
     def __setitem__(self, key, value):
         """Would allow setting or replacing records, but not implemented."""
         raise NotImplementedError("An indexed a sequence file is read only.")
@@ -407,6 +682,68 @@ class _IndexedSeqFileDict(_dict_base):
         self._proxy._handle.close()
 
 
+#Number of offset rows to insert per transaction when building an
+#index_db in parallel (see _SQLiteManySeqFilesDict)
+_BULK_COMMIT_SIZE = 500000
+
+#Number of bytes from the start and end of a file used for its checksum
+_CHECKSUM_BLOCK_SIZE = 65536
+
+
+def _scan_offsets(task):
+    """Return a list of (key, offset, length) tuples for one file (PRIVATE).
+
+    Worker function used when building an SQLite index in a process pool,
+    the task is a (proxy_factory, format, filename) tuple.
+    """
+    proxy_factory, format, filename = task
+    random_access_proxy = proxy_factory(format, filename)
+    try:
+        return list(random_access_proxy)
+    finally:
+        random_access_proxy._handle.close()
+
+
+def _file_checksum(filename):
+    """Return a quick MD5 checksum of a file's first and last blocks (PRIVATE).
+
+    Only the start and end of the file are read (so this is fast even for
+    very large files), which together with the file size is enough to
+    spot appended, truncated or replaced files.
+    """
+    md5 = hashlib.md5()
+    with open(filename, "rb") as handle:
+        md5.update(handle.read(_CHECKSUM_BLOCK_SIZE))
+        handle.seek(0, 2)
+        if handle.tell() > _CHECKSUM_BLOCK_SIZE:
+            handle.seek(max(_CHECKSUM_BLOCK_SIZE,
+                            handle.tell() - _CHECKSUM_BLOCK_SIZE))
+            md5.update(handle.read())
+    return md5.hexdigest()
+
+
+def _file_stats(filename):
+    """Return (size, mtime, checksum) tuple for a file (PRIVATE)."""
+    return (os.path.getsize(filename), os.path.getmtime(filename),
+            _file_checksum(filename))
+
+
+def _file_changed(filename, size, mtime, checksum):
+    """Has the file changed since these stats were recorded (PRIVATE)?
+
+    Missing stats (e.g. from an index made with an older version of
+    Biopython) or a missing file count as changed. The checksum is only
+    computed if the modification time differs but the size does not.
+    """
+    if size is None or not os.path.isfile(filename):
+        return True
+    if os.path.getsize(filename) != size:
+        return True
+    if os.path.getmtime(filename) == mtime:
+        return False
+    return _file_checksum(filename) != checksum
+
+
 class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     """Read only dictionary interface to many sequential record files.
 
@@ -420,10 +757,23 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     There are OS limits on the number of files that can be open at once,
     so a pool are kept. If a record is required from a closed file, then
     one of the open handles is closed first.
+
+    When building a new index from many files, processes can be set to
+    scan the files in a pool of that many worker processes, with the
+    offsets then bulk loaded into the database in large transactions.
+
+    The size, modification time and a checksum of each file are recorded
+    in the database. On reloading an index a warning is given for any file
+    which has changed since it was indexed. With update=True an existing
+    index is instead brought up to date with the given list of filenames
+    (or with the recorded list if none is given): new files are indexed,
+    files which have changed are re-indexed, and files no longer listed
+    (or no longer present) are dropped, all without a full rebuild.
     """
     def __init__(self, index_filename, filenames,
                  proxy_factory, format,
-                 key_function, repr, max_open=10):
+                 key_function, repr, max_open=10, processes=None,
+                 update=False):
         self._proxy_factory = proxy_factory
         self._repr = repr
         random_access_proxies = {}
@@ -467,13 +817,16 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
                 self._filenames = [row[0] for row in
                                    con.execute("SELECT name FROM file_data "
                                                "ORDER BY file_number;").fetchall()]
-                if filenames and len(filenames) != len(self._filenames):
+                if filenames and len(filenames) != len(self._filenames) \
+                and not update:
                     con.close()
                     raise ValueError("Index file says %i files, not %i"
                                      % (len(self._filenames), len(filenames)))
-                if filenames and filenames != self._filenames:
+                if filenames and filenames != self._filenames \
+                and not update:
                     con.close()
                     raise ValueError("Index file has different filenames")
+                file_stats = self._load_file_stats(con)
             except _OperationalError as err:
                 con.close()
                 raise ValueError("Not a Biopython index database? %s" % err)
@@ -481,6 +834,21 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             if not proxy_factory(self._format):
                 con.close()
                 raise ValueError("Unsupported format '%s'" % self._format)
+            if update:
+                if filenames is None:
+                    #Keep the files we have, except those since removed
+                    filenames = [f for f in self._filenames
+                                 if os.path.isfile(f)]
+                self._update_index(con, filenames, file_stats,
+                                   key_function, processes)
+            else:
+                for filename, stats in zip(self._filenames, file_stats):
+                    if stats[0] is not None and os.path.isfile(filename) \
+                    and _file_changed(filename, *stats):
+                        warnings.warn("File %s has changed since it was "
+                                      "indexed, use update=True to refresh "
+                                      "the index" % filename,
+                                      BiopythonWarning)
         else:
             self._filenames = filenames
             self._format = format
@@ -504,37 +872,14 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             con.execute("INSERT INTO meta_data (key, value) VALUES (?,?);",
                         ("format", format))
             #TODO - Record the alphabet?
-            #TODO - Record the file size and modified date?
             con.execute(
-                "CREATE TABLE file_data (file_number INTEGER, name TEXT);")
+                "CREATE TABLE file_data (file_number INTEGER, name TEXT, "
+                "size INTEGER, mtime REAL, checksum TEXT);")
             con.execute("CREATE TABLE offset_data (key TEXT, file_number INTEGER, offset INTEGER, length INTEGER);")
-            count = 0
-            for i, filename in enumerate(filenames):
-                con.execute(
-                    "INSERT INTO file_data (file_number, name) VALUES (?,?);",
-                    (i, filename))
-                random_access_proxy = proxy_factory(format, filename)
-                if key_function:
-                    offset_iter = ((key_function(
-                        k), i, o, l) for (k, o, l) in random_access_proxy)
-                else:
-                    offset_iter = (
-                        (k, i, o, l) for (k, o, l) in random_access_proxy)
-                while True:
-                    batch = list(itertools.islice(offset_iter, 100))
-                    if not batch:
-                        break
-                    #print("Inserting batch of %i offsets, %s ... %s" \
-                    # % (len(batch), batch[0][0], batch[-1][0]))
-                    con.executemany(
-                        "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
-                        batch)
-                    con.commit()
-                    count += len(batch)
-                if len(random_access_proxies) < max_open:
-                    random_access_proxies[i] = random_access_proxy
-                else:
-                    random_access_proxy._handle.close()
+            count = self._load_files(con, list(enumerate(filenames)),
+                                     proxy_factory, format, key_function,
+                                     processes, random_access_proxies,
+                                     max_open)
             self._length = count
             #print("About to index %i entries" % count)
             try:
@@ -555,6 +900,197 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         self._index_filename = index_filename
         self._key_function = key_function
 
+    def _load_file_stats(self, con):
+        """Return list of (size, mtime, checksum) tuples from the DB (PRIVATE).
+
+        Indexes from older versions of Biopython did not record these, in
+        which case all the values will be None.
+        """
+        columns = [row[1] for row in
+                   con.execute("PRAGMA table_info(file_data);").fetchall()]
+        if "checksum" not in columns:
+            return [(None, None, None)] * len(self._filenames)
+        return con.execute("SELECT size, mtime, checksum FROM file_data "
+                           "ORDER BY file_number;").fetchall()
+
+    def _load_files(self, con, numbered_files, proxy_factory, format,
+                    key_function, processes, random_access_proxies, max_open,
+                    commit=True):
+        """Index the given (file_number, filename) pairs (PRIVATE).
+
+        Records each file in the file_data table (with its size, mtime
+        and checksum), and its offsets in the offset_data table. Returns
+        the number of offsets added. With commit=False the caller is left
+        to commit (or roll back) the transaction.
+        """
+        if processes and processes > 1 and len(numbered_files) > 1:
+            return self._build_index_parallel(con, numbered_files,
+                                              proxy_factory, format,
+                                              key_function, processes,
+                                              commit)
+        count = 0
+        for i, filename in numbered_files:
+            con.execute(
+                "INSERT INTO file_data (file_number, name, size, mtime, "
+                "checksum) VALUES (?,?,?,?,?);",
+                (i, filename) + _file_stats(filename))
+            random_access_proxy = proxy_factory(format, filename)
+            if key_function:
+                offset_iter = ((key_function(
+                    k), i, o, l) for (k, o, l) in random_access_proxy)
+            else:
+                offset_iter = (
+                    (k, i, o, l) for (k, o, l) in random_access_proxy)
+            while True:
+                batch = list(itertools.islice(offset_iter, 100))
+                if not batch:
+                    break
+                #print("Inserting batch of %i offsets, %s ... %s" \
+                # % (len(batch), batch[0][0], batch[-1][0]))
+                con.executemany(
+                    "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
+                    batch)
+                if commit:
+                    con.commit()
+                count += len(batch)
+            if len(random_access_proxies) < max_open:
+                random_access_proxies[i] = random_access_proxy
+            else:
+                random_access_proxy._handle.close()
+        return count
+
+    def _build_index_parallel(self, con, numbered_files, proxy_factory,
+                              format, key_function, processes, commit=True):
+        """Scan the files in a process pool and bulk load the offsets (PRIVATE).
+
+        Each worker process scans a whole file and hands back its list of
+        (key, offset, length) tuples, which are inserted here in file order
+        (so the file numbers match the serial code). The rows are committed
+        in large transactions rather than every hundred records. Returns the
+        number of offsets loaded.
+
+        The proxy_factory must be picklable (e.g. a module level function
+        or a functools.partial of one), but the key_function need not be
+        since it is applied here in the parent process.
+        """
+        import multiprocessing
+        #Record the file stats before scanning, so that anything appended
+        #while we are busy will count as a change on the next update.
+        stats = [_file_stats(filename) for i, filename in numbered_files]
+        pool = multiprocessing.Pool(processes)
+        try:
+            tasks = [(proxy_factory, format, filename)
+                     for i, filename in numbered_files]
+            count = 0
+            pending = 0
+            for j, offsets in enumerate(pool.imap(_scan_offsets, tasks)):
+                i, filename = numbered_files[j]
+                con.execute(
+                    "INSERT INTO file_data (file_number, name, size, mtime, "
+                    "checksum) VALUES (?,?,?,?,?);",
+                    (i, filename) + stats[j])
+                if key_function:
+                    batch = [(key_function(k), i, o, l)
+                             for (k, o, l) in offsets]
+                else:
+                    batch = [(k, i, o, l) for (k, o, l) in offsets]
+                del offsets
+                con.executemany(
+                    "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
+                    batch)
+                count += len(batch)
+                pending += len(batch)
+                if commit and pending >= _BULK_COMMIT_SIZE:
+                    con.commit()
+                    pending = 0
+            if commit:
+                con.commit()
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        return count
+
+    def _update_index(self, con, filenames, file_stats, key_function,
+                      processes):
+        """Bring an existing index up to date with these files (PRIVATE).
+
+        Offsets for files which have been dropped from the list or which
+        have changed on disk are deleted, the remaining files are
+        renumbered to match their position in the new list, and then the
+        new and changed files are scanned and added. This is done as a
+        single transaction, rolled back on failure (e.g. duplicate keys).
+        """
+        wanted = set(filenames)
+        keep = {}
+        for old_number, (filename, stats) in enumerate(zip(self._filenames,
+                                                           file_stats)):
+            if filename in wanted and not _file_changed(filename, *stats):
+                keep[filename] = (old_number, stats)
+        if filenames == self._filenames and len(keep) == len(filenames):
+            #Nothing to do
+            return
+        #Any DDL must come first, as it would commit our transaction
+        columns = [row[1] for row in
+                   con.execute("PRAGMA table_info(file_data);").fetchall()]
+        if "checksum" not in columns:
+            #Index from an older version of Biopython
+            for column, sql_type in [("size", "INTEGER"), ("mtime", "REAL"),
+                                     ("checksum", "TEXT")]:
+                con.execute("ALTER TABLE file_data ADD COLUMN %s %s;"
+                            % (column, sql_type))
+        con.execute("CREATE TEMP TABLE IF NOT EXISTS file_renumber "
+                    "(old INTEGER PRIMARY KEY, new INTEGER);")
+        #Mark the database as unfinished until we are done
+        con.execute("UPDATE meta_data SET value = ? WHERE key = ?;",
+                    (-1, "count"))
+        con.commit()
+        to_load = []
+        renumber = []
+        for new_number, filename in enumerate(filenames):
+            if filename in keep:
+                renumber.append((keep[filename][0], new_number))
+            else:
+                to_load.append((new_number, filename))
+        try:
+            con.execute("DELETE FROM file_renumber;")
+            con.executemany("INSERT INTO file_renumber (old, new) "
+                            "VALUES (?,?);", renumber)
+            con.execute("DELETE FROM offset_data WHERE file_number NOT IN "
+                        "(SELECT old FROM file_renumber);")
+            if any(old != new for old, new in renumber):
+                con.execute("UPDATE offset_data SET file_number = "
+                            "(SELECT new FROM file_renumber "
+                            "WHERE old = offset_data.file_number);")
+            con.execute("DELETE FROM file_data;")
+            con.executemany(
+                "INSERT INTO file_data (file_number, name, size, mtime, "
+                "checksum) VALUES (?,?,?,?,?);",
+                [(new, filenames[new]) + tuple(keep[filenames[new]][1])
+                 for old, new in renumber])
+            self._load_files(con, to_load, self._proxy_factory,
+                             self._format, key_function, processes, {}, 0,
+                             commit=False)
+        except:
+            #Put things back as they were (including the count)
+            err = sys.exc_info()[1]
+            con.rollback()
+            con.execute("UPDATE meta_data SET value = ? WHERE key = ?;",
+                        (self._length, "count"))
+            con.commit()
+            con.close()
+            if isinstance(err, _IntegrityError):
+                raise ValueError("Duplicate key? %s" % err)
+            raise
+        count, = con.execute("SELECT COUNT(key) FROM offset_data;").fetchone()
+        con.execute("UPDATE meta_data SET value = ? WHERE key = ?;",
+                    (count, "count"))
+        con.commit()
+        self._length = count
+        self._filenames = filenames
+
     def __repr__(self):
         return self._repr
 
@@ -592,7 +1128,8 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         file_number, offset = row
         proxies = self._proxies
         if file_number in proxies:
-            record = proxies[file_number].get(offset)
+            proxy = proxies[file_number]
+            record = proxy.get(offset)
         else:
             if len(proxies) >= self._max_open:
                 #Close an old handle...
@@ -601,12 +1138,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             proxy = self._proxy_factory(self._format, self._filenames[file_number])
             record = proxy.get(offset)
             proxies[file_number] = proxy
-        if self._key_function:
-            key2 = self._key_function(record.id)
-        else:
-            key2 = record.id
-        if key != key2:
-            raise ValueError("Key did not match (%s vs %s)" % (key, key2))
+        self._check_key(key, proxy, record)
         return record
 
     def get(self, k, d=None):
@@ -658,6 +1190,61 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             else:
                 return proxy.get_raw(offset)
 
+    def _lookup_many(self, keys):
+        """Return list of (file_number, offset, length) for the keys (PRIVATE).
+
+        The keys are loaded into a temporary table, and looked up with a
+        single join against the offset table rather than one query per key.
+        Raises a KeyError if any key is not found.
+        """
+        con = self._con
+        con.execute("CREATE TEMP TABLE IF NOT EXISTS many_keys "
+                    "(position INTEGER PRIMARY KEY, key TEXT);")
+        try:
+            con.executemany("INSERT INTO many_keys (position, key) "
+                            "VALUES (?,?);", enumerate(keys))
+            locations = [None] * len(keys)
+            for position, file_number, offset, length in con.execute(
+                    "SELECT many_keys.position, offset_data.file_number, "
+                    "offset_data.offset, offset_data.length FROM many_keys "
+                    "LEFT JOIN offset_data ON many_keys.key = offset_data.key;"):
+                if file_number is None:
+                    raise KeyError(keys[position])
+                locations[position] = (file_number, offset, length)
+        finally:
+            con.execute("DELETE FROM many_keys;")
+            con.commit()
+        return locations
+
+    def _get_proxy(self, file_number):
+        """Return the random access proxy for a file number (PRIVATE).
+
+        If need be, an older proxy is closed to keep within max_open.
+        """
+        proxies = self._proxies
+        try:
+            return proxies[file_number]
+        except KeyError:
+            if len(proxies) >= self._max_open:
+                #Close an old handle...
+                proxies.popitem()[1]._handle.close()
+            #Open a new handle...
+            proxy = self._proxy_factory(self._format,
+                                        self._filenames[file_number])
+            proxies[file_number] = proxy
+            return proxy
+
+    def _fetch_raw(self, key, file_number, offset, length):
+        """Return the raw record at this location (PRIVATE)."""
+        proxy = self._get_proxy(file_number)
+        if length:
+            #Shortcut if we have the length
+            h = proxy._handle
+            h.seek(offset)
+            return h.read(length)
+        else:
+            return proxy.get_raw(offset)
+
     def close(self):
         """Close any open file handles."""
         proxies = self._proxies
@@ -0,0 +1,311 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+#
+
+"""Hidden Markov Models stored as NumPy arrays for fast calculations.
+
+The HiddenMarkovModel class holds its probabilities in dictionaries keyed
+by tuples of letters, which is flexible but slow to use in the dynamic
+programming recursions. A CompiledMarkovModel takes a copy of the current
+probabilities of a HiddenMarkovModel as arrays, with the states and
+emissions coded as integers (in the order of the letters of the given
+alphabets), so that each step of the forward, backward and Viterbi
+algorithms is a handful of NumPy operations over all of the states.
+
+The forward and backward variables are scaled at each position as
+described on p78 of Durbin et al, so that long sequences do not underflow.
+The model starts in each state with its initial probability, and there is
+no end state.
+
+The compiled model is a snapshot, so it must be compiled again after the
+probabilities of the HiddenMarkovModel change (for example, at each step
+of the Baum-Welch training).
+"""
+
+from Bio._py3k import basestring, _as_bytes
+
+try:
+    import numpy
+except ImportError:
+    from Bio import MissingPythonDependencyError
+    raise MissingPythonDependencyError(
+        "Install NumPy if you want to use Bio.HMM.Compiled.")
+
+from Bio.Seq import Seq, MutableSeq
+
+
+class CompiledMarkovModel(object):
+    """A HiddenMarkovModel as arrays of probabilities.
+
+    Attributes:
+
+    o states -- List of the state letters, in the order of the arrays.
+
+    o emissions -- List of the emission letters, in the order of the arrays.
+
+    o initial -- Array of the initial probability of each state.
+
+    o transition -- Array of the transition probabilities, with the from
+    states as the rows and the to states as the columns.
+
+    o emission -- Array of the emission probabilities, with the states as
+    the rows and the emission letters as the columns.
+
+    o log_initial, log_transition, log_emission -- The natural logarithms
+    of these arrays (minus infinity for zero probabilities).
+    """
+    def __init__(self, markov_model, state_alphabet, emission_alphabet=None):
+        """Compile the current probabilities of a HiddenMarkovModel.
+
+        Arguments:
+
+        o markov_model -- The HiddenMarkovModel to take the probabilities
+        from. Any transitions or emissions without a probability are taken
+        to be impossible.
+
+        o state_alphabet -- The alphabet of the states.
+
+        o emission_alphabet -- The alphabet of the emissions. If this is not
+        given, the emission letters found in the model's emission
+        probabilities are used (in sorted order).
+        """
+        self.states = list(state_alphabet.letters)
+        if emission_alphabet is None:
+            self.emissions = sorted(set(letter for state, letter
+                                        in markov_model.emission_prob))
+        else:
+            self.emissions = list(emission_alphabet.letters)
+        self._state_index = dict((letter, i) for i, letter
+                                 in enumerate(self.states))
+        self._emission_index = dict((letter, i) for i, letter
+                                    in enumerate(self.emissions))
+        self.initial = _to_array(markov_model.initial_prob,
+                                 self._state_index)
+        self.transition = _to_array(markov_model.transition_prob,
+                                    self._state_index, self._state_index)
+        self.emission = _to_array(markov_model.emission_prob,
+                                  self._state_index, self._emission_index)
+        with numpy.errstate(divide="ignore"):
+            self.log_initial = numpy.log(self.initial)
+            self.log_transition = numpy.log(self.transition)
+            self.log_emission = numpy.log(self.emission)
+        #Table to code single letter emissions from their byte values
+        self._lookup = None
+        if all(isinstance(letter, basestring) and len(letter) == 1
+               and ord(letter) < 128 for letter in self.emissions):
+            lookup = numpy.zeros(256, int)
+            lookup[:] = -1
+            for i, letter in enumerate(self.emissions):
+                lookup[ord(letter)] = i
+            self._lookup = lookup
+
+    def encode(self, sequence):
+        """Return an integer array coding the emissions in a sequence.
+
+        The sequence can be a string, Seq object or list of emission
+        letters. A ValueError is raised for any unexpected letter.
+        """
+        if self._lookup is not None and isinstance(sequence, (basestring, Seq,
+                                                              MutableSeq)):
+            data = numpy.frombuffer(_as_bytes(str(sequence)), numpy.uint8)
+            codes = self._lookup[data]
+            if len(codes) and codes.min() < 0:
+                bad = chr(data[numpy.nonzero(codes < 0)[0][0]])
+                raise ValueError("Unexpected emission %r" % bad)
+            return codes
+        index = self._emission_index
+        try:
+            return numpy.array([index[letter] for letter in sequence], int)
+        except KeyError as err:
+            raise ValueError("Unexpected emission %r" % err.args[0])
+
+    def _codes(self, sequence):
+        """Code a sequence, unless already coded as an array (PRIVATE)."""
+        if isinstance(sequence, numpy.ndarray):
+            return sequence
+        codes = self.encode(sequence)
+        if not len(codes):
+            raise ValueError("Empty sequence")
+        return codes
+
+    def forward(self, sequence):
+        """Calculate the scaled forward variables of a sequence.
+
+        Returns a tuple of:
+
+        o An array of the forward variables, with a row for each position
+        in the sequence and a column for each state. The rows are scaled
+        to add up to one.
+
+        o An array of the scaling factors for each position.
+
+        o The natural logarithm of the probability of the sequence.
+
+        A ValueError is raised if the sequence is impossible under the model.
+        """
+        codes = self._codes(sequence)
+        transition = self.transition
+        emission_columns = self.emission.T[codes]
+        forward = numpy.empty(emission_columns.shape)
+        scales = numpy.empty(len(codes))
+        values = self.initial * emission_columns[0]
+        for i in range(len(codes)):
+            if i:
+                values = numpy.dot(values, transition) * emission_columns[i]
+            scale = values.sum()
+            if scale <= 0:
+                raise ValueError("Sequence is impossible under the model "
+                                 "(at position %i)" % i)
+            values = values / scale
+            forward[i] = values
+            scales[i] = scale
+        return forward, scales, float(numpy.log(scales).sum())
+
+    def backward(self, sequence, scales):
+        """Calculate the scaled backward variables of a sequence.
+
+        Arguments:
+
+        o sequence -- The sequence of emissions.
+
+        o scales -- The scaling factors calculated by the forward method.
+
+        Returns an array of the backward variables, with a row for each
+        position in the sequence and a column for each state, scaled to
+        match the forward variables (so that their product at each position
+        gives the posterior probabilities of the states).
+        """
+        codes = self._codes(sequence)
+        transition = self.transition
+        emission_columns = self.emission.T[codes]
+        backward = numpy.empty(emission_columns.shape)
+        values = numpy.ones(len(self.states))
+        backward[-1] = values
+        for i in range(len(codes) - 2, -1, -1):
+            values = numpy.dot(transition,
+                               emission_columns[i + 1] * values) / scales[i + 1]
+            backward[i] = values
+        return backward
+
+    def log_probability(self, sequence):
+        """Return the natural logarithm of the probability of a sequence.
+
+        This is minus infinity if the sequence is impossible under the model.
+        """
+        codes = self._codes(sequence)
+        try:
+            return self.forward(codes)[2]
+        except ValueError:
+            return float("-inf")
+
+    def posterior(self, sequence):
+        """Return the posterior probabilities of the states.
+
+        This is an array with a row for each position in the sequence and a
+        column for each state, giving the probability that the sequence was
+        in that state at that position (given the whole sequence).
+        """
+        codes = self._codes(sequence)
+        forward, scales, log_prob = self.forward(codes)
+        return forward * self.backward(codes, scales)
+
+    def posterior_decode(self, sequence, state_alphabet=None):
+        """Return the most probable state at each position of a sequence.
+
+        Unlike the Viterbi path, this gives the state with the highest
+        posterior probability at each position, which need not be a
+        possible path through the model. Returns a tuple of a Seq object
+        (using the given state alphabet) and an array of the posterior
+        probability of each of these states.
+        """
+        probabilities = self.posterior(sequence)
+        best = probabilities.argmax(axis=1)
+        path = "".join(self.states[i] for i in best)
+        return (Seq(path, state_alphabet) if state_alphabet else Seq(path),
+                probabilities[numpy.arange(len(best)), best])
+
+    def viterbi(self, sequence, state_alphabet=None):
+        """Calculate the most probable state path using the Viterbi algorithm.
+
+        This returns a tuple of the most probable state path (as a Seq
+        object using the given state alphabet) and its natural log
+        probability, like the viterbi method of the HiddenMarkovModel.
+        When several paths share the highest probability, the two methods
+        may choose different ones, as this takes the first of any equally
+        probable states (by the order of the state alphabet) at each step.
+        """
+        codes = self._codes(sequence)
+        log_transition = self.log_transition
+        log_emission_columns = self.log_emission.T[codes]
+        pointers = numpy.empty((len(codes), len(self.states)), int)
+        values = self.log_initial + log_emission_columns[0]
+        for i in range(1, len(codes)):
+            scores = values[:, None] + log_transition
+            pointers[i] = scores.argmax(axis=0)
+            values = scores.max(axis=0) + log_emission_columns[i]
+        state = int(values.argmax())
+        path = [state]
+        for i in range(len(codes) - 1, 0, -1):
+            state = pointers[i, state]
+            path.append(state)
+        path = "".join(self.states[i] for i in reversed(path))
+        return (Seq(path, state_alphabet) if state_alphabet else Seq(path),
+                float(values.max()))
+
+    def expected_counts(self, sequence):
+        """Calculate the expected transition and emission counts for a sequence.
+
+        This is the expectation step of the Baum-Welch algorithm (formulas
+        3.20 and 3.21 in Durbin et al). Returns a tuple of:
+
+        o An array of the expected number of each transition, with the from
+        states as the rows and the to states as the columns.
+
+        o An array of the expected number of emissions of each letter, with
+        the states as the rows and the emission letters as the columns.
+
+        o The natural logarithm of the probability of the sequence.
+        """
+        codes = self._codes(sequence)
+        forward, scales, log_prob = self.forward(codes)
+        backward = self.backward(codes, scales)
+        #Sum over the positions of f_k(i) a_kl e_l(x_{i+1}) b_l(i+1),
+        #allowing for the scaling
+        later = self.emission.T[codes[1:]] * backward[1:] / scales[1:, None]
+        transitions = numpy.dot(forward[:-1].T, later) * self.transition
+        posterior = forward * backward
+        emissions = numpy.zeros(self.emission.shape)
+        for letter in range(len(self.emissions)):
+            emissions[:, letter] = posterior[codes == letter].sum(axis=0)
+        return transitions, emissions, log_prob
+
+
+def _to_array(probabilities, row_index, column_index=None):
+    """Turn a dictionary of probabilities into an array (PRIVATE).
+
+    The keys are letters, or (row letter, column letter) tuples, and any
+    letters not in the index dictionaries are ignored.
+    """
+    if column_index is None:
+        values = numpy.zeros(len(row_index))
+        for letter, prob in probabilities.items():
+            if letter in row_index:
+                values[row_index[letter]] = prob
+        return values
+    values = numpy.zeros((len(row_index), len(column_index)))
+    for (row, column), prob in probabilities.items():
+        if row in row_index and column in column_index:
+            values[row_index[row], column_index[column]] = prob
+    return values
+
+
+def _add_counts(counts, values, row_index, column_index):
+    """Add an array of counts to a dictionary keyed by letter tuples (PRIVATE).
+
+    Only the keys already in the dictionary are updated, in place.
+    """
+    for (row, column) in counts:
+        counts[(row, column)] += float(values[row_index[row],
+                                              column_index[column]])
+    return counts
@@ -360,7 +360,7 @@ class MarkovModelBuilder(object):
 
             # set the initial pseudocounts
             if pseudocount is None:
-                pseudcount = self.DEFAULT_PSEUDO
+                pseudocount = self.DEFAULT_PSEUDO
             self.transition_pseudo[(from_state, to_state)] = pseudocount
         else:
             raise KeyError("Transition from %s to %s is already allowed."
@@ -549,6 +549,11 @@ class HiddenMarkovModel(object):
 
         o state_alphabet -- The alphabet of the possible state sequences
         that can be generated.
+
+        For long sequences, the viterbi method of a CompiledMarkovModel
+        (see Bio.HMM.Compiled, which needs NumPy) is much faster, but it
+        may choose a different path when several have the same highest
+        probability.
         """
 
         # calculate logarithms of the initial, transition, and emission probs
@@ -20,9 +20,17 @@ in the training data.
 # standard modules
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # local stuff
 from .DynamicProgramming import ScaledDPAlgorithms
 
+# Number of training sequences in each batch given to a worker process
+_TRAIN_BATCH_SIZE = 100
+
 
 class TrainingSequence(object):
     """Hold a training sequence with emissions and optionally, a state path.
@@ -173,7 +181,8 @@ class BaumWelchTrainer(AbstractTrainer):
         AbstractTrainer.__init__(self, markov_model)
 
     def train(self, training_seqs, stopping_criteria,
-              dp_method = ScaledDPAlgorithms):
+              dp_method = ScaledDPAlgorithms, processes = None,
+              update_fn = None):
         """Estimate the parameters using training sequences.
 
         The algorithm for this is taken from Durbin et al. p64, so this
@@ -191,7 +200,35 @@ class BaumWelchTrainer(AbstractTrainer):
         o dp_method -- A class instance specifying the dynamic programming
         implementation we should use to calculate the forward and
         backward variables. By default, we use the scaling method.
+        Pass the CompiledMarkovModel class (see Bio.HMM.Compiled, which
+        needs NumPy) to do the calculations with NumPy arrays instead,
+        which is much faster.
+
+        o processes -- The number of worker processes to share the training
+        sequences between when calculating the expected counts. This is
+        only supported with dp_method set to CompiledMarkovModel. The
+        batches of counts are summed in a fixed order, so the estimates
+        are the same for any number of processes.
+
+        o update_fn -- An optional function called once per iteration with
+        the iteration number and the log likelihood of the training
+        sequences, for example to report the progress of the training.
+
+        Note the two approaches give different estimates, so switching
+        between them will change the trained model. The CompiledMarkovModel
+        starts each sequence using the model's initial probabilities and
+        gives the exact expected counts, while the ScaledDPAlgorithms
+        classes treat the first state as the begin (and end) state.
         """
+        if numpy is not None:
+            from .Compiled import CompiledMarkovModel
+            if dp_method is CompiledMarkovModel:
+                return self._train_compiled(training_seqs, stopping_criteria,
+                                            processes, update_fn)
+        if processes is not None and processes > 1:
+            raise ValueError("Training with several processes needs "
+                             "dp_method=CompiledMarkovModel")
+
         prev_log_likelihood = None
         num_iterations = 1
 
@@ -229,6 +266,8 @@ class BaumWelchTrainer(AbstractTrainer):
             self._markov_model.emission_prob = ml_emissions
 
             cur_log_likelihood = self.log_likelihood(all_probabilities)
+            if update_fn is not None:
+                update_fn(num_iterations, cur_log_likelihood)
 
             # if we have previously calculated the log likelihood (ie.
             # not the first round), see if we can finish
@@ -250,6 +289,86 @@ class BaumWelchTrainer(AbstractTrainer):
 
         return self._markov_model
 
+    def _train_compiled(self, training_seqs, stopping_criteria,
+                        processes=None, update_fn=None):
+        """Estimate the parameters using a CompiledMarkovModel (PRIVATE).
+
+        This follows the train method, but the expected counts for each
+        training sequence are calculated with NumPy arrays. The sequences
+        are split into batches, optionally shared between a pool of worker
+        processes, and the counts for each batch are added up in order.
+        """
+        from .Compiled import CompiledMarkovModel, _add_counts
+
+        state_alphabet = training_seqs[0].states.alphabet
+        emission_alphabet = training_seqs[0].emissions.alphabet
+        compiled = CompiledMarkovModel(self._markov_model,
+                                       state_alphabet, emission_alphabet)
+        # the emissions are coded once, as the alphabets don't change
+        all_codes = [compiled._codes(training_seq.emissions)
+                     for training_seq in training_seqs]
+        batches = [(start, start + _TRAIN_BATCH_SIZE) for start
+                   in range(0, len(all_codes), _TRAIN_BATCH_SIZE)]
+        pool = None
+        if processes is not None and processes > 1:
+            from multiprocessing import Pool
+            pool = Pool(processes, _init_train_worker, (all_codes,))
+        try:
+            prev_log_likelihood = None
+            num_iterations = 1
+
+            while True:
+                if pool is None:
+                    results = [_sum_expected_counts(compiled,
+                                                    all_codes[start:end])
+                               for start, end in batches]
+                else:
+                    results = pool.map(_train_batch,
+                                       [(compiled, start, end)
+                                        for start, end in batches])
+                transitions, emissions, cur_log_likelihood = results[0]
+                for batch_transitions, batch_emissions, log_prob \
+                        in results[1:]:
+                    transitions = transitions + batch_transitions
+                    emissions = emissions + batch_emissions
+                    cur_log_likelihood += log_prob
+                if update_fn is not None:
+                    update_fn(num_iterations, cur_log_likelihood)
+
+                # start from (copies of) the pseudo counts
+                transition_count = _add_counts(
+                    dict(self._markov_model.get_blank_transitions()),
+                    transitions, compiled._state_index, compiled._state_index)
+                emission_count = _add_counts(
+                    dict(self._markov_model.get_blank_emissions()),
+                    emissions, compiled._state_index, compiled._emission_index)
+
+                # update the markov model with the new probabilities
+                ml_transitions, ml_emissions = \
+                    self.estimate_params(transition_count, emission_count)
+                self._markov_model.transition_prob = ml_transitions
+                self._markov_model.emission_prob = ml_emissions
+
+                # see train for the stopping calculation
+                if prev_log_likelihood is not None:
+                    log_likelihood_change = abs(abs(cur_log_likelihood) -
+                                                abs(prev_log_likelihood))
+                    if stopping_criteria(log_likelihood_change,
+                                         num_iterations):
+                        break
+
+                prev_log_likelihood = cur_log_likelihood
+                num_iterations += 1
+                compiled = CompiledMarkovModel(self._markov_model,
+                                               state_alphabet,
+                                               emission_alphabet)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        return self._markov_model
+
     def update_transitions(self, transition_counts, training_seq,
                            forward_vars, backward_vars, training_seq_prob):
         """Add the contribution of a new training sequence to the transitions.
@@ -426,3 +545,40 @@ class KnownStateTrainer(AbstractTrainer):
                                (cur_state, next_state))
 
         return transition_counts
+
+
+_worker_codes = None   # the coded training sequences in a worker process
+
+
+def _init_train_worker(all_codes):
+    """Store the coded training sequences once per worker process (PRIVATE)."""
+    global _worker_codes
+    _worker_codes = all_codes
+
+
+def _train_batch(task):
+    """Sum the expected counts for a batch of the stored sequences (PRIVATE).
+
+    The task is a tuple of the CompiledMarkovModel for the current
+    iteration, and the start and end of the batch.
+    """
+    compiled, start, end = task
+    return _sum_expected_counts(compiled, _worker_codes[start:end])
+
+
+def _sum_expected_counts(compiled, all_codes):
+    """Sum the expected counts over a list of coded sequences (PRIVATE).
+
+    Returns a tuple of the transition counts, emission counts and log
+    likelihood, as for the expected_counts method of CompiledMarkovModel.
+    """
+    transitions = numpy.zeros(compiled.transition.shape)
+    emissions = numpy.zeros(compiled.emission.shape)
+    log_likelihood = 0.0
+    for codes in all_codes:
+        seq_transitions, seq_emissions, log_prob = \
+            compiled.expected_counts(codes)
+        transitions += seq_transitions
+        emissions += seq_emissions
+        log_likelihood += log_prob
+    return transitions, emissions, log_likelihood
@@ -17,6 +17,7 @@ struct KDTree
     struct DataPoint* _data_point_list;
     int _data_point_list_size;
     struct Radius* _radius_list;
+    long int _radius_list_size;
     struct Neighbor* _neighbor_list;
     struct Node *_root;
     struct Region *_query_region;
@@ -290,6 +291,7 @@ struct KDTree* KDTree_init(int dim, int bucket_size)
     tree->_root=NULL;
     tree->_coords=NULL;
     tree->_radius_list = NULL;
+    tree->_radius_list_size = 0;
     tree->_count=0;
     tree->_neighbor_count=0;
     tree->_neighbor_list = NULL;
@@ -309,6 +311,7 @@ void KDTree_destroy(struct KDTree* tree)
     if (tree->_center_coord) free(tree->_center_coord);
     if (tree->_coords) free(tree->_coords);
     if (tree->_data_point_list) free(tree->_data_point_list);
+    if (tree->_radius_list) free(tree->_radius_list);
     if (tree->_neighbor_list) free(tree->_neighbor_list);
     free(tree);
 }
@@ -420,18 +423,24 @@ static int KDTree_report_point(struct KDTree* tree, long int index, float *coord
 
     if (r<=tree->_radius_sq)
     {
-        int n = tree->_count;
-        struct Radius* p;
+        long int n = tree->_count;
+        struct Radius* p = tree->_radius_list;
 
-    p  = realloc(tree->_radius_list, (n+1)*sizeof(struct Radius));
-        if (p==NULL)
+        if (n >= tree->_radius_list_size)
         {
-            return 0;
+            /* grow the list geometrically, it is reused between searches */
+            long int size = 2*n+16;
+            p = realloc(p, size*sizeof(struct Radius));
+            if (p==NULL)
+            {
+                return 0;
+            }
+            tree->_radius_list = p;
+            tree->_radius_list_size = size;
         }
         /* note use of sqrt - only calculated if necessary */
         p[n].index = index;
         p[n].value = sqrt(r);
-        tree->_radius_list = p;
         tree->_count++;
     }
     return 1;
@@ -469,6 +478,17 @@ long int KDTree_get_count(struct KDTree* tree)
     return tree->_count;
 }
 
+long int KDTree_get_size(struct KDTree* tree)
+{
+    /* the number of points in the tree */
+    return tree->_data_point_list_size;
+}
+
+int KDTree_get_dim(struct KDTree* tree)
+{
+    return tree->dim;
+}
+
 long int KDTree_neighbor_get_count(struct KDTree* tree)
 {
     return tree->_neighbor_count;
@@ -616,11 +636,19 @@ int KDTree_set_data(struct KDTree* tree, float *coords, long int nr_points)
 
     /* clean up stuff from previous use */
     Node_destroy(tree->_root);
+    tree->_root=NULL;
     if (tree->_coords) free(tree->_coords);
+    if (tree->_data_point_list)
+    {
+        free(tree->_data_point_list);
+        tree->_data_point_list = NULL;
+        tree->_data_point_list_size = 0;
+    }
     if (tree->_radius_list)
     {
         free(tree->_radius_list);
         tree->_radius_list = NULL;
+        tree->_radius_list_size = 0;
     }
     tree->_count=0;
     /* keep pointer to coords to delete it */
@@ -659,11 +687,6 @@ int KDTree_search_center_radius(struct KDTree* tree, float *coord, float radius)
 
     Region_dim=tree->dim;
 
-    if (tree->_radius_list)
-    {
-        free(tree->_radius_list);
-        tree->_radius_list = NULL;
-    }
     tree->_count=0;
 
     tree->_radius=radius;
@@ -692,6 +715,240 @@ int KDTree_search_center_radius(struct KDTree* tree, float *coord, float radius)
     return KDTree_search(tree, NULL, NULL, 0);
 }
 
+static int KDTree_search_ball(struct KDTree* tree, struct Node *node, float radius)
+{
+    /* search for the points within radius of the center, descending
+     * directly on the cut values rather than intersecting regions */
+    if (Node_is_leaf(node))
+    {
+        long int i;
+
+        for (i=node->_start; i<node->_end; i++)
+        {
+            struct DataPoint data_point;
+
+            data_point=tree->_data_point_list[i];
+            if (!KDTree_report_point(tree, data_point._index, data_point._coord))
+                return 0;
+        }
+    }
+    else
+    {
+        float x = tree->_center_coord[node->_cut_dim];
+
+        if (x-radius <= node->_cut_value)
+        {
+            if (!KDTree_search_ball(tree, node->_left, radius)) return 0;
+        }
+        if (x+radius >= node->_cut_value)
+        {
+            if (!KDTree_search_ball(tree, node->_right, radius)) return 0;
+        }
+    }
+    return 1;
+}
+
+static int Radius_compare(const void* self, const void* other)
+{
+    const struct Radius* p = (const struct Radius*)self;
+    const struct Radius* q = (const struct Radius*)other;
+
+    if (p->index < q->index) return -1;
+    if (p->index > q->index) return +1;
+    return 0;
+}
+
+int KDTree_search_centers_radius(struct KDTree* tree, const float *coords,
+                                 long int nr_centers, float radius,
+                                 long int **indices, float **radii,
+                                 long int *offsets)
+{
+    /* offsets must have room for nr_centers+1 values; the indices and
+     * radii are allocated here, and must be freed by the caller */
+    long int i, j;
+    long int total = 0;
+    long int size = 0;
+    long int *p = NULL;
+    float *q = NULL;
+
+    tree->_radius=radius;
+    tree->_radius_sq=radius*radius;
+
+    offsets[0] = 0;
+    for (i=0; i<nr_centers; i++)
+    {
+        long int count;
+        struct Radius* radius_list;
+        int k;
+
+        tree->_count=0;
+        for (k=0; k<tree->dim; k++)
+            tree->_center_coord[k]=coords[i*tree->dim+k];
+        if (!KDTree_search_ball(tree, tree->_root, radius))
+            goto error;
+
+        count = tree->_count;
+        radius_list = tree->_radius_list;
+        /* report the points of each center in order of their index */
+        if (count > 1)
+            qsort(radius_list, count, sizeof(struct Radius), Radius_compare);
+
+        if (total+count > size)
+        {
+            long int *pp;
+            float *qq;
+
+            size = 2*(total+count);
+            pp = realloc(p, size*sizeof(long int));
+            if (pp==NULL) goto error;
+            p = pp;
+            qq = realloc(q, size*sizeof(float));
+            if (qq==NULL) goto error;
+            q = qq;
+        }
+        for (j=0; j<count; j++)
+        {
+            p[total+j] = radius_list[j].index;
+            q[total+j] = radius_list[j].value;
+        }
+        total += count;
+        offsets[i+1] = total;
+    }
+
+    *indices = p;
+    *radii = q;
+    return 1;
+
+error:
+    if (p) free(p);
+    if (q) free(q);
+    return 0;
+}
+
+/* k nearest neighbor search, keeping the best points found so far in a
+ * max-heap ordered by (squared distance, index) */
+
+static int Radius_greater(const struct Radius* p, const struct Radius* q)
+{
+    if (p->value > q->value) return 1;
+    if (p->value < q->value) return 0;
+    return p->index > q->index;
+}
+
+static void Heap_replace_top(struct Radius* heap, long int n, struct Radius item)
+{
+    long int i = 0;
+
+    while (1)
+    {
+        long int child = 2*i+1;
+
+        if (child >= n) break;
+        if (child+1 < n && Radius_greater(&heap[child+1], &heap[child]))
+            child++;
+        if (!Radius_greater(&heap[child], &item)) break;
+        heap[i] = heap[child];
+        i = child;
+    }
+    heap[i] = item;
+}
+
+static void Heap_push(struct Radius* heap, long int n, struct Radius item)
+{
+    /* n is the number of items already in the heap */
+    long int i = n;
+
+    while (i > 0)
+    {
+        long int parent = (i-1)/2;
+
+        if (!Radius_greater(&item, &heap[parent])) break;
+        heap[i] = heap[parent];
+        i = parent;
+    }
+    heap[i] = item;
+}
+
+static void KDTree_nearest(struct KDTree* tree, struct Node *node,
+                           const float *coord, struct Radius* heap,
+                           long int k, long int *count)
+{
+    if (Node_is_leaf(node))
+    {
+        long int i;
+
+        for (i=node->_start; i<node->_end; i++)
+        {
+            struct DataPoint data_point;
+            struct Radius item;
+
+            data_point=tree->_data_point_list[i];
+            item.index = data_point._index;
+            item.value = KDTree_dist((float*)coord, data_point._coord, tree->dim);
+            if (*count < k)
+            {
+                Heap_push(heap, *count, item);
+                (*count)++;
+            }
+            else if (Radius_greater(&heap[0], &item))
+            {
+                Heap_replace_top(heap, k, item);
+            }
+        }
+    }
+    else
+    {
+        /* visit the half plane containing the point first; the points
+         * in the other one are at least diff away */
+        float diff = coord[node->_cut_dim]-node->_cut_value;
+        struct Node *near_node, *far_node;
+
+        if (diff <= 0)
+        {
+            near_node = node->_left;
+            far_node = node->_right;
+        }
+        else
+        {
+            near_node = node->_right;
+            far_node = node->_left;
+        }
+        KDTree_nearest(tree, near_node, coord, heap, k, count);
+        if (*count < k || diff*diff <= heap[0].value)
+            KDTree_nearest(tree, far_node, coord, heap, k, count);
+    }
+}
+
+int KDTree_search_nearest(struct KDTree* tree, const float *coords,
+                          long int nr_centers, long int k,
+                          long int *indices, float *radii)
+{
+    /* indices and radii must have room for nr_centers*k values, and
+     * k must not be more than the number of points */
+    long int i, j;
+    struct Radius* heap = malloc(k*sizeof(struct Radius));
+    if (heap==NULL) return 0;
+
+    for (i=0; i<nr_centers; i++)
+    {
+        long int count = 0;
+
+        KDTree_nearest(tree, tree->_root, coords+i*tree->dim, heap, k, &count);
+        /* empty the heap from the back, giving the nearest point first */
+        for (j=count-1; j>=0; j--)
+        {
+            struct Radius top = heap[0];
+
+            Heap_replace_top(heap, j, heap[j]);
+            indices[i*k+j] = top.index;
+            radii[i*k+j] = sqrt(top.value);
+        }
+    }
+
+    free(heap);
+    return 1;
+}
+
 void KDTree_copy_indices(struct KDTree* tree, long *indices)
 {
     long int i;
@@ -11,16 +11,29 @@ within a radius of a given point) or finding all point pairs in a set
 that are within a certain radius of each other. See "Computational Geometry:
 Algorithms and Applications" (Mark de Berg, Marc van Kreveld, Mark Overmars,
 Otfried Schwarzkopf). Author: Thomas Hamelryck.
+
+Many queries can also be done at once, finding the points within radius of
+each of an array of centers (with the results as arrays in compressed sparse
+row form), or the k nearest points to each center. Optionally the points can
+lie in a periodic box, as in a molecular dynamics simulation.
 """
 
 from __future__ import print_function
 
-from numpy import sum, sqrt, array
+from collections import namedtuple
+from itertools import product
+
+from numpy import sum, sqrt, array, arange, bincount, concatenate, cumsum
+from numpy import diff, hstack, lexsort, ones, repeat, zeros
 from numpy.random import random
 
 from Bio.KDTree import _CKDTree
 
 
+#A neighbor pair found with periodic boundaries, like a _CKDTree.Neighbor
+_Neighbor = namedtuple("_Neighbor", ["index1", "index2", "radius"])
+
+
 def _dist(p, q):
     diff = p - q
     return sqrt(sum(diff * diff))
@@ -130,20 +143,36 @@ class KDTree(object):
         self.dim = dim
         self.kdt = _CKDTree.KDTree(dim, bucket_size)
         self.built = 0
+        self.box = None
 
     # Set data
 
-    def set_coords(self, coords):
+    def set_coords(self, coords, box=None):
         """Add the coordinates of the points.
 
         o coords - two dimensional NumPy array. E.g. if the points
         have dimensionality D and there are N points, the coords
         array should be NxD dimensional.
+        o box - optional sequence of D box lengths, for periodic
+        boundary conditions in a rectangular box. The points are
+        wrapped into the box, and all the searches then use the
+        distance to the nearest periodic image of each point.
+
+        The coordinates can be set again (e.g. for each frame of a
+        trajectory), replacing the previous points.
         """
         if coords.min() <= -1e6 or coords.max() >= 1e6:
                 raise Exception("Points should lie between -1e6 and 1e6")
         if len(coords.shape) != 2 or coords.shape[1] != self.dim:
                 raise Exception("Expected a Nx%i NumPy array" % self.dim)
+        if box is not None:
+            box = array(box, "d")
+            if box.shape != (self.dim,) or box.min() <= 0:
+                raise Exception("Expected %i positive box lengths" % self.dim)
+            coords = coords % box
+        self.box = box
+        self._coords = coords
+        self._result = None
         self.kdt.set_data(coords)
         self.built = 1
 
@@ -161,7 +190,12 @@ class KDTree(object):
         if center.shape != (self.dim,):
                 raise Exception("Expected a %i-dimensional NumPy array"
                                 % self.dim)
-        self.kdt.search_center_radius(center, radius)
+        if self.box is None:
+            self.kdt.search_center_radius(center, radius)
+        else:
+            indices, radii, offsets = self._periodic_search(center[None, :],
+                                                            radius)
+            self._result = (indices, radii)
 
     def get_radii(self):
         """Return radii.
@@ -169,6 +203,8 @@ class KDTree(object):
         Return the list of distances from center after
         a neighbor search.
         """
+        if self.box is not None:
+            return self._result[1]
         a = self.kdt.get_radii()
         if a is None:
             return []
@@ -183,11 +219,131 @@ class KDTree(object):
 
         For an index pair, the first index<second index.
         """
+        if self.box is not None:
+            return self._result[0]
         a = self.kdt.get_indices()
         if a is None:
             return []
         return a
 
+    # Fixed radius search for many points
+
+    def search_centers(self, centers, radius):
+        """Search all points within radius of each of many centers.
+
+        o centers - two dimensional NumPy array. E.g. if the points
+        have dimensionality D, for N centers the array should be NxD
+        dimensional.
+        o radius - float>0
+
+        All the centers are searched in a single call to the C module.
+        Returns a tuple of two NumPy arrays (indices, offsets) in
+        compressed sparse row form, so that the indices of the points
+        within radius of center i are indices[offsets[i]:offsets[i+1]]
+        (in ascending order). The matching distances are then returned
+        by get_centers_radii.
+        """
+        if not self.built:
+                raise Exception("No point set specified")
+        if len(centers.shape) != 2 or centers.shape[1] != self.dim:
+                raise Exception("Expected a Nx%i NumPy array" % self.dim)
+        if self.box is None:
+            indices, radii, offsets = self.kdt.search_centers_radius(centers,
+                                                                     radius)
+        else:
+            indices, radii, offsets = self._periodic_search(centers, radius)
+        self._centers_radii = radii
+        return indices, offsets
+
+    def get_centers_radii(self):
+        """Return the distances found by search_centers.
+
+        Return a NumPy array of the distances from the centers, in
+        the same order as the indices returned by search_centers.
+        """
+        return self._centers_radii
+
+    def search_nearest(self, centers, k=1):
+        """Find the k nearest points to each of many centers.
+
+        o centers - two dimensional NumPy array. E.g. if the points
+        have dimensionality D, for N centers the array should be NxD
+        dimensional.
+        o k - number of points to find for each center, at most the
+        number of points in the tree.
+
+        Returns a tuple of two Nxk NumPy arrays (indices, radii), where
+        row i holds the indices and distances of the nearest points to
+        center i, nearest first (with ties in order of their index).
+        """
+        if not self.built:
+                raise Exception("No point set specified")
+        if len(centers.shape) != 2 or centers.shape[1] != self.dim:
+                raise Exception("Expected a Nx%i NumPy array" % self.dim)
+        if self.box is None:
+            return self.kdt.search_nearest(centers, k)
+        count = len(centers)
+        indices = []
+        radii = []
+        for rows, images in self._images(centers, None):
+            i, r = self.kdt.search_nearest(images, k)
+            indices.append(i)
+            radii.append(r)
+        indices = hstack(indices).ravel()
+        radii = hstack(radii).ravel()
+        rows = repeat(arange(count), len(indices) // max(count, 1))
+        rows, indices, radii = _nearest_images(rows, indices, radii)
+        #Sort each row by distance, and keep the first k points
+        order = lexsort((indices, radii, rows))
+        rows, indices, radii = rows[order], indices[order], radii[order]
+        counts = bincount(rows, minlength=count)
+        keep = arange(len(rows)) - (cumsum(counts) - counts)[rows] < k
+        return (indices[keep].reshape(count, k), radii[keep].reshape(count, k))
+
+    def _images(self, centers, radius):
+        """Periodic images of the centers (PRIVATE).
+
+        Returns a list of (rows, centers) tuples, one for each shift of
+        the centers by -1, 0 or +1 box lengths in each dimension, giving
+        the indices of the centers used and their shifted coordinates.
+        If a radius is given, only the centers within radius of the box
+        after the shift are used.
+        """
+        box = self.box
+        centers = centers % box
+        images = []
+        for shift in product((0, -1, 1), repeat=self.dim):
+            mask = ones(len(centers), bool)
+            if radius is not None:
+                for d, s in enumerate(shift):
+                    if s == 1:
+                        mask &= centers[:, d] <= radius
+                    elif s == -1:
+                        mask &= centers[:, d] >= box[d] - radius
+            rows = mask.nonzero()[0]
+            if len(rows):
+                images.append((rows, centers[rows] + array(shift) * box))
+        return images
+
+    def _periodic_search(self, centers, radius):
+        """Search the periodic images of many centers (PRIVATE).
+
+        Returns (indices, radii, offsets) arrays as the C module does.
+        """
+        rows = [zeros(0, int)]
+        indices = [zeros(0, int)]
+        radii = [zeros(0, "f")]
+        for image_rows, images in self._images(centers, radius):
+            i, r, offsets = self.kdt.search_centers_radius(images, radius)
+            rows.append(repeat(image_rows, diff(offsets)))
+            indices.append(i)
+            radii.append(r)
+        rows, indices, radii = _nearest_images(concatenate(rows),
+                                               concatenate(indices),
+                                               concatenate(radii))
+        offsets = concatenate([[0], cumsum(bincount(rows, minlength=len(centers)))])
+        return indices, radii, offsets
+
     # Fixed radius search for all points
 
     def all_search(self, radius):
@@ -199,7 +355,14 @@ class KDTree(object):
         """
         if not self.built:
                 raise Exception("No point set specified")
-        self.neighbors = self.kdt.neighbor_search(radius)
+        if self.box is None:
+            self.neighbors = self.kdt.neighbor_search(radius)
+            return
+        indices, offsets = self.search_centers(self._coords, radius)
+        radii = self.get_centers_radii()
+        rows = repeat(arange(len(self._coords)), diff(offsets))
+        self.neighbors = [_Neighbor(int(i), int(j), float(r))
+                          for i, j, r in zip(rows, indices, radii) if i < j]
 
     def all_get_indices(self):
         """Return All Fixed Neighbor Search results.
@@ -220,6 +383,18 @@ class KDTree(object):
         """
         return [neighbor.radius for neighbor in self.neighbors]
 
+def _nearest_images(rows, indices, radii):
+    """Keep only the nearest image of each point found for a center (PRIVATE).
+
+    Returns the (rows, indices, radii) arrays sorted by row and index.
+    """
+    order = lexsort((radii, indices, rows))
+    rows, indices, radii = rows[order], indices[order], radii[order]
+    keep = ones(len(rows), bool)
+    keep[1:] = (rows[1:] != rows[:-1]) | (indices[1:] != indices[:-1])
+    return rows[keep], indices[keep], radii[keep]
+
+
 if __name__ == "__main__":
 
     nr_points = 100000
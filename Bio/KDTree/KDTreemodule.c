@@ -412,6 +412,223 @@ PyTree_search_center_radius(PyTree* self, PyObject* args)
     return Py_None;
 }
 
+static float*
+PyTree_get_centers(PyObject* obj, int dim, long int* nr_centers)
+{
+    /* Copy an Nxdim array of centers to a new array of floats */
+    float* coords;
+    long int n, i;
+    PyArrayObject *array;
+    npy_intp rowstride, colstride;
+    const char* p;
+
+    /* Check if it is an array */
+    if (!PyArray_Check(obj))
+    {
+        PyErr_SetString(PyExc_TypeError, "First argument must be an array.");
+        return NULL;
+    }
+    array=(PyArrayObject *) obj;
+    if(PyArray_NDIM(array)!=2 || PyArray_DIM(array, 1)!=dim)
+    {
+        PyErr_Format(PyExc_ValueError, "Expected a Nx%i array.", dim);
+        return NULL;
+    }
+    if (PyArray_TYPE(array) == NPY_DOUBLE)
+    {
+        Py_INCREF(obj);
+    }
+    else
+    {
+        /* Cast to type double */
+        obj = PyArray_Cast(array, NPY_DOUBLE);
+        if (!obj)
+        {
+            PyErr_SetString(PyExc_ValueError,
+                            "coordinates cannot be cast to needed type.");
+            return NULL;
+        }
+        array = (PyArrayObject*) obj;
+    }
+
+    n = (long int) PyArray_DIM(array, 0);
+
+    coords= malloc((n ? n : 1)*dim*sizeof(float));
+    if (!coords)
+    {
+        Py_DECREF(obj);
+        PyErr_SetString (PyExc_MemoryError, "Failed to allocate memory for coordinates.");
+        return NULL;
+    }
+
+    rowstride =  PyArray_STRIDE(array, 0);
+    colstride =  PyArray_STRIDE(array, 1);
+    p = PyArray_BYTES(array);
+
+    for (i=0; i<n; i++)
+    {
+        int j;
+
+        for (j=0; j<dim; j++)
+        {
+            coords[i*dim+j]=*(double *) (p+i*rowstride+j*colstride);
+        }
+    }
+    Py_DECREF(obj);
+
+    *nr_centers = n;
+    return coords;
+}
+
+static char PyTree_search_centers_radius__doc__[] =
+"search_centers_radius(centers, radius) -> (indices, radii, offsets)\n"
+"\n"
+"Search all points within radius of each row of an Nxdim array of centers.\n"
+"The indices and radii of the points found for center i are in\n"
+"indices[offsets[i]:offsets[i+1]] and radii[offsets[i]:offsets[i+1]],\n"
+"in order of their index.\n";
+
+static PyObject*
+PyTree_search_centers_radius(PyTree* self, PyObject* args)
+{
+    PyObject *obj;
+    double radius;
+    long int n, i;
+    float *coords;
+    long int *indices = NULL;
+    float *radii = NULL;
+    struct KDTree* tree = self->tree;
+    int ok;
+    npy_intp length;
+    PyArrayObject *offsets_array;
+    PyArrayObject *indices_array;
+    PyArrayObject *radii_array;
+    long int *offsets;
+
+    if(!PyArg_ParseTuple(args, "Od:KDTree_search_centers_radius", &obj ,&radius))
+        return NULL;
+
+    if(radius <= 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "Radius must be positive.");
+        return NULL;
+    }
+
+    coords = PyTree_get_centers(obj, KDTree_get_dim(tree), &n);
+    if (!coords) return NULL;
+
+    length = n+1;
+    offsets_array=(PyArrayObject *) PyArray_SimpleNew(1, &length, PyArray_LONG);
+    if (!offsets_array)
+    {
+        free(coords);
+        PyErr_SetString(PyExc_MemoryError,
+                        "Insufficient memory for array");
+        return NULL;
+    }
+    offsets = (long int *) PyArray_BYTES(offsets_array);
+
+    ok = KDTree_search_centers_radius(tree, coords, n, radius,
+                                      &indices, &radii, offsets);
+    free(coords);
+    if (!ok)
+    {
+        Py_DECREF(offsets_array);
+        PyErr_SetString (PyExc_MemoryError, "Insufficient memory for calculation.");
+        return NULL;
+    }
+
+    length = offsets[n];
+    indices_array=(PyArrayObject *) PyArray_SimpleNew(1, &length, PyArray_LONG);
+    radii_array=(PyArrayObject *) PyArray_SimpleNew(1, &length, PyArray_FLOAT);
+    if (!indices_array || !radii_array)
+    {
+        Py_XDECREF(indices_array);
+        Py_XDECREF(radii_array);
+        Py_DECREF(offsets_array);
+        if (indices) free(indices);
+        if (radii) free(radii);
+        PyErr_SetString(PyExc_MemoryError,
+                        "Insufficient memory for array");
+        return NULL;
+    }
+
+    /* copy the data into the Numpy data pointers */
+    for (i=0; i<length; i++)
+    {
+        ((long int *) PyArray_BYTES(indices_array))[i] = indices[i];
+        ((float *) PyArray_BYTES(radii_array))[i] = radii[i];
+    }
+    if (indices) free(indices);
+    if (radii) free(radii);
+
+    return Py_BuildValue("NNN", indices_array, radii_array, offsets_array);
+}
+
+static char PyTree_search_nearest__doc__[] =
+"search_nearest(centers, k) -> (indices, radii)\n"
+"\n"
+"Find the k nearest points to each row of an Nxdim array of centers.\n"
+"Returns two Nxk arrays, with the nearest point first in each row.\n";
+
+static PyObject*
+PyTree_search_nearest(PyTree* self, PyObject* args)
+{
+    PyObject *obj;
+    long int k, n;
+    float *coords;
+    struct KDTree* tree = self->tree;
+    int ok;
+    npy_intp shape[2];
+    PyArrayObject *indices_array;
+    PyArrayObject *radii_array;
+
+    if(!PyArg_ParseTuple(args, "Ol:KDTree_search_nearest", &obj, &k))
+        return NULL;
+
+    if (k <= 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "k must be positive.");
+        return NULL;
+    }
+    if (k > KDTree_get_size(tree))
+    {
+        PyErr_SetString(PyExc_ValueError, "k is more than the number of points.");
+        return NULL;
+    }
+
+    coords = PyTree_get_centers(obj, KDTree_get_dim(tree), &n);
+    if (!coords) return NULL;
+
+    shape[0] = n;
+    shape[1] = k;
+    indices_array=(PyArrayObject *) PyArray_SimpleNew(2, shape, PyArray_LONG);
+    radii_array=(PyArrayObject *) PyArray_SimpleNew(2, shape, PyArray_FLOAT);
+    if (!indices_array || !radii_array)
+    {
+        Py_XDECREF(indices_array);
+        Py_XDECREF(radii_array);
+        free(coords);
+        PyErr_SetString(PyExc_MemoryError,
+                        "Insufficient memory for array");
+        return NULL;
+    }
+
+    ok = KDTree_search_nearest(tree, coords, n, k,
+                               (long int *) PyArray_BYTES(indices_array),
+                               (float *) PyArray_BYTES(radii_array));
+    free(coords);
+    if (!ok)
+    {
+        Py_DECREF(indices_array);
+        Py_DECREF(radii_array);
+        PyErr_SetString (PyExc_MemoryError, "Insufficient memory for calculation.");
+        return NULL;
+    }
+
+    return Py_BuildValue("NN", indices_array, radii_array);
+}
+
 static PyObject*
 PyTree_neighbor_search(PyTree* self, PyObject* args)
 {
@@ -605,6 +822,8 @@ static PyMethodDef PyTree_methods[] = {
     {"neighbor_simple_search", (PyCFunction)PyTree_neighbor_simple_search, METH_VARARGS, NULL},
     {"get_indices", (PyCFunction)PyTree_get_indices, METH_NOARGS, PyTree_get_indices__doc__},
     {"get_radii", (PyCFunction)PyTree_get_radii, METH_NOARGS, PyTree_get_radii__doc__},
+    {"search_centers_radius", (PyCFunction)PyTree_search_centers_radius, METH_VARARGS, PyTree_search_centers_radius__doc__},
+    {"search_nearest", (PyCFunction)PyTree_search_nearest, METH_VARARGS, PyTree_search_nearest__doc__},
     {NULL}  /* Sentinel */
 };
 
@@ -137,10 +137,11 @@ def save(mm, handle):
 # XXX allow them to specify starting points
 def train_bw(states, alphabet, training_data,
              pseudo_initial=None, pseudo_transition=None, pseudo_emission=None,
-             update_fn=None,
+             update_fn=None, batch=False, processes=None,
              ):
     """train_bw(states, alphabet, training_data[, pseudo_initial]
-    [, pseudo_transition][, pseudo_emission][, update_fn]) -> MarkovModel
+    [, pseudo_transition][, pseudo_emission][, update_fn]
+    [, batch][, processes]) -> MarkovModel
 
     Train a MarkovModel using the Baum-Welch algorithm.  states is a list
     of strings that describe the names of each state.  alphabet is a
@@ -157,8 +158,25 @@ def train_bw(states, alphabet, training_data,
     update_fn is an optional callback that takes parameters
     (iteration, log_likelihood).  It is called once per iteration.
 
+    By default the parameters are updated after each observation in
+    turn, and the initial probabilities are never re-estimated (they
+    keep their random starting values).  If batch is true, batch
+    re-estimation is used instead: the expected counts of all the
+    observations are summed before each update, and the initial
+    probabilities are re-estimated along with the transition and
+    emission probabilities.  This gives a different model from the
+    default.
+
+    processes is the number of worker processes to share the batch
+    re-estimation between (by default it is all done in this process),
+    and needs batch to be true.  It only changes where the work is
+    done, not the trained model, as the batch totals are always
+    combined in one order.
+
     """
     N, M = len(states), len(alphabet)
+    if processes is not None and processes > 1 and not batch:
+        raise ValueError("Training with several processes needs batch=True")
     if not training_data:
         raise ValueError("No training data given.")
     if pseudo_initial is not None:
@@ -194,17 +212,21 @@ def train_bw(states, alphabet, training_data,
                     pseudo_initial=pseudo_initial,
                     pseudo_transition=pseudo_transition,
                     pseudo_emission=pseudo_emission,
-                    update_fn=update_fn)
+                    update_fn=update_fn, batch=batch, processes=processes)
     p_initial, p_transition, p_emission = x
     return MarkovModel(states, alphabet, p_initial, p_transition, p_emission)
 
 MAX_ITERATIONS = 1000
 
+# Number of observations in each batch given to a worker process
+_BATCH_SIZE = 100
+
 
 def _baum_welch(N, M, training_outputs,
                 p_initial=None, p_transition=None, p_emission=None,
                 pseudo_initial=None, pseudo_transition=None,
-                pseudo_emission=None, update_fn=None):
+                pseudo_emission=None, update_fn=None, batch=False,
+                processes=None):
     # Returns (p_initial, p_transition, p_emission)
     if p_initial is None:
         p_initial = _random_norm(N)
@@ -220,6 +242,12 @@ def _baum_welch(N, M, training_outputs,
     else:
         p_emission = _copy_and_check(p_emission, (N, M))
 
+    if batch:
+        return _baum_welch_batch(N, M, training_outputs,
+                                 p_initial, p_transition, p_emission,
+                                 pseudo_initial, pseudo_transition,
+                                 pseudo_emission, update_fn, processes)
+
     # Do all the calculations in log space to avoid underflows.
     lp_initial = numpy.log(p_initial)
     lp_transition = numpy.log(p_transition)
@@ -316,7 +344,8 @@ def _baum_welch_one(N, M, outputs,
         for j in range(N):
             lp_transition[i][j] = _logsum(lp_arc[i, j,:]) - lp_arcout[i]
         if lpseudo_transition is not None:
-            lp_transition[i] = _logvecadd(lp_transition[i], lpseudo_transition)
+            lp_transition[i] = _logvecadd(lp_transition[i],
+                                          lpseudo_transition[i])
             lp_transition[i] = lp_transition[i] - _logsum(lp_transition[i])
 
     # UPDATE P_EMISSION.  lp_emission[i][k] is the sum of all the
@@ -344,6 +373,146 @@ def _baum_welch_one(N, M, outputs,
     return _logsum(fmat[:, T])
 
 
+def _baum_welch_batch(N, M, training_outputs,
+                      p_initial, p_transition, p_emission,
+                      pseudo_initial, pseudo_transition, pseudo_emission,
+                      update_fn, processes):
+    # Baum-Welch using the expected counts summed over all the
+    # outputs at each iteration.  The outputs are split into batches
+    # of _BATCH_SIZE, and the batch sums are combined in batch order
+    # (not the order the workers finish in).  Unlike _baum_welch_one,
+    # this also re-estimates the initial probabilities.
+    batches = [(start, start + _BATCH_SIZE)
+               for start in range(0, len(training_outputs), _BATCH_SIZE)]
+    pool = None
+    if processes is not None and processes > 1:
+        from multiprocessing import Pool
+        pool = Pool(processes, _init_batch_worker, (training_outputs,))
+    try:
+        prev_llik = None
+        for i in range(MAX_ITERATIONS):
+            # Do the calculations in log space to avoid underflows.
+            lp = [numpy.log(x + VERY_SMALL_NUMBER)
+                  for x in (p_initial, p_transition, p_emission)]
+            if pool is None:
+                results = [_baum_welch_sum(N, M, training_outputs[start:end],
+                                           *lp)
+                           for start, end in batches]
+            else:
+                results = pool.map(_baum_welch_batch_worker,
+                                   [(N, M, start, end) + tuple(lp)
+                                    for start, end in batches])
+            initial_counts, transition_counts, emission_counts, llik = \
+                results[0]
+            for x in results[1:]:
+                initial_counts = initial_counts + x[0]
+                transition_counts = transition_counts + x[1]
+                emission_counts = emission_counts + x[2]
+                llik += x[3]
+            if update_fn is not None:
+                update_fn(i, llik)
+            # As in _baum_welch_one, any pseudo-counts are added to the
+            # estimated probabilities before renormalizing.
+            p_initial = _estimate(initial_counts, pseudo_initial, p_initial)
+            p_transition = _estimate(transition_counts, pseudo_transition,
+                                     p_transition)
+            p_emission = _estimate(emission_counts, pseudo_emission,
+                                   p_emission)
+            if prev_llik is not None and numpy.fabs(prev_llik-llik) < 0.1:
+                break
+            prev_llik = llik
+        else:
+            raise RuntimeError("HMM did not converge in %d iterations"
+                               % MAX_ITERATIONS)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return [p_initial, p_transition, p_emission]
+
+
+def _estimate(counts, pseudo, previous):
+    # Normalize expected counts (by rows for a matrix), add any
+    # pseudo-counts and renormalize.  States with no expected counts
+    # keep their previous probabilities.
+    total = counts.sum(axis=-1)
+    if counts.ndim == 2:
+        total = total[:, None]
+    probs = numpy.where(total > 0, counts / numpy.where(total > 0, total, 1),
+                        previous)
+    if pseudo is not None:
+        probs = probs + pseudo
+        total = probs.sum(axis=-1)
+        if probs.ndim == 2:
+            total = total[:, None]
+        probs = probs / total
+    return probs
+
+
+_worker_outputs = None   # the training outputs in a worker process
+
+
+def _init_batch_worker(training_outputs):
+    # Store the training outputs once per worker process.
+    global _worker_outputs
+    _worker_outputs = training_outputs
+
+
+def _baum_welch_batch_worker(args):
+    # Sum the expected counts for one batch of the stored outputs.
+    N, M, start, end, lp_initial, lp_transition, lp_emission = args
+    return _baum_welch_sum(N, M, _worker_outputs[start:end],
+                           lp_initial, lp_transition, lp_emission)
+
+
+def _baum_welch_sum(N, M, training_outputs,
+                    lp_initial, lp_transition, lp_emission):
+    # Returns the expected initial, transition and emission counts,
+    # and the log likelihood, summed over a list of outputs.
+    initial_counts = numpy.zeros(N)
+    transition_counts = numpy.zeros((N, N))
+    emission_counts = numpy.zeros((N, M))
+    llik = 0.0
+    for outputs in training_outputs:
+        x = _baum_welch_counts(N, M, outputs,
+                               lp_initial, lp_transition, lp_emission)
+        initial_counts += x[0]
+        transition_counts += x[1]
+        emission_counts += x[2]
+        llik += x[3]
+    return initial_counts, transition_counts, emission_counts, llik
+
+
+def _baum_welch_counts(N, M, outputs, lp_initial, lp_transition, lp_emission):
+    # Returns the expected initial, transition and emission counts for
+    # a sequence of output, and its log likelihood.  This uses the
+    # same arc probabilities as _baum_welch_one, without changing the
+    # parameters.
+    T = len(outputs)
+    fmat = _forward(N, T, lp_initial, lp_transition, lp_emission, outputs)
+    bmat = _backward(N, T, lp_transition, lp_emission, outputs)
+    outputs = numpy.asarray(outputs)
+
+    # lp_arc[t, i, j] is the log probability of going over the arc
+    # from i to j at time t, emitting outputs[t].
+    lp_arc = (fmat[:, :T].T[:, :, None] +
+              lp_transition[None, :, :] +
+              lp_emission[:, outputs].T[:, :, None] +
+              bmat[:, 1:].T[:, None, :])
+    # Normalize the probabilities for each time step.
+    lp_max = lp_arc.reshape(T, N * N).max(axis=1)
+    arc = numpy.exp(lp_arc - lp_max[:, None, None])
+    arc /= arc.reshape(T, N * N).sum(axis=1)[:, None, None]
+
+    # Sum of all the transitions out of state i at time t.
+    arcout_t = arc.sum(axis=2)
+    emission_counts = numpy.zeros((N, M))
+    for k in range(M):
+        emission_counts[:, k] = arcout_t[outputs == k].sum(axis=0)
+    return (arcout_t[0], arc.sum(axis=0), emission_counts,
+            _logsum(fmat[:, T]))
+
+
 def _forward(N, T, lp_initial, lp_transition, lp_emission, outputs):
     # Implement the forward algorithm.  This actually calculates a
     # Nx(T+1) matrix, where the last column is the total probability
@@ -16,6 +16,10 @@ from Bio.Data import IUPACData
 
 
 class Atom(object):
+    #Packed coordinates (see Entity.pack_coords), the array and row index
+    _coord_array=None
+    _coord_index=None
+
     def __init__(self, name, coord, bfactor, occupancy, altloc, fullname, serial_number,
                  element=None):
         """
@@ -126,6 +130,22 @@ class Atom(object):
         diff=self.coord-other.coord
         return numpy.sqrt(numpy.dot(diff, diff))
 
+    # Coordinates, either held by the atom or a row of a packed array
+
+    def _get_coord(self):
+        if self._coord_array is None:
+            return self._coord
+        return self._coord_array[self._coord_index]
+
+    def _set_coord(self, coord):
+        if self._coord_array is None:
+            self._coord=coord
+        else:
+            self._coord_array[self._coord_index]=coord
+
+    coord=property(_get_coord, _set_coord,
+                   doc="Atomic coordinates (a view of the row if packed).")
+
     # set methods
 
     def set_serial_number(self, n):
@@ -292,6 +312,9 @@ class Atom(object):
         # Do a shallow copy then explicitly copy what needs to be deeper.
         shallow = copy.copy(self)
         shallow.detach_parent()
+        # The copy holds its own coordinates, even if packed
+        shallow._coord_array=None
+        shallow._coord_index=None
         shallow.set_coord(copy.copy(self.get_coord()))
         shallow.xtra = self.xtra.copy()
         return shallow
@@ -327,6 +350,8 @@ class DisorderedAtom(DisorderedEntityWrapper):
         # set the residue parent of the added atom
         residue=self.get_parent()
         atom.set_parent(residue)
+        if residue is not None:
+            residue._reset_coords()
         altloc=atom.get_altloc()
         occupancy=atom.get_occupancy()
         self[altloc]=atom
@@ -334,3 +359,22 @@ class DisorderedAtom(DisorderedEntityWrapper):
             self.last_occupancy=occupancy
             self.disordered_select(altloc)
 
+
+
+def _packed_rows(atom_list):
+    """Return the packed coordinate array and row of each atom, or None (PRIVATE).
+
+    This is None unless all the atoms are packed into the same array (see
+    Entity.pack_coords), with no atom given twice.
+    """
+    coords=None
+    rows=[]
+    for atom in atom_list:
+        array=atom._coord_array
+        if array is None or (coords is not None and array is not coords):
+            return None
+        coords=array
+        rows.append(atom._coord_index)
+    if coords is None or len(set(rows))!=len(rows):
+        return None
+    return coords, numpy.array(rows, int)
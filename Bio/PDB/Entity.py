@@ -5,11 +5,17 @@
 
 from copy import copy
 
+import numpy
+
 from Bio.PDB.PDBExceptions import PDBConstructionException
 
 """Base class for Residue, Chain, Model and Structure classes.
 
 It is a simple container class, with list and dictionary like properties.
+
+The coordinates of all the atoms in an entity can be packed into a single
+array (see the pack_coords method), which saves memory for large structures
+and lets transform and center_of_mass work on the whole array at once.
 """
 
 
@@ -18,6 +24,10 @@ class Entity(object):
     Basic container object. Structure, Model, Chain and Residue
     are subclasses of Entity. It deals with storage and lookup.
     """
+    #View of the packed coordinates of the atoms, and their weights
+    _coords=None
+    _coord_weights=None
+
     def __init__(self, id):
         self.id=id
         self.full_id=None
@@ -77,6 +87,7 @@ class Entity(object):
         child.detach_parent()
         del self.child_dict[id]
         self.child_list.remove(child)
+        self._reset_coords()
 
     def add(self, entity):
         "Add a child to the Entity."
@@ -87,6 +98,7 @@ class Entity(object):
         entity.set_parent(self)
         self.child_list.append(entity)
         self.child_dict[entity_id]=entity
+        self._reset_coords()
 
     def insert(self, pos, entity):
         "Add a child to the Entity at a specified position."
@@ -97,6 +109,7 @@ class Entity(object):
         entity.set_parent(self)
         self.child_list[pos:pos] = [entity]
         self.child_dict[entity_id]=entity
+        self._reset_coords()
 
     def get_iterator(self):
         "Return iterator over children."
@@ -165,16 +178,129 @@ class Entity(object):
 
         @param tran: the translation vector
         @type tran: size 3 Numeric array
+
+        All the alternative locations of any disordered atoms (or
+        residues) are moved. If the coordinates are packed (see
+        pack_coords), all the atoms are transformed at once.
         """
+        if self._coords is not None:
+            self._coords[:]=numpy.dot(self._coords, rot)+tran
+            return
         for o in self.get_list():
             o.transform(rot, tran)
 
+    def pack_coords(self):
+        """Store the coordinates of all the atoms in a single array.
+
+        The coordinates of every Atom object in the entity (including the
+        alternative locations of disordered atoms) are copied into one
+        Nx3 array of floats, which is returned. Each atom
+        then refers to its row of this array, rather than holding its own
+        coordinate array, and each entity to its slice of the rows. The
+        atoms work as before, with get_coord returning a view of the row.
+
+        This saves memory for large structures, and makes transform and
+        center_of_mass work on all the atoms at once. Adding or removing
+        atoms or other entities afterwards is allowed, but the entities
+        they belong to then go back to working atom by atom (until the
+        coordinates are packed again). Likewise packing an entity again
+        after packing its parent leaves the parent working atom by atom.
+        """
+        parent=self.get_parent()
+        if parent is not None:
+            #The parent's slice would no longer hold these atoms
+            parent._reset_coords()
+        atoms=[]
+        entities=[]
+        self._get_packed_atoms(atoms, entities)
+        coords=numpy.array([atom.get_coord() for atom in atoms],
+                           "d").reshape(-1, 3)
+        weights=_atom_weights(atoms)
+        for index, atom in enumerate(atoms):
+            atom._coord_array=coords
+            atom._coord_index=index
+            #Drop the atom's own array (Atom.copy gives copies a new one)
+            atom.__dict__.pop("_coord", None)
+        for entity, start, end in entities:
+            entity._coords=coords[start:end]
+            entity._coord_weights=weights[start:end]
+        return coords
+
+    def get_coord_array(self):
+        """Return an Nx3 array of the coordinates of all the atoms.
+
+        This includes the alternative locations of disordered atoms, in the
+        same order as used by pack_coords. If the coordinates are packed,
+        this is a view of the packed array (so changing it moves the atoms),
+        otherwise it is a new array.
+        """
+        if self._coords is not None:
+            return self._coords
+        atoms=[]
+        self._get_packed_atoms(atoms, [])
+        return numpy.array([atom.get_coord() for atom in atoms]).reshape(-1, 3)
+
+    def center_of_mass(self, geometric=False):
+        """Return the center of mass of the atoms, as a size 3 Numeric array.
+
+        The alternative locations of disordered atoms are weighted by their
+        occupancy. If geometric is True, all the atoms have equal weight
+        (giving the centroid). Atoms whose element (and thus mass) is not
+        known give a result of NaN unless geometric is used.
+        """
+        if self._coords is not None:
+            coords=self._coords
+            weights=self._coord_weights
+        else:
+            atoms=[]
+            self._get_packed_atoms(atoms, [])
+            coords=numpy.array([atom.get_coord() for atom in atoms]).reshape(-1, 3)
+            weights=_atom_weights(atoms)
+        if geometric:
+            return coords.mean(axis=0)
+        return numpy.dot(weights, coords)/weights.sum()
+
+    def _get_packed_atoms(self, atoms, entities):
+        """Collect the atoms, and the range of rows for each entity (PRIVATE).
+
+        The Atom objects (including those of disordered atoms) are appended
+        to the atoms list, and (entity, start, end) tuples to the entities
+        list, for this entity and all those below it.
+        """
+        start=len(atoms)
+        for child in self.child_list:
+            if isinstance(child, DisorderedEntityWrapper):
+                children=child.disordered_get_list()
+            else:
+                children=[child]
+            for child in children:
+                if isinstance(child, Entity):
+                    child._get_packed_atoms(atoms, entities)
+                else:
+                    atoms.append(child)
+        entities.append((self, start, len(atoms)))
+
+    def _reset_coords(self):
+        """Forget the packed rows of this entity and its parents (PRIVATE).
+
+        This is used when the atoms of the entity change. As the parents
+        of an entity which is not packed are not packed either, this stops
+        at the first entity without packed rows.
+        """
+        entity=self
+        while entity is not None and entity._coords is not None:
+            entity._coords=None
+            entity._coord_weights=None
+            entity=entity.get_parent()
+
     def copy(self):
         shallow = copy(self)
 
         shallow.child_list = []
         shallow.child_dict = {}
         shallow.xtra = copy(self.xtra)
+        shallow._coords = None
+        shallow._coord_weights = None
 
         shallow.detach_parent()
 
@@ -183,6 +309,17 @@ class Entity(object):
         return shallow
 
 
+def _atom_weights(atoms):
+    """Return an array of the mass of each atom, times occupancy if disordered (PRIVATE)."""
+    weights=numpy.zeros(len(atoms))
+    for index, atom in enumerate(atoms):
+        weight=atom.mass
+        if atom.is_disordered() and atom.get_occupancy() is not None:
+            weight*=atom.get_occupancy()
+        weights[index]=weight
+    return weights
+
+
 class DisorderedEntityWrapper(object):
     """
     This class is a simple wrapper class that groups a number of equivalent
@@ -268,6 +405,15 @@ class DisorderedEntityWrapper(object):
         """
         self.selected_child=self.child_dict[id]
 
+    def transform(self, rot, tran):
+        """Apply rotation and translation to all the children.
+
+        Unlike most methods, this is not just forwarded to the selected
+        child, so that all the alternative locations are moved together.
+        """
+        for child in self.disordered_get_list():
+            child.transform(rot, tran)
+
     def disordered_add(self, child):
         "This is implemented by DisorderedAtom and DisorderedResidue."
         raise NotImplementedError
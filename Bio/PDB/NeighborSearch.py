@@ -26,13 +26,21 @@ class NeighborSearch(object):
     a fixed radius of each other.
 
     NeighborSearch makes use of the Bio.KDTree C++ module, so it's fast.
+
+    For many query positions at once (e.g. all the atoms of a ligand in
+    many docking poses), use search_centers or search_nearest, which do
+    all the queries in a single call to the C module and return NumPy
+    arrays of atom indices rather than lists of entities.
     """
-    def __init__(self, atom_list, bucket_size=10):
+    def __init__(self, atom_list, bucket_size=10, box=None):
         """
         o atom_list - list of atoms. This list is used in the queries.
         It can contain atoms from different structures.
         o bucket_size - bucket size of KD tree. You can play around
         with this to optimize speed if you feel like it.
+        o box - optional (a, b, c) lengths of a rectangular periodic
+        box, e.g. from a molecular dynamics simulation, in which case
+        all distances are to the nearest periodic image of each atom.
         """
         self.atom_list=atom_list
         # get the coordinates
@@ -42,7 +50,7 @@ class NeighborSearch(object):
         assert(bucket_size>1)
         assert(self.coords.shape[1]==3)
         self.kdt=KDTree(3, bucket_size)
-        self.kdt.set_coords(self.coords)
+        self.kdt.set_coords(self.coords, box)
 
     # Private
 
@@ -121,6 +129,36 @@ class NeighborSearch(object):
             if level==l:
                 return next_level_pair_list
 
+    def search_centers(self, centers, radius):
+        """Neighbor search for many query positions.
+
+        Return the atoms within radius of each row of centers, as a tuple
+        of two NumPy arrays (indices, offsets) in compressed sparse row
+        form: the atoms within radius of centers[i] are given by the
+        indices into the atom list indices[offsets[i]:offsets[i+1]].
+        The distances are then given by get_centers_radii.
+
+        o centers - Nx3 Numeric array
+        o radius - float
+        """
+        return self.kdt.search_centers(numpy.asarray(centers), radius)
+
+    def get_centers_radii(self):
+        """Return the distances of the atoms found by search_centers."""
+        return self.kdt.get_centers_radii()
+
+    def search_nearest(self, centers, k=1):
+        """Find the k nearest atoms to many query positions.
+
+        Return a tuple of two Nxk NumPy arrays (indices, radii), giving
+        the indices into the atom list and the distances of the k atoms
+        nearest to each row of centers, nearest first.
+
+        o centers - Nx3 Numeric array
+        o k - int
+        """
+        return self.kdt.search_nearest(numpy.asarray(centers), k)
+
 if __name__=="__main__":
 
     from numpy.random import random
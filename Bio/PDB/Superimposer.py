@@ -10,9 +10,23 @@ from __future__ import print_function
 import numpy
 
 from Bio.SVDSuperimposer import SVDSuperimposer
+from Bio.PDB.Atom import _packed_rows
 from Bio.PDB.PDBExceptions import PDBException
 
 
+def _get_coords(atom_list):
+    """Return an Nx3 array of the coordinates of the atoms (PRIVATE)."""
+    packed=_packed_rows(atom_list)
+    if packed is not None:
+        coords, rows=packed
+        return coords[rows]
+    l=len(atom_list)
+    coords=numpy.zeros((l, 3))
+    for i in range(0, l):
+        coords[i]=atom_list[i].get_coord()
+    return coords
+
+
 class Superimposer(object):
     """
     Rotate/translate one set of atoms on top of another,
@@ -33,12 +47,8 @@ class Superimposer(object):
         """
         if not (len(fixed)==len(moving)):
             raise PDBException("Fixed and moving atom lists differ in size")
-        l=len(fixed)
-        fixed_coord=numpy.zeros((l, 3))
-        moving_coord=numpy.zeros((l, 3))
-        for i in range(0, len(fixed)):
-            fixed_coord[i]=fixed[i].get_coord()
-            moving_coord[i]=moving[i].get_coord()
+        fixed_coord=_get_coords(fixed)
+        moving_coord=_get_coords(moving)
         sup=SVDSuperimposer()
         sup.set(fixed_coord, moving_coord)
         sup.run()
@@ -48,12 +58,28 @@ class Superimposer(object):
     def apply(self, atom_list):
         """
         Rotate/translate a list of atoms.
+
+        All the alternative locations of any disordered atoms are moved.
+        If the atoms are packed into one coordinate array (see the
+        pack_coords method of the Entity class), they are all moved
+        at once.
         """
         if self.rotran is None:
             raise PDBException("No transformation has been calculated yet")
         rot, tran=self.rotran
         rot=rot.astype('f')
         tran=tran.astype('f')
+        atoms=[]
+        for atom in atom_list:
+            if atom.is_disordered()==2:
+                atoms.extend(atom.disordered_get_list())
+            else:
+                atoms.append(atom)
+        packed=_packed_rows(atoms)
+        if packed is not None:
+            coords, rows=packed
+            coords[rows]=numpy.dot(coords[rows], rot)+tran
+            return
         for atom in atom_list:
             atom.transform(rot, tran)
 
@@ -84,14 +84,19 @@ from Bio._py3k import filter
 from Bio._py3k import range
 
 import re
+import sys
+import math
 import itertools
+import collections
+from types import ModuleType
 
 from Bio.Seq import Seq, MutableSeq
 from Bio.Alphabet import IUPAC
 
-from Bio.Restriction.Restriction_Dictionary import rest_dict as enzymedict
-from Bio.Restriction.Restriction_Dictionary import typedict
-from Bio.Restriction.Restriction_Dictionary import suppliers as suppliers_dict
+from Bio.Restriction.Restriction_Table import enzymes as enzyme_table
+from Bio.Restriction.Restriction_Table import fields as enzyme_fields
+from Bio.Restriction.Restriction_Table import types as enzyme_types
+from Bio.Restriction.Restriction_Table import suppliers as suppliers_dict
 # TODO: Consider removing this wildcard import.
 from Bio.Restriction.RanaConfig import *
 from Bio.Restriction.PrintFormat import PrintFormat
@@ -232,6 +237,199 @@ class FormattedSeq(object):
         return self.klass(self.data[i], self.alphabet)
 
 
+#Batches with fewer enzymes than this are searched one enzyme at a time,
+#as a regular expression per enzyme is then quicker than the automaton.
+_AUTOMATON_MIN_ENZYMES = 4
+
+#Most sequences the keyword of a site may expand into (e.g. CC[AT]GG -> 2)
+_MAX_KEYWORD_EXPANSIONS = 16
+
+
+def _site_patterns(enzyme):
+    """Split the compsite of an enzyme into its forward and reverse patterns (PRIVATE).
+
+    The compsite is a regular expression of the form
+    (?P<EcoRI>GAATTC)|(?P<EcoRI_as>GAATTC), where each pattern uses
+    only letters, . and character classes like [AT]. Each pattern is
+    returned as a list with one string of allowed letters per position,
+    or None for any letter.
+    """
+    patterns = []
+    for pattern in re.findall(r"\(\?P<\w+>([^)]*)\)", enzyme.compsite.pattern):
+        letters = []
+        for token in re.findall(r"\[[A-Z]+\]|\.|[A-Z]", pattern):
+            if token == ".":
+                letters.append(None)
+            else:
+                letters.append(token.strip("[]"))
+        patterns.append((pattern, letters))
+    return patterns
+
+
+def _site_keyword(letters):
+    """Choose the most specific part of a pattern to look for (PRIVATE).
+
+    Returns the (start, end) of the run of positions without any N giving
+    the most information, with at most _MAX_KEYWORD_EXPANSIONS different
+    sequences, or None if there is no such run of at least two letters.
+    """
+    best = None
+    best_score = None
+    for start in range(len(letters)):
+        expansions = 1
+        information = 0.0
+        for end in range(start, len(letters)):
+            if letters[end] is None:
+                break
+            expansions *= len(letters[end])
+            if expansions > _MAX_KEYWORD_EXPANSIONS:
+                break
+            information += 2 - math.log(len(letters[end]), 2)
+            score = (information, -expansions)
+            if best_score is None or score > best_score:
+                best = start, end + 1
+                best_score = score
+    if best_score is None or best_score[0] < 4:
+        return None
+    return best
+
+
+class _SiteAutomaton(object):
+    """Find the sites of many enzymes in a single pass (PRIVATE).
+
+    This is an Aho-Corasick automaton, built from a keyword for each
+    pattern in the compsite of the enzymes (with any ambiguous letters
+    expanded). Where the keyword is only part of the site, the rest of
+    the site is checked with the pattern as a regular expression. The
+    sites found for each enzyme are then the same as the non-overlapping
+    matches of its compsite found by FormattedSeq.finditer.
+
+    Enzymes without a suitable keyword (e.g. sites which are mostly N)
+    are searched using their own search method instead.
+    """
+
+    def __init__(self, enzymes):
+        self.enzymes = frozenset(enzymes)
+        self.others = []
+        self.sites = []
+        self.patterns = []
+        self.max_size = 0
+        pattern_ids = {}
+        keywords = {}
+        for enzyme in self.enzymes:
+            ids = []
+            for pattern, letters in _site_patterns(enzyme):
+                if pattern in pattern_ids:
+                    ids.append(pattern_ids[pattern])
+                    continue
+                keyword = _site_keyword(letters)
+                if keyword is None:
+                    break
+                start, end = keyword
+                exact = (start, end) == (0, len(letters))
+                pid = len(self.patterns)
+                pattern_ids[pattern] = pid
+                self.patterns.append(None if exact else re.compile(pattern))
+                for word in itertools.product(*letters[start:end]):
+                    keywords.setdefault("".join(word), []).append(
+                        (pid, end - 1))
+                ids.append(pid)
+            else:
+                forward = ids[0]
+                reverse = ids[-1] if ids[-1] != ids[0] else None
+                self.sites.append((enzyme, forward, reverse, len(letters)))
+                self.max_size = max(self.max_size, enzyme.size)
+                continue
+            self.others.append(enzyme)
+        self._build(keywords)
+
+    def _build(self, keywords):
+        """Build the transition table of the automaton (PRIVATE)."""
+        delta = [{}]
+        outputs = [[]]
+        for word, matches in keywords.items():
+            state = 0
+            for letter in word:
+                if letter not in delta[state]:
+                    delta[state][letter] = len(delta)
+                    delta.append({})
+                    outputs.append([])
+                state = delta[state][letter]
+            outputs[state].extend(matches)
+        #Breadth first, filling in the missing transitions from the
+        #state of the longest proper suffix (the failure link)
+        fail = [0] * len(delta)
+        queue = collections.deque()
+        for letter in "ACGT":
+            if letter in delta[0]:
+                queue.append(delta[0][letter])
+            else:
+                delta[0][letter] = 0
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            for letter in "ACGT":
+                if letter in delta[state]:
+                    child = delta[state][letter]
+                    fail[child] = delta[fail[state]][letter]
+                    queue.append(child)
+                else:
+                    delta[state][letter] = delta[fail[state]][letter]
+        #Any other letter (e.g. N) or the leading space goes back to the start
+        for transitions in delta:
+            for letter in " BDHKMNRSVWY":
+                transitions[letter] = 0
+        self._delta = delta
+        self._outputs = [tuple(matches) for matches in outputs]
+
+    def search(self, dna):
+        """Return a dictionary of the enzymes and their cuts in a FormattedSeq."""
+        data = dna.data
+        if not dna.is_linear():
+            data = data + data[1:self.max_size]
+        delta = self._delta
+        outputs = self._outputs
+        hits = [[] for pattern in self.patterns]
+        state = 0
+        for i, letter in enumerate(data):
+            state = delta[state][letter]
+            if outputs[state]:
+                for pid, shift in outputs[state]:
+                    hits[pid].append(i - shift)
+        for pid, pattern in enumerate(self.patterns):
+            if pattern is not None:
+                match = pattern.match
+                hits[pid] = [p for p in hits[pid] if p > 0 and match(data, p)]
+        mapping = {}
+        length = len(dna.data)
+        for enzyme, forward, reverse, size in self.sites:
+            #Last start position of a site, as in FormattedSeq.finditer
+            if dna.is_linear():
+                limit = length - size
+            else:
+                limit = length + min(enzyme.size - 1, length - 1) - size
+            if reverse is None:
+                starts = hits[forward]
+                on_plus = None
+            else:
+                on_plus = set(hits[forward])
+                starts = sorted(on_plus.union(hits[reverse]))
+            #Only keep non-overlapping sites, like re.finditer
+            sites = []
+            after = 0
+            for start in starts:
+                if start > limit:
+                    break
+                if start >= after:
+                    sites.append((start, on_plus is None or start in on_plus))
+                    after = start + size
+            enzyme.dna = dna
+            mapping[enzyme] = enzyme._cut_results(sites)
+        for enzyme in self.others:
+            mapping[enzyme] = enzyme.search(dna)
+        return mapping
+
+
 class RestrictionType(type):
     """RestrictionType. Type from which derives all enzyme classes.
 
@@ -521,7 +719,7 @@ class AbstractCut(RestrictionType):
 
         equischizomer <=> same site, same position of restriction."""
         if not batch:
-            batch = AllEnzymes
+            batch = _all_enzymes()
         r = [x for x in batch if not self != x]
         i = r.index(self)
         del r[i]
@@ -537,7 +735,7 @@ class AbstractCut(RestrictionType):
 
         neoschizomer <=> same site, different position of restriction."""
         if not batch:
-            batch = AllEnzymes
+            batch = _all_enzymes()
         r = sorted(x for x in batch if self >> x)
         return r
 
@@ -548,7 +746,7 @@ class AbstractCut(RestrictionType):
         return a tuple of all the equischizomers and neoschizomers of RE.
         if batch is supplied it is used instead of the default AllEnzymes."""
         if not batch:
-            batch = AllEnzymes
+            batch = _all_enzymes()
         r = [x for x in batch if (self >> x) or (not self != x)]
         i = r.index(self)
         del r[i]
@@ -837,7 +1035,18 @@ class Palindromic(AbstractCut):
         implement the search method for palindromic and non palindromic enzyme.
         """
         siteloc = self.dna.finditer(self.compsite, self.size)
-        self.results = [r for s, g in siteloc for r in self._modify(s)]
+        return self._cut_results((s, True) for s, g in siteloc)
+
+    @classmethod
+    def _cut_results(self, sites):
+        """RE._cut_results(sites) -> list.
+
+        for internal use only.
+
+        sites is an iterable of (location, forward) tuples, as found in
+        self.dna. Return the positions of the cuts.
+        """
+        self.results = [r for s, f in sites for r in self._modify(s)]
         if self.results:
             self._drop()
         return self.results
@@ -867,13 +1076,26 @@ class NonPalindromic(AbstractCut):
         implement the search method for palindromic and non palindromic enzyme.
         """
         iterator = self.dna.finditer(self.compsite, self.size)
+        s = str(self)
+        return self._cut_results((start, bool(group(s)))
+                                 for start, group in iterator)
+
+    @classmethod
+    def _cut_results(self, sites):
+        """RE._cut_results(sites) -> list.
+
+        for internal use only.
+
+        sites is an iterable of (location, forward) tuples, as found in
+        self.dna, where forward is False for the sites on the antiparallel
+        strand. Return the positions of the cuts.
+        """
         self.results = []
         modif = self._modify
         revmodif = self._rev_modify
-        s = str(self)
         self.on_minus = []
-        for start, group in iterator:
-            if group(s):
+        for start, forward in sites:
+            if forward:
                 self.results += [r for r in modif(start)]
             else:
                 self.on_minus += [r for r in revmodif(start)]
@@ -1082,8 +1304,8 @@ class Blunt(AbstractCut):
 
         list of all the enzymes that share compatible end with RE."""
         if not batch:
-            batch = AllEnzymes
-        r = sorted(x for x in iter(AllEnzymes) if x.is_blunt())
+            batch = _all_enzymes()
+        r = sorted(x for x in iter(_all_enzymes()) if x.is_blunt())
         return r
 
     @staticmethod
@@ -1202,8 +1424,8 @@ class Ov5(AbstractCut):
 
         list of all the enzymes that share compatible end with RE."""
         if not batch:
-            batch = AllEnzymes
-        r = sorted(x for x in iter(AllEnzymes) if x.is_5overhang() and x % self)
+            batch = _all_enzymes()
+        r = sorted(x for x in iter(_all_enzymes()) if x.is_5overhang() and x % self)
         return r
 
     @classmethod
@@ -1325,8 +1547,8 @@ class Ov3(AbstractCut):
 
         list of all the enzymes that share compatible end with RE."""
         if not batch:
-            batch = AllEnzymes
-        r = sorted(x for x in iter(AllEnzymes) if x.is_3overhang() and x % self)
+            batch = _all_enzymes()
+        r = sorted(x for x in iter(_all_enzymes()) if x.is_3overhang() and x % self)
         return r
 
     @classmethod
@@ -1847,7 +2069,7 @@ class RestrictionBatch(set):
     def __init__(self, first=[], suppliers=[]):
         """RestrictionBatch([sequence]) -> new RestrictionBatch."""
         first = [self.format(x) for x in first]
-        first += [eval(x) for n in suppliers for x in suppliers_dict[n][1]]
+        first += [_get_enzyme(x) for n in suppliers for x in suppliers_dict[n][1]]
         set.__init__(self, first)
         self.mapping = dict.fromkeys(self)
         self.already_mapped = None
@@ -1912,7 +2134,7 @@ class RestrictionBatch(set):
         supplier = suppliers_dict[letter]
         self.suppliers.append(letter)
         for x in supplier[1]:
-            self.add_nocheck(eval(x))
+            self.add_nocheck(_get_enzyme(x))
         return
 
     def current_suppliers(self):
@@ -1961,25 +2183,21 @@ class RestrictionBatch(set):
         """B.format(y) -> RestrictionType or raise ValueError.
 
         if y is a RestrictionType return y
-        if y can be evaluated to a RestrictionType return eval(y)
+        if y is the name of a RestrictionType return this enzyme
         raise a Value Error in all other case."""
+        if isinstance(y, RestrictionType):
+            return y
         try:
-            if isinstance(y, RestrictionType):
-                return y
-            elif isinstance(eval(str(y)), RestrictionType):
-                return eval(y)
-            else:
-                pass
-        except (NameError, SyntaxError):
+            return _get_enzyme(str(y))
+        except KeyError:
             pass
         raise ValueError('%s is not a RestrictionType' % y.__class__)
 
     def is_restriction(self, y):
         """B.is_restriction(y) -> bool.
 
-        True is y or eval(y) is a RestrictionType."""
-        return isinstance(y, RestrictionType) or \
-               isinstance(eval(str(y)), RestrictionType)
+        True is y is a RestrictionType or the name of one."""
+        return isinstance(y, RestrictionType) or str(y) in enzyme_table
 
     def split(self, *classes, **bool):
         """B.split(class, [class.__name__ = True]) -> new RestrictionBatch.
@@ -2052,18 +2270,137 @@ class RestrictionBatch(set):
             else:
                 self.already_mapped = str(dna), linear
                 fseq = FormattedSeq(dna, linear)
-                self.mapping = dict((x, x.search(fseq)) for x in self)
+                self.mapping = self._search_all(fseq)
                 return self.mapping
         elif isinstance(dna, FormattedSeq):
             if (str(dna), dna.linear) == self.already_mapped:
                 return self.mapping
             else:
                 self.already_mapped = str(dna), dna.linear
-                self.mapping = dict((x, x.search(dna)) for x in self)
+                self.mapping = self._search_all(dna)
                 return self.mapping
         raise TypeError("Expected Seq or MutableSeq instance, got %s instead"
                         %type(dna))
 
+    def search_records(self, records, linear=True, processes=None):
+        """B.search_records(records, linear=True, processes=None) -> iterator.
+
+        search each SeqRecord in records (any iterable, e.g. from
+        Bio.SeqIO.parse) and return an iterator of tuples:
+            (record.id, mapping, fragments)
+        mapping is the dictionary of the enzymes and their cuts as given
+        by B.search(record.seq, linear), and fragments is the list of the
+        fragment sizes produced by cutting the record with all the enzymes
+        of B together. As with catalyse, for a circular sequence the
+        fragment spanning the origin is given first. Enzymes which do not
+        cut (NoCut) are ignored for the fragments.
+
+        Unlike B.search, the results are not kept in B.mapping.
+
+        if processes is more than one, the records are shared between a
+        pool of worker processes, with at most two batches of records per
+        process queued at a time. The results are still returned in the
+        order of the records."""
+        if processes is not None and processes > 1:
+            return _search_records_parallel(self, records, linear, processes)
+        return self._search_records(records, linear)
+
+    def _search_records(self, records, linear):
+        """B._search_records(records, linear) -> iterator.
+
+        for internal use only.
+
+        implement B.search_records in the current process."""
+        for record in records:
+            fseq = FormattedSeq(record.seq, linear)
+            mapping = self._search_all(fseq)
+            yield record.id, mapping, _fragment_sizes(mapping, len(fseq),
+                                                      linear)
+
+    def _search_all(self, fseq):
+        """B._search_all(fseq) -> dict.
+
+        for internal use only.
+
+        search the FormattedSeq for all the enzymes of B. For large batches
+        this is done in a single pass over the sequence, using an automaton
+        which is kept until the enzymes in B change."""
+        if len(self) < _AUTOMATON_MIN_ENZYMES:
+            return dict((x, x.search(fseq)) for x in self)
+        automaton = getattr(self, "_automaton", None)
+        if automaton is None or automaton.enzymes != self:
+            automaton = self._automaton = _SiteAutomaton(self)
+        return automaton.search(fseq)
+
+def _fragment_sizes(mapping, length, linear):
+    """Return the fragment sizes from cutting with all the enzymes (PRIVATE).
+
+    mapping is a dictionary of the enzymes and their cuts, as given by
+    RestrictionBatch.search, for a sequence of the given length.
+    """
+    cuts = set()
+    for enzyme, positions in mapping.items():
+        if enzyme.cut_once() or enzyme.cut_twice():
+            cuts.update(positions)
+    if linear:
+        cuts = [1] + sorted(c for c in cuts if 1 < c <= length) + [length + 1]
+        return [cuts[i+1] - cuts[i] for i in range(len(cuts) - 1)]
+    cuts = sorted(cuts)
+    if not cuts:
+        return [length]
+    sizes = [length + cuts[0] - cuts[-1]]
+    sizes += [cuts[i+1] - cuts[i] for i in range(len(cuts) - 1)]
+    return sizes
+
+
+#Number of records sent to a worker process at a time
+_SEARCH_CHUNK_SIZE = 100
+
+_worker_batch = None   # the RestrictionBatch in a worker process
+
+
+def _init_search_worker(batch):
+    """Store the batch once per worker process (PRIVATE)."""
+    global _worker_batch
+    _worker_batch = batch
+
+
+def _search_chunk(chunk, linear):
+    """Search a list of (record id, sequence string) pairs (PRIVATE)."""
+    results = []
+    for record_id, sequence in chunk:
+        fseq = FormattedSeq(DNA(sequence), linear)
+        mapping = _worker_batch._search_all(fseq)
+        results.append((record_id, mapping,
+                        _fragment_sizes(mapping, len(fseq), linear)))
+    return results
+
+
+def _search_records_parallel(batch, records, linear, processes):
+    """Share out the records between a pool of processes (PRIVATE)."""
+    from multiprocessing import Pool
+
+    records = iter(records)
+    pool = Pool(processes, _init_search_worker, (RestrictionBatch(batch),))
+    try:
+        pending = collections.deque()
+        while True:
+            chunk = [(record.id, str(record.seq))
+                     for record in itertools.islice(records, _SEARCH_CHUNK_SIZE)]
+            if not chunk:
+                break
+            pending.append(pool.apply_async(_search_chunk, (chunk, linear)))
+            while len(pending) >= 2 * processes:
+                for result in pending.popleft().get():
+                    yield result
+        while pending:
+            for result in pending.popleft().get():
+                yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 ###############################################################################
 #                                                                             #
 #                       Restriction Analysis                                  #
@@ -2260,7 +2597,7 @@ class Analysis(RestrictionBatch, PrintFormat):
 
          Limit the search to the enzymes named in list_of_names."""
         for i, enzyme in enumerate(names):
-            if not enzyme in AllEnzymes:
+            if not enzyme in _all_enzymes():
                 print("no data for the enzyme: %s" % name)
                 del names[i]
         if not dct:
@@ -2377,82 +2714,154 @@ class Analysis(RestrictionBatch, PrintFormat):
         return d
 
 #
-#   The restriction enzyme classes are created dynamically when the module is
-#   imported. Here is the magic which allow the creation of the
-#   restriction-enzyme classes.
+#   The restriction enzyme classes are created dynamically. Here is the
+#   magic which allow the creation of the restriction-enzyme classes.
 #
-#   The reason for the two dictionaries in Restriction_Dictionary
-#   one for the types (which will be called pseudo-type as they really
-#   correspond to the values that instances of RestrictionType can take)
-#   and one for the enzymes is efficiency as the bases are evaluated
-#   once per pseudo-type.
+#   The data comes from the compact table in Restriction_Table, which is
+#   built from Restriction_Dictionary. The enzymes are grouped by their
+#   pseudo-type (as they really correspond to the values that instances of
+#   RestrictionType can take), so the bases are evaluated once per
+#   pseudo-type.
 #
-#   However Restriction is still a very inefficient module at import. But
-#   remember that around 660 classes (which is more or less the size of Rebase)
-#   have to be created dynamically. However, this processing take place only
-#   once.
-#   This inefficiency is however largely compensated by the use of metaclass
-#   which provide a very efficient layout for the class themselves mostly
-#   alleviating the need of if/else loops in the class methods.
+#   Creating around 750 classes (which is more or less the size of Rebase)
+#   takes a while, so rather than creating them all when the module is
+#   imported, each enzyme class is created the first time it is used, e.g.
+#   by "from Bio.Restriction import EcoRI". The batches AllEnzymes, CommOnly
+#   and NonComm need all the enzymes, so they are also only created when
+#   first used. For this, the module is replaced in sys.modules by a
+#   _LazyModule (see below).
+#   The use of metaclass provide a very efficient layout for the class
+#   themselves mostly alleviating the need of if/else loops in the class
+#   methods.
 #
-#   It is essential to run Restriction with doc string optimisation (-OO switch)
-#   as the doc string of 660 classes take a lot of processing.
-#
-CommOnly = RestrictionBatch()    # commercial enzymes
-NonComm = RestrictionBatch()     # not available commercially
-for TYPE, (bases, enzymes) in typedict.items():
-    #
-    #   The keys are the pseudo-types TYPE (stored as type1, type2...)
-    #   The names are not important and are only present to differentiate
-    #   the keys in the dict. All the pseudo-types are in fact RestrictionType.
-    #   These names will not be used after and the pseudo-types are not
-    #   kept in the locals() dictionary. It is therefore impossible to
-    #   import them.
-    #   Now, if you have look at the dictionary, you will see that not all the
-    #   types are present as those without corresponding enzymes have been
-    #   removed by Dictionary_Builder().
-    #
-    #   The values are tuples which contain
-    #   as first element a tuple of bases (as string) and
-    #   as second element the names of the enzymes.
+_pseudo_types = {}    # index in enzyme_types -> (pseudo-type, bases)
+_enzymes = {}         # name -> enzyme class
+_batch_names = ('AllEnzymes', 'CommOnly', 'NonComm')
+
+
+def _get_enzyme(name):
+    """Return the enzyme class of the given name, creating it if need be (PRIVATE).
+
+    Raise a KeyError if there is no enzyme of that name.
+    """
+    try:
+        return _enzymes[name]
+    except KeyError:
+        pass
+    type_index, values = enzyme_table[name]
+    try:
+        T, bases = _pseudo_types[type_index]
+    except KeyError:
+        #
+        #   First eval the bases, then create the particular value of
+        #   RestrictionType for the enzymes of this pseudo-type.
+        #
+        bases = tuple(globals()[x] for x in enzyme_types[type_index])
+        T = type.__new__(RestrictionType, 'RestrictionType', bases, {})
+        _pseudo_types[type_index] = T, bases
     #
-    #   First eval the bases.
+    #   The values of the attributes for this particular class (self.site,
+    #   self.ovhg,....), plus those left out of the table.
     #
-    bases = tuple(eval(x) for x in bases)
+    attributes = dict(zip(enzyme_fields, values))
+    attributes['charac'] = (attributes['fst5'], attributes['fst3'],
+                            attributes['scd5'], attributes['scd3'],
+                            attributes['site'])
+    attributes['dna'] = attributes['results'] = None
+    attributes['substrat'] = 'DNA'
+    newenz = T(name, bases, attributes)
     #
-    #   now create the particular value of RestrictionType for the classes
-    #   in enzymes.
+    #   place the enzyme in globals so it can be imported.
     #
-    T = type.__new__(RestrictionType, 'RestrictionType', bases, {})
-    for k in enzymes:
-        #
-        #   Now, we go through all the enzymes and assign them their type.
-        #   enzymedict[k] contains the values of the attributes for this
-        #   particular class (self.site, self.ovhg,....).
-        #
-        newenz = T(k, bases, enzymedict[k])
-        #
-        #   we add the enzymes to the corresponding batch.
+    _enzymes[name] = globals()[name] = newenz
+    return newenz
+
+
+def _get_batch(name):
+    """Return AllEnzymes, CommOnly or NonComm, creating them if need be (PRIVATE)."""
+    namespace = globals()
+    if name not in namespace:
+        CommOnly = RestrictionBatch()    # commercial enzymes
+        NonComm = RestrictionBatch()     # not available commercially
+        for enzyme in sorted(enzyme_table):
+            newenz = _get_enzyme(enzyme)
+            #
+            #   No need to verify the enzyme is a RestrictionType -> add_nocheck
+            #
+            if newenz.is_comm():
+                CommOnly.add_nocheck(newenz)
+            else:
+                NonComm.add_nocheck(newenz)
+        namespace['CommOnly'] = CommOnly
+        namespace['NonComm'] = NonComm
         #
-        #   No need to verify the enzyme is a RestrictionType -> add_nocheck
+        #   AllEnzymes is a RestrictionBatch with all the enzymes from Rebase.
+        #   (Using RestrictionBatch as on Python 3 the union is a plain set)
         #
-        if newenz.is_comm():
-            CommOnly.add_nocheck(newenz)
-        else:
-            NonComm.add_nocheck(newenz)
-#
-#   AllEnzymes is a RestrictionBatch with all the enzymes from Rebase.
-#
-AllEnzymes = CommOnly | NonComm
-#
-#   Now, place the enzymes in locals so they can be imported.
-#
-names = [str(x) for x in AllEnzymes]
-try:
-    del x
-except NameError:
-    #Scoping changed in Python 3, the variable isn't leaked
-    pass
-locals().update(dict(zip(names, AllEnzymes)))
-__all__=['FormattedSeq', 'Analysis', 'RestrictionBatch', 'AllEnzymes', 'CommOnly', 'NonComm']+names
-del k, enzymes, TYPE, bases, names
+        namespace['AllEnzymes'] = RestrictionBatch(CommOnly | NonComm)
+    return namespace[name]
+
+
+def _all_enzymes():
+    """Return the AllEnzymes batch (PRIVATE)."""
+    return _get_batch('AllEnzymes')
+
+
+def _lazy_attribute(name):
+    """Return an enzyme or batch, creating it if need be (PRIVATE).
+
+    Raise a KeyError if name is neither.
+    """
+    if name in _batch_names:
+        return _get_batch(name)
+    return _get_enzyme(name)
+
+
+class _LazyModule(ModuleType):
+    """Module which creates the enzymes when first used (PRIVATE).
+
+    This takes the place of the module in sys.modules, and looks up (and
+    sets) the attributes in the namespace of the original module. When an
+    attribute is missing, but is the name of an enzyme or batch, this is
+    created with _lazy_attribute.
+    """
+
+    def __init__(self, module):
+        ModuleType.__init__(self, module.__name__, module.__doc__)
+        for key in ('__file__', '__path__', '__package__', '__loader__',
+                    '__spec__'):
+            if key in module.__dict__:
+                self.__dict__[key] = module.__dict__[key]
+        #Keeping a reference stops Python 2 clearing the original namespace
+        self.__dict__['_module'] = module
+
+    def __getattr__(self, name):
+        namespace = self.__dict__['_module'].__dict__
+        try:
+            return namespace[name]
+        except KeyError:
+            pass
+        try:
+            value = _lazy_attribute(name)
+        except KeyError:
+            raise AttributeError("'module' object has no attribute %r"
+                                 % name)
+        namespace[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self.__dict__['_module'], name, value)
+
+    def __delattr__(self, name):
+        delattr(self.__dict__['_module'], name)
+
+    def __dir__(self):
+        names = set(self.__dict__['_module'].__dict__)
+        names.update(enzyme_table)
+        names.update(_batch_names)
+        return sorted(names)
+
+
+__all__ = ['FormattedSeq', 'Analysis', 'RestrictionBatch', 'AllEnzymes',
+           'CommOnly', 'NonComm'] + sorted(enzyme_table)
+sys.modules[__name__] = _LazyModule(sys.modules[__name__])
@@ -0,0 +1,929 @@
+#!/usr/bin/env python
+#
+#      Restriction Analysis Libraries.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+#
+# This file is automatically generated - do not edit it by hand! Instead,
+# use the tool Scripts/Restriction/ranacompiler.py which in turn uses
+# Bio/Restriction/_Update/RestrictionCompiler.py and TableCompiler.py
+#
+# This is a compact version of Restriction_Dictionary.py, with one tuple
+# of values per enzyme in the order given by fields. As in that file, the
+# data is split between temporary functions to avoid the JVM limits of
+# Jython.
+
+fields = ('compsite', 'site', 'size', 'fst5', 'fst3', 'scd5', 'scd3', 'ovhg', 'ovhgseq', 'freq', 'opt_temp', 'inact_temp', 'suppl')
+
+#The base classes of each type of enzyme
+types = (
+    ('NonPalindromic', 'NoCut', 'Unknown', 'NotDefined', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'NoCut', 'Unknown', 'NotDefined', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Blunt', 'Defined', 'Meth_Dep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Blunt', 'Defined', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Blunt', 'Defined', 'Meth_Undep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Blunt', 'Defined', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Defined', 'Meth_Dep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Defined', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Defined', 'Meth_Undep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Defined', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Ambiguous', 'Meth_Dep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Ambiguous', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Ambiguous', 'Meth_Undep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov5', 'Ambiguous', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Defined', 'Meth_Dep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Defined', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Defined', 'Meth_Undep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Defined', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Ambiguous', 'Meth_Dep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Ambiguous', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Ambiguous', 'Meth_Undep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'OneCut', 'Ov3', 'Ambiguous', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'TwoCuts', 'Ov5', 'Ambiguous', 'Meth_Dep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'TwoCuts', 'Ov3', 'Ambiguous', 'Meth_Dep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'TwoCuts', 'Ov3', 'Ambiguous', 'Meth_Undep', 'Commercially_available', 'AbstractCut', 'RestrictionType'),
+    ('NonPalindromic', 'TwoCuts', 'Ov3', 'Ambiguous', 'Meth_Undep', 'Not_available', 'AbstractCut', 'RestrictionType'),
+)
+
+#The type index and values of the fields for each enzyme
+enzymes = {}
+def _temp():
+    return {
+        'AanI': (4, ('(?P<AanI>TTATAA)|(?P<AanI_as>TTATAA)', 'TTATAA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'AarI': (12, ('(?P<AarI>CACCTGC)|(?P<AarI_as>GCAGGTG)', 'CACCTGC', 7, 11, 8, None, None, -4, 'NNNN', 16384, 37, 65, ('F',))),
+        'AasI': (20, ('(?P<AasI>GAC......GTC)|(?P<AasI_as>GAC......GTC)', 'GACNNNNNNGTC', 12, 7, -7, None, None, 2, 'NN', 4096, 37, 65, ('F',))),
+        'AatI': (4, ('(?P<AatI>AGGCCT)|(?P<AatI_as>AGGCCT)', 'AGGCCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('O',))),
+        'AatII': (16, ('(?P<AatII>GACGTC)|(?P<AatII_as>GACGTC)', 'GACGTC', 6, 5, -5, None, None, 4, 'ACGT', 4096, 37, 65, ('F', 'I', 'K', 'M', 'N', 'O', 'R', 'V'))),
+        'AbsI': (8, ('(?P<AbsI>CCTCGAGG)|(?P<AbsI_as>CCTCGAGG)', 'CCTCGAGG', 8, 2, -2, None, None, -4, 'TCGA', 65536, 37, 65, ('I',))),
+        'Acc16I': (4, ('(?P<Acc16I>TGCGCA)|(?P<Acc16I_as>TGCGCA)', 'TGCGCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'Acc36I': (12, ('(?P<Acc36I>ACCTGC)|(?P<Acc36I_as>GCAGGT)', 'ACCTGC', 6, 10, 8, None, None, -4, 'NNNN', 4096, 37, 65, ('I',))),
+        'Acc65I': (8, ('(?P<Acc65I>GGTACC)|(?P<Acc65I_as>GGTACC)', 'GGTACC', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('F', 'I', 'N', 'R', 'V', 'W'))),
+        'AccB1I': (12, ('(?P<AccB1I>GG[CT][AG]CC)|(?P<AccB1I_as>GG[CT][AG]CC)', 'GGYRCC', 6, 1, -1, None, None, -4, 'GYRC', 1024, 37, 65, ('I', 'V'))),
+        'AccB7I': (20, ('(?P<AccB7I>CCA.....TGG)|(?P<AccB7I_as>CCA.....TGG)', 'CCANNNNNTGG', 11, 7, -7, None, None, 3, 'NNN', 4096, 37, 65, ('I', 'R', 'V'))),
+        'AccBSI': (4, ('(?P<AccBSI>CCGCTC)|(?P<AccBSI_as>GAGCGG)', 'CCGCTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'AccI': (10, ('(?P<AccI>GT[AC][GT]AC)|(?P<AccI_as>GT[AC][GT]AC)', 'GTMKAC', 6, 2, -2, None, None, -2, 'MK', 1024, 37, 65, ('B', 'J', 'K', 'M', 'N', 'O', 'R', 'S', 'U', 'W', 'X'))),
+        'AccII': (4, ('(?P<AccII>CGCG)|(?P<AccII_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('J', 'K'))),
+        'AccIII': (8, ('(?P<AccIII>TCCGGA)|(?P<AccIII_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('J', 'K', 'R', 'W'))),
+        'AceIII': (13, ('(?P<AceIII>CAGCTC)|(?P<AceIII_as>GAGCTG)', 'CAGCTC', 6, 13, 11, None, None, -4, 'NNNN', 4096, 37, 65, ())),
+        'AciI': (6, ('(?P<AciI>CCGC)|(?P<AciI_as>GCGG)', 'CCGC', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('N',))),
+        'AclI': (6, ('(?P<AclI>AACGTT)|(?P<AclI_as>AACGTT)', 'AACGTT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('I', 'N', 'V'))),
+        'AclWI': (12, ('(?P<AclWI>GGATC)|(?P<AclWI_as>GATCC)', 'GGATC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ('I',))),
+        'AcoI': (8, ('(?P<AcoI>[CT]GGCC[AG])|(?P<AcoI_as>[CT]GGCC[AG])', 'YGGCCR', 6, 1, -1, None, None, -4, 'GGCC', 1024, 37, 65, ('I',))),
+        'AcsI': (8, ('(?P<AcsI>[AG]AATT[CT])|(?P<AcsI_as>[AG]AATT[CT])', 'RAATTY', 6, 1, -1, None, None, -4, 'AATT', 1024, 37, 65, ('I', 'V'))),
+        'AcuI': (20, ('(?P<AcuI>CTGAAG)|(?P<AcuI_as>CTTCAG)', 'CTGAAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ('I', 'N'))),
+        'AcvI': (4, ('(?P<AcvI>CACGTG)|(?P<AcvI_as>CACGTG)', 'CACGTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('Q', 'X'))),
+        'AcyI': (8, ('(?P<AcyI>G[AG]CG[CT]C)|(?P<AcyI_as>G[AG]CG[CT]C)', 'GRCGYC', 6, 2, -2, None, None, -2, 'CG', 1024, 37, 65, ('J', 'M'))),
+        'AdeI': (20, ('(?P<AdeI>CAC...GTG)|(?P<AdeI_as>CAC...GTG)', 'CACNNNGTG', 9, 6, -6, None, None, 3, 'NNN', 4096, 37, 65, ('F',))),
+        'AfaI': (4, ('(?P<AfaI>GTAC)|(?P<AfaI_as>GTAC)', 'GTAC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('K',))),
+        'AfeI': (4, ('(?P<AfeI>AGCGCT)|(?P<AfeI_as>AGCGCT)', 'AGCGCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'N'))),
+        'AfiI': (20, ('(?P<AfiI>CC.......GG)|(?P<AfiI_as>CC.......GG)', 'CCNNNNNNNGG', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('V',))),
+        'AflII': (8, ('(?P<AflII>CTTAAG)|(?P<AflII_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('J', 'K', 'N'))),
+        'AflIII': (10, ('(?P<AflIII>AC[AG][CT]GT)|(?P<AflIII_as>AC[AG][CT]GT)', 'ACRYGT', 6, 1, -1, None, None, -4, 'CRYG', 1024, 37, 65, ('M', 'N', 'W'))),
+        'AgeI': (6, ('(?P<AgeI>ACCGGT)|(?P<AgeI_as>ACCGGT)', 'ACCGGT', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('J', 'N', 'R'))),
+        'AgsI': (20, ('(?P<AgsI>TT[CG]AA)|(?P<AgsI_as>TT[CG]AA)', 'TTSAA', 5, 3, -3, None, None, 1, 'S', 512, 37, 65, ('I',))),
+        'AhaIII': (5, ('(?P<AhaIII>TTTAAA)|(?P<AhaIII_as>TTTAAA)', 'TTTAAA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ())),
+        'AhdI': (20, ('(?P<AhdI>GAC.....GTC)|(?P<AhdI_as>GAC.....GTC)', 'GACNNNNNGTC', 11, 6, -6, None, None, 1, 'N', 4096, 37, 65, ('N',))),
+        'AhlI': (8, ('(?P<AhlI>ACTAGT)|(?P<AhlI_as>ACTAGT)', 'ACTAGT', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('I', 'V'))),
+        'AjiI': (4, ('(?P<AjiI>CACGTC)|(?P<AjiI_as>GACGTG)', 'CACGTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'AjnI': (12, ('(?P<AjnI>CC[AT]GG)|(?P<AjnI_as>CC[AT]GG)', 'CCWGG', 5, 0, 0, None, None, -5, 'CCWGG', 512, 37, 65, ('I',))),
+        'AjuI': (24, ('(?P<AjuI>GAA.......TTGG)|(?P<AjuI_as>CCAA.......TTC)', 'GAANNNNNNNTTGG', 14, -7, -26, 25, 6, 5, 'NNNNN', 16384, 37, 65, ('F',))),
+        'AleI': (4, ('(?P<AleI>CAC....GTG)|(?P<AleI_as>CAC....GTG)', 'CACNNNNGTG', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'AlfI': (24, ('(?P<AlfI>GCA......TGC)|(?P<AlfI_as>GCA......TGC)', 'GCANNNNNNTGC', 12, -10, -24, 24, 10, 2, 'NN', 4096, 37, 65, ('F',))),
+        'AloI': (23, ('(?P<AloI>GAAC......TCC)|(?P<AloI_as>GGA......GTTC)', 'GAACNNNNNNTCC', 13, -7, -25, 25, 7, 5, 'NNNNN', 16384, 37, 65, ('F',))),
+        'AluBI': (4, ('(?P<AluBI>AGCT)|(?P<AluBI_as>AGCT)', 'AGCT', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('I',))),
+        'AluI': (2, ('(?P<AluI>AGCT)|(?P<AluI_as>AGCT)', 'AGCT', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'Alw21I': (20, ('(?P<Alw21I>G[AT]GC[AT]C)|(?P<Alw21I_as>G[AT]GC[AT]C)', 'GWGCWC', 6, 5, -5, None, None, 4, 'WGCW', 1024, 37, 65, ('F',))),
+        'Alw26I': (10, ('(?P<Alw26I>GTCTC)|(?P<Alw26I_as>GAGAC)', 'GTCTC', 5, 6, 5, None, None, -4, 'NNNN', 1024, 37, 65, ('F',))),
+        'Alw44I': (8, ('(?P<Alw44I>GTGCAC)|(?P<Alw44I_as>GTGCAC)', 'GTGCAC', 6, 1, -1, None, None, -4, 'TGCA', 4096, 37, 65, ('F', 'J', 'O', 'R'))),
+        'AlwFI': (1, ('(?P<AlwFI>GAAA[CT].....[AG]TG)|(?P<AlwFI_as>CA[CT].....[AG]TTTC)', 'GAAAYNNNNNRTG', 13, None, None, None, None, None, None, 16384, 37, 65, ())),
+        'AlwI': (10, ('(?P<AlwI>GGATC)|(?P<AlwI_as>GATCC)', 'GGATC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ('N',))),
+        'AlwNI': (20, ('(?P<AlwNI>CAG...CTG)|(?P<AlwNI_as>CAG...CTG)', 'CAGNNNCTG', 9, 6, -6, None, None, 3, 'NNN', 4096, 37, 65, ('N',))),
+        'Ama87I': (12, ('(?P<Ama87I>C[CT]CG[AG]G)|(?P<Ama87I_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 1, -1, None, None, -4, 'YCGR', 1024, 37, 65, ('I', 'V'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'Aor13HI': (8, ('(?P<Aor13HI>TCCGGA)|(?P<Aor13HI_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('K',))),
+        'Aor51HI': (4, ('(?P<Aor51HI>AGCGCT)|(?P<Aor51HI_as>AGCGCT)', 'AGCGCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('K',))),
+        'ApaBI': (21, ('(?P<ApaBI>GCA.....TGC)|(?P<ApaBI_as>GCA.....TGC)', 'GCANNNNNTGC', 11, 8, -8, None, None, 5, 'NNNNN', 4096, 37, 65, ())),
+        'ApaI': (14, ('(?P<ApaI>GGGCCC)|(?P<ApaI_as>GGGCCC)', 'GGGCCC', 6, 5, -5, None, None, 4, 'GGCC', 4096, 37, 65, ('B', 'F', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X'))),
+        'ApaLI': (6, ('(?P<ApaLI>GTGCAC)|(?P<ApaLI_as>GTGCAC)', 'GTGCAC', 6, 1, -1, None, None, -4, 'TGCA', 4096, 37, 65, ('C', 'K', 'N', 'U'))),
+        'ApeKI': (10, ('(?P<ApeKI>GC[AT]GC)|(?P<ApeKI_as>GC[AT]GC)', 'GCWGC', 5, 1, -1, None, None, -3, 'CWG', 512, 37, 65, ('N',))),
+        'ApoI': (6, ('(?P<ApoI>[AG]AATT[CT])|(?P<ApoI_as>[AG]AATT[CT])', 'RAATTY', 6, 1, -1, None, None, -4, 'AATT', 1024, 37, 65, ('N',))),
+        'ApyPI': (21, ('(?P<ApyPI>ATCGAC)|(?P<ApyPI_as>GTCGAT)', 'ATCGAC', 6, 26, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'AquII': (21, ('(?P<AquII>GCCG.AC)|(?P<AquII_as>GT.CGGC)', 'GCCGNAC', 7, 27, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'AquIII': (21, ('(?P<AquIII>GAGGAG)|(?P<AquIII_as>CTCCTC)', 'GAGGAG', 6, 26, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'AquIV': (21, ('(?P<AquIV>G[AG]GGAAG)|(?P<AquIV_as>CTTCC[CT]C)', 'GRGGAAG', 7, 26, 17, None, None, 2, 'NN', 8192, 37, 65, ())),
+        'ArsI': (24, ('(?P<ArsI>GAC......TT[CT]G)|(?P<ArsI_as>C[AG]AA......GTC)', 'GACNNNNNNTTYG', 13, -8, -26, 24, 6, 5, 'NNNNN', 8192, 37, 65, ('I',))),
+        'AscI': (6, ('(?P<AscI>GGCGCGCC)|(?P<AscI_as>GGCGCGCC)', 'GGCGCGCC', 8, 2, -2, None, None, -4, 'CGCG', 65536, 37, 65, ('N', 'W'))),
+        'AseI': (6, ('(?P<AseI>ATTAAT)|(?P<AseI_as>ATTAAT)', 'ATTAAT', 6, 2, -2, None, None, -2, 'TA', 4096, 37, 65, ('J', 'N', 'O'))),
+        'Asi256I': (9, ('(?P<Asi256I>GATC)|(?P<Asi256I_as>GATC)', 'GATC', 4, 1, -1, None, None, -2, 'AT', 256, 37, 65, ())),
+        'AsiGI': (8, ('(?P<AsiGI>ACCGGT)|(?P<AsiGI_as>ACCGGT)', 'ACCGGT', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('I', 'V'))),
+        'AsiSI': (14, ('(?P<AsiSI>GCGATCGC)|(?P<AsiSI_as>GCGATCGC)', 'GCGATCGC', 8, 5, -5, None, None, 2, 'AT', 65536, 37, 65, ('N',))),
+        'Asp700I': (4, ('(?P<Asp700I>GAA....TTC)|(?P<Asp700I_as>GAA....TTC)', 'GAANNNNTTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('M',))),
+        'Asp718I': (8, ('(?P<Asp718I>GGTACC)|(?P<Asp718I_as>GGTACC)', 'GGTACC', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('M',))),
+        'AspA2I': (8, ('(?P<AspA2I>CCTAGG)|(?P<AspA2I_as>CCTAGG)', 'CCTAGG', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('I', 'V'))),
+        'AspCNI': (0, ('(?P<AspCNI>GCCGC)|(?P<AspCNI_as>GCGGC)', 'GCCGC', 5, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'AspEI': (20, ('(?P<AspEI>GAC.....GTC)|(?P<AspEI_as>GAC.....GTC)', 'GACNNNNNGTC', 11, 6, -6, None, None, 1, 'N', 4096, 37, 65, ('M',))),
+        'AspI': (12, ('(?P<AspI>GAC...GTC)|(?P<AspI_as>GAC...GTC)', 'GACNNNGTC', 9, 4, -4, None, None, -1, 'N', 4096, 37, 65, ('M',))),
+        'AspLEI': (16, ('(?P<AspLEI>GCGC)|(?P<AspLEI_as>GCGC)', 'GCGC', 4, 3, -3, None, None, 2, 'CG', 256, 37, 65, ('I', 'V'))),
+        'AspS9I': (12, ('(?P<AspS9I>GG.CC)|(?P<AspS9I_as>GG.CC)', 'GGNCC', 5, 1, -1, None, None, -3, 'GNC', 256, 37, 65, ('I', 'V'))),
+        'AssI': (4, ('(?P<AssI>AGTACT)|(?P<AssI_as>AGTACT)', 'AGTACT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('U',))),
+        'AsuC2I': (12, ('(?P<AsuC2I>CC[CG]GG)|(?P<AsuC2I_as>CC[CG]GG)', 'CCSGG', 5, 2, -2, None, None, -1, 'S', 512, 37, 65, ('I',))),
+        'AsuHPI': (20, ('(?P<AsuHPI>GGTGA)|(?P<AsuHPI_as>TCACC)', 'GGTGA', 5, 13, 7, None, None, 1, 'N', 1024, 37, 65, ('I', 'V'))),
+        'AsuI': (13, ('(?P<AsuI>GG.CC)|(?P<AsuI_as>GG.CC)', 'GGNCC', 5, 1, -1, None, None, -3, 'GNC', 256, 37, 65, ())),
+        'AsuII': (8, ('(?P<AsuII>TTCGAA)|(?P<AsuII_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('C',))),
+        'AsuNHI': (8, ('(?P<AsuNHI>GCTAGC)|(?P<AsuNHI_as>GCTAGC)', 'GCTAGC', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('I', 'V'))),
+        'AvaI': (10, ('(?P<AvaI>C[CT]CG[AG]G)|(?P<AvaI_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 1, -1, None, None, -4, 'YCGR', 1024, 37, 65, ('B', 'J', 'M', 'N', 'O', 'R', 'S', 'U', 'W', 'X'))),
+        'AvaII': (10, ('(?P<AvaII>GG[AT]CC)|(?P<AvaII_as>GG[AT]CC)', 'GGWCC', 5, 1, -1, None, None, -3, 'GWC', 512, 37, 65, ('J', 'K', 'M', 'N', 'R', 'S', 'W', 'Y'))),
+        'AvaIII': (1, ('(?P<AvaIII>ATGCAT)|(?P<AvaIII_as>ATGCAT)', 'ATGCAT', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'AviII': (4, ('(?P<AviII>TGCGCA)|(?P<AviII_as>TGCGCA)', 'TGCGCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('M',))),
+        'AvrII': (8, ('(?P<AvrII>CCTAGG)|(?P<AvrII_as>CCTAGG)', 'CCTAGG', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('N',))),
+        'AxyI': (12, ('(?P<AxyI>CCT.AGG)|(?P<AxyI_as>CCT.AGG)', 'CCTNAGG', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('J',))),
+        'BaeGI': (20, ('(?P<BaeGI>G[GT]GC[AC]C)|(?P<BaeGI_as>G[GT]GC[AC]C)', 'GKGCMC', 6, 5, -5, None, None, 4, 'KGCM', 1024, 37, 65, ('N',))),
+        'BaeI': (24, ('(?P<BaeI>AC....GTA[CT]C)|(?P<BaeI_as>G[AG]TAC....GT)', 'ACNNNNGTAYC', 11, -10, -26, 23, 7, 5, 'NNNNN', 8192, 37, 65, ('N',))),
+        'BalI': (2, ('(?P<BalI>TGGCCA)|(?P<BalI_as>TGGCCA)', 'TGGCCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('J', 'K', 'R', 'X'))),
+        'BamHI': (6, ('(?P<BamHI>GGATCC)|(?P<BamHI_as>GGATCC)', 'GGATCC', 6, 1, -1, None, None, -4, 'GATC', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'BanI': (10, ('(?P<BanI>GG[CT][AG]CC)|(?P<BanI_as>GG[CT][AG]CC)', 'GGYRCC', 6, 1, -1, None, None, -4, 'GYRC', 1024, 37, 65, ('N', 'O', 'R', 'U'))),
+        'BanII': (18, ('(?P<BanII>G[AG]GC[CT]C)|(?P<BanII_as>G[AG]GC[CT]C)', 'GRGCYC', 6, 5, -5, None, None, 4, 'RGCY', 1024, 37, 65, ('K', 'N', 'O', 'Q', 'R', 'W', 'X'))),
+        'BanIII': (8, ('(?P<BanIII>ATCGAT)|(?P<BanIII_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('O',))),
+        'BarI': (24, ('(?P<BarI>GAAG......TAC)|(?P<BarI_as>GTA......CTTC)', 'GAAGNNNNNNTAC', 13, -7, -25, 25, 7, 5, 'NNNNN', 16384, 37, 65, ('I',))),
+        'BasI': (20, ('(?P<BasI>CCA.....TGG)|(?P<BasI_as>CCA.....TGG)', 'CCANNNNNTGG', 11, 7, -7, None, None, 3, 'NNN', 4096, 37, 65, ('U',))),
+        'BauI': (8, ('(?P<BauI>CACGAG)|(?P<BauI_as>CTCGTG)', 'CACGAG', 6, 1, -1, None, None, -4, 'ACGA', 4096, 37, 65, ('F',))),
+        'BbeI': (16, ('(?P<BbeI>GGCGCC)|(?P<BbeI_as>GGCGCC)', 'GGCGCC', 6, 5, -5, None, None, 4, 'GCGC', 4096, 37, 65, ('K',))),
+        'Bbr7I': (13, ('(?P<Bbr7I>GAAGAC)|(?P<Bbr7I_as>GTCTTC)', 'GAAGAC', 6, 13, 11, None, None, -4, 'NNNN', 4096, 37, 65, ())),
+        'BbrPI': (4, ('(?P<BbrPI>CACGTG)|(?P<BbrPI_as>CACGTG)', 'CACGTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('M', 'O'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'BbsI': (12, ('(?P<BbsI>GAAGAC)|(?P<BbsI_as>GTCTTC)', 'GAAGAC', 6, 8, 6, None, None, -4, 'NNNN', 4096, 37, 65, ('N',))),
+        'BbuI': (16, ('(?P<BbuI>GCATGC)|(?P<BbuI_as>GCATGC)', 'GCATGC', 6, 5, -5, None, None, 4, 'CATG', 4096, 37, 65, ('R',))),
+        'Bbv12I': (20, ('(?P<Bbv12I>G[AT]GC[AT]C)|(?P<Bbv12I_as>G[AT]GC[AT]C)', 'GWGCWC', 6, 5, -5, None, None, 4, 'WGCW', 1024, 37, 65, ('I', 'V'))),
+        'BbvCI': (6, ('(?P<BbvCI>CCTCAGC)|(?P<BbvCI_as>GCTGAGG)', 'CCTCAGC', 7, 2, -2, None, None, -3, 'TCA', 16384, 37, 65, ('N',))),
+        'BbvI': (10, ('(?P<BbvI>GCAGC)|(?P<BbvI_as>GCTGC)', 'GCAGC', 5, 13, 12, None, None, -4, 'NNNN', 1024, 37, 65, ('N',))),
+        'BbvII': (13, ('(?P<BbvII>GAAGAC)|(?P<BbvII_as>GTCTTC)', 'GAAGAC', 6, 8, 6, None, None, -4, 'NNNN', 4096, 37, 65, ())),
+        'BccI': (12, ('(?P<BccI>CCATC)|(?P<BccI_as>GATGG)', 'CCATC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ('N',))),
+        'Bce83I': (21, ('(?P<Bce83I>CTTGAG)|(?P<Bce83I_as>CTCAAG)', 'CTTGAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'BceAI': (10, ('(?P<BceAI>ACGGC)|(?P<BceAI_as>GCCGT)', 'ACGGC', 5, 17, 14, None, None, -2, 'NN', 1024, 37, 65, ('N',))),
+        'BcefI': (13, ('(?P<BcefI>ACGGC)|(?P<BcefI_as>GCCGT)', 'ACGGC', 5, 17, 13, None, None, -1, 'N', 1024, 37, 65, ())),
+        'BcgI': (23, ('(?P<BcgI>CGA......TGC)|(?P<BcgI_as>GCA......TCG)', 'CGANNNNNNTGC', 12, -10, -24, 24, 10, 2, 'NN', 4096, 37, 65, ('N',))),
+        'BciVI': (20, ('(?P<BciVI>GTATCC)|(?P<BciVI_as>GGATAC)', 'GTATCC', 6, 12, 5, None, None, 1, 'N', 4096, 37, 65, ('N',))),
+        'BclI': (6, ('(?P<BclI>TGATCA)|(?P<BclI_as>TGATCA)', 'TGATCA', 6, 1, -1, None, None, -4, 'GATC', 4096, 37, 65, ('C', 'F', 'J', 'M', 'N', 'O', 'R', 'S', 'U', 'W', 'Y'))),
+        'BcnI': (10, ('(?P<BcnI>CC[CG]GG)|(?P<BcnI_as>CC[CG]GG)', 'CCSGG', 5, 2, -2, None, None, -1, 'S', 512, 37, 65, ('F', 'K'))),
+        'BcuI': (8, ('(?P<BcuI>ACTAGT)|(?P<BcuI_as>ACTAGT)', 'ACTAGT', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('F',))),
+        'BdaI': (24, ('(?P<BdaI>TGA......TCA)|(?P<BdaI_as>TGA......TCA)', 'TGANNNNNNTCA', 12, -10, -24, 24, 10, 2, 'NN', 4096, 37, 65, ('F',))),
+        'BetI': (9, ('(?P<BetI>[AT]CCGG[AT])|(?P<BetI_as>[AT]CCGG[AT])', 'WCCGGW', 6, 1, -1, None, None, -4, 'CCGG', 1024, 37, 65, ())),
+        'BfaI': (8, ('(?P<BfaI>CTAG)|(?P<BfaI_as>CTAG)', 'CTAG', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('N',))),
+        'BfiI': (18, ('(?P<BfiI>ACTGGG)|(?P<BfiI_as>CCCAGT)', 'ACTGGG', 6, 11, 4, None, None, 1, 'N', 4096, 37, 65, ('F',))),
+        'BfmI': (12, ('(?P<BfmI>CT[AG][CT]AG)|(?P<BfmI_as>CT[AG][CT]AG)', 'CTRYAG', 6, 1, -1, None, None, -4, 'TRYA', 1024, 37, 65, ('F',))),
+        'BfoI': (16, ('(?P<BfoI>[AG]GCGC[CT])|(?P<BfoI_as>[AG]GCGC[CT])', 'RGCGCY', 6, 5, -5, None, None, 4, 'GCGC', 1024, 37, 65, ('F',))),
+        'BfrI': (8, ('(?P<BfrI>CTTAAG)|(?P<BfrI_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('M', 'O'))),
+        'BfuAI': (10, ('(?P<BfuAI>ACCTGC)|(?P<BfuAI_as>GCAGGT)', 'ACCTGC', 6, 10, 8, None, None, -4, 'NNNN', 4096, 37, 65, ('N',))),
+        'BfuCI': (8, ('(?P<BfuCI>GATC)|(?P<BfuCI_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('N',))),
+        'BfuI': (20, ('(?P<BfuI>GTATCC)|(?P<BfuI_as>GGATAC)', 'GTATCC', 6, 12, 5, None, None, 1, 'N', 4096, 37, 65, ('F',))),
+        'BglI': (18, ('(?P<BglI>GCC.....GGC)|(?P<BglI_as>GCC.....GGC)', 'GCCNNNNNGGC', 11, 7, -7, None, None, 3, 'NNN', 4096, 37, 65, ('C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'BglII': (6, ('(?P<BglII>AGATCT)|(?P<BglII_as>AGATCT)', 'AGATCT', 6, 1, -1, None, None, -4, 'GATC', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'BinI': (13, ('(?P<BinI>GGATC)|(?P<BinI_as>GATCC)', 'GGATC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ())),
+        'BisI': (12, ('(?P<BisI>GC.GC)|(?P<BisI_as>GC.GC)', 'GCNGC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('I',))),
+        'BlnI': (8, ('(?P<BlnI>CCTAGG)|(?P<BlnI_as>CCTAGG)', 'CCTAGG', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('K', 'M', 'S'))),
+        'BlpI': (10, ('(?P<BlpI>GCT.AGC)|(?P<BlpI_as>GCT.AGC)', 'GCTNAGC', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('N',))),
+        'BlsI': (20, ('(?P<BlsI>GC.GC)|(?P<BlsI_as>GC.GC)', 'GCNGC', 5, 3, -3, None, None, 1, 'N', 256, 37, 65, ('I',))),
+        'BmcAI': (4, ('(?P<BmcAI>AGTACT)|(?P<BmcAI_as>AGTACT)', 'AGTACT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('V',))),
+        'Bme1390I': (12, ('(?P<Bme1390I>CC.GG)|(?P<Bme1390I_as>CC.GG)', 'CCNGG', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('F',))),
+        'Bme18I': (12, ('(?P<Bme18I>GG[AT]CC)|(?P<Bme18I_as>GG[AT]CC)', 'GGWCC', 5, 1, -1, None, None, -3, 'GWC', 512, 37, 65, ('I', 'V'))),
+        'BmeRI': (20, ('(?P<BmeRI>GAC.....GTC)|(?P<BmeRI_as>GAC.....GTC)', 'GACNNNNNGTC', 11, 6, -6, None, None, 1, 'N', 4096, 37, 65, ('V',))),
+        'BmeT110I': (12, ('(?P<BmeT110I>C[CT]CG[AG]G)|(?P<BmeT110I_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 1, -1, None, None, -4, 'YCGR', 1024, 37, 65, ('K',))),
+        'BmgBI': (2, ('(?P<BmgBI>CACGTC)|(?P<BmgBI_as>GACGTG)', 'CACGTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'BmgI': (1, ('(?P<BmgI>G[GT]GCCC)|(?P<BmgI_as>GGGC[AC]C)', 'GKGCCC', 6, None, None, None, None, None, None, 2048, 37, 65, ())),
+        'BmgT120I': (12, ('(?P<BmgT120I>GG.CC)|(?P<BmgT120I_as>GG.CC)', 'GGNCC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('K',))),
+        'BmiI': (4, ('(?P<BmiI>GG..CC)|(?P<BmiI_as>GG..CC)', 'GGNNCC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('V',))),
+        'BmrFI': (12, ('(?P<BmrFI>CC.GG)|(?P<BmrFI_as>CC.GG)', 'CCNGG', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('V',))),
+        'BmrI': (18, ('(?P<BmrI>ACTGGG)|(?P<BmrI_as>CCCAGT)', 'ACTGGG', 6, 11, 4, None, None, 1, 'N', 4096, 37, 65, ('N',))),
+        'BmsI': (12, ('(?P<BmsI>GCATC)|(?P<BmsI_as>GATGC)', 'GCATC', 5, 10, 9, None, None, -4, 'NNNN', 1024, 37, 65, ('F',))),
+        'BmtI': (14, ('(?P<BmtI>GCTAGC)|(?P<BmtI_as>GCTAGC)', 'GCTAGC', 6, 5, -5, None, None, 4, 'CTAG', 4096, 37, 65, ('I', 'N', 'V'))),
+        'BmuI': (20, ('(?P<BmuI>ACTGGG)|(?P<BmuI_as>CCCAGT)', 'ACTGGG', 6, 11, 4, None, None, 1, 'N', 4096, 37, 65, ('I',))),
+        'BoxI': (4, ('(?P<BoxI>GAC....GTC)|(?P<BoxI_as>GAC....GTC)', 'GACNNNNGTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'BpiI': (12, ('(?P<BpiI>GAAGAC)|(?P<BpiI_as>GTCTTC)', 'GAAGAC', 6, 8, 6, None, None, -4, 'NNNN', 4096, 37, 65, ('F',))),
+        'BplI': (24, ('(?P<BplI>GAG.....CTC)|(?P<BplI_as>GAG.....CTC)', 'GAGNNNNNCTC', 11, -8, -24, 24, 8, 5, 'NNNNN', 4096, 37, 65, ('F',))),
+        'BpmI': (20, ('(?P<BpmI>CTGGAG)|(?P<BpmI_as>CTCCAG)', 'CTGGAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ('I', 'N'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'Bpu10I': (10, ('(?P<Bpu10I>CCT.AGC)|(?P<Bpu10I_as>GCT.AGG)', 'CCTNAGC', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('F', 'I', 'N', 'V'))),
+        'Bpu1102I': (12, ('(?P<Bpu1102I>GCT.AGC)|(?P<Bpu1102I_as>GCT.AGC)', 'GCTNAGC', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('F', 'K'))),
+        'Bpu14I': (8, ('(?P<Bpu14I>TTCGAA)|(?P<Bpu14I_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('I', 'V'))),
+        'BpuAI': (12, ('(?P<BpuAI>GAAGAC)|(?P<BpuAI_as>GTCTTC)', 'GAAGAC', 6, 8, 6, None, None, -4, 'NNNN', 4096, 37, 65, ('M',))),
+        'BpuEI': (20, ('(?P<BpuEI>CTTGAG)|(?P<BpuEI_as>CTCAAG)', 'CTTGAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'BpuMI': (12, ('(?P<BpuMI>CC[CG]GG)|(?P<BpuMI_as>CC[CG]GG)', 'CCSGG', 5, 2, -2, None, None, -1, 'S', 512, 37, 65, ('V',))),
+        'BpvUI': (16, ('(?P<BpvUI>CGATCG)|(?P<BpvUI_as>CGATCG)', 'CGATCG', 6, 4, -4, None, None, 2, 'AT', 4096, 37, 65, ('V',))),
+        'Bsa29I': (8, ('(?P<Bsa29I>ATCGAT)|(?P<Bsa29I_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('I',))),
+        'BsaAI': (2, ('(?P<BsaAI>[CT]ACGT[AG])|(?P<BsaAI_as>[CT]ACGT[AG])', 'YACGTR', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ('N',))),
+        'BsaBI': (4, ('(?P<BsaBI>GAT....ATC)|(?P<BsaBI_as>GAT....ATC)', 'GATNNNNATC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'BsaHI': (6, ('(?P<BsaHI>G[AG]CG[CT]C)|(?P<BsaHI_as>G[AG]CG[CT]C)', 'GRCGYC', 6, 2, -2, None, None, -2, 'CG', 1024, 37, 65, ('N',))),
+        'BsaI': (12, ('(?P<BsaI>GGTCTC)|(?P<BsaI_as>GAGACC)', 'GGTCTC', 6, 7, 5, None, None, -4, 'NNNN', 4096, 37, 65, ('N',))),
+        'BsaJI': (10, ('(?P<BsaJI>CC..GG)|(?P<BsaJI_as>CC..GG)', 'CCNNGG', 6, 1, -1, None, None, -4, 'CNNG', 256, 37, 65, ('N',))),
+        'BsaMI': (20, ('(?P<BsaMI>GAATGC)|(?P<BsaMI_as>GCATTC)', 'GAATGC', 6, 7, -1, None, None, 2, 'CN', 4096, 37, 65, ('R',))),
+        'BsaWI': (6, ('(?P<BsaWI>[AT]CCGG[AT])|(?P<BsaWI_as>[AT]CCGG[AT])', 'WCCGGW', 6, 1, -1, None, None, -4, 'CCGG', 1024, 37, 65, ('N',))),
+        'BsaXI': (24, ('(?P<BsaXI>AC.....CTCC)|(?P<BsaXI_as>GGAG.....GT)', 'ACNNNNNCTCC', 11, -9, -23, 21, 7, 3, 'NNN', 4096, 37, 65, ('N',))),
+        'BsbI': (21, ('(?P<BsbI>CAACAC)|(?P<BsbI_as>GTGTTG)', 'CAACAC', 6, 27, 19, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'Bsc4I': (18, ('(?P<Bsc4I>CC.......GG)|(?P<Bsc4I_as>CC.......GG)', 'CCNNNNNNNGG', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('I',))),
+        'BscAI': (13, ('(?P<BscAI>GCATC)|(?P<BscAI_as>GATGC)', 'GCATC', 5, 9, 6, None, None, -2, 'NN', 1024, 37, 65, ())),
+        'BscGI': (0, ('(?P<BscGI>CCCGT)|(?P<BscGI_as>ACGGG)', 'CCCGT', 5, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'Bse118I': (8, ('(?P<Bse118I>[AG]CCGG[CT])|(?P<Bse118I_as>[AG]CCGG[CT])', 'RCCGGY', 6, 1, -1, None, None, -4, 'CCGG', 1024, 37, 65, ('I', 'V'))),
+        'Bse1I': (20, ('(?P<Bse1I>ACTGG)|(?P<Bse1I_as>CCAGT)', 'ACTGG', 5, 6, -1, None, None, 2, 'GN', 1024, 37, 65, ('I', 'V'))),
+        'Bse21I': (12, ('(?P<Bse21I>CCT.AGG)|(?P<Bse21I_as>CCT.AGG)', 'CCTNAGG', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('I', 'V'))),
+        'Bse3DI': (20, ('(?P<Bse3DI>GCAATG)|(?P<Bse3DI_as>CATTGC)', 'GCAATG', 6, 8, 0, None, None, 2, 'NN', 4096, 37, 65, ('I', 'V'))),
+        'Bse8I': (4, ('(?P<Bse8I>GAT....ATC)|(?P<Bse8I_as>GAT....ATC)', 'GATNNNNATC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'BseAI': (8, ('(?P<BseAI>TCCGGA)|(?P<BseAI_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('C', 'M'))),
+        'BseBI': (12, ('(?P<BseBI>CC[AT]GG)|(?P<BseBI_as>CC[AT]GG)', 'CCWGG', 5, 2, -2, None, None, -1, 'W', 512, 37, 65, ('C',))),
+        'BseCI': (6, ('(?P<BseCI>ATCGAT)|(?P<BseCI_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('C',))),
+        'BseDI': (12, ('(?P<BseDI>CC..GG)|(?P<BseDI_as>CC..GG)', 'CCNNGG', 6, 1, -1, None, None, -4, 'CNNG', 256, 37, 65, ('F',))),
+        'BseGI': (20, ('(?P<BseGI>GGATG)|(?P<BseGI_as>CATCC)', 'GGATG', 5, 7, 0, None, None, 2, 'NN', 1024, 37, 65, ('F',))),
+        'BseJI': (4, ('(?P<BseJI>GAT....ATC)|(?P<BseJI_as>GAT....ATC)', 'GATNNNNATC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'BseLI': (20, ('(?P<BseLI>CC.......GG)|(?P<BseLI_as>CC.......GG)', 'CCNNNNNNNGG', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('F',))),
+        'BseMI': (20, ('(?P<BseMI>GCAATG)|(?P<BseMI_as>CATTGC)', 'GCAATG', 6, 8, 0, None, None, 2, 'NN', 4096, 37, 65, ('F',))),
+        'BseMII': (20, ('(?P<BseMII>CTCAG)|(?P<BseMII_as>CTGAG)', 'CTCAG', 5, 15, 8, None, None, 2, 'NN', 1024, 37, 65, ('F',))),
+        'BseNI': (20, ('(?P<BseNI>ACTGG)|(?P<BseNI_as>CCAGT)', 'ACTGG', 5, 6, -1, None, None, 2, 'GN', 1024, 37, 65, ('F',))),
+        'BsePI': (8, ('(?P<BsePI>GCGCGC)|(?P<BsePI_as>GCGCGC)', 'GCGCGC', 6, 1, -1, None, None, -4, 'CGCG', 4096, 37, 65, ('I', 'V'))),
+        'BseRI': (20, ('(?P<BseRI>GAGGAG)|(?P<BseRI_as>CTCCTC)', 'GAGGAG', 6, 16, 8, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'BseSI': (20, ('(?P<BseSI>G[GT]GC[AC]C)|(?P<BseSI_as>G[GT]GC[AC]C)', 'GKGCMC', 6, 5, -5, None, None, 4, 'KGCM', 1024, 37, 65, ('F',))),
+        'BseX3I': (8, ('(?P<BseX3I>CGGCCG)|(?P<BseX3I_as>CGGCCG)', 'CGGCCG', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('I', 'V'))),
+        'BseXI': (12, ('(?P<BseXI>GCAGC)|(?P<BseXI_as>GCTGC)', 'GCAGC', 5, 13, 12, None, None, -4, 'NNNN', 1024, 37, 65, ('F',))),
+        'BseYI': (8, ('(?P<BseYI>CCCAGC)|(?P<BseYI_as>GCTGGG)', 'CCCAGC', 6, 1, -1, None, None, -4, 'CCAG', 4096, 37, 65, ('N',))),
+        'BsgI': (20, ('(?P<BsgI>GTGCAG)|(?P<BsgI_as>CTGCAC)', 'GTGCAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'Bsh1236I': (4, ('(?P<Bsh1236I>CGCG)|(?P<Bsh1236I_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('F',))),
+        'Bsh1285I': (20, ('(?P<Bsh1285I>CG[AG][CT]CG)|(?P<Bsh1285I_as>CG[AG][CT]CG)', 'CGRYCG', 6, 4, -4, None, None, 2, 'RY', 1024, 37, 65, ('F',))),
+        'BshFI': (4, ('(?P<BshFI>GGCC)|(?P<BshFI_as>GGCC)', 'GGCC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('C',))),
+        'BshNI': (12, ('(?P<BshNI>GG[CT][AG]CC)|(?P<BshNI_as>GG[CT][AG]CC)', 'GGYRCC', 6, 1, -1, None, None, -4, 'GYRC', 1024, 37, 65, ('F',))),
+        'BshTI': (8, ('(?P<BshTI>ACCGGT)|(?P<BshTI_as>ACCGGT)', 'ACCGGT', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('F',))),
+        'BshVI': (8, ('(?P<BshVI>ATCGAT)|(?P<BshVI_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('V',))),
+        'BsiEI': (20, ('(?P<BsiEI>CG[AG][CT]CG)|(?P<BsiEI_as>CG[AG][CT]CG)', 'CGRYCG', 6, 4, -4, None, None, 2, 'RY', 1024, 37, 65, ('N',))),
+        'BsiHKAI': (18, ('(?P<BsiHKAI>G[AT]GC[AT]C)|(?P<BsiHKAI_as>G[AT]GC[AT]C)', 'GWGCWC', 6, 5, -5, None, None, 4, 'WGCW', 1024, 37, 65, ('N',))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'BsiHKCI': (12, ('(?P<BsiHKCI>C[CT]CG[AG]G)|(?P<BsiHKCI_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 1, -1, None, None, -4, 'YCGR', 1024, 37, 65, ('Q', 'X'))),
+        'BsiI': (9, ('(?P<BsiI>CACGAG)|(?P<BsiI_as>CTCGTG)', 'CACGAG', 6, 1, -1, None, None, -4, 'ACGA', 4096, 37, 65, ())),
+        'BsiSI': (8, ('(?P<BsiSI>CCGG)|(?P<BsiSI_as>CCGG)', 'CCGG', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('C',))),
+        'BsiWI': (8, ('(?P<BsiWI>CGTACG)|(?P<BsiWI_as>CGTACG)', 'CGTACG', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('M', 'N', 'O'))),
+        'BsiYI': (21, ('(?P<BsiYI>CC.......GG)|(?P<BsiYI_as>CC.......GG)', 'CCNNNNNNNGG', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ())),
+        'BslFI': (12, ('(?P<BslFI>GGGAC)|(?P<BslFI_as>GTCCC)', 'GGGAC', 5, 15, 14, None, None, -4, 'NNNN', 1024, 37, 65, ('I',))),
+        'BslI': (18, ('(?P<BslI>CC.......GG)|(?P<BslI_as>CC.......GG)', 'CCNNNNNNNGG', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('N', 'W'))),
+        'BsmAI': (10, ('(?P<BsmAI>GTCTC)|(?P<BsmAI_as>GAGAC)', 'GTCTC', 5, 6, 5, None, None, -4, 'NNNN', 1024, 37, 65, ('N',))),
+        'BsmBI': (10, ('(?P<BsmBI>CGTCTC)|(?P<BsmBI_as>GAGACG)', 'CGTCTC', 6, 7, 5, None, None, -4, 'NNNN', 4096, 37, 65, ('N',))),
+        'BsmFI': (10, ('(?P<BsmFI>GGGAC)|(?P<BsmFI_as>GTCCC)', 'GGGAC', 5, 15, 14, None, None, -4, 'NNNN', 1024, 37, 65, ('N',))),
+        'BsmI': (20, ('(?P<BsmI>GAATGC)|(?P<BsmI_as>GCATTC)', 'GAATGC', 6, 7, -1, None, None, 2, 'CN', 4096, 37, 65, ('J', 'M', 'N', 'O', 'S', 'W'))),
+        'BsnI': (4, ('(?P<BsnI>GGCC)|(?P<BsnI_as>GGCC)', 'GGCC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('V',))),
+        'Bso31I': (12, ('(?P<Bso31I>GGTCTC)|(?P<Bso31I_as>GAGACC)', 'GGTCTC', 6, 7, 5, None, None, -4, 'NNNN', 4096, 37, 65, ('I', 'V'))),
+        'BsoBI': (10, ('(?P<BsoBI>C[CT]CG[AG]G)|(?P<BsoBI_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 1, -1, None, None, -4, 'YCGR', 1024, 37, 65, ('N',))),
+        'Bsp119I': (8, ('(?P<Bsp119I>TTCGAA)|(?P<Bsp119I_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('F',))),
+        'Bsp120I': (8, ('(?P<Bsp120I>GGGCCC)|(?P<Bsp120I_as>GGGCCC)', 'GGGCCC', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('F',))),
+        'Bsp1286I': (18, ('(?P<Bsp1286I>G[AGT]GC[ACT]C)|(?P<Bsp1286I_as>G[AGT]GC[ACT]C)', 'GDGCHC', 6, 5, -5, None, None, 4, 'DGCH', 256, 37, 65, ('J', 'K', 'N', 'R'))),
+        'Bsp13I': (8, ('(?P<Bsp13I>TCCGGA)|(?P<Bsp13I_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('I', 'V'))),
+        'Bsp1407I': (8, ('(?P<Bsp1407I>TGTACA)|(?P<Bsp1407I_as>TGTACA)', 'TGTACA', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('F', 'K'))),
+        'Bsp143I': (8, ('(?P<Bsp143I>GATC)|(?P<Bsp143I_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('F',))),
+        'Bsp1720I': (12, ('(?P<Bsp1720I>GCT.AGC)|(?P<Bsp1720I_as>GCT.AGC)', 'GCTNAGC', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('I', 'V'))),
+        'Bsp19I': (8, ('(?P<Bsp19I>CCATGG)|(?P<Bsp19I_as>CCATGG)', 'CCATGG', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('I', 'V'))),
+        'Bsp24I': (25, ('(?P<Bsp24I>GAC......TGG)|(?P<Bsp24I_as>CCA......GTC)', 'GACNNNNNNTGG', 12, -8, -25, 24, 7, 5, 'NNNNN', 4096, 37, 65, ())),
+        'Bsp68I': (4, ('(?P<Bsp68I>TCGCGA)|(?P<Bsp68I_as>TCGCGA)', 'TCGCGA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'BspACI': (8, ('(?P<BspACI>CCGC)|(?P<BspACI_as>GCGG)', 'CCGC', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('I',))),
+        'BspCNI': (18, ('(?P<BspCNI>CTCAG)|(?P<BspCNI_as>CTGAG)', 'CTCAG', 5, 14, 7, None, None, 2, 'NN', 1024, 37, 65, ('N',))),
+        'BspD6I': (13, ('(?P<BspD6I>GACTC)|(?P<BspD6I_as>GAGTC)', 'GACTC', 5, 9, 6, None, None, -2, 'NN', 1024, 37, 65, ())),
+        'BspDI': (8, ('(?P<BspDI>ATCGAT)|(?P<BspDI_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('N',))),
+        'BspEI': (8, ('(?P<BspEI>TCCGGA)|(?P<BspEI_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('N',))),
+        'BspFNI': (4, ('(?P<BspFNI>CGCG)|(?P<BspFNI_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('I',))),
+        'BspGI': (1, ('(?P<BspGI>CTGGAC)|(?P<BspGI_as>GTCCAG)', 'CTGGAC', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'BspHI': (6, ('(?P<BspHI>TCATGA)|(?P<BspHI_as>TCATGA)', 'TCATGA', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('N',))),
+        'BspLI': (4, ('(?P<BspLI>GG..CC)|(?P<BspLI_as>GG..CC)', 'GGNNCC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('F',))),
+        'BspLU11I': (9, ('(?P<BspLU11I>ACATGT)|(?P<BspLU11I_as>ACATGT)', 'ACATGT', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ())),
+        'BspMI': (10, ('(?P<BspMI>ACCTGC)|(?P<BspMI_as>GCAGGT)', 'ACCTGC', 6, 10, 8, None, None, -4, 'NNNN', 4096, 37, 65, ('N',))),
+        'BspMII': (9, ('(?P<BspMII>TCCGGA)|(?P<BspMII_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ())),
+        'BspNCI': (1, ('(?P<BspNCI>CCAGA)|(?P<BspNCI_as>TCTGG)', 'CCAGA', 5, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'BspOI': (16, ('(?P<BspOI>GCTAGC)|(?P<BspOI_as>GCTAGC)', 'GCTAGC', 6, 5, -5, None, None, 4, 'CTAG', 4096, 37, 65, ('F',))),
+        'BspPI': (12, ('(?P<BspPI>GGATC)|(?P<BspPI_as>GATCC)', 'GGATC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ('F',))),
+        'BspQI': (12, ('(?P<BspQI>GCTCTTC)|(?P<BspQI_as>GAAGAGC)', 'GCTCTTC', 7, 8, 4, None, None, -3, 'NNN', 16384, 37, 65, ('N',))),
+        'BspT104I': (8, ('(?P<BspT104I>TTCGAA)|(?P<BspT104I_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('K',))),
+        'BspT107I': (12, ('(?P<BspT107I>GG[CT][AG]CC)|(?P<BspT107I_as>GG[CT][AG]CC)', 'GGYRCC', 6, 1, -1, None, None, -4, 'GYRC', 1024, 37, 65, ('K',))),
+        'BspTI': (8, ('(?P<BspTI>CTTAAG)|(?P<BspTI_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('F',))),
+        'BspTNI': (12, ('(?P<BspTNI>GGTCTC)|(?P<BspTNI_as>GAGACC)', 'GGTCTC', 6, 7, 5, None, None, -4, 'NNNN', 4096, 37, 65, ('Q', 'X'))),
+        'BspXI': (8, ('(?P<BspXI>ATCGAT)|(?P<BspXI_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('W',))),
+        'BsrBI': (2, ('(?P<BsrBI>CCGCTC)|(?P<BsrBI_as>GAGCGG)', 'CCGCTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'BsrDI': (20, ('(?P<BsrDI>GCAATG)|(?P<BsrDI_as>CATTGC)', 'GCAATG', 6, 8, 0, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'BsrFI': (6, ('(?P<BsrFI>[AG]CCGG[CT])|(?P<BsrFI_as>[AG]CCGG[CT])', 'RCCGGY', 6, 1, -1, None, None, -4, 'CCGG', 1024, 37, 65, ('N',))),
+        'BsrGI': (8, ('(?P<BsrGI>TGTACA)|(?P<BsrGI_as>TGTACA)', 'TGTACA', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('N',))),
+        'BsrI': (18, ('(?P<BsrI>ACTGG)|(?P<BsrI_as>CCAGT)', 'ACTGG', 5, 6, -1, None, None, 2, 'GN', 1024, 37, 65, ('N',))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'BsrSI': (20, ('(?P<BsrSI>ACTGG)|(?P<BsrSI_as>CCAGT)', 'ACTGG', 5, 6, -1, None, None, 2, 'GN', 1024, 37, 65, ('R',))),
+        'BssAI': (8, ('(?P<BssAI>[AG]CCGG[CT])|(?P<BssAI_as>[AG]CCGG[CT])', 'RCCGGY', 6, 1, -1, None, None, -4, 'CCGG', 1024, 37, 65, ('C',))),
+        'BssECI': (12, ('(?P<BssECI>CC..GG)|(?P<BssECI_as>CC..GG)', 'CCNNGG', 6, 1, -1, None, None, -4, 'CNNG', 256, 37, 65, ('I',))),
+        'BssHII': (6, ('(?P<BssHII>GCGCGC)|(?P<BssHII_as>GCGCGC)', 'GCGCGC', 6, 1, -1, None, None, -4, 'CGCG', 4096, 37, 65, ('J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'X'))),
+        'BssKI': (10, ('(?P<BssKI>CC.GG)|(?P<BssKI_as>CC.GG)', 'CCNGG', 5, 0, 0, None, None, -5, 'CCNGG', 256, 37, 65, ('N',))),
+        'BssMI': (8, ('(?P<BssMI>GATC)|(?P<BssMI_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('V',))),
+        'BssNAI': (4, ('(?P<BssNAI>GTATAC)|(?P<BssNAI_as>GTATAC)', 'GTATAC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'BssNI': (8, ('(?P<BssNI>G[AG]CG[CT]C)|(?P<BssNI_as>G[AG]CG[CT]C)', 'GRCGYC', 6, 2, -2, None, None, -2, 'CG', 1024, 37, 65, ('V',))),
+        'BssSI': (6, ('(?P<BssSI>CACGAG)|(?P<BssSI_as>CTCGTG)', 'CACGAG', 6, 1, -1, None, None, -4, 'ACGA', 4096, 37, 65, ('N',))),
+        'BssT1I': (12, ('(?P<BssT1I>CC[AT][AT]GG)|(?P<BssT1I_as>CC[AT][AT]GG)', 'CCWWGG', 6, 1, -1, None, None, -4, 'CWWG', 1024, 37, 65, ('I', 'V'))),
+        'Bst1107I': (4, ('(?P<Bst1107I>GTATAC)|(?P<Bst1107I_as>GTATAC)', 'GTATAC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F', 'K', 'M'))),
+        'Bst2BI': (8, ('(?P<Bst2BI>CACGAG)|(?P<Bst2BI_as>CTCGTG)', 'CACGAG', 6, 1, -1, None, None, -4, 'ACGA', 4096, 37, 65, ('I', 'V'))),
+        'Bst2UI': (12, ('(?P<Bst2UI>CC[AT]GG)|(?P<Bst2UI_as>CC[AT]GG)', 'CCWGG', 5, 2, -2, None, None, -1, 'W', 512, 37, 65, ('I', 'V'))),
+        'Bst4CI': (20, ('(?P<Bst4CI>AC.GT)|(?P<Bst4CI_as>AC.GT)', 'ACNGT', 5, 3, -3, None, None, 1, 'N', 256, 37, 65, ('I', 'V'))),
+        'Bst6I': (12, ('(?P<Bst6I>CTCTTC)|(?P<Bst6I_as>GAAGAG)', 'CTCTTC', 6, 7, 4, None, None, -3, 'NNN', 4096, 37, 65, ('I', 'V'))),
+        'Bst98I': (8, ('(?P<Bst98I>CTTAAG)|(?P<Bst98I_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('R',))),
+        'BstACI': (8, ('(?P<BstACI>G[AG]CG[CT]C)|(?P<BstACI_as>G[AG]CG[CT]C)', 'GRCGYC', 6, 2, -2, None, None, -2, 'CG', 1024, 37, 65, ('I',))),
+        'BstAFI': (8, ('(?P<BstAFI>CTTAAG)|(?P<BstAFI_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('I',))),
+        'BstAPI': (20, ('(?P<BstAPI>GCA.....TGC)|(?P<BstAPI_as>GCA.....TGC)', 'GCANNNNNTGC', 11, 7, -7, None, None, 3, 'NNN', 4096, 37, 65, ('I', 'N'))),
+        'BstAUI': (8, ('(?P<BstAUI>TGTACA)|(?P<BstAUI_as>TGTACA)', 'TGTACA', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('I', 'V'))),
+        'BstBAI': (4, ('(?P<BstBAI>[CT]ACGT[AG])|(?P<BstBAI_as>[CT]ACGT[AG])', 'YACGTR', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ('I', 'V'))),
+        'BstBI': (8, ('(?P<BstBI>TTCGAA)|(?P<BstBI_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('N',))),
+        'BstC8I': (4, ('(?P<BstC8I>GC..GC)|(?P<BstC8I_as>GC..GC)', 'GCNNGC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('I',))),
+        'BstDEI': (12, ('(?P<BstDEI>CT.AG)|(?P<BstDEI_as>CT.AG)', 'CTNAG', 5, 1, -1, None, None, -3, 'TNA', 256, 37, 65, ('I', 'V'))),
+        'BstDSI': (12, ('(?P<BstDSI>CC[AG][CT]GG)|(?P<BstDSI_as>CC[AG][CT]GG)', 'CCRYGG', 6, 1, -1, None, None, -4, 'CRYG', 1024, 37, 65, ('I', 'V'))),
+        'BstEII': (12, ('(?P<BstEII>GGT.ACC)|(?P<BstEII_as>GGT.ACC)', 'GGTNACC', 7, 1, -1, None, None, -5, 'GTNAC', 4096, 37, 65, ('C', 'H', 'J', 'M', 'N', 'O', 'R', 'S', 'U', 'W'))),
+        'BstENI': (12, ('(?P<BstENI>CCT.....AGG)|(?P<BstENI_as>CCT.....AGG)', 'CCTNNNNNAGG', 11, 5, -5, None, None, -1, 'N', 4096, 37, 65, ('I', 'V'))),
+        'BstF5I': (18, ('(?P<BstF5I>GGATG)|(?P<BstF5I_as>CATCC)', 'GGATG', 5, 7, 0, None, None, 2, 'NN', 1024, 37, 65, ('I', 'V'))),
+        'BstFNI': (4, ('(?P<BstFNI>CGCG)|(?P<BstFNI_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('I', 'V'))),
+        'BstH2I': (16, ('(?P<BstH2I>[AG]GCGC[CT])|(?P<BstH2I_as>[AG]GCGC[CT])', 'RGCGCY', 6, 5, -5, None, None, 4, 'GCGC', 1024, 37, 65, ('I', 'V'))),
+        'BstHHI': (16, ('(?P<BstHHI>GCGC)|(?P<BstHHI_as>GCGC)', 'GCGC', 4, 3, -3, None, None, 2, 'CG', 256, 37, 65, ('I', 'V'))),
+        'BstKTI': (16, ('(?P<BstKTI>GATC)|(?P<BstKTI_as>GATC)', 'GATC', 4, 3, -3, None, None, 2, 'AT', 256, 37, 65, ('I',))),
+        'BstMAI': (12, ('(?P<BstMAI>GTCTC)|(?P<BstMAI_as>GAGAC)', 'GTCTC', 5, 6, 5, None, None, -4, 'NNNN', 1024, 37, 65, ('I', 'V'))),
+        'BstMBI': (8, ('(?P<BstMBI>GATC)|(?P<BstMBI_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('I', 'V'))),
+        'BstMCI': (20, ('(?P<BstMCI>CG[AG][CT]CG)|(?P<BstMCI_as>CG[AG][CT]CG)', 'CGRYCG', 6, 4, -4, None, None, 2, 'RY', 1024, 37, 65, ('I', 'V'))),
+        'BstMWI': (20, ('(?P<BstMWI>GC.......GC)|(?P<BstMWI_as>GC.......GC)', 'GCNNNNNNNGC', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('I',))),
+        'BstNI': (10, ('(?P<BstNI>CC[AT]GG)|(?P<BstNI_as>CC[AT]GG)', 'CCWGG', 5, 2, -2, None, None, -1, 'W', 512, 37, 65, ('N',))),
+        'BstNSI': (16, ('(?P<BstNSI>[AG]CATG[CT])|(?P<BstNSI_as>[AG]CATG[CT])', 'RCATGY', 6, 5, -5, None, None, 4, 'CATG', 1024, 37, 65, ('I', 'V'))),
+        'BstOI': (12, ('(?P<BstOI>CC[AT]GG)|(?P<BstOI_as>CC[AT]GG)', 'CCWGG', 5, 2, -2, None, None, -1, 'W', 512, 37, 65, ('R',))),
+        'BstPAI': (4, ('(?P<BstPAI>GAC....GTC)|(?P<BstPAI_as>GAC....GTC)', 'GACNNNNGTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'BstPI': (12, ('(?P<BstPI>GGT.ACC)|(?P<BstPI_as>GGT.ACC)', 'GGTNACC', 7, 1, -1, None, None, -5, 'GTNAC', 4096, 37, 65, ('K',))),
+        'BstSCI': (12, ('(?P<BstSCI>CC.GG)|(?P<BstSCI_as>CC.GG)', 'CCNGG', 5, 0, 0, None, None, -5, 'CCNGG', 256, 37, 65, ('I',))),
+        'BstSFI': (12, ('(?P<BstSFI>CT[AG][CT]AG)|(?P<BstSFI_as>CT[AG][CT]AG)', 'CTRYAG', 6, 1, -1, None, None, -4, 'TRYA', 1024, 37, 65, ('I',))),
+        'BstSLI': (20, ('(?P<BstSLI>G[GT]GC[AC]C)|(?P<BstSLI_as>G[GT]GC[AC]C)', 'GKGCMC', 6, 5, -5, None, None, 4, 'KGCM', 1024, 37, 65, ('I',))),
+        'BstSNI': (4, ('(?P<BstSNI>TACGTA)|(?P<BstSNI_as>TACGTA)', 'TACGTA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'BstUI': (2, ('(?P<BstUI>CGCG)|(?P<BstUI_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('N',))),
+        'BstV1I': (12, ('(?P<BstV1I>GCAGC)|(?P<BstV1I_as>GCTGC)', 'GCAGC', 5, 13, 12, None, None, -4, 'NNNN', 1024, 37, 65, ('I',))),
+        'BstV2I': (12, ('(?P<BstV2I>GAAGAC)|(?P<BstV2I_as>GTCTTC)', 'GAAGAC', 6, 8, 6, None, None, -4, 'NNNN', 4096, 37, 65, ('I', 'V'))),
+        'BstX2I': (8, ('(?P<BstX2I>[AG]GATC[CT])|(?P<BstX2I_as>[AG]GATC[CT])', 'RGATCY', 6, 1, -1, None, None, -4, 'GATC', 1024, 37, 65, ('I', 'V'))),
+        'BstXI': (20, ('(?P<BstXI>CCA......TGG)|(?P<BstXI_as>CCA......TGG)', 'CCANNNNNNTGG', 12, 8, -8, None, None, 4, 'NNNN', 4096, 37, 65, ('F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'V', 'W', 'X'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'BstYI': (6, ('(?P<BstYI>[AG]GATC[CT])|(?P<BstYI_as>[AG]GATC[CT])', 'RGATCY', 6, 1, -1, None, None, -4, 'GATC', 1024, 37, 65, ('N',))),
+        'BstZ17I': (4, ('(?P<BstZ17I>GTATAC)|(?P<BstZ17I_as>GTATAC)', 'GTATAC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'BstZI': (8, ('(?P<BstZI>CGGCCG)|(?P<BstZI_as>CGGCCG)', 'CGGCCG', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('R',))),
+        'Bsu15I': (6, ('(?P<Bsu15I>ATCGAT)|(?P<Bsu15I_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('F',))),
+        'Bsu36I': (12, ('(?P<Bsu36I>CCT.AGG)|(?P<Bsu36I_as>CCT.AGG)', 'CCTNAGG', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('N', 'R'))),
+        'BsuRI': (2, ('(?P<BsuRI>GGCC)|(?P<BsuRI_as>GGCC)', 'GGCC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('F', 'I'))),
+        'BsuTUI': (8, ('(?P<BsuTUI>ATCGAT)|(?P<BsuTUI_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('X',))),
+        'BtgI': (12, ('(?P<BtgI>CC[AG][CT]GG)|(?P<BtgI_as>CC[AG][CT]GG)', 'CCRYGG', 6, 1, -1, None, None, -4, 'CRYG', 1024, 37, 65, ('N',))),
+        'BtgZI': (12, ('(?P<BtgZI>GCGATG)|(?P<BtgZI_as>CATCGC)', 'GCGATG', 6, 16, 14, None, None, -4, 'NNNN', 4096, 37, 65, ('N',))),
+        'BthCI': (19, ('(?P<BthCI>GC.GC)|(?P<BthCI_as>GC.GC)', 'GCNGC', 5, 4, -4, None, None, 3, 'CNG', 256, 37, 65, ())),
+        'BtrI': (4, ('(?P<BtrI>CACGTC)|(?P<BtrI_as>GACGTG)', 'CACGTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'BtsCI': (20, ('(?P<BtsCI>GGATG)|(?P<BtsCI_as>CATCC)', 'GGATG', 5, 7, 0, None, None, 2, 'NN', 1024, 37, 65, ('N',))),
+        'BtsI': (20, ('(?P<BtsI>GCAGTG)|(?P<BtsI_as>CACTGC)', 'GCAGTG', 6, 8, 0, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'BtuMI': (4, ('(?P<BtuMI>TCGCGA)|(?P<BtuMI_as>TCGCGA)', 'TCGCGA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('V',))),
+        'BveI': (12, ('(?P<BveI>ACCTGC)|(?P<BveI_as>GCAGGT)', 'ACCTGC', 6, 10, 8, None, None, -4, 'NNNN', 4096, 37, 65, ('F',))),
+        'Cac8I': (2, ('(?P<Cac8I>GC..GC)|(?P<Cac8I_as>GC..GC)', 'GCNNGC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('N',))),
+        'CaiI': (20, ('(?P<CaiI>CAG...CTG)|(?P<CaiI_as>CAG...CTG)', 'CAGNNNCTG', 9, 6, -6, None, None, 3, 'NNN', 4096, 37, 65, ('F',))),
+        'CauII': (13, ('(?P<CauII>CC[CG]GG)|(?P<CauII_as>CC[CG]GG)', 'CCSGG', 5, 2, -2, None, None, -1, 'S', 512, 37, 65, ())),
+        'CciI': (8, ('(?P<CciI>TCATGA)|(?P<CciI_as>TCATGA)', 'TCATGA', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('I',))),
+        'CciNI': (8, ('(?P<CciNI>GCGGCCGC)|(?P<CciNI_as>GCGGCCGC)', 'GCGGCCGC', 8, 2, -2, None, None, -4, 'GGCC', 65536, 37, 65, ('I', 'V'))),
+        'CdiI': (5, ('(?P<CdiI>CATCG)|(?P<CdiI_as>CGATG)', 'CATCG', 5, 4, -1, None, None, 0, '', 1024, 37, 65, ())),
+        'CdpI': (21, ('(?P<CdpI>GCGGAG)|(?P<CdpI_as>CTCCGC)', 'GCGGAG', 6, 26, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'CelII': (12, ('(?P<CelII>GCT.AGC)|(?P<CelII_as>GCT.AGC)', 'GCTNAGC', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('M',))),
+        'CfoI': (16, ('(?P<CfoI>GCGC)|(?P<CfoI_as>GCGC)', 'GCGC', 4, 3, -3, None, None, 2, 'CG', 256, 37, 65, ('M', 'R', 'S'))),
+        'Cfr10I': (6, ('(?P<Cfr10I>[AG]CCGG[CT])|(?P<Cfr10I_as>[AG]CCGG[CT])', 'RCCGGY', 6, 1, -1, None, None, -4, 'CCGG', 1024, 37, 65, ('F', 'K', 'O'))),
+        'Cfr13I': (10, ('(?P<Cfr13I>GG.CC)|(?P<Cfr13I_as>GG.CC)', 'GGNCC', 5, 1, -1, None, None, -3, 'GNC', 256, 37, 65, ('F', 'O'))),
+        'Cfr42I': (14, ('(?P<Cfr42I>CCGCGG)|(?P<Cfr42I_as>CCGCGG)', 'CCGCGG', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ('F',))),
+        'Cfr9I': (6, ('(?P<Cfr9I>CCCGGG)|(?P<Cfr9I_as>CCCGGG)', 'CCCGGG', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('F', 'O'))),
+        'CfrI': (6, ('(?P<CfrI>[CT]GGCC[AG])|(?P<CfrI_as>[CT]GGCC[AG])', 'YGGCCR', 6, 1, -1, None, None, -4, 'GGCC', 1024, 37, 65, ('F',))),
+        'ChaI': (17, ('(?P<ChaI>GATC)|(?P<ChaI_as>GATC)', 'GATC', 4, 4, -4, None, None, 4, 'GATC', 256, 37, 65, ())),
+        'CjeI': (25, ('(?P<CjeI>CCA......GT)|(?P<CjeI_as>AC......TGG)', 'CCANNNNNNGT', 11, -8, -25, 26, 9, 6, 'NNNNNN', 1024, 37, 65, ())),
+        'CjeNII': (1, ('(?P<CjeNII>GAG.....GT)|(?P<CjeNII_as>AC.....CTC)', 'GAGNNNNNGT', 10, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'CjePI': (25, ('(?P<CjePI>CCA.......TC)|(?P<CjePI_as>GA.......TGG)', 'CCANNNNNNNTC', 12, -7, -25, 26, 8, 6, 'NNNNNN', 1024, 37, 65, ())),
+        'CjuI': (1, ('(?P<CjuI>CA[CT].....[AG]TG)|(?P<CjuI_as>CA[CT].....[AG]TG)', 'CAYNNNNNRTG', 11, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'CjuII': (1, ('(?P<CjuII>CA[CT].....CTC)|(?P<CjuII_as>GAG.....[AG]TG)', 'CAYNNNNNCTC', 11, None, None, None, None, None, None, 2048, 37, 65, ())),
+        'ClaI': (6, ('(?P<ClaI>ATCGAT)|(?P<ClaI_as>ATCGAT)', 'ATCGAT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('B', 'H', 'K', 'M', 'N', 'R', 'S', 'U'))),
+        'CpoI': (12, ('(?P<CpoI>CGG[AT]CCG)|(?P<CpoI_as>CGG[AT]CCG)', 'CGGWCCG', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ('F', 'K'))),
+        'CseI': (12, ('(?P<CseI>GACGC)|(?P<CseI_as>GCGTC)', 'GACGC', 5, 10, 10, None, None, -5, 'NNNNN', 1024, 37, 65, ('F',))),
+        'CsiI': (12, ('(?P<CsiI>ACC[AT]GGT)|(?P<CsiI_as>ACC[AT]GGT)', 'ACCWGGT', 7, 1, -1, None, None, -5, 'CCWGG', 8192, 37, 65, ('F',))),
+        'Csp45I': (8, ('(?P<Csp45I>TTCGAA)|(?P<Csp45I_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('O', 'R'))),
+        'Csp6I': (8, ('(?P<Csp6I>GTAC)|(?P<Csp6I_as>GTAC)', 'GTAC', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('F',))),
+        'CspAI': (8, ('(?P<CspAI>ACCGGT)|(?P<CspAI_as>ACCGGT)', 'ACCGGT', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('C',))),
+        'CspCI': (24, ('(?P<CspCI>CAA.....GTGG)|(?P<CspCI_as>CCAC.....TTG)', 'CAANNNNNGTGG', 12, -11, -25, 24, 10, 2, 'NN', 16384, 37, 65, ('N',))),
+        'CspI': (12, ('(?P<CspI>CGG[AT]CCG)|(?P<CspI_as>CGG[AT]CCG)', 'CGGWCCG', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ('O', 'R'))),
+        'CstMI': (21, ('(?P<CstMI>AAGGAG)|(?P<CstMI_as>CTCCTT)', 'AAGGAG', 6, 26, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'CviAII': (6, ('(?P<CviAII>CATG)|(?P<CviAII_as>CATG)', 'CATG', 4, 1, -1, None, None, -2, 'AT', 256, 37, 65, ('N',))),
+        'CviJI': (2, ('(?P<CviJI>[AG]GC[CT])|(?P<CviJI_as>[AG]GC[CT])', 'RGCY', 4, 2, -2, None, None, 0, '', 64, 37, 65, ('Q', 'X'))),
+        'CviKI_1': (4, ('(?P<CviKI_1>[AG]GC[CT])|(?P<CviKI_1_as>[AG]GC[CT])', 'RGCY', 4, 2, -2, None, None, 0, '', 64, 37, 65, ('N',))),
+        'CviQI': (6, ('(?P<CviQI>GTAC)|(?P<CviQI_as>GTAC)', 'GTAC', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('N',))),
+        'CviRI': (3, ('(?P<CviRI>TGCA)|(?P<CviRI_as>TGCA)', 'TGCA', 4, 2, -2, None, None, 0, '', 256, 37, 65, ())),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'DdeI': (10, ('(?P<DdeI>CT.AG)|(?P<DdeI_as>CT.AG)', 'CTNAG', 5, 1, -1, None, None, -3, 'TNA', 256, 37, 65, ('B', 'M', 'N', 'O', 'R', 'S', 'W'))),
+        'DinI': (4, ('(?P<DinI>GGCGCC)|(?P<DinI_as>GGCGCC)', 'GGCGCC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('V',))),
+        'DpnI': (4, ('(?P<DpnI>GATC)|(?P<DpnI_as>GATC)', 'GATC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('B', 'E', 'F', 'M', 'N', 'O', 'R', 'S', 'W', 'X'))),
+        'DpnII': (6, ('(?P<DpnII>GATC)|(?P<DpnII_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('N',))),
+        'DraI': (2, ('(?P<DraI>TTTAAA)|(?P<DraI_as>TTTAAA)', 'TTTAAA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'F', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'DraII': (12, ('(?P<DraII>[AG]GG.CC[CT])|(?P<DraII_as>[AG]GG.CC[CT])', 'RGGNCCY', 7, 2, -2, None, None, -3, 'GNC', 1024, 37, 65, ('M', 'W'))),
+        'DraIII': (18, ('(?P<DraIII>CAC...GTG)|(?P<DraIII_as>CAC...GTG)', 'CACNNNGTG', 9, 6, -6, None, None, 3, 'NNN', 4096, 37, 65, ('I', 'M', 'N', 'V', 'W'))),
+        'DraRI': (21, ('(?P<DraRI>CAAG.AC)|(?P<DraRI_as>GT.CTTG)', 'CAAGNAC', 7, 27, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'DrdI': (20, ('(?P<DrdI>GAC......GTC)|(?P<DrdI_as>GAC......GTC)', 'GACNNNNNNGTC', 12, 7, -7, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'DrdII': (1, ('(?P<DrdII>GAACCA)|(?P<DrdII_as>TGGTTC)', 'GAACCA', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'DrdIV': (21, ('(?P<DrdIV>TACGAC)|(?P<DrdIV_as>GTCGTA)', 'TACGAC', 6, 26, 18, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'DriI': (20, ('(?P<DriI>GAC.....GTC)|(?P<DriI_as>GAC.....GTC)', 'GACNNNNNGTC', 11, 6, -6, None, None, 1, 'N', 4096, 37, 65, ('I',))),
+        'DsaI': (13, ('(?P<DsaI>CC[AG][CT]GG)|(?P<DsaI_as>CC[AG][CT]GG)', 'CCRYGG', 6, 1, -1, None, None, -4, 'CRYG', 1024, 37, 65, ())),
+        'DseDI': (20, ('(?P<DseDI>GAC......GTC)|(?P<DseDI_as>GAC......GTC)', 'GACNNNNNNGTC', 12, 7, -7, None, None, 2, 'NN', 4096, 37, 65, ('I', 'V'))),
+        'EaeI': (6, ('(?P<EaeI>[CT]GGCC[AG])|(?P<EaeI_as>[CT]GGCC[AG])', 'YGGCCR', 6, 1, -1, None, None, -4, 'GGCC', 1024, 37, 65, ('K', 'N'))),
+        'EagI': (6, ('(?P<EagI>CGGCCG)|(?P<EagI_as>CGGCCG)', 'CGGCCG', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('N', 'W'))),
+        'Eam1104I': (12, ('(?P<Eam1104I>CTCTTC)|(?P<Eam1104I_as>GAAGAG)', 'CTCTTC', 6, 7, 4, None, None, -3, 'NNN', 4096, 37, 65, ('F',))),
+        'Eam1105I': (20, ('(?P<Eam1105I>GAC.....GTC)|(?P<Eam1105I_as>GAC.....GTC)', 'GACNNNNNGTC', 11, 6, -6, None, None, 1, 'N', 4096, 37, 65, ('F', 'K'))),
+        'EarI': (12, ('(?P<EarI>CTCTTC)|(?P<EarI_as>GAAGAG)', 'CTCTTC', 6, 7, 4, None, None, -3, 'NNN', 4096, 37, 65, ('N',))),
+        'EciI': (20, ('(?P<EciI>GGCGGA)|(?P<EciI_as>TCCGCC)', 'GGCGGA', 6, 17, 9, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'Ecl136II': (4, ('(?P<Ecl136II>GAGCTC)|(?P<Ecl136II_as>GAGCTC)', 'GAGCTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'EclXI': (8, ('(?P<EclXI>CGGCCG)|(?P<EclXI_as>CGGCCG)', 'CGGCCG', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('M', 'S'))),
+        'Eco105I': (4, ('(?P<Eco105I>TACGTA)|(?P<Eco105I_as>TACGTA)', 'TACGTA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F', 'O'))),
+        'Eco130I': (12, ('(?P<Eco130I>CC[AT][AT]GG)|(?P<Eco130I_as>CC[AT][AT]GG)', 'CCWWGG', 6, 1, -1, None, None, -4, 'CWWG', 1024, 37, 65, ('F',))),
+        'Eco147I': (4, ('(?P<Eco147I>AGGCCT)|(?P<Eco147I_as>AGGCCT)', 'AGGCCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'Eco24I': (20, ('(?P<Eco24I>G[AG]GC[CT]C)|(?P<Eco24I_as>G[AG]GC[CT]C)', 'GRGCYC', 6, 5, -5, None, None, 4, 'RGCY', 1024, 37, 65, ('F',))),
+        'Eco31I': (10, ('(?P<Eco31I>GGTCTC)|(?P<Eco31I_as>GAGACC)', 'GGTCTC', 6, 7, 5, None, None, -4, 'NNNN', 4096, 37, 65, ('F',))),
+        'Eco32I': (4, ('(?P<Eco32I>GATATC)|(?P<Eco32I_as>GATATC)', 'GATATC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'Eco47I': (12, ('(?P<Eco47I>GG[AT]CC)|(?P<Eco47I_as>GG[AT]CC)', 'GGWCC', 5, 1, -1, None, None, -3, 'GWC', 512, 37, 65, ('F', 'O'))),
+        'Eco47III': (4, ('(?P<Eco47III>AGCGCT)|(?P<Eco47III_as>AGCGCT)', 'AGCGCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F', 'M', 'O', 'R', 'W'))),
+        'Eco52I': (8, ('(?P<Eco52I>CGGCCG)|(?P<Eco52I_as>CGGCCG)', 'CGGCCG', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('F', 'K', 'O'))),
+        'Eco53kI': (4, ('(?P<Eco53kI>GAGCTC)|(?P<Eco53kI_as>GAGCTC)', 'GAGCTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'Eco57I': (18, ('(?P<Eco57I>CTGAAG)|(?P<Eco57I_as>CTTCAG)', 'CTGAAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ('F',))),
+        'Eco57MI': (20, ('(?P<Eco57MI>CTG[AG]AG)|(?P<Eco57MI_as>CT[CT]CAG)', 'CTGRAG', 6, 22, 14, None, None, 2, 'NN', 2048, 37, 65, ('F',))),
+        'Eco72I': (4, ('(?P<Eco72I>CACGTG)|(?P<Eco72I_as>CACGTG)', 'CACGTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'Eco81I': (12, ('(?P<Eco81I>CCT.AGG)|(?P<Eco81I_as>CCT.AGG)', 'CCTNAGG', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ('F', 'K', 'O'))),
+        'Eco88I': (12, ('(?P<Eco88I>C[CT]CG[AG]G)|(?P<Eco88I_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 1, -1, None, None, -4, 'YCGR', 1024, 37, 65, ('F',))),
+        'Eco91I': (12, ('(?P<Eco91I>GGT.ACC)|(?P<Eco91I_as>GGT.ACC)', 'GGTNACC', 7, 1, -1, None, None, -5, 'GTNAC', 4096, 37, 65, ('F',))),
+        'EcoHI': (11, ('(?P<EcoHI>CC[CG]GG)|(?P<EcoHI_as>CC[CG]GG)', 'CCSGG', 5, 0, 0, None, None, -5, 'CCSGG', 512, 37, 65, ())),
+        'EcoICRI': (4, ('(?P<EcoICRI>GAGCTC)|(?P<EcoICRI_as>GAGCTC)', 'GAGCTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'R', 'V'))),
+        'EcoNI': (12, ('(?P<EcoNI>CCT.....AGG)|(?P<EcoNI_as>CCT.....AGG)', 'CCTNNNNNAGG', 11, 5, -5, None, None, -1, 'N', 4096, 37, 65, ('N',))),
+        'EcoO109I': (10, ('(?P<EcoO109I>[AG]GG.CC[CT])|(?P<EcoO109I_as>[AG]GG.CC[CT])', 'RGGNCCY', 7, 2, -2, None, None, -3, 'GNC', 1024, 37, 65, ('F', 'J', 'K', 'N'))),
+        'EcoO65I': (12, ('(?P<EcoO65I>GGT.ACC)|(?P<EcoO65I_as>GGT.ACC)', 'GGTNACC', 7, 1, -1, None, None, -5, 'GTNAC', 4096, 37, 65, ('K',))),
+        'EcoRI': (6, ('(?P<EcoRI>GAATTC)|(?P<EcoRI_as>GAATTC)', 'GAATTC', 6, 1, -1, None, None, -4, 'AATT', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'EcoRII': (10, ('(?P<EcoRII>CC[AT]GG)|(?P<EcoRII_as>CC[AT]GG)', 'CCWGG', 5, 0, 0, None, None, -5, 'CCWGG', 512, 37, 65, ('F', 'J', 'M', 'O', 'S'))),
+        'EcoRV': (2, ('(?P<EcoRV>GATATC)|(?P<EcoRV_as>GATATC)', 'GATATC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'EcoT14I': (12, ('(?P<EcoT14I>CC[AT][AT]GG)|(?P<EcoT14I_as>CC[AT][AT]GG)', 'CCWWGG', 6, 1, -1, None, None, -4, 'CWWG', 1024, 37, 65, ('K',))),
+        'EcoT22I': (16, ('(?P<EcoT22I>ATGCAT)|(?P<EcoT22I_as>ATGCAT)', 'ATGCAT', 6, 5, -5, None, None, 4, 'TGCA', 4096, 37, 65, ('K', 'O'))),
+        'EcoT38I': (18, ('(?P<EcoT38I>G[AG]GC[CT]C)|(?P<EcoT38I_as>G[AG]GC[CT]C)', 'GRGCYC', 6, 5, -5, None, None, 4, 'RGCY', 1024, 37, 65, ('J',))),
+        'EgeI': (4, ('(?P<EgeI>GGCGCC)|(?P<EgeI_as>GGCGCC)', 'GGCGCC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I',))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'EheI': (4, ('(?P<EheI>GGCGCC)|(?P<EheI_as>GGCGCC)', 'GGCGCC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F', 'O'))),
+        'ErhI': (12, ('(?P<ErhI>CC[AT][AT]GG)|(?P<ErhI_as>CC[AT][AT]GG)', 'CCWWGG', 6, 1, -1, None, None, -4, 'CWWG', 1024, 37, 65, ('I', 'V'))),
+        'EsaBC3I': (3, ('(?P<EsaBC3I>TCGA)|(?P<EsaBC3I_as>TCGA)', 'TCGA', 4, 2, -2, None, None, 0, '', 256, 37, 65, ())),
+        'EsaSSI': (1, ('(?P<EsaSSI>GACCAC)|(?P<EsaSSI_as>GTGGTC)', 'GACCAC', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'Esp3I': (10, ('(?P<Esp3I>CGTCTC)|(?P<Esp3I_as>GAGACG)', 'CGTCTC', 6, 7, 5, None, None, -4, 'NNNN', 4096, 37, 65, ('F',))),
+        'EspI': (13, ('(?P<EspI>GCT.AGC)|(?P<EspI_as>GCT.AGC)', 'GCTNAGC', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ())),
+        'FaeI': (16, ('(?P<FaeI>CATG)|(?P<FaeI_as>CATG)', 'CATG', 4, 4, -4, None, None, 4, 'CATG', 256, 37, 65, ('I',))),
+        'FaiI': (4, ('(?P<FaiI>[CT]AT[AG])|(?P<FaiI_as>[CT]AT[AG])', 'YATR', 4, 2, -2, None, None, 0, '', 64, 37, 65, ('I',))),
+        'FalI': (24, ('(?P<FalI>AAG.....CTT)|(?P<FalI_as>AAG.....CTT)', 'AAGNNNNNCTT', 11, -8, -24, 24, 8, 5, 'NNNNN', 4096, 37, 65, ('I',))),
+        'FaqI': (12, ('(?P<FaqI>GGGAC)|(?P<FaqI_as>GTCCC)', 'GGGAC', 5, 15, 14, None, None, -4, 'NNNN', 1024, 37, 65, ('F',))),
+        'FatI': (6, ('(?P<FatI>CATG)|(?P<FatI_as>CATG)', 'CATG', 4, 0, 0, None, None, -4, 'CATG', 256, 37, 65, ('I', 'N'))),
+        'FauI': (12, ('(?P<FauI>CCCGC)|(?P<FauI_as>GCGGG)', 'CCCGC', 5, 9, 6, None, None, -2, 'NN', 1024, 37, 65, ('I', 'N'))),
+        'FauNDI': (8, ('(?P<FauNDI>CATATG)|(?P<FauNDI_as>CATATG)', 'CATATG', 6, 2, -2, None, None, -2, 'TA', 4096, 37, 65, ('I', 'V'))),
+        'FbaI': (8, ('(?P<FbaI>TGATCA)|(?P<FbaI_as>TGATCA)', 'TGATCA', 6, 1, -1, None, None, -4, 'GATC', 4096, 37, 65, ('K',))),
+        'FblI': (12, ('(?P<FblI>GT[AC][GT]AC)|(?P<FblI_as>GT[AC][GT]AC)', 'GTMKAC', 6, 2, -2, None, None, -2, 'MK', 1024, 37, 65, ('I', 'V'))),
+        'FinI': (1, ('(?P<FinI>GGGAC)|(?P<FinI_as>GTCCC)', 'GGGAC', 5, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'FmuI': (21, ('(?P<FmuI>GG.CC)|(?P<FmuI_as>GG.CC)', 'GGNCC', 5, 4, -4, None, None, 3, 'GNC', 256, 37, 65, ())),
+        'Fnu4HI': (10, ('(?P<Fnu4HI>GC.GC)|(?P<Fnu4HI_as>GC.GC)', 'GCNGC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('N',))),
+        'FnuDII': (3, ('(?P<FnuDII>CGCG)|(?P<FnuDII_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ())),
+        'FokI': (10, ('(?P<FokI>GGATG)|(?P<FokI_as>CATCC)', 'GGATG', 5, 14, 13, None, None, -4, 'NNNN', 1024, 37, 65, ('I', 'J', 'K', 'M', 'N', 'Q', 'R', 'V', 'W', 'X'))),
+        'FriOI': (20, ('(?P<FriOI>G[AG]GC[CT]C)|(?P<FriOI_as>G[AG]GC[CT]C)', 'GRGCYC', 6, 5, -5, None, None, 4, 'RGCY', 1024, 37, 65, ('I', 'V'))),
+        'FseI': (14, ('(?P<FseI>GGCCGGCC)|(?P<FseI_as>GGCCGGCC)', 'GGCCGGCC', 8, 6, -6, None, None, 4, 'CCGG', 65536, 37, 65, ('N',))),
+        'Fsp4HI': (10, ('(?P<Fsp4HI>GC.GC)|(?P<Fsp4HI_as>GC.GC)', 'GCNGC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('I',))),
+        'FspAI': (4, ('(?P<FspAI>[AG]TGCGCA[CT])|(?P<FspAI_as>[AG]TGCGCA[CT])', 'RTGCGCAY', 8, 4, -4, None, None, 0, '', 16384, 37, 65, ('F',))),
+        'FspBI': (8, ('(?P<FspBI>CTAG)|(?P<FspBI_as>CTAG)', 'CTAG', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('F',))),
+        'FspI': (2, ('(?P<FspI>TGCGCA)|(?P<FspI_as>TGCGCA)', 'TGCGCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('J', 'N', 'O'))),
+        'GdiII': (9, ('(?P<GdiII>CGGCC[AG])|(?P<GdiII_as>[CT]GGCCG)', 'CGGCCR', 6, 1, -1, None, None, -4, 'GGCC', 2048, 37, 65, ())),
+        'GlaI': (4, ('(?P<GlaI>GCGC)|(?P<GlaI_as>GCGC)', 'GCGC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('I',))),
+        'GluI': (12, ('(?P<GluI>GC.GC)|(?P<GluI_as>GC.GC)', 'GCNGC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('I',))),
+        'GsaI': (16, ('(?P<GsaI>CCCAGC)|(?P<GsaI_as>GCTGGG)', 'CCCAGC', 6, 5, -5, None, None, 4, 'CCAG', 4096, 37, 65, ('I',))),
+        'GsuI': (20, ('(?P<GsuI>CTGGAG)|(?P<GsuI_as>CTCCAG)', 'CTGGAG', 6, 22, 14, None, None, 2, 'NN', 4096, 37, 65, ('F',))),
+        'HaeI': (5, ('(?P<HaeI>[AT]GGCC[AT])|(?P<HaeI_as>[AT]GGCC[AT])', 'WGGCCW', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ())),
+        'HaeII': (14, ('(?P<HaeII>[AG]GCGC[CT])|(?P<HaeII_as>[AG]GCGC[CT])', 'RGCGCY', 6, 5, -5, None, None, 4, 'GCGC', 1024, 37, 65, ('J', 'K', 'N', 'O', 'R', 'W'))),
+        'HaeIII': (2, ('(?P<HaeIII>GGCC)|(?P<HaeIII_as>GGCC)', 'GGCC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('B', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X', 'Y'))),
+        'HapII': (6, ('(?P<HapII>CCGG)|(?P<HapII_as>CCGG)', 'CCGG', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('K',))),
+        'HgaI': (10, ('(?P<HgaI>GACGC)|(?P<HgaI_as>GCGTC)', 'GACGC', 5, 10, 10, None, None, -5, 'NNNNN', 1024, 37, 65, ('I', 'N'))),
+        'HgiAI': (21, ('(?P<HgiAI>G[AT]GC[AT]C)|(?P<HgiAI_as>G[AT]GC[AT]C)', 'GWGCWC', 6, 5, -5, None, None, 4, 'WGCW', 1024, 37, 65, ())),
+        'HgiCI': (11, ('(?P<HgiCI>GG[CT][AG]CC)|(?P<HgiCI_as>GG[CT][AG]CC)', 'GGYRCC', 6, 1, -1, None, None, -4, 'GYRC', 1024, 37, 65, ())),
+        'HgiEII': (1, ('(?P<HgiEII>ACC......GGT)|(?P<HgiEII_as>ACC......GGT)', 'ACCNNNNNNGGT', 12, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'HgiJII': (21, ('(?P<HgiJII>G[AG]GC[CT]C)|(?P<HgiJII_as>G[AG]GC[CT]C)', 'GRGCYC', 6, 5, -5, None, None, 4, 'RGCY', 1024, 37, 65, ())),
+        'HhaI': (14, ('(?P<HhaI>GCGC)|(?P<HhaI_as>GCGC)', 'GCGC', 4, 3, -3, None, None, 2, 'CG', 256, 37, 65, ('B', 'F', 'J', 'K', 'N', 'O', 'R', 'U', 'W', 'Y'))),
+        'Hin1I': (8, ('(?P<Hin1I>G[AG]CG[CT]C)|(?P<Hin1I_as>G[AG]CG[CT]C)', 'GRCGYC', 6, 2, -2, None, None, -2, 'CG', 1024, 37, 65, ('F', 'K', 'O'))),
+        'Hin1II': (16, ('(?P<Hin1II>CATG)|(?P<Hin1II_as>CATG)', 'CATG', 4, 4, -4, None, None, 4, 'CATG', 256, 37, 65, ('F',))),
+        'Hin4I': (24, ('(?P<Hin4I>GA[CT].....[ACG]TC)|(?P<Hin4I_as>GA[CGT].....[AG]TC)', 'GAYNNNNNVTC', 11, -8, -24, 24, 8, 5, 'NNNNN', 512, 37, 65, ('F',))),
+        'Hin4II': (21, ('(?P<Hin4II>CCTTC)|(?P<Hin4II_as>GAAGG)', 'CCTTC', 5, 11, 5, None, None, 1, 'N', 1024, 37, 65, ())),
+        'Hin6I': (8, ('(?P<Hin6I>GCGC)|(?P<Hin6I_as>GCGC)', 'GCGC', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('F',))),
+        'HinP1I': (6, ('(?P<HinP1I>GCGC)|(?P<HinP1I_as>GCGC)', 'GCGC', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('N',))),
+        'HincII': (2, ('(?P<HincII>GT[CT][AG]AC)|(?P<HincII_as>GT[CT][AG]AC)', 'GTYRAC', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ('B', 'F', 'H', 'J', 'K', 'N', 'O', 'Q', 'R', 'U', 'W', 'X', 'Y'))),
+        'HindII': (2, ('(?P<HindII>GT[CT][AG]AC)|(?P<HindII_as>GT[CT][AG]AC)', 'GTYRAC', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ('I', 'M', 'S', 'V'))),
+        'HindIII': (6, ('(?P<HindIII>AAGCTT)|(?P<HindIII_as>AAGCTT)', 'AAGCTT', 6, 1, -1, None, None, -4, 'AGCT', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'HinfI': (10, ('(?P<HinfI>GA.TC)|(?P<HinfI_as>GA.TC)', 'GANTC', 5, 1, -1, None, None, -3, 'ANT', 256, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'U', 'V', 'W', 'X', 'Y'))),
+        'HpaI': (2, ('(?P<HpaI>GTTAAC)|(?P<HpaI_as>GTTAAC)', 'GTTAAC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X'))),
+        'HpaII': (6, ('(?P<HpaII>CCGG)|(?P<HpaII_as>CCGG)', 'CCGG', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('B', 'F', 'I', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X'))),
+        'HphI': (18, ('(?P<HphI>GGTGA)|(?P<HphI_as>TCACC)', 'GGTGA', 5, 13, 7, None, None, 1, 'N', 1024, 37, 65, ('F', 'N'))),
+        'Hpy166II': (4, ('(?P<Hpy166II>GT..AC)|(?P<Hpy166II_as>GT..AC)', 'GTNNAC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('N',))),
+        'Hpy178III': (13, ('(?P<Hpy178III>TC..GA)|(?P<Hpy178III_as>TC..GA)', 'TCNNGA', 6, 2, -2, None, None, -2, 'NN', 256, 37, 65, ())),
+        'Hpy188I': (18, ('(?P<Hpy188I>TC.GA)|(?P<Hpy188I_as>TC.GA)', 'TCNGA', 5, 3, -3, None, None, 1, 'N', 256, 37, 65, ('N',))),
+        'Hpy188III': (12, ('(?P<Hpy188III>TC..GA)|(?P<Hpy188III_as>TC..GA)', 'TCNNGA', 6, 2, -2, None, None, -2, 'NN', 256, 37, 65, ('N',))),
+        'Hpy8I': (2, ('(?P<Hpy8I>GT..AC)|(?P<Hpy8I_as>GT..AC)', 'GTNNAC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('F',))),
+        'Hpy99I': (18, ('(?P<Hpy99I>CG[AT]CG)|(?P<Hpy99I_as>CG[AT]CG)', 'CGWCG', 5, 5, -5, None, None, 5, 'CGWCG', 512, 37, 65, ('N',))),
+        'HpyAV': (18, ('(?P<HpyAV>CCTTC)|(?P<HpyAV_as>GAAGG)', 'CCTTC', 5, 11, 5, None, None, 1, 'N', 1024, 37, 65, ('N',))),
+        'HpyCH4III': (20, ('(?P<HpyCH4III>AC.GT)|(?P<HpyCH4III_as>AC.GT)', 'ACNGT', 5, 3, -3, None, None, 1, 'N', 256, 37, 65, ('N',))),
+        'HpyCH4IV': (6, ('(?P<HpyCH4IV>ACGT)|(?P<HpyCH4IV_as>ACGT)', 'ACGT', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('N',))),
+        'HpyCH4V': (4, ('(?P<HpyCH4V>TGCA)|(?P<HpyCH4V_as>TGCA)', 'TGCA', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('N',))),
+        'HpyF10VI': (20, ('(?P<HpyF10VI>GC.......GC)|(?P<HpyF10VI_as>GC.......GC)', 'GCNNNNNNNGC', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('F',))),
+        'HpyF3I': (12, ('(?P<HpyF3I>CT.AG)|(?P<HpyF3I_as>CT.AG)', 'CTNAG', 5, 1, -1, None, None, -3, 'TNA', 256, 37, 65, ('F',))),
+        'Hsp92I': (8, ('(?P<Hsp92I>G[AG]CG[CT]C)|(?P<Hsp92I_as>G[AG]CG[CT]C)', 'GRCGYC', 6, 2, -2, None, None, -2, 'CG', 1024, 37, 65, ('R',))),
+        'Hsp92II': (16, ('(?P<Hsp92II>CATG)|(?P<Hsp92II_as>CATG)', 'CATG', 4, 4, -4, None, None, 4, 'CATG', 256, 37, 65, ('R',))),
+        'HspAI': (6, ('(?P<HspAI>GCGC)|(?P<HspAI_as>GCGC)', 'GCGC', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('I', 'V'))),
+        'ItaI': (12, ('(?P<ItaI>GC.GC)|(?P<ItaI_as>GC.GC)', 'GCNGC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('M',))),
+        'KasI': (6, ('(?P<KasI>GGCGCC)|(?P<KasI_as>GGCGCC)', 'GGCGCC', 6, 1, -1, None, None, -4, 'GCGC', 4096, 37, 65, ('N',))),
+        'KflI': (12, ('(?P<KflI>GGG[AT]CCC)|(?P<KflI_as>GGG[AT]CCC)', 'GGGWCCC', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ('F',))),
+        'Kpn2I': (6, ('(?P<Kpn2I>TCCGGA)|(?P<Kpn2I_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('F',))),
+        'KpnI': (14, ('(?P<KpnI>GGTACC)|(?P<KpnI_as>GGTACC)', 'GGTACC', 6, 5, -5, None, None, 4, 'GTAC', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'Ksp22I': (8, ('(?P<Ksp22I>TGATCA)|(?P<Ksp22I_as>TGATCA)', 'TGATCA', 6, 1, -1, None, None, -4, 'GATC', 4096, 37, 65, ('I', 'V'))),
+        'Ksp632I': (13, ('(?P<Ksp632I>CTCTTC)|(?P<Ksp632I_as>GAAGAG)', 'CTCTTC', 6, 7, 4, None, None, -3, 'NNN', 4096, 37, 65, ())),
+        'KspAI': (4, ('(?P<KspAI>GTTAAC)|(?P<KspAI_as>GTTAAC)', 'GTTAAC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'KspI': (16, ('(?P<KspI>CCGCGG)|(?P<KspI_as>CCGCGG)', 'CCGCGG', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ('M', 'S'))),
+        'Kzo9I': (8, ('(?P<Kzo9I>GATC)|(?P<Kzo9I_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('I',))),
+        'LguI': (12, ('(?P<LguI>GCTCTTC)|(?P<LguI_as>GAAGAGC)', 'GCTCTTC', 7, 8, 4, None, None, -3, 'NNN', 16384, 37, 65, ('F',))),
+        'LpnI': (5, ('(?P<LpnI>[AG]GCGC[CT])|(?P<LpnI_as>[AG]GCGC[CT])', 'RGCGCY', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ())),
+        'Lsp1109I': (10, ('(?P<Lsp1109I>GCAGC)|(?P<Lsp1109I_as>GCTGC)', 'GCAGC', 5, 13, 12, None, None, -4, 'NNNN', 1024, 37, 65, ('F',))),
+        'LweI': (12, ('(?P<LweI>GCATC)|(?P<LweI_as>GATGC)', 'GCATC', 5, 10, 9, None, None, -4, 'NNNN', 1024, 37, 65, ('F',))),
+        'MabI': (12, ('(?P<MabI>ACC[AT]GGT)|(?P<MabI_as>ACC[AT]GGT)', 'ACCWGGT', 7, 1, -1, None, None, -5, 'CCWGG', 8192, 37, 65, ('I',))),
+        'MaeI': (8, ('(?P<MaeI>CTAG)|(?P<MaeI_as>CTAG)', 'CTAG', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('M',))),
+        'MaeII': (8, ('(?P<MaeII>ACGT)|(?P<MaeII_as>ACGT)', 'ACGT', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('M',))),
+        'MaeIII': (12, ('(?P<MaeIII>GT.AC)|(?P<MaeIII_as>GT.AC)', 'GTNAC', 5, 0, 0, None, None, -5, 'GTNAC', 256, 37, 65, ('M',))),
+        'MalI': (4, ('(?P<MalI>GATC)|(?P<MalI_as>GATC)', 'GATC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('I',))),
+        'MaqI': (21, ('(?P<MaqI>C[AG]TTGAC)|(?P<MaqI_as>GTCAA[CT]G)', 'CRTTGAC', 7, 28, 19, None, None, 2, 'NN', 8192, 37, 65, ())),
+        'MauBI': (8, ('(?P<MauBI>CGCGCGCG)|(?P<MauBI_as>CGCGCGCG)', 'CGCGCGCG', 8, 2, -2, None, None, -4, 'CGCG', 65536, 37, 65, ('F',))),
+        'MbiI': (4, ('(?P<MbiI>CCGCTC)|(?P<MbiI_as>GAGCGG)', 'CCGCTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'MboI': (6, ('(?P<MboI>GATC)|(?P<MboI_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('B', 'C', 'F', 'K', 'N', 'Q', 'R', 'U', 'W', 'X', 'Y'))),
+        'MboII': (18, ('(?P<MboII>GAAGA)|(?P<MboII_as>TCTTC)', 'GAAGA', 5, 13, 7, None, None, 1, 'N', 1024, 37, 65, ('F', 'I', 'J', 'K', 'N', 'O', 'Q', 'R', 'V', 'W', 'X'))),
+        'McaTI': (15, ('(?P<McaTI>GCGCGC)|(?P<McaTI_as>GCGCGC)', 'GCGCGC', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ())),
+        'McrI': (21, ('(?P<McrI>CG[AG][CT]CG)|(?P<McrI_as>CG[AG][CT]CG)', 'CGRYCG', 6, 4, -4, None, None, 2, 'RY', 1024, 37, 65, ())),
+        'MfeI': (6, ('(?P<MfeI>CAATTG)|(?P<MfeI_as>CAATTG)', 'CAATTG', 6, 1, -1, None, None, -4, 'AATT', 4096, 37, 65, ('N',))),
+        'MflI': (8, ('(?P<MflI>[AG]GATC[CT])|(?P<MflI_as>[AG]GATC[CT])', 'RGATCY', 6, 1, -1, None, None, -4, 'GATC', 1024, 37, 65, ('K',))),
+        'MhlI': (20, ('(?P<MhlI>G[AGT]GC[ACT]C)|(?P<MhlI_as>G[AGT]GC[ACT]C)', 'GDGCHC', 6, 5, -5, None, None, 4, 'DGCH', 256, 37, 65, ('I', 'V'))),
+        'MjaIV': (1, ('(?P<MjaIV>GT..AC)|(?P<MjaIV_as>GT..AC)', 'GTNNAC', 6, None, None, None, None, None, None, 256, 37, 65, ())),
+        'MlsI': (4, ('(?P<MlsI>TGGCCA)|(?P<MlsI_as>TGGCCA)', 'TGGCCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'MluI': (6, ('(?P<MluI>ACGCGT)|(?P<MluI_as>ACGCGT)', 'ACGCGT', 6, 1, -1, None, None, -4, 'CGCG', 4096, 37, 65, ('B', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X'))),
+        'MluNI': (4, ('(?P<MluNI>TGGCCA)|(?P<MluNI_as>TGGCCA)', 'TGGCCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('M', 'S'))),
+        'Mly113I': (8, ('(?P<Mly113I>GGCGCC)|(?P<Mly113I_as>GGCGCC)', 'GGCGCC', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('I',))),
+        'MlyI': (2, ('(?P<MlyI>GAGTC)|(?P<MlyI_as>GACTC)', 'GAGTC', 5, 10, 5, None, None, 0, '', 1024, 37, 65, ('N',))),
+        'MmeI': (18, ('(?P<MmeI>TCC[AG]AC)|(?P<MmeI_as>GT[CT]GGA)', 'TCCRAC', 6, 26, 18, None, None, 2, 'NN', 2048, 37, 65, ('N', 'X'))),
+        'MnlI': (18, ('(?P<MnlI>CCTC)|(?P<MnlI_as>GAGG)', 'CCTC', 4, 11, 6, None, None, 1, 'N', 256, 37, 65, ('F', 'I', 'N', 'Q', 'V', 'W', 'X'))),
+        'Mph1103I': (16, ('(?P<Mph1103I>ATGCAT)|(?P<Mph1103I_as>ATGCAT)', 'ATGCAT', 6, 5, -5, None, None, 4, 'TGCA', 4096, 37, 65, ('F',))),
+        'MreI': (8, ('(?P<MreI>CGCCGGCG)|(?P<MreI_as>CGCCGGCG)', 'CGCCGGCG', 8, 2, -2, None, None, -4, 'CCGG', 65536, 37, 65, ('F',))),
+        'MroI': (8, ('(?P<MroI>TCCGGA)|(?P<MroI_as>TCCGGA)', 'TCCGGA', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('M', 'O'))),
+        'MroNI': (8, ('(?P<MroNI>GCCGGC)|(?P<MroNI_as>GCCGGC)', 'GCCGGC', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('I', 'V'))),
+        'MroXI': (4, ('(?P<MroXI>GAA....TTC)|(?P<MroXI_as>GAA....TTC)', 'GAANNNNTTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'MscI': (4, ('(?P<MscI>TGGCCA)|(?P<MscI_as>TGGCCA)', 'TGGCCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'N', 'O'))),
+        'MseI': (6, ('(?P<MseI>TTAA)|(?P<MseI_as>TTAA)', 'TTAA', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('B', 'N'))),
+        'MslI': (4, ('(?P<MslI>CA[CT]....[AG]TG)|(?P<MslI_as>CA[CT]....[AG]TG)', 'CAYNNNNRTG', 10, 5, -5, None, None, 0, '', 1024, 37, 65, ('N',))),
+        'Msp20I': (4, ('(?P<Msp20I>TGGCCA)|(?P<Msp20I_as>TGGCCA)', 'TGGCCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'MspA1I': (2, ('(?P<MspA1I>C[AC]GC[GT]G)|(?P<MspA1I_as>C[AC]GC[GT]G)', 'CMGCKG', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ('I', 'N', 'R', 'V'))),
+        'MspCI': (8, ('(?P<MspCI>CTTAAG)|(?P<MspCI_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('C',))),
+        'MspI': (6, ('(?P<MspI>CCGG)|(?P<MspI_as>CCGG)', 'CCGG', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'MspR9I': (12, ('(?P<MspR9I>CC.GG)|(?P<MspR9I_as>CC.GG)', 'CCNGG', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('I',))),
+        'MssI': (4, ('(?P<MssI>GTTTAAAC)|(?P<MssI_as>GTTTAAAC)', 'GTTTAAAC', 8, 4, -4, None, None, 0, '', 65536, 37, 65, ('F',))),
+        'MstI': (5, ('(?P<MstI>TGCGCA)|(?P<MstI_as>TGCGCA)', 'TGCGCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ())),
+        'MunI': (6, ('(?P<MunI>CAATTG)|(?P<MunI_as>CAATTG)', 'CAATTG', 6, 1, -1, None, None, -4, 'AATT', 4096, 37, 65, ('F', 'K', 'M'))),
+        'Mva1269I': (20, ('(?P<Mva1269I>GAATGC)|(?P<Mva1269I_as>GCATTC)', 'GAATGC', 6, 7, -1, None, None, 2, 'CN', 4096, 37, 65, ('F',))),
+        'MvaI': (10, ('(?P<MvaI>CC[AT]GG)|(?P<MvaI_as>CC[AT]GG)', 'CCWGG', 5, 2, -2, None, None, -1, 'W', 512, 37, 65, ('F', 'K', 'M', 'O', 'S', 'W'))),
+        'MvnI': (4, ('(?P<MvnI>CGCG)|(?P<MvnI_as>CGCG)', 'CGCG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('M',))),
+        'MvrI': (16, ('(?P<MvrI>CGATCG)|(?P<MvrI_as>CGATCG)', 'CGATCG', 6, 4, -4, None, None, 2, 'AT', 4096, 37, 65, ('U',))),
+        'MwoI': (18, ('(?P<MwoI>GC.......GC)|(?P<MwoI_as>GC.......GC)', 'GCNNNNNNNGC', 11, 7, -7, None, None, 3, 'NNN', 256, 37, 65, ('N',))),
+        'NaeI': (2, ('(?P<NaeI>GCCGGC)|(?P<NaeI_as>GCCGGC)', 'GCCGGC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('C', 'K', 'M', 'N', 'O', 'R', 'U'))),
+        'NarI': (8, ('(?P<NarI>GGCGCC)|(?P<NarI_as>GGCGCC)', 'GGCGCC', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('J', 'M', 'N', 'O', 'Q', 'R', 'U', 'W', 'X'))),
+        'NciI': (12, ('(?P<NciI>CC[CG]GG)|(?P<NciI_as>CC[CG]GG)', 'CCSGG', 5, 2, -2, None, None, -1, 'S', 512, 37, 65, ('J', 'N', 'O', 'R', 'W'))),
+        'NcoI': (6, ('(?P<NcoI>CCATGG)|(?P<NcoI_as>CCATGG)', 'CCATGG', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('B', 'C', 'F', 'H', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X', 'Y'))),
+        'NdeI': (6, ('(?P<NdeI>CATATG)|(?P<NdeI_as>CATATG)', 'CATATG', 6, 2, -2, None, None, -2, 'TA', 4096, 37, 65, ('B', 'F', 'J', 'K', 'M', 'N', 'Q', 'R', 'S', 'W', 'X', 'Y'))),
+        'NdeII': (8, ('(?P<NdeII>GATC)|(?P<NdeII_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('J', 'M', 'R', 'W'))),
+        'NgoAVIII': (25, ('(?P<NgoAVIII>GAC.....TGA)|(?P<NgoAVIII_as>TCA.....GTC)', 'GACNNNNNTGA', 11, -12, -25, 24, 11, 2, 'NN', 4096, 37, 65, ())),
+        'NgoMIV': (6, ('(?P<NgoMIV>GCCGGC)|(?P<NgoMIV_as>GCCGGC)', 'GCCGGC', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('N', 'R'))),
+        'NhaXI': (1, ('(?P<NhaXI>CAAG[AG]AG)|(?P<NhaXI_as>CT[CT]CTTG)', 'CAAGRAG', 7, None, None, None, None, None, None, 8192, 37, 65, ())),
+        'NheI': (8, ('(?P<NheI>GCTAGC)|(?P<NheI_as>GCTAGC)', 'GCTAGC', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('B', 'C', 'F', 'J', 'K', 'M', 'N', 'O', 'R', 'S', 'U', 'W'))),
+        'NlaCI': (21, ('(?P<NlaCI>CATCAC)|(?P<NlaCI_as>GTGATG)', 'CATCAC', 6, 25, 17, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'NlaIII': (14, ('(?P<NlaIII>CATG)|(?P<NlaIII_as>CATG)', 'CATG', 4, 4, -4, None, None, 4, 'CATG', 256, 37, 65, ('N', 'W'))),
+        'NlaIV': (2, ('(?P<NlaIV>GG..CC)|(?P<NlaIV_as>GG..CC)', 'GGNNCC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('N', 'W'))),
+        'Nli3877I': (21, ('(?P<Nli3877I>C[CT]CG[AG]G)|(?P<Nli3877I_as>C[CT]CG[AG]G)', 'CYCGRG', 6, 5, -5, None, None, 4, 'YCGR', 1024, 37, 65, ())),
+        'NmeAIII': (20, ('(?P<NmeAIII>GCCGAG)|(?P<NmeAIII_as>CTCGGC)', 'GCCGAG', 6, 27, 19, None, None, 2, 'NN', 4096, 37, 65, ('N',))),
+        'NmeDI': (22, ('(?P<NmeDI>[AG]CCGG[CT])|(?P<NmeDI_as>[AG]CCGG[CT])', 'RCCGGY', 6, -12, -13, 13, 12, -5, 'NNNNN', 1024, 37, 65, ())),
+        'NmuCI': (12, ('(?P<NmuCI>GT[CG]AC)|(?P<NmuCI_as>GT[CG]AC)', 'GTSAC', 5, 0, 0, None, None, -5, 'GTSAC', 512, 37, 65, ('F',))),
+        'NotI': (6, ('(?P<NotI>GCGGCCGC)|(?P<NotI_as>GCGGCCGC)', 'GCGGCCGC', 8, 2, -2, None, None, -4, 'GGCC', 65536, 37, 65, ('B', 'C', 'F', 'H', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X', 'Y'))),
+        'NruI': (4, ('(?P<NruI>TCGCGA)|(?P<NruI_as>TCGCGA)', 'TCGCGA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'U', 'W', 'X'))),
+        'NsbI': (4, ('(?P<NsbI>TGCGCA)|(?P<NsbI_as>TGCGCA)', 'TGCGCA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F', 'K'))),
+        'NsiI': (16, ('(?P<NsiI>ATGCAT)|(?P<NsiI_as>ATGCAT)', 'ATGCAT', 6, 5, -5, None, None, 4, 'TGCA', 4096, 37, 65, ('B', 'H', 'J', 'M', 'N', 'R', 'S', 'U', 'W'))),
+        'NspBII': (5, ('(?P<NspBII>C[AC]GC[GT]G)|(?P<NspBII_as>C[AC]GC[GT]G)', 'CMGCKG', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ())),
+        'NspI': (14, ('(?P<NspI>[AG]CATG[CT])|(?P<NspI_as>[AG]CATG[CT])', 'RCATGY', 6, 5, -5, None, None, 4, 'CATG', 1024, 37, 65, ('M', 'N'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'NspV': (8, ('(?P<NspV>TTCGAA)|(?P<NspV_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('J', 'O'))),
+        'OliI': (4, ('(?P<OliI>CAC....GTG)|(?P<OliI_as>CAC....GTG)', 'CACNNNNGTG', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'PabI': (15, ('(?P<PabI>GTAC)|(?P<PabI_as>GTAC)', 'GTAC', 4, 3, -3, None, None, 2, 'TA', 256, 37, 65, ())),
+        'PacI': (16, ('(?P<PacI>TTAATTAA)|(?P<PacI_as>TTAATTAA)', 'TTAATTAA', 8, 5, -5, None, None, 2, 'AT', 65536, 37, 65, ('F', 'N', 'O', 'W'))),
+        'PaeI': (16, ('(?P<PaeI>GCATGC)|(?P<PaeI_as>GCATGC)', 'GCATGC', 6, 5, -5, None, None, 4, 'CATG', 4096, 37, 65, ('F',))),
+        'PaeR7I': (6, ('(?P<PaeR7I>CTCGAG)|(?P<PaeR7I_as>CTCGAG)', 'CTCGAG', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('N',))),
+        'PagI': (8, ('(?P<PagI>TCATGA)|(?P<PagI_as>TCATGA)', 'TCATGA', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('F',))),
+        'PalAI': (8, ('(?P<PalAI>GGCGCGCC)|(?P<PalAI_as>GGCGCGCC)', 'GGCGCGCC', 8, 2, -2, None, None, -4, 'CGCG', 65536, 37, 65, ('I',))),
+        'PasI': (12, ('(?P<PasI>CCC[AT]GGG)|(?P<PasI_as>CCC[AT]GGG)', 'CCCWGGG', 7, 2, -2, None, None, -3, 'CWG', 8192, 37, 65, ('F',))),
+        'PauI': (8, ('(?P<PauI>GCGCGC)|(?P<PauI_as>GCGCGC)', 'GCGCGC', 6, 1, -1, None, None, -4, 'CGCG', 4096, 37, 65, ('F',))),
+        'PceI': (4, ('(?P<PceI>AGGCCT)|(?P<PceI_as>AGGCCT)', 'AGGCCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'PciI': (8, ('(?P<PciI>ACATGT)|(?P<PciI_as>ACATGT)', 'ACATGT', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('I', 'N'))),
+        'PciSI': (12, ('(?P<PciSI>GCTCTTC)|(?P<PciSI_as>GAAGAGC)', 'GCTCTTC', 7, 8, 4, None, None, -3, 'NNN', 16384, 37, 65, ('I',))),
+        'PctI': (20, ('(?P<PctI>GAATGC)|(?P<PctI_as>GCATTC)', 'GAATGC', 6, 7, -1, None, None, 2, 'CN', 4096, 37, 65, ('I', 'V'))),
+        'PdiI': (4, ('(?P<PdiI>GCCGGC)|(?P<PdiI_as>GCCGGC)', 'GCCGGC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'PdmI': (4, ('(?P<PdmI>GAA....TTC)|(?P<PdmI_as>GAA....TTC)', 'GAANNNNTTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'PfeI': (12, ('(?P<PfeI>GA[AT]TC)|(?P<PfeI_as>GA[AT]TC)', 'GAWTC', 5, 1, -1, None, None, -3, 'AWT', 512, 37, 65, ('F',))),
+        'Pfl1108I': (1, ('(?P<Pfl1108I>TCGTAG)|(?P<Pfl1108I_as>CTACGA)', 'TCGTAG', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'Pfl23II': (8, ('(?P<Pfl23II>CGTACG)|(?P<Pfl23II_as>CGTACG)', 'CGTACG', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('F',))),
+        'PflFI': (12, ('(?P<PflFI>GAC...GTC)|(?P<PflFI_as>GAC...GTC)', 'GACNNNGTC', 9, 4, -4, None, None, -1, 'N', 4096, 37, 65, ('N',))),
+        'PflMI': (20, ('(?P<PflMI>CCA.....TGG)|(?P<PflMI_as>CCA.....TGG)', 'CCANNNNNTGG', 11, 7, -7, None, None, 3, 'NNN', 4096, 37, 65, ('N',))),
+        'PfoI': (12, ('(?P<PfoI>TCC.GGA)|(?P<PfoI_as>TCC.GGA)', 'TCCNGGA', 7, 1, -1, None, None, -5, 'CCNGG', 4096, 37, 65, ('F',))),
+        'PhoI': (2, ('(?P<PhoI>GGCC)|(?P<PhoI_as>GGCC)', 'GGCC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('N',))),
+        'PinAI': (8, ('(?P<PinAI>ACCGGT)|(?P<PinAI_as>ACCGGT)', 'ACCGGT', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('B', 'M', 'Q', 'X'))),
+        'PlaDI': (21, ('(?P<PlaDI>CATCAG)|(?P<PlaDI_as>CTGATG)', 'CATCAG', 6, 27, 19, None, None, 2, 'NN', 4096, 37, 65, ())),
+        'Ple19I': (16, ('(?P<Ple19I>CGATCG)|(?P<Ple19I_as>CGATCG)', 'CGATCG', 6, 4, -4, None, None, 2, 'AT', 4096, 37, 65, ('I',))),
+        'PleI': (12, ('(?P<PleI>GAGTC)|(?P<PleI_as>GACTC)', 'GAGTC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ('N',))),
+        'PmaCI': (4, ('(?P<PmaCI>CACGTG)|(?P<PmaCI_as>CACGTG)', 'CACGTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('K',))),
+        'PmeI': (4, ('(?P<PmeI>GTTTAAAC)|(?P<PmeI_as>GTTTAAAC)', 'GTTTAAAC', 8, 4, -4, None, None, 0, '', 65536, 37, 65, ('N', 'W'))),
+        'PmlI': (4, ('(?P<PmlI>CACGTG)|(?P<PmlI_as>CACGTG)', 'CACGTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'PpiI': (24, ('(?P<PpiI>GAAC.....CTC)|(?P<PpiI_as>GAG.....GTTC)', 'GAACNNNNNCTC', 12, -7, -24, 25, 8, 5, 'NNNNN', 16384, 37, 65, ('F',))),
+        'PpsI': (12, ('(?P<PpsI>GAGTC)|(?P<PpsI_as>GACTC)', 'GAGTC', 5, 9, 5, None, None, -1, 'N', 1024, 37, 65, ('I',))),
+        'Ppu10I': (9, ('(?P<Ppu10I>ATGCAT)|(?P<Ppu10I_as>ATGCAT)', 'ATGCAT', 6, 1, -1, None, None, -4, 'TGCA', 4096, 37, 65, ())),
+        'Ppu21I': (4, ('(?P<Ppu21I>[CT]ACGT[AG])|(?P<Ppu21I_as>[CT]ACGT[AG])', 'YACGTR', 6, 3, -3, None, None, 0, '', 1024, 37, 65, ('F',))),
+        'PpuMI': (10, ('(?P<PpuMI>[AG]GG[AT]CC[CT])|(?P<PpuMI_as>[AG]GG[AT]CC[CT])', 'RGGWCCY', 7, 2, -2, None, None, -3, 'GWC', 2048, 37, 65, ('N', 'O'))),
+        'PscI': (8, ('(?P<PscI>ACATGT)|(?P<PscI_as>ACATGT)', 'ACATGT', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('F',))),
+        'PshAI': (2, ('(?P<PshAI>GAC....GTC)|(?P<PshAI_as>GAC....GTC)', 'GACNNNNGTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('K', 'N'))),
+        'PshBI': (8, ('(?P<PshBI>ATTAAT)|(?P<PshBI_as>ATTAAT)', 'ATTAAT', 6, 2, -2, None, None, -2, 'TA', 4096, 37, 65, ('K',))),
+        'PsiI': (4, ('(?P<PsiI>TTATAA)|(?P<PsiI_as>TTATAA)', 'TTATAA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'N', 'O'))),
+        'Psp03I': (21, ('(?P<Psp03I>GG[AT]CC)|(?P<Psp03I_as>GG[AT]CC)', 'GGWCC', 5, 4, -4, None, None, 3, 'GWC', 512, 37, 65, ())),
+        'Psp124BI': (16, ('(?P<Psp124BI>GAGCTC)|(?P<Psp124BI_as>GAGCTC)', 'GAGCTC', 6, 5, -5, None, None, 4, 'AGCT', 4096, 37, 65, ('I', 'V'))),
+        'Psp1406I': (8, ('(?P<Psp1406I>AACGTT)|(?P<Psp1406I_as>AACGTT)', 'AACGTT', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('F', 'K'))),
+        'Psp5II': (12, ('(?P<Psp5II>[AG]GG[AT]CC[CT])|(?P<Psp5II_as>[AG]GG[AT]CC[CT])', 'RGGWCCY', 7, 2, -2, None, None, -3, 'GWC', 2048, 37, 65, ('F',))),
+        'Psp6I': (12, ('(?P<Psp6I>CC[AT]GG)|(?P<Psp6I_as>CC[AT]GG)', 'CCWGG', 5, 0, 0, None, None, -5, 'CCWGG', 512, 37, 65, ('I',))),
+        'PspCI': (4, ('(?P<PspCI>CACGTG)|(?P<PspCI_as>CACGTG)', 'CACGTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'V'))),
+        'PspEI': (12, ('(?P<PspEI>GGT.ACC)|(?P<PspEI_as>GGT.ACC)', 'GGTNACC', 7, 1, -1, None, None, -5, 'GTNAC', 4096, 37, 65, ('I', 'V'))),
+        'PspGI': (10, ('(?P<PspGI>CC[AT]GG)|(?P<PspGI_as>CC[AT]GG)', 'CCWGG', 5, 0, 0, None, None, -5, 'CCWGG', 512, 37, 65, ('N',))),
+        'PspLI': (8, ('(?P<PspLI>CGTACG)|(?P<PspLI_as>CGTACG)', 'CGTACG', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ('I',))),
+        'PspN4I': (4, ('(?P<PspN4I>GG..CC)|(?P<PspN4I_as>GG..CC)', 'GGNNCC', 6, 3, -3, None, None, 0, '', 256, 37, 65, ('I',))),
+        'PspOMI': (8, ('(?P<PspOMI>GGGCCC)|(?P<PspOMI_as>GGGCCC)', 'GGGCCC', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ('I', 'N', 'V'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'PspOMII': (21, ('(?P<PspOMII>CGCCCA[AG])|(?P<PspOMII_as>[CT]TGGGCG)', 'CGCCCAR', 7, 27, 18, None, None, 2, 'NN', 8192, 37, 65, ())),
+        'PspPI': (10, ('(?P<PspPI>GG.CC)|(?P<PspPI_as>GG.CC)', 'GGNCC', 5, 1, -1, None, None, -3, 'GNC', 256, 37, 65, ('C',))),
+        'PspPPI': (12, ('(?P<PspPPI>[AG]GG[AT]CC[CT])|(?P<PspPPI_as>[AG]GG[AT]CC[CT])', 'RGGWCCY', 7, 2, -2, None, None, -3, 'GWC', 2048, 37, 65, ('I',))),
+        'PspPRI': (21, ('(?P<PspPRI>CC[CT]CAG)|(?P<PspPRI_as>CTG[AG]GG)', 'CCYCAG', 6, 21, 13, None, None, 2, 'NN', 2048, 37, 65, ())),
+        'PspXI': (8, ('(?P<PspXI>[ACG]CTCGAG[CGT])|(?P<PspXI_as>[ACG]CTCGAG[CGT])', 'VCTCGAGB', 8, 2, -2, None, None, -4, 'TCGA', 4096, 37, 65, ('I', 'N'))),
+        'PsrI': (24, ('(?P<PsrI>GAAC......TAC)|(?P<PsrI_as>GTA......GTTC)', 'GAACNNNNNNTAC', 13, -7, -25, 25, 7, 5, 'NNNNN', 16384, 37, 65, ('I',))),
+        'PssI': (21, ('(?P<PssI>[AG]GG.CC[CT])|(?P<PssI_as>[AG]GG.CC[CT])', 'RGGNCCY', 7, 5, -5, None, None, 3, 'GNC', 1024, 37, 65, ())),
+        'PstI': (14, ('(?P<PstI>CTGCAG)|(?P<PstI_as>CTGCAG)', 'CTGCAG', 6, 5, -5, None, None, 4, 'TGCA', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'PsuI': (8, ('(?P<PsuI>[AG]GATC[CT])|(?P<PsuI_as>[AG]GATC[CT])', 'RGATCY', 6, 1, -1, None, None, -4, 'GATC', 1024, 37, 65, ('F',))),
+        'PsyI': (12, ('(?P<PsyI>GAC...GTC)|(?P<PsyI_as>GAC...GTC)', 'GACNNNGTC', 9, 4, -4, None, None, -1, 'N', 4096, 37, 65, ('F',))),
+        'PteI': (8, ('(?P<PteI>GCGCGC)|(?P<PteI_as>GCGCGC)', 'GCGCGC', 6, 1, -1, None, None, -4, 'CGCG', 4096, 37, 65, ('F',))),
+        'PvuI': (16, ('(?P<PvuI>CGATCG)|(?P<PvuI_as>CGATCG)', 'CGATCG', 6, 4, -4, None, None, 2, 'AT', 4096, 37, 65, ('B', 'F', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X', 'Y'))),
+        'PvuII': (2, ('(?P<PvuII>CAGCTG)|(?P<PvuII_as>CAGCTG)', 'CAGCTG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'RcaI': (8, ('(?P<RcaI>TCATGA)|(?P<RcaI_as>TCATGA)', 'TCATGA', 6, 1, -1, None, None, -4, 'CATG', 4096, 37, 65, ('M',))),
+        'RceI': (21, ('(?P<RceI>CATCGAC)|(?P<RceI_as>GTCGATG)', 'CATCGAC', 7, 27, 18, None, None, 2, 'NN', 16384, 37, 65, ())),
+        'RgaI': (16, ('(?P<RgaI>GCGATCGC)|(?P<RgaI_as>GCGATCGC)', 'GCGATCGC', 8, 5, -5, None, None, 2, 'AT', 65536, 37, 65, ('I',))),
+        'RigI': (16, ('(?P<RigI>GGCCGGCC)|(?P<RigI_as>GGCCGGCC)', 'GGCCGGCC', 8, 6, -6, None, None, 4, 'CCGG', 65536, 37, 65, ('I',))),
+        'RleAI': (21, ('(?P<RleAI>CCCACA)|(?P<RleAI_as>TGTGGG)', 'CCCACA', 6, 18, 9, None, None, 3, 'NNN', 4096, 37, 65, ())),
+        'RpaB5I': (21, ('(?P<RpaB5I>CG[AG]GGAC)|(?P<RpaB5I_as>GTCC[CT]CG)', 'CGRGGAC', 7, 27, 18, None, None, 2, 'NN', 8192, 37, 65, ())),
+        'RruI': (4, ('(?P<RruI>TCGCGA)|(?P<RruI_as>TCGCGA)', 'TCGCGA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('F',))),
+        'RsaI': (2, ('(?P<RsaI>GTAC)|(?P<RsaI_as>GTAC)', 'GTAC', 4, 2, -2, None, None, 0, '', 256, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'M', 'N', 'O', 'Q', 'R', 'S', 'V', 'W', 'X', 'Y'))),
+        'RsaNI': (8, ('(?P<RsaNI>GTAC)|(?P<RsaNI_as>GTAC)', 'GTAC', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('I',))),
+        'RseI': (4, ('(?P<RseI>CA[CT]....[AG]TG)|(?P<RseI_as>CA[CT]....[AG]TG)', 'CAYNNNNRTG', 10, 5, -5, None, None, 0, '', 1024, 37, 65, ('F',))),
+        'Rsr2I': (12, ('(?P<Rsr2I>CGG[AT]CCG)|(?P<Rsr2I_as>CGG[AT]CCG)', 'CGGWCCG', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ('I', 'V'))),
+        'RsrII': (10, ('(?P<RsrII>CGG[AT]CCG)|(?P<RsrII_as>CGG[AT]CCG)', 'CGGWCCG', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ('M', 'N', 'Q', 'X'))),
+        'SacI': (14, ('(?P<SacI>GAGCTC)|(?P<SacI_as>GAGCTC)', 'GAGCTC', 6, 5, -5, None, None, 4, 'AGCT', 4096, 37, 65, ('F', 'H', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X'))),
+        'SacII': (14, ('(?P<SacII>CCGCGG)|(?P<SacII_as>CCGCGG)', 'CCGCGG', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ('H', 'J', 'K', 'N', 'O', 'Q', 'R', 'W', 'X'))),
+        'SalI': (6, ('(?P<SalI>GTCGAC)|(?P<SalI_as>GTCGAC)', 'GTCGAC', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'SanDI': (12, ('(?P<SanDI>GGG[AT]CCC)|(?P<SanDI_as>GGG[AT]CCC)', 'GGGWCCC', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ('E',))),
+        'SapI': (12, ('(?P<SapI>GCTCTTC)|(?P<SapI_as>GAAGAGC)', 'GCTCTTC', 7, 8, 4, None, None, -3, 'NNN', 16384, 37, 65, ('N',))),
+        'SaqAI': (8, ('(?P<SaqAI>TTAA)|(?P<SaqAI_as>TTAA)', 'TTAA', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('F',))),
+        'SatI': (12, ('(?P<SatI>GC.GC)|(?P<SatI_as>GC.GC)', 'GCNGC', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('F',))),
+        'Sau3AI': (6, ('(?P<Sau3AI>GATC)|(?P<Sau3AI_as>GATC)', 'GATC', 4, 0, 0, None, None, -4, 'GATC', 256, 37, 65, ('C', 'H', 'J', 'K', 'M', 'N', 'O', 'R', 'S', 'U', 'W', 'X'))),
+        'Sau96I': (10, ('(?P<Sau96I>GG.CC)|(?P<Sau96I_as>GG.CC)', 'GGNCC', 5, 1, -1, None, None, -3, 'GNC', 256, 37, 65, ('J', 'N', 'O', 'U', 'W'))),
+        'SauI': (13, ('(?P<SauI>CCT.AGG)|(?P<SauI_as>CCT.AGG)', 'CCTNAGG', 7, 2, -2, None, None, -3, 'TNA', 4096, 37, 65, ())),
+        'SbfI': (16, ('(?P<SbfI>CCTGCAGG)|(?P<SbfI_as>CCTGCAGG)', 'CCTGCAGG', 8, 6, -6, None, None, 4, 'TGCA', 65536, 37, 65, ('I', 'N', 'O', 'V'))),
+        'ScaI': (2, ('(?P<ScaI>AGTACT)|(?P<ScaI_as>AGTACT)', 'AGTACT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'F', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'W', 'X'))),
+        'SchI': (4, ('(?P<SchI>GAGTC)|(?P<SchI_as>GACTC)', 'GAGTC', 5, 10, 5, None, None, 0, '', 1024, 37, 65, ('F',))),
+        'SciI': (5, ('(?P<SciI>CTCGAG)|(?P<SciI_as>CTCGAG)', 'CTCGAG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ())),
+        'ScrFI': (10, ('(?P<ScrFI>CC.GG)|(?P<ScrFI_as>CC.GG)', 'CCNGG', 5, 2, -2, None, None, -1, 'N', 256, 37, 65, ('J', 'N', 'O', 'S'))),
+        'SdaI': (16, ('(?P<SdaI>CCTGCAGG)|(?P<SdaI_as>CCTGCAGG)', 'CCTGCAGG', 8, 6, -6, None, None, 4, 'TGCA', 65536, 37, 65, ('F',))),
+        'SdeAI': (21, ('(?P<SdeAI>CAG[AG]AG)|(?P<SdeAI_as>CT[CT]CTG)', 'CAGRAG', 6, 27, 19, None, None, 2, 'NN', 2048, 37, 65, ())),
+        'SdeOSI': (25, ('(?P<SdeOSI>GAC....[AG]TGA)|(?P<SdeOSI_as>TCA[CT]....GTC)', 'GACNNNNRTGA', 11, -11, -24, 23, 10, 2, 'NN', 8192, 37, 65, ())),
+        'SduI': (20, ('(?P<SduI>G[AGT]GC[ACT]C)|(?P<SduI_as>G[AGT]GC[ACT]C)', 'GDGCHC', 6, 5, -5, None, None, 4, 'DGCH', 256, 37, 65, ('F',))),
+        'SecI': (13, ('(?P<SecI>CC..GG)|(?P<SecI_as>CC..GG)', 'CCNNGG', 6, 1, -1, None, None, -4, 'CNNG', 256, 37, 65, ())),
+        'SelI': (9, ('(?P<SelI>CGCG)|(?P<SelI_as>CGCG)', 'CGCG', 4, 0, 0, None, None, -4, 'CGCG', 256, 37, 65, ())),
+        'SetI': (20, ('(?P<SetI>A[CG][CG]T)|(?P<SetI_as>A[CG][CG]T)', 'ASST', 4, 4, -4, None, None, 4, 'ASST', 64, 37, 65, ('I',))),
+        'SexAI': (10, ('(?P<SexAI>ACC[AT]GGT)|(?P<SexAI_as>ACC[AT]GGT)', 'ACCWGGT', 7, 1, -1, None, None, -5, 'CCWGG', 8192, 37, 65, ('M', 'N'))),
+        'SfaAI': (16, ('(?P<SfaAI>GCGATCGC)|(?P<SfaAI_as>GCGATCGC)', 'GCGATCGC', 8, 5, -5, None, None, 2, 'AT', 65536, 37, 65, ('F',))),
+        'SfaNI': (12, ('(?P<SfaNI>GCATC)|(?P<SfaNI_as>GATGC)', 'GCATC', 5, 10, 9, None, None, -4, 'NNNN', 1024, 37, 65, ('I', 'N', 'V'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'SfcI': (12, ('(?P<SfcI>CT[AG][CT]AG)|(?P<SfcI_as>CT[AG][CT]AG)', 'CTRYAG', 6, 1, -1, None, None, -4, 'TRYA', 1024, 37, 65, ('N',))),
+        'SfeI': (13, ('(?P<SfeI>CT[AG][CT]AG)|(?P<SfeI_as>CT[AG][CT]AG)', 'CTRYAG', 6, 1, -1, None, None, -4, 'TRYA', 1024, 37, 65, ())),
+        'SfiI': (18, ('(?P<SfiI>GGCC.....GGCC)|(?P<SfiI_as>GGCC.....GGCC)', 'GGCCNNNNNGGCC', 13, 8, -8, None, None, 3, 'NNN', 65536, 37, 65, ('C', 'F', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X'))),
+        'SfoI': (2, ('(?P<SfoI>GGCGCC)|(?P<SfoI_as>GGCGCC)', 'GGCGCC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('N',))),
+        'Sfr274I': (8, ('(?P<Sfr274I>CTCGAG)|(?P<Sfr274I_as>CTCGAG)', 'CTCGAG', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('I', 'V'))),
+        'Sfr303I': (16, ('(?P<Sfr303I>CCGCGG)|(?P<Sfr303I_as>CCGCGG)', 'CCGCGG', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ('I', 'V'))),
+        'SfuI': (8, ('(?P<SfuI>TTCGAA)|(?P<SfuI_as>TTCGAA)', 'TTCGAA', 6, 2, -2, None, None, -2, 'CG', 4096, 37, 65, ('M',))),
+        'SgfI': (16, ('(?P<SgfI>GCGATCGC)|(?P<SgfI_as>GCGATCGC)', 'GCGATCGC', 8, 5, -5, None, None, 2, 'AT', 65536, 37, 65, ('R',))),
+        'SgrAI': (6, ('(?P<SgrAI>C[AG]CCGG[CT]G)|(?P<SgrAI_as>C[AG]CCGG[CT]G)', 'CRCCGGYG', 8, 2, -2, None, None, -4, 'CCGG', 16384, 37, 65, ('M', 'N'))),
+        'SgrBI': (16, ('(?P<SgrBI>CCGCGG)|(?P<SgrBI_as>CCGCGG)', 'CCGCGG', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ('C',))),
+        'SgrDI': (8, ('(?P<SgrDI>CGTCGACG)|(?P<SgrDI_as>CGTCGACG)', 'CGTCGACG', 8, 2, -2, None, None, -4, 'TCGA', 65536, 37, 65, ('F',))),
+        'SgsI': (8, ('(?P<SgsI>GGCGCGCC)|(?P<SgsI_as>GGCGCGCC)', 'GGCGCGCC', 8, 2, -2, None, None, -4, 'CGCG', 65536, 37, 65, ('F',))),
+        'SimI': (9, ('(?P<SimI>GGGTC)|(?P<SimI_as>GACCC)', 'GGGTC', 5, 2, 0, None, None, -3, 'GTC', 1024, 37, 65, ())),
+        'SinI': (10, ('(?P<SinI>GG[AT]CC)|(?P<SinI_as>GG[AT]CC)', 'GGWCC', 5, 1, -1, None, None, -3, 'GWC', 512, 37, 65, ('Q', 'R', 'W', 'X'))),
+        'SlaI': (8, ('(?P<SlaI>CTCGAG)|(?P<SlaI_as>CTCGAG)', 'CTCGAG', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('C',))),
+        'SmaI': (2, ('(?P<SmaI>CCCGGG)|(?P<SmaI_as>CCCGGG)', 'CCCGGG', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'SmiI': (4, ('(?P<SmiI>ATTTAAAT)|(?P<SmiI_as>ATTTAAAT)', 'ATTTAAAT', 8, 4, -4, None, None, 0, '', 65536, 37, 65, ('F', 'I', 'K', 'V'))),
+        'SmiMI': (4, ('(?P<SmiMI>CA[CT]....[AG]TG)|(?P<SmiMI_as>CA[CT]....[AG]TG)', 'CAYNNNNRTG', 10, 5, -5, None, None, 0, '', 1024, 37, 65, ('I', 'V'))),
+        'SmlI': (12, ('(?P<SmlI>CT[CT][AG]AG)|(?P<SmlI_as>CT[CT][AG]AG)', 'CTYRAG', 6, 1, -1, None, None, -4, 'TYRA', 1024, 37, 65, ('N',))),
+        'SmoI': (12, ('(?P<SmoI>CT[CT][AG]AG)|(?P<SmoI_as>CT[CT][AG]AG)', 'CTYRAG', 6, 1, -1, None, None, -4, 'TYRA', 1024, 37, 65, ('F',))),
+        'SmuI': (12, ('(?P<SmuI>CCCGC)|(?P<SmuI_as>GCGGG)', 'CCCGC', 5, 9, 6, None, None, -2, 'NN', 1024, 37, 65, ('F',))),
+        'SnaBI': (2, ('(?P<SnaBI>TACGTA)|(?P<SnaBI_as>TACGTA)', 'TACGTA', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('C', 'K', 'M', 'N', 'R'))),
+        'SnaI': (1, ('(?P<SnaI>GTATAC)|(?P<SnaI_as>GTATAC)', 'GTATAC', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'SpeI': (8, ('(?P<SpeI>ACTAGT)|(?P<SpeI_as>ACTAGT)', 'ACTAGT', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('B', 'H', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X'))),
+        'SphI': (16, ('(?P<SphI>GCATGC)|(?P<SphI_as>GCATGC)', 'GCATGC', 6, 5, -5, None, None, 4, 'CATG', 4096, 37, 65, ('B', 'C', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'V', 'W', 'X'))),
+        'SplI': (9, ('(?P<SplI>CGTACG)|(?P<SplI_as>CGTACG)', 'CGTACG', 6, 1, -1, None, None, -4, 'GTAC', 4096, 37, 65, ())),
+        'SpoDI': (1, ('(?P<SpoDI>GCGG[AG]AG)|(?P<SpoDI_as>CT[CT]CCGC)', 'GCGGRAG', 7, None, None, None, None, None, None, 8192, 37, 65, ())),
+        'SrfI': (4, ('(?P<SrfI>GCCCGGGC)|(?P<SrfI_as>GCCCGGGC)', 'GCCCGGGC', 8, 4, -4, None, None, 0, '', 65536, 37, 65, ('E', 'O'))),
+        'Sse232I': (9, ('(?P<Sse232I>CGCCGGCG)|(?P<Sse232I_as>CGCCGGCG)', 'CGCCGGCG', 8, 2, -2, None, None, -4, 'CCGG', 65536, 37, 65, ())),
+        'Sse8387I': (16, ('(?P<Sse8387I>CCTGCAGG)|(?P<Sse8387I_as>CCTGCAGG)', 'CCTGCAGG', 8, 6, -6, None, None, 4, 'TGCA', 65536, 37, 65, ('K',))),
+        'Sse8647I': (13, ('(?P<Sse8647I>AGG[AT]CCT)|(?P<Sse8647I_as>AGG[AT]CCT)', 'AGGWCCT', 7, 2, -2, None, None, -3, 'GWC', 8192, 37, 65, ())),
+        'Sse9I': (6, ('(?P<Sse9I>AATT)|(?P<Sse9I_as>AATT)', 'AATT', 4, 0, 0, None, None, -4, 'AATT', 256, 37, 65, ('I', 'V'))),
+        'SseBI': (4, ('(?P<SseBI>AGGCCT)|(?P<SseBI_as>AGGCCT)', 'AGGCCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('C',))),
+        'SsiI': (8, ('(?P<SsiI>CCGC)|(?P<SsiI_as>GCGG)', 'CCGC', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('F',))),
+        'SspD5I': (5, ('(?P<SspD5I>GGTGA)|(?P<SspD5I_as>TCACC)', 'GGTGA', 5, 13, 8, None, None, 0, '', 1024, 37, 65, ())),
+        'SspDI': (8, ('(?P<SspDI>GGCGCC)|(?P<SspDI_as>GGCGCC)', 'GGCGCC', 6, 1, -1, None, None, -4, 'GCGC', 4096, 37, 65, ('F',))),
+        'SspI': (2, ('(?P<SspI>AATATT)|(?P<SspI_as>AATATT)', 'AATATT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'C', 'F', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X'))),
+        'SstI': (16, ('(?P<SstI>GAGCTC)|(?P<SstI_as>GAGCTC)', 'GAGCTC', 6, 5, -5, None, None, 4, 'AGCT', 4096, 37, 65, ('B', 'C'))),
+        'SstII': (16, ('(?P<SstII>CCGCGG)|(?P<SstII_as>CCGCGG)', 'CCGCGG', 6, 4, -4, None, None, 2, 'GC', 4096, 37, 65, ('B',))),
+        'Sth132I': (13, ('(?P<Sth132I>CCCG)|(?P<Sth132I_as>CGGG)', 'CCCG', 4, 8, 8, None, None, -4, 'NNNN', 256, 37, 65, ())),
+        'Sth302II': (5, ('(?P<Sth302II>CCGG)|(?P<Sth302II_as>CCGG)', 'CCGG', 4, 2, -2, None, None, 0, '', 256, 37, 65, ())),
+        'StrI': (8, ('(?P<StrI>CTCGAG)|(?P<StrI_as>CTCGAG)', 'CTCGAG', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('U',))),
+        'StsI': (11, ('(?P<StsI>GGATG)|(?P<StsI_as>CATCC)', 'GGATG', 5, 15, 14, None, None, -4, 'NNNN', 1024, 37, 65, ())),
+        'StuI': (4, ('(?P<StuI>AGGCCT)|(?P<StuI_as>AGGCCT)', 'AGGCCT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('B', 'J', 'K', 'M', 'N', 'Q', 'R', 'S', 'U', 'X'))),
+        'StyD4I': (10, ('(?P<StyD4I>CC.GG)|(?P<StyD4I_as>CC.GG)', 'CCNGG', 5, 0, 0, None, None, -5, 'CCNGG', 256, 37, 65, ('N',))),
+        'StyI': (12, ('(?P<StyI>CC[AT][AT]GG)|(?P<StyI_as>CC[AT][AT]GG)', 'CCWWGG', 6, 1, -1, None, None, -4, 'CWWG', 1024, 37, 65, ('C', 'J', 'M', 'N', 'R', 'S'))),
+        'SwaI': (2, ('(?P<SwaI>ATTTAAAT)|(?P<SwaI_as>ATTTAAAT)', 'ATTTAAAT', 8, 4, -4, None, None, 0, '', 65536, 37, 65, ('J', 'M', 'N', 'S', 'W'))),
+        'TaaI': (20, ('(?P<TaaI>AC.GT)|(?P<TaaI_as>AC.GT)', 'ACNGT', 5, 3, -3, None, None, 1, 'N', 256, 37, 65, ('F',))),
+        'TaiI': (16, ('(?P<TaiI>ACGT)|(?P<TaiI_as>ACGT)', 'ACGT', 4, 4, -4, None, None, 4, 'ACGT', 256, 37, 65, ('F',))),
+        'TaqI': (6, ('(?P<TaqI>TCGA)|(?P<TaqI_as>TCGA)', 'TCGA', 4, 1, -1, None, None, -2, 'CG', 256, 37, 65, ('B', 'C', 'F', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'TaqII': (20, ('(?P<TaqII>CACCCA)|(?P<TaqII_as>TGGGTG)', 'CACCCA|GACCGA', 6, 17, 9, None, None, 2, '(?P<TaqII>CACCCA|GACCGA)|(?P<TaqII_as>TGGGTG|TCGGTC)', 4096, 37, 65, ('Q', 'X'))),
+        'TatI': (8, ('(?P<TatI>[AT]GTAC[AT])|(?P<TatI_as>[AT]GTAC[AT])', 'WGTACW', 6, 1, -1, None, None, -4, 'GTAC', 1024, 37, 65, ('F',))),
+        'TauI': (20, ('(?P<TauI>GC[CG]GC)|(?P<TauI_as>GC[CG]GC)', 'GCSGC', 5, 4, -4, None, None, 3, 'CSG', 512, 37, 65, ('F',))),
+        'TfiI': (10, ('(?P<TfiI>GA[AT]TC)|(?P<TfiI_as>GA[AT]TC)', 'GAWTC', 5, 1, -1, None, None, -3, 'AWT', 512, 37, 65, ('N',))),
+        'TliI': (8, ('(?P<TliI>CTCGAG)|(?P<TliI_as>CTCGAG)', 'CTCGAG', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('N',))),
+        'Tru1I': (8, ('(?P<Tru1I>TTAA)|(?P<Tru1I_as>TTAA)', 'TTAA', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('F',))),
+        'Tru9I': (8, ('(?P<Tru9I>TTAA)|(?P<Tru9I_as>TTAA)', 'TTAA', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('I', 'M', 'R', 'V', 'W'))),
+        'TscAI': (20, ('(?P<TscAI>CA[CG]TG)|(?P<TscAI_as>CA[CG]TG)', 'CASTG', 5, 7, -7, None, None, 10, 'NNCASTGNN', 512, 37, 65, ('F',))),
+        'TseI': (10, ('(?P<TseI>GC[AT]GC)|(?P<TseI_as>GC[AT]GC)', 'GCWGC', 5, 1, -1, None, None, -3, 'CWG', 512, 37, 65, ('N',))),
+        'TsoI': (20, ('(?P<TsoI>TA[AG]CCA)|(?P<TsoI_as>TGG[CT]TA)', 'TARCCA', 6, 17, 9, None, None, 2, 'NN', 2048, 37, 65, ('F',))),
+        'Tsp45I': (10, ('(?P<Tsp45I>GT[CG]AC)|(?P<Tsp45I_as>GT[CG]AC)', 'GTSAC', 5, 0, 0, None, None, -5, 'GTSAC', 512, 37, 65, ('N',))),
+        'Tsp4CI': (21, ('(?P<Tsp4CI>AC.GT)|(?P<Tsp4CI_as>AC.GT)', 'ACNGT', 5, 3, -3, None, None, 1, 'N', 256, 37, 65, ())),
+        'Tsp509I': (6, ('(?P<Tsp509I>AATT)|(?P<Tsp509I_as>AATT)', 'AATT', 4, 0, 0, None, None, -4, 'AATT', 256, 37, 65, ('N',))),
+        'TspDTI': (20, ('(?P<TspDTI>ATGAA)|(?P<TspDTI_as>TTCAT)', 'ATGAA', 5, 16, 9, None, None, 2, 'NN', 1024, 37, 65, ('X',))),
+        'TspEI': (8, ('(?P<TspEI>AATT)|(?P<TspEI_as>AATT)', 'AATT', 4, 0, 0, None, None, -4, 'AATT', 256, 37, 65, ('O',))),
+        'TspGWI': (20, ('(?P<TspGWI>ACGGA)|(?P<TspGWI_as>TCCGT)', 'ACGGA', 5, 16, 9, None, None, 2, 'NN', 1024, 37, 65, ('X',))),
+        'TspMI': (6, ('(?P<TspMI>CCCGGG)|(?P<TspMI_as>CCCGGG)', 'CCCGGG', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('N',))),
+        'TspRI': (18, ('(?P<TspRI>CA[CG]TG)|(?P<TspRI_as>CA[CG]TG)', 'CASTG', 5, 7, -7, None, None, 10, 'NNCASTGNN', 512, 37, 65, ('N',))),
+        'TssI': (1, ('(?P<TssI>GAG...CTC)|(?P<TssI_as>GAG...CTC)', 'GAGNNNCTC', 9, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'TstI': (24, ('(?P<TstI>CAC......TCC)|(?P<TstI_as>GGA......GTG)', 'CACNNNNNNTCC', 12, -8, -25, 24, 7, 5, 'NNNNN', 4096, 37, 65, ('F',))),
+        'TsuI': (1, ('(?P<TsuI>GCGAC)|(?P<TsuI_as>GTCGC)', 'GCGAC', 5, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'Tth111I': (10, ('(?P<Tth111I>GAC...GTC)|(?P<Tth111I_as>GAC...GTC)', 'GACNNNGTC', 9, 4, -4, None, None, -1, 'N', 4096, 37, 65, ('I', 'K', 'N', 'Q', 'R', 'V', 'W', 'X'))),
+        'Tth111II': (21, ('(?P<Tth111II>CAA[AG]CA)|(?P<Tth111II_as>TG[CT]TTG)', 'CAARCA', 6, 17, 9, None, None, 2, 'NN', 2048, 37, 65, ())),
+        'UbaF11I': (1, ('(?P<UbaF11I>TCGTA)|(?P<UbaF11I_as>TACGA)', 'TCGTA', 5, None, None, None, None, None, None, 1024, 37, 65, ())),
+        'UbaF12I': (1, ('(?P<UbaF12I>CTAC...GTC)|(?P<UbaF12I_as>GAC...GTAG)', 'CTACNNNGTC', 10, None, None, None, None, None, None, 16384, 37, 65, ())),
+        'UbaF13I': (1, ('(?P<UbaF13I>GAG......CTGG)|(?P<UbaF13I_as>CCAG......CTC)', 'GAGNNNNNNCTGG', 13, None, None, None, None, None, None, 16384, 37, 65, ())),
+        'UbaF14I': (1, ('(?P<UbaF14I>CCA.....TCG)|(?P<UbaF14I_as>CGA.....TGG)', 'CCANNNNNTCG', 11, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'UbaF9I': (1, ('(?P<UbaF9I>TAC.....[AG]TGT)|(?P<UbaF9I_as>ACA[CT].....GTA)', 'TACNNNNNRTGT', 12, None, None, None, None, None, None, 8192, 37, 65, ())),
+        'UbaPI': (1, ('(?P<UbaPI>CGAACG)|(?P<UbaPI_as>CGTTCG)', 'CGAACG', 6, None, None, None, None, None, None, 4096, 37, 65, ())),
+        'UnbI': (13, ('(?P<UnbI>GG.CC)|(?P<UnbI_as>GG.CC)', 'GGNCC', 5, 0, 0, None, None, -5, 'GGNCC', 256, 37, 65, ())),
+        'Van91I': (20, ('(?P<Van91I>CCA.....TGG)|(?P<Van91I_as>CCA.....TGG)', 'CCANNNNNTGG', 11, 7, -7, None, None, 3, 'NNN', 4096, 37, 65, ('F', 'K', 'M'))),
+        'Vha464I': (8, ('(?P<Vha464I>CTTAAG)|(?P<Vha464I_as>CTTAAG)', 'CTTAAG', 6, 1, -1, None, None, -4, 'TTAA', 4096, 37, 65, ('V',))),
+        'VneI': (8, ('(?P<VneI>GTGCAC)|(?P<VneI_as>GTGCAC)', 'GTGCAC', 6, 1, -1, None, None, -4, 'TGCA', 4096, 37, 65, ('I', 'V'))),
+        'VpaK11AI': (13, ('(?P<VpaK11AI>GG[AT]CC)|(?P<VpaK11AI_as>GG[AT]CC)', 'GGWCC', 5, 0, 0, None, None, -5, 'GGWCC', 512, 37, 65, ())),
+        'VpaK11BI': (12, ('(?P<VpaK11BI>GG[AT]CC)|(?P<VpaK11BI_as>GG[AT]CC)', 'GGWCC', 5, 1, -1, None, None, -3, 'GWC', 512, 37, 65, ('K',))),
+        'VspI': (6, ('(?P<VspI>ATTAAT)|(?P<VspI_as>ATTAAT)', 'ATTAAT', 6, 2, -2, None, None, -2, 'TA', 4096, 37, 65, ('F', 'I', 'R', 'V'))),
+        'XagI': (12, ('(?P<XagI>CCT.....AGG)|(?P<XagI_as>CCT.....AGG)', 'CCTNNNNNAGG', 11, 5, -5, None, None, -1, 'N', 4096, 37, 65, ('F',))),
+        'XapI': (8, ('(?P<XapI>[AG]AATT[CT])|(?P<XapI_as>[AG]AATT[CT])', 'RAATTY', 6, 1, -1, None, None, -4, 'AATT', 1024, 37, 65, ('F',))),
+        'XbaI': (6, ('(?P<XbaI>TCTAGA)|(?P<XbaI_as>TCTAGA)', 'TCTAGA', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('B', 'C', 'F', 'H', 'I', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'V', 'W', 'X', 'Y'))),
+        'XceI': (16, ('(?P<XceI>[AG]CATG[CT])|(?P<XceI_as>[AG]CATG[CT])', 'RCATGY', 6, 5, -5, None, None, 4, 'CATG', 1024, 37, 65, ('F',))),
+        'XcmI': (18, ('(?P<XcmI>CCA.........TGG)|(?P<XcmI_as>CCA.........TGG)', 'CCANNNNNNNNNTGG', 15, 8, -8, None, None, 1, 'N', 4096, 37, 65, ('N',))),
+        'XhoI': (6, ('(?P<XhoI>CTCGAG)|(?P<XhoI_as>CTCGAG)', 'CTCGAG', 6, 1, -1, None, None, -4, 'TCGA', 4096, 37, 65, ('B', 'F', 'H', 'J', 'K', 'M', 'N', 'O', 'Q', 'R', 'S', 'U', 'W', 'X', 'Y'))),
+        'XhoII': (6, ('(?P<XhoII>[AG]GATC[CT])|(?P<XhoII_as>[AG]GATC[CT])', 'RGATCY', 6, 1, -1, None, None, -4, 'GATC', 1024, 37, 65, ('R', 'W'))),
+        'XmaCI': (8, ('(?P<XmaCI>CCCGGG)|(?P<XmaCI_as>CCCGGG)', 'CCCGGG', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('M',))),
+        'XmaI': (6, ('(?P<XmaI>CCCGGG)|(?P<XmaI_as>CCCGGG)', 'CCCGGG', 6, 1, -1, None, None, -4, 'CCGG', 4096, 37, 65, ('I', 'N', 'R', 'U', 'V'))),
+        'XmaIII': (7, ('(?P<XmaIII>CGGCCG)|(?P<XmaIII_as>CGGCCG)', 'CGGCCG', 6, 1, -1, None, None, -4, 'GGCC', 4096, 37, 65, ())),
+        'XmaJI': (8, ('(?P<XmaJI>CCTAGG)|(?P<XmaJI_as>CCTAGG)', 'CCTAGG', 6, 1, -1, None, None, -4, 'CTAG', 4096, 37, 65, ('F',))),
+        'XmiI': (12, ('(?P<XmiI>GT[AC][GT]AC)|(?P<XmiI_as>GT[AC][GT]AC)', 'GTMKAC', 6, 2, -2, None, None, -2, 'MK', 1024, 37, 65, ('F',))),
+        'XmnI': (4, ('(?P<XmnI>GAA....TTC)|(?P<XmnI_as>GAA....TTC)', 'GAANNNNTTC', 10, 5, -5, None, None, 0, '', 4096, 37, 65, ('N', 'R', 'U', 'W'))),
+        'XspI': (8, ('(?P<XspI>CTAG)|(?P<XspI_as>CTAG)', 'CTAG', 4, 1, -1, None, None, -2, 'TA', 256, 37, 65, ('K',))),
+    }
+enzymes.update(_temp())
+def _temp():
+    return {
+        'ZraI': (4, ('(?P<ZraI>GACGTC)|(?P<ZraI_as>GACGTC)', 'GACGTC', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I', 'N', 'V'))),
+        'ZrmI': (4, ('(?P<ZrmI>AGTACT)|(?P<ZrmI_as>AGTACT)', 'AGTACT', 6, 3, -3, None, None, 0, '', 4096, 37, 65, ('I',))),
+        'Zsp2I': (16, ('(?P<Zsp2I>ATGCAT)|(?P<Zsp2I_as>ATGCAT)', 'ATGCAT', 6, 5, -5, None, None, 4, 'TGCA', 4096, 37, 65, ('I', 'V'))),
+    }
+enzymes.update(_temp())
+
+#The name and enzymes of each supplier
+suppliers = {}
+def _temp():
+    return ('Invitrogen Corporation', ('MluI', 'HpaII', 'SalI', 'NcoI', 'ClaI', 'DraI', 'SstII', 'AvaI', 'PvuI', 'DpnI', 'TaqI', 'KpnI', 'NdeI', 'PinAI', 'BglII', 'NruI', 'RsaI', 'HincII', 'XbaI', 'MboI', 'AluI', 'MscI', 'SmaI', 'NheI', 'StuI', 'SphI', 'PvuII', 'SstI', 'SpeI', 'HinfI', 'EcoRV', 'EcoRI', 'XhoI', 'PstI', 'MseI', 'HaeIII', 'AccI', 'SspI', 'NsiI', 'ApaI', 'ScaI', 'DdeI', 'NotI', 'HindIII', 'BamHI', 'HpaI', 'HhaI'))
+suppliers['B'] = _temp()
+def _temp():
+    return ('Minotech Biotechnology', ('SgrBI', 'BclI', 'BglI', 'SalI', 'PspPI', 'SnaBI', 'BstEII', 'NcoI', 'BshFI', 'AsuII', 'BssAI', 'BseAI', 'TaqI', 'KpnI', 'BglII', 'NaeI', 'BseBI', 'NruI', 'SlaI', 'RsaI', 'BsiSI', 'XbaI', 'Sau3AI', 'MboI', 'AluI', 'SseBI', 'SmaI', 'NheI', 'SphI', 'PvuII', 'ApaLI', 'SstI', 'HinfI', 'MspCI', 'EcoRV', 'EcoRI', 'BseCI', 'PstI', 'SfiI', 'SspI', 'CspAI', 'ScaI', 'NotI', 'HindIII', 'BamHI', 'HpaI', 'StyI'))
+suppliers['C'] = _temp()
+def _temp():
+    return ('Stratagene', ('SanDI', 'DpnI', 'SrfI'))
+suppliers['E'] = _temp()
+def _temp():
+    return ('Fermentas International Inc.', ('MluI', 'CseI', 'PscI', 'HpaII', 'MreI', 'BclI', 'SacI', 'PauI', 'BglI', 'SalI', 'MspI', 'Bsu15I', 'Mva1269I', 'Bsp68I', 'LweI', 'SmiI', 'PteI', 'BshTI', 'TstI', 'TscAI', 'NcoI', 'PsyI', 'BseJI', 'MauBI', 'Eco24I', 'Eco47III', 'Eco91I', 'DraI', 'BseXI', 'BstXI', 'RruI', 'Esp3I', 'BseSI', 'Cfr9I', 'AarI', 'RseI', 'PvuI', 'BspOI', 'DpnI', 'Hin6I', 'Van91I', 'Bst1107I', 'Bme1390I', 'BveI', 'Psp5II', 'TaqI', 'Eco52I', 'BfiI', 'KpnI', 'Kpn2I', 'SspDI', 'SsiI', 'MlsI', 'NdeI', 'PpiI', 'Cfr13I', 'MboII', 'SdaI', 'BmsI', 'BglII', 'AjuI', 'AloI', 'FspBI', 'SchI', 'PfoI', 'Bpu10I', 'BshNI', 'Acc65I', 'XapI', 'TaaI', 'Bsp1407I', 'MvaI', 'PasI', 'Hin1II', 'Bsh1236I', 'MssI', 'CpoI', 'Eco130I', 'BdaI', 'TaiI', 'FspAI', 'BfmI', 'Eco47I', 'BoxI', 'RsaI', 'HincII', 'HpyF10VI', 'XbaI', 'Lsp1109I', 'Cfr10I', 'AjiI', 'Bsp119I', 'MboI', 'AluI', 'SduI', 'SgsI', 'BseGI', 'Eco72I', 'BcnI', 'Mph1103I', 'EcoRII', 'Alw21I', 'XagI', 'Hpy8I', 'PsuI', 'PaeI', 'SmaI', 'NheI', 'BplI', 'Ppu21I', 'SmoI', 'FaqI', 'AdeI', 'BcuI', 'BspTI', 'GsuI', 'BseLI', 'AasI', 'PvuII', 'EheI', 'Hin1I', 'Alw26I', 'SgrDI', 'Eco31I', 'HinfI', 'Eam1105I', 'BsuRI', 'TsoI', 'XmiI', 'Eam1104I', 'Ecl136II', 'XmaJI', 'SfaAI', 'HphI', 'Psp1406I', 'Csp6I', 'EcoO109I', 'BseMII', 'AatII', 'BfuI', 'EcoRI', 'TauI', 'XhoI', 'Bsp143I', 'BspPI', 'CfrI', 'MnlI', 'PfeI', 'CaiI', 'Bpu1102I', 'MunI', 'Tru1I', 'BspLI', 'SmuI', 'Eco105I', 'NsbI', 'PstI', 'LguI', 'VspI', 'Alw44I', 'SfiI', 'BpiI', 'XceI', 'BseMI', 'Eco57MI', 'Cfr42I', 'SatI', 'Hin4I', 'SspI', 'Eco32I', 'KflI', 'BseDI', 'KspAI', 'Eco81I', 'BauI', 'AanI', 'ApaI', 'SaqAI', 'Eco88I', 'ScaI', 'AlfI', 'Eco57I', 'Eco147I', 'OliI', 'PacI', 'PdmI', 'CsiI', 'Bsp120I', 'NotI', 'MbiI', 'HindIII', 'BamHI', 'BfoI', 'TatI', 'HpyF3I', 'Pfl23II', 'Bsh1285I', 'HhaI', 'NmuCI', 'BseNI', 'PagI', 'PdiI'))
+suppliers['F'] = _temp()
+def _temp():
+    return ('American Allied Biochemical, Inc.', ('MluI', 'SacI', 'BglI', 'SalI', 'MspI', 'BstEII', 'NcoI', 'ClaI', 'BstXI', 'KpnI', 'BglII', 'SacII', 'RsaI', 'HincII', 'XbaI', 'Sau3AI', 'AluI', 'SmaI', 'SphI', 'PvuII', 'SpeI', 'HinfI', 'EcoRV', 'EcoRI', 'XhoI', 'PstI', 'HaeIII', 'NsiI', 'NotI', 'HindIII', 'BamHI', 'HpaI'))
+suppliers['H'] = _temp()
+def _temp():
+    return ('SibEnzyme Ltd.', ('AsuNHI', 'AgsI', 'BstSFI', 'MluI', 'CciI', 'BstHHI', 'HpaII', 'AhlI', 'PspN4I', 'BglI', 'SalI', 'MspI', 'VneI', 'BstH2I', 'BisI', 'BmtI', 'PspXI', 'AsiGI', 'CciNI', 'Sfr274I', 'SmiI', 'Ksp22I', 'BssT1I', 'MspA1I', 'Bsp19I', 'Bse1I', 'AspS9I', 'AbsI', 'FauNDI', 'BstMWI', 'AclWI', 'DraI', 'Bst2UI', 'AluBI', 'PsrI', 'BstACI', 'BstXI', 'BstDEI', 'GluI', 'BspACI', 'AcoI', 'XmaI', 'BstF5I', 'BstMBI', 'BstENI', 'BssECI', 'FalI', 'EgeI', 'Ama87I', 'BstDSI', 'BstV2I', 'AjnI', 'AspLEI', 'PalAI', 'Zsp2I', 'DseDI', 'BstAUI', 'Bpu14I', 'FaeI', 'TaqI', 'KpnI', 'BstSNI', 'AclI', 'MboII', 'BglII', 'PspPPI', 'SetI', 'AcsI', 'BstNSI', 'BseX3I', 'RsaNI', 'Bpu10I', 'Rsr2I', 'Acc65I', 'PspEI', 'Bst2BI', 'NruI', 'Ple19I', 'SmiMI', 'PciI', 'MalI', 'Bse118I', 'BsePI', 'BstMCI', 'Bme18I', 'RsaI', 'BssNAI', 'BstV1I', 'Bsp13I', 'Bst4CI', 'MabI', 'AsuHPI', 'BtrI', 'XbaI', 'ArsI', 'BstC8I', 'Psp124BI', 'GlaI', 'HgaI', 'BstX2I', 'AluI', 'ZraI', 'Bse21I', 'Sfr303I', 'BstSCI', 'Bse3DI', 'Bso31I', 'AccB7I', 'BstKTI', 'AccBSI', 'SmaI', 'AspA2I', 'Bsp1720I', 'Bsc4I', 'SphI', 'Mly113I', 'FriOI', 'PvuII', 'ErhI', 'FokI', 'AsuC2I', 'GsaI', 'HinfI', 'BsuRI', 'PpsI', 'BstPAI', 'HspAI', 'RgaI', 'Fsp4HI', 'Kzo9I', 'Acc36I', 'DraIII', 'Acc16I', 'MspR9I', 'EcoRV', 'PsiI', 'AatII', 'MroXI', 'EcoRI', 'ZrmI', 'BstFNI', 'PspOMI', 'BslFI', 'Bsa29I', 'MnlI', 'SbfI', 'PstI', 'Bse8I', 'FauI', 'VspI', 'PciSI', 'SfiI', 'Bst6I', 'PspLI', 'BspFNI', 'Msp20I', 'Bbv12I', 'HaeIII', 'BstAPI', 'SspI', 'AfeI', 'Tth111I', 'BstMAI', 'BstSLI', 'ApaI', 'BlsI', 'FblI', 'BmuI', 'BarI', 'PctI', 'FaiI', 'BpmI', 'AcuI', 'AccB1I', 'PceI', 'Sse9I', 'Tru9I', 'MhlI', 'BstBAI', 'DriI', 'MroNI', 'HindIII', 'EcoICRI', 'FatI', 'BamHI', 'Psp6I', 'BstAFI', 'SfaNI', 'RigI', 'HpaI', 'PspCI', 'HindII'))
+suppliers['I'] = _temp()
+def _temp():
+    return ('Nippon Gene Co., Ltd.', ('BssHII', 'AxyI', 'MluI', 'BclI', 'SacI', 'EcoT38I', 'BglI', 'SalI', 'MspI', 'BstEII', 'NcoI', 'DraI', 'BstXI', 'SwaI', 'AvaI', 'TaqI', 'AseI', 'KpnI', 'Sau96I', 'HaeII', 'NdeI', 'MboII', 'AflII', 'BglII', 'AccII', 'SacII', 'NruI', 'NarI', 'RsaI', 'HincII', 'XbaI', 'Sau3AI', 'AluI', 'ScrFI', 'EcoRII', 'SmaI', 'NheI', 'StuI', 'SphI', 'NciI', 'FspI', 'PvuII', 'FokI', 'SpeI', 'HinfI', 'EcoO109I', 'EcoRV', 'EcoRI', 'XhoI', 'Bsp1286I', 'AccIII', 'PstI', 'BsmI', 'Alw44I', 'SfiI', 'HaeIII', 'NdeII', 'AccI', 'SspI', 'NsiI', 'ApaI', 'ScaI', 'AgeI', 'NspV', 'BalI', 'NotI', 'HindIII', 'AcyI', 'BamHI', 'AvaII', 'HpaI', 'StyI', 'HhaI'))
+suppliers['J'] = _temp()
+def _temp():
+    return ('Takara Bio Inc.', ('BssHII', 'MluI', 'BspT107I', 'SacI', 'XspI', 'BglI', 'SalI', 'MspI', 'BstPI', 'BanII', 'PmaCI', 'SnaBI', 'SmiI', 'BmgT120I', 'NcoI', 'ClaI', 'DraI', 'BstXI', 'PshAI', 'PvuI', 'Van91I', 'Bst1107I', 'TaqI', 'EaeI', 'Eco52I', 'BspT104I', 'KpnI', 'HaeII', 'EcoO65I', 'NdeI', 'HapII', 'MboII', 'AflII', 'EcoT14I', 'BglII', 'NaeI', 'AccII', 'SacII', 'BmeT110I', 'Aor51HI', 'Bsp1407I', 'NruI', 'MvaI', 'Sse8387I', 'CpoI', 'HincII', 'XbaI', 'Sau3AI', 'Cfr10I', 'MboI', 'AluI', 'BcnI', 'SmaI', 'NheI', 'StuI', 'SphI', 'PvuII', 'MflI', 'FokI', 'Hin1I', 'ApaLI', 'SpeI', 'HinfI', 'Eam1105I', 'Psp1406I', 'EcoO109I', 'BbeI', 'EcoRV', 'AatII', 'EcoRI', 'XhoI', 'VpaK11BI', 'Bsp1286I', 'AccIII', 'Bpu1102I', 'MunI', 'Aor13HI', 'NsbI', 'PstI', 'SfiI', 'BlnI', 'HaeIII', 'AccI', 'SspI', 'Tth111I', 'FbaI', 'Eco81I', 'ApaI', 'PshBI', 'EcoT22I', 'ScaI', 'BalI', 'AfaI', 'NotI', 'HindIII', 'BamHI', 'AvaII', 'HpaI', 'HhaI'))
+suppliers['K'] = _temp()
+def _temp():
+    return ('Roche Applied Science', ('BssHII', 'MluI', 'HpaII', 'BclI', 'SacI', 'BglI', 'SalI', 'Asp718I', 'MspI', 'SnaBI', 'XmaCI', 'BstEII', 'NcoI', 'ClaI', 'DraII', 'Eco47III', 'DraI', 'BstXI', 'SwaI', 'AvaI', 'PvuI', 'BseAI', 'DpnI', 'Van91I', 'Bst1107I', 'BsiWI', 'TaqI', 'SexAI', 'KpnI', 'NdeI', 'PinAI', 'BglII', 'NaeI', 'MaeI', 'AspI', 'NruI', 'MvaI', 'BpuAI', 'NarI', 'RsaI', 'MaeII', 'AflIII', 'AspEI', 'XbaI', 'Sau3AI', 'MvnI', 'AluI', 'RsrII', 'EcoRII', 'CfoI', 'SmaI', 'NheI', 'StuI', 'BbrPI', 'SphI', 'MaeIII', 'PvuII', 'FokI', 'SpeI', 'HinfI', 'DraIII', 'MluNI', 'EcoRV', 'AatII', 'EcoRI', 'XhoI', 'MunI', 'EclXI', 'PstI', 'BsmI', 'SfiI', 'BlnI', 'HaeIII', 'NdeII', 'AccI', 'SspI', 'SgrAI', 'NsiI', 'ItaI', 'ApaI', 'SfuI', 'ScaI', 'BfrI', 'NspI', 'KspI', 'Tru9I', 'DdeI', 'NotI', 'MroI', 'Asp700I', 'HindIII', 'AcyI', 'RcaI', 'BamHI', 'AviII', 'AvaII', 'CelII', 'HpaI', 'StyI', 'HindII'))
+suppliers['M'] = _temp()
+def _temp():
+    return ('New England Biolabs', ('BssHII', 'EciI', 'BsrFI', 'DpnII', 'AlwI', 'MluI', 'NgoMIV', 'HpaII', 'TspMI', 'BclI', 'MlyI', 'BsaWI', 'SacI', 'MwoI', 'BfaI', 'DrdI', 'BmgBI', 'BglI', 'SalI', 'MspI', 'BanII', 'MslI', 'BmtI', 'PspXI', 'BsaBI', 'SnaBI', 'BstEII', 'TspRI', 'NcoI', 'MspA1I', 'BtgI', 'ClaI', 'BsaI', 'BsrBI', 'AlwNI', 'XmnI', 'DraI', 'Hpy166II', 'Hpy99I', 'StyD4I', 'BstXI', 'PspGI', 'BsiHKAI', 'BlpI', 'PshAI', 'XmaI', 'SwaI', 'AvaI', 'PvuI', 'DpnI', 'CspCI', 'PflFI', 'BpuEI', 'BsiWI', 'TaqI', 'EaeI', 'SexAI', 'BsrI', 'AseI', 'KpnI', 'Sau96I', 'BstNI', 'HaeII', 'AclI', 'ApoI', 'HpyCH4IV', 'NdeI', 'MboII', 'AflII', 'TseI', 'BglII', 'SmlI', 'NaeI', 'Bpu10I', 'SacII', 'Acc65I', 'BspQI', 'AvrII', 'NruI', 'BaeI', 'BtsCI', 'BssKI', 'PciI', 'PhoI', 'BcgI', 'BsaHI', 'SfoI', 'TliI', 'NarI', 'Bsu36I', 'RsaI', 'HincII', 'AflIII', 'BsgI', 'XbaI', 'Sau3AI', 'BfuAI', 'TfiI', 'PmlI', 'BbvI', 'MboI', 'HgaI', 'BanI', 'AluI', 'BaeGI', 'ZraI', 'Hpy188III', 'RsrII', 'BspMI', 'AciI', 'ScrFI', 'MscI', 'BseYI', 'CviQI', 'BmrI', 'Hpy188I', 'SmaI', 'PleI', 'EcoNI', 'NheI', 'BccI', 'BsiEI', 'StuI', 'BspCNI', 'SphI', 'HpyAV', 'NciI', 'FspI', 'CviAII', 'PvuII', 'Eco53kI', 'MfeI', 'BsrDI', 'BssSI', 'FokI', 'ApaLI', 'ApeKI', 'SpeI', 'HinfI', 'BciVI', 'HinP1I', 'BceAI', 'HphI', 'BsmAI', 'DraIII', 'EcoO109I', 'BtsI', 'SapI', 'PpuMI', 'EcoRV', 'PsiI', 'AatII', 'EcoRI', 'BsmFI', 'XhoI', 'Bsp1286I', 'PspOMI', 'MnlI', 'EagI', 'AscI', 'AhdI', 'NlaIII', 'SbfI', 'BsoBI', 'PstI', 'Tsp509I', 'MseI', 'FauI', 'SfcI', 'BspEI', 'BsmI', 'SfiI', 'BstUI', 'BstZ17I', 'KasI', 'HaeIII', 'BsmBI', 'XcmI', 'BstAPI', 'AccI', 'SspI', 'HpyCH4III', 'BsrGI', 'AfeI', 'Tth111I', 'SgrAI', 'NsiI', 'BspHI', 'BstYI', 'PmeI', 'FseI', 'ApaI', 'BseRI', 'MmeI', 'ScaI', 'AgeI', 'BtgZI', 'BpmI', 'EarI', 'CviKI_1', 'AcuI', 'BfuCI', 'NspI', 'PacI', 'BstBI', 'HpyCH4V', 'NlaIV', 'BbsI', 'DdeI', 'NotI', 'BsaXI', 'HindIII', 'FatI', 'BamHI', 'BslI', 'AvaII', 'BspDI', 'PaeR7I', 'SfaNI', 'HpaI', 'BsaJI', 'BbvCI', 'Fnu4HI', 'Cac8I', 'Tsp45I', 'StyI', 'PflMI', 'HhaI', 'AsiSI', 'AleI', 'NmeAIII', 'BsaAI'))
+suppliers['N'] = _temp()
+def _temp():
+    return ('Toyobo Biochemicals', ('BssHII', 'MluI', 'HpaII', 'BclI', 'SacI', 'BglI', 'SalI', 'MspI', 'BanII', 'BstEII', 'NcoI', 'Eco47III', 'DraI', 'BstXI', 'Cfr9I', 'AvaI', 'PvuI', 'DpnI', 'BsiWI', 'TaqI', 'Eco52I', 'AseI', 'KpnI', 'Sau96I', 'HaeII', 'Cfr13I', 'MboII', 'TspEI', 'BglII', 'NaeI', 'SacII', 'NruI', 'MvaI', 'CspI', 'NarI', 'Eco47I', 'RsaI', 'HincII', 'XbaI', 'Sau3AI', 'Cfr10I', 'BanIII', 'BanI', 'AluI', 'ScrFI', 'EcoRII', 'MscI', 'Csp45I', 'SmaI', 'NheI', 'BbrPI', 'SphI', 'NciI', 'FspI', 'PvuII', 'EheI', 'Hin1I', 'SpeI', 'HinfI', 'PpuMI', 'EcoRV', 'PsiI', 'AatII', 'EcoRI', 'AatI', 'XhoI', 'SbfI', 'Eco105I', 'PstI', 'BsmI', 'Alw44I', 'SfiI', 'HaeIII', 'AccI', 'SspI', 'SrfI', 'Eco81I', 'ApaI', 'EcoT22I', 'ScaI', 'NspV', 'BfrI', 'PacI', 'DdeI', 'NotI', 'MroI', 'HindIII', 'BamHI', 'HpaI', 'HhaI'))
+suppliers['O'] = _temp()
+def _temp():
+    return ('Molecular Biology Resources - CHIMERx', ('BssHII', 'MluI', 'HpaII', 'BspTNI', 'SacI', 'BglI', 'SalI', 'MspI', 'BanII', 'NcoI', 'CviJI', 'DraI', 'BstXI', 'AcvI', 'PvuI', 'TaqI', 'SinI', 'KpnI', 'NdeI', 'PinAI', 'MboII', 'BglII', 'SacII', 'NruI', 'NarI', 'TaqII', 'RsaI', 'HincII', 'XbaI', 'MboI', 'AluI', 'RsrII', 'SmaI', 'StuI', 'SphI', 'FokI', 'SpeI', 'HinfI', 'BsiHKCI', 'EcoRV', 'EcoRI', 'XhoI', 'MnlI', 'PstI', 'SfiI', 'HaeIII', 'SspI', 'Tth111I', 'ApaI', 'ScaI', 'NotI', 'HindIII', 'BamHI', 'HpaI'))
+suppliers['Q'] = _temp()
+def _temp():
+    return ('Promega Corporation', ('BssHII', 'MluI', 'NgoMIV', 'HpaII', 'BclI', 'SacI', 'BglI', 'SalI', 'BstOI', 'MspI', 'BanII', 'SnaBI', 'BstEII', 'NcoI', 'MspA1I', 'ClaI', 'XmnI', 'Eco47III', 'DraI', 'BstXI', 'XmaI', 'AvaI', 'PvuI', 'DpnI', 'BbuI', 'TaqI', 'SinI', 'KpnI', 'HaeII', 'NdeI', 'MboII', 'BglII', 'NaeI', 'SacII', 'Acc65I', 'NruI', 'CspI', 'NarI', 'Bsu36I', 'Bst98I', 'RsaI', 'HincII', 'XbaI', 'BsrSI', 'Sau3AI', 'MboI', 'BanI', 'AluI', 'CfoI', 'Csp45I', 'AccB7I', 'SmaI', 'NheI', 'XhoII', 'StuI', 'SphI', 'NciI', 'PvuII', 'FokI', 'SpeI', 'HinfI', 'SgfI', 'EcoRV', 'AatII', 'EcoRI', 'XhoI', 'Bsp1286I', 'AccIII', 'PstI', 'VspI', 'BstZI', 'Alw44I', 'SfiI', 'Hsp92I', 'HaeIII', 'NdeII', 'AccI', 'SspI', 'Tth111I', 'NsiI', 'ApaI', 'ScaI', 'AgeI', 'BsaMI', 'BalI', 'Tru9I', 'Hsp92II', 'DdeI', 'NotI', 'HindIII', 'EcoICRI', 'BamHI', 'AvaII', 'HpaI', 'StyI', 'HhaI'))
+suppliers['R'] = _temp()
+def _temp():
+    return ('Sigma Chemical Corporation', ('BssHII', 'MluI', 'HpaII', 'BclI', 'SacI', 'BglI', 'SalI', 'MspI', 'BstEII', 'NcoI', 'ClaI', 'DraI', 'SwaI', 'AvaI', 'PvuI', 'DpnI', 'TaqI', 'KpnI', 'NdeI', 'BglII', 'MvaI', 'RsaI', 'XbaI', 'Sau3AI', 'AluI', 'ScrFI', 'EcoRII', 'CfoI', 'SmaI', 'NheI', 'StuI', 'SphI', 'PvuII', 'SpeI', 'MluNI', 'EcoRV', 'EcoRI', 'XhoI', 'EclXI', 'PstI', 'BsmI', 'SfiI', 'BlnI', 'HaeIII', 'AccI', 'SspI', 'NsiI', 'ApaI', 'ScaI', 'KspI', 'DdeI', 'NotI', 'HindIII', 'BamHI', 'AvaII', 'HpaI', 'StyI', 'HindII'))
+suppliers['S'] = _temp()
+def _temp():
+    return ('Bangalore Genei', ('MluI', 'HpaII', 'BclI', 'SacI', 'BglI', 'SalI', 'MspI', 'BstEII', 'NcoI', 'ClaI', 'XmnI', 'DraI', 'XmaI', 'AvaI', 'PvuI', 'AssI', 'TaqI', 'KpnI', 'Sau96I', 'BglII', 'NaeI', 'NruI', 'NarI', 'HincII', 'XbaI', 'Sau3AI', 'StrI', 'MboI', 'BanI', 'AluI', 'SmaI', 'BasI', 'NheI', 'StuI', 'PvuII', 'ApaLI', 'SpeI', 'HinfI', 'MvrI', 'EcoRV', 'EcoRI', 'XhoI', 'PstI', 'SfiI', 'HaeIII', 'AccI', 'SspI', 'NsiI', 'ApaI', 'NotI', 'HindIII', 'BamHI', 'HpaI', 'HhaI'))
+suppliers['U'] = _temp()
+def _temp():
+    return ('Vivantis Technologies', ('BssMI', 'AsuNHI', 'MluI', 'BstHHI', 'HpaII', 'AhlI', 'BglI', 'SalI', 'MspI', 'VneI', 'BstH2I', 'BmtI', 'AsiGI', 'CciNI', 'Sfr274I', 'SmiI', 'Ksp22I', 'BssT1I', 'MspA1I', 'Bsp19I', 'Bse1I', 'AspS9I', 'BmcAI', 'FauNDI', 'DraI', 'Bst2UI', 'Vha464I', 'BstXI', 'BstDEI', 'XmaI', 'BstF5I', 'BpvUI', 'BstMBI', 'BstENI', 'Ama87I', 'BstDSI', 'BstV2I', 'AspLEI', 'Zsp2I', 'DseDI', 'BstAUI', 'Bpu14I', 'TaqI', 'KpnI', 'BstSNI', 'AclI', 'MboII', 'BmrFI', 'BglII', 'AcsI', 'BstNSI', 'BmeRI', 'BseX3I', 'Bpu10I', 'Rsr2I', 'Acc65I', 'BtuMI', 'PspEI', 'Bst2BI', 'SmiMI', 'Bse118I', 'BsnI', 'BmiI', 'BsePI', 'BstMCI', 'Bme18I', 'RsaI', 'BssNAI', 'Bsp13I', 'Bst4CI', 'AsuHPI', 'BtrI', 'XbaI', 'Psp124BI', 'BstX2I', 'AluI', 'ZraI', 'Bse21I', 'Sfr303I', 'BpuMI', 'Bse3DI', 'Bso31I', 'AccB7I', 'AccBSI', 'SmaI', 'AspA2I', 'Bsp1720I', 'SphI', 'FriOI', 'PvuII', 'ErhI', 'BshVI', 'FokI', 'HinfI', 'BstPAI', 'HspAI', 'DraIII', 'Acc16I', 'EcoRV', 'AatII', 'MroXI', 'EcoRI', 'DinI', 'BstFNI', 'AfiI', 'PspOMI', 'MnlI', 'SbfI', 'PstI', 'Bse8I', 'VspI', 'SfiI', 'Bst6I', 'Msp20I', 'Bbv12I', 'SspI', 'Tth111I', 'BstMAI', 'ApaI', 'FblI', 'PctI', 'AccB1I', 'BssNI', 'PceI', 'Sse9I', 'Tru9I', 'MhlI', 'BstBAI', 'MroNI', 'HindIII', 'EcoICRI', 'BamHI', 'SfaNI', 'HpaI', 'PspCI', 'HindII'))
+suppliers['V'] = _temp()
+def _temp():
+    return ('MP Biomedicals', ('MluI', 'HpaII', 'BclI', 'SacI', 'BglI', 'SalI', 'MspI', 'BanII', 'BstEII', 'NcoI', 'DraII', 'XmnI', 'Eco47III', 'DraI', 'BstXI', 'SwaI', 'AvaI', 'PvuI', 'DpnI', 'TaqI', 'SinI', 'KpnI', 'Sau96I', 'HaeII', 'NdeI', 'MboII', 'BglII', 'SacII', 'Acc65I', 'BspXI', 'NruI', 'MvaI', 'NarI', 'RsaI', 'HincII', 'AflIII', 'XbaI', 'Sau3AI', 'MboI', 'AluI', 'SmaI', 'NheI', 'XhoII', 'SphI', 'NciI', 'PvuII', 'FokI', 'SpeI', 'HinfI', 'DraIII', 'EcoRV', 'EcoRI', 'XhoI', 'MnlI', 'AccIII', 'EagI', 'AscI', 'NlaIII', 'PstI', 'BsmI', 'SfiI', 'HaeIII', 'NdeII', 'AccI', 'SspI', 'Tth111I', 'NsiI', 'PmeI', 'ApaI', 'ScaI', 'PacI', 'NlaIV', 'Tru9I', 'DdeI', 'NotI', 'HindIII', 'BamHI', 'BslI', 'AvaII', 'HpaI', 'HhaI'))
+suppliers['W'] = _temp()
+def _temp():
+    return ('EURx Ltd.', ('BssHII', 'MluI', 'HpaII', 'BspTNI', 'SacI', 'BglI', 'SalI', 'MspI', 'BanII', 'NcoI', 'CviJI', 'DraI', 'BstXI', 'AcvI', 'AvaI', 'PvuI', 'DpnI', 'TaqI', 'SinI', 'KpnI', 'NdeI', 'PinAI', 'MboII', 'BglII', 'SacII', 'NruI', 'NarI', 'TaqII', 'RsaI', 'HincII', 'XbaI', 'Sau3AI', 'TspGWI', 'MboI', 'AluI', 'RsrII', 'SmaI', 'StuI', 'SphI', 'PvuII', 'FokI', 'SpeI', 'HinfI', 'BsiHKCI', 'EcoRV', 'EcoRI', 'XhoI', 'MnlI', 'PstI', 'SfiI', 'HaeIII', 'AccI', 'SspI', 'Tth111I', 'ApaI', 'MmeI', 'ScaI', 'TspDTI', 'BalI', 'NotI', 'HindIII', 'BamHI', 'BsuTUI', 'HpaI'))
+suppliers['X'] = _temp()
+def _temp():
+    return ('CinnaGen Inc.', ('BclI', 'BglI', 'SalI', 'MspI', 'NcoI', 'DraI', 'PvuI', 'TaqI', 'KpnI', 'NdeI', 'BglII', 'RsaI', 'HincII', 'XbaI', 'MboI', 'AluI', 'SmaI', 'PvuII', 'HinfI', 'EcoRV', 'EcoRI', 'XhoI', 'PstI', 'HaeIII', 'NotI', 'HindIII', 'BamHI', 'AvaII', 'HhaI'))
+suppliers['Y'] = _temp()
+del _temp
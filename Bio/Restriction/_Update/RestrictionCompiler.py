@@ -59,6 +59,7 @@ from Bio.Restriction.Restriction import Commercially_available, Not_available
 
 import Bio.Restriction.RanaConfig as config
 from Bio.Restriction._Update.Update import RebaseUpdate
+from Bio.Restriction._Update.TableCompiler import write_table
 from Bio.Restriction.Restriction import *
 from Bio.Restriction.DNAUtils import antiparallel
 
@@ -517,6 +518,10 @@ class DictionaryBuilder(object):
             results.write("del _temp\n")
             results.write("\n")
             print('OK.\n')
+        with open(os.path.join(update, 'Restriction_Table.py'), 'w') as results:
+            print('Writing the compact table of the Restriction classes...')
+            write_table(results, classdict, suppliersdict, typedict)
+            print('OK.\n')
         return
 
     def install_dict(self):
@@ -557,6 +562,9 @@ class DictionaryBuilder(object):
             return
         try:
             shutil.copyfile(new, old)
+            shutil.copyfile(os.path.join(update_folder, 'Restriction_Table.py'),
+                            os.path.join(os.path.split(old)[0],
+                                         'Restriction_Table.py'))
             print('\n\t Everything ok. If you need it a version of the old\
             \n\t dictionary have been saved in the Updates folder under\
             \n\t the name Restriction_Dictionary.old.')
@@ -596,8 +604,8 @@ class DictionaryBuilder(object):
         \n You will find the newly created 'Restriction_Dictionary.py' file\
         \n in the folder : \n\
         \n\t%s\n\
-        \n Make a copy of 'Restriction_Dictionary.py' and place it with \
-        \n the other Restriction libraries.\n\
+        \n Make a copy of 'Restriction_Dictionary.py' and 'Restriction_Table.py'\
+        \n and place them with the other Restriction libraries.\n\
         \n note : \
         \n This folder should be :\n\
         \n\t%s\n" % places)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+#
+#      Restriction Analysis Libraries.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+#
+#   this script is used to produce the compact table of the restriction
+#   enzymes (Restriction_Table.py), which is what Bio.Restriction loads.
+#   It is built from the dictionaries in Restriction_Dictionary.py, and is
+#   written by RestrictionCompiler.py at the same time as that file.
+#
+#   To rebuild the table from the installed Restriction_Dictionary.py, run
+#   this file as a script from the Bio/Restriction folder.
+#
+
+"""Write the compact table of enzymes used by Bio.Restriction.
+
+Rather than a dictionary of attributes per enzyme, the table has one tuple
+of values per enzyme (in the order given by fields), and the index of its
+type (i.e. the tuple of base classes). The attributes which are always the
+same (dna, results and substrat) or which can be worked out from the others
+(charac) are left out.
+"""
+
+from __future__ import print_function
+
+#The attributes of an enzyme stored in the table, in order
+fields = ('compsite', 'site', 'size', 'fst5', 'fst3', 'scd5', 'scd3',
+          'ovhg', 'ovhgseq', 'freq', 'opt_temp', 'inact_temp', 'suppl')
+
+#Number of enzymes per temporary function (see the Jython note in start)
+_CHUNK_SIZE = 50
+
+start = '''\
+#!/usr/bin/env python
+#
+#      Restriction Analysis Libraries.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+#
+# This file is automatically generated - do not edit it by hand! Instead,
+# use the tool Scripts/Restriction/ranacompiler.py which in turn uses
+# Bio/Restriction/_Update/RestrictionCompiler.py and TableCompiler.py
+#
+# This is a compact version of Restriction_Dictionary.py, with one tuple
+# of values per enzyme in the order given by fields. As in that file, the
+# data is split between temporary functions to avoid the JVM limits of
+# Jython.
+
+'''
+
+
+def write_table(handle, rest_dict, suppliers, typedict):
+    """Write the table for the given enzyme dictionaries to a handle.
+
+    The arguments are the dictionaries from Restriction_Dictionary.py.
+    """
+    handle.write(start)
+    handle.write("fields = %r\n\n" % (fields,))
+    type_names = sorted(typedict)
+    handle.write("#The base classes of each type of enzyme\n")
+    handle.write("types = (\n")
+    for name in type_names:
+        handle.write("    %r,\n" % (tuple(typedict[name][0]),))
+    handle.write(")\n\n")
+    enzyme_types = {}
+    for index, name in enumerate(type_names):
+        for enzyme in typedict[name][1]:
+            enzyme_types[enzyme] = index
+    handle.write("#The type index and values of the fields for each enzyme\n")
+    handle.write("enzymes = {}\n")
+    names = sorted(rest_dict)
+    for i in range(0, len(names), _CHUNK_SIZE):
+        handle.write("def _temp():\n")
+        handle.write("    return {\n")
+        for name in names[i:i + _CHUNK_SIZE]:
+            values = tuple(rest_dict[name][field] for field in fields)
+            handle.write("        %r: (%i, %r),\n"
+                         % (name, enzyme_types[name], values))
+        handle.write("    }\n")
+        handle.write("enzymes.update(_temp())\n")
+    handle.write("\n")
+    handle.write("#The name and enzymes of each supplier\n")
+    handle.write("suppliers = {}\n")
+    for code in sorted(suppliers):
+        name, enzymes = suppliers[code]
+        handle.write("def _temp():\n")
+        handle.write("    return (%r, %r)\n" % (name, tuple(enzymes)))
+        handle.write("suppliers[%r] = _temp()\n" % code)
+    handle.write("del _temp\n")
+
+
+def check_table(rest_dict, typedict, table):
+    """Check the table module matches the enzyme dictionaries, returns bool.
+
+    Each enzyme is rebuilt from the table as done in Bio.Restriction, and
+    compared to the entries in the dictionaries.
+    """
+    if sorted(rest_dict) != sorted(table.enzymes):
+        return False
+    for bases, enzymes in typedict.values():
+        for name in enzymes:
+            if table.types[table.enzymes[name][0]] != tuple(bases):
+                return False
+    for name, (index, values) in table.enzymes.items():
+        attributes = dict(zip(table.fields, values))
+        attributes["charac"] = (attributes["fst5"], attributes["fst3"],
+                                attributes["scd5"], attributes["scd3"],
+                                attributes["site"])
+        attributes["dna"] = attributes["results"] = None
+        attributes["substrat"] = "DNA"
+        if attributes != rest_dict[name]:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    #Not imported, as importing Bio.Restriction needs the table
+    rd = {}
+    with open("Restriction_Dictionary.py") as handle:
+        exec(compile(handle.read(), "Restriction_Dictionary.py", "exec"), rd)
+    with open("Restriction_Table.py", "w") as handle:
+        write_table(handle, rd["rest_dict"], rd["suppliers"], rd["typedict"])
+    print("Written Restriction_Table.py")
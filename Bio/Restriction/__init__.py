@@ -58,7 +58,19 @@ Usage:
     >>>
     """
 
-from Bio.Restriction.Restriction import *
+import sys
+
+from Bio.Restriction import Restriction
+from Bio.Restriction.Restriction import FormattedSeq, Analysis, RestrictionBatch
+
+#
+#   The enzymes (and the batches AllEnzymes, CommOnly and NonComm) are only
+#   created when first used, so are looked up in Restriction when needed
+#   (see the end of Restriction.py). from Bio.Restriction import * works as
+#   before, but creates all the enzymes.
+#
+__all__ = Restriction.__all__
+sys.modules[__name__] = Restriction._LazyModule(sys.modules[__name__])
 #
 #   OK can't put the following code in Bio.Restriction.__init__ unless
 #   I put everything from Restriction in here.
@@ -199,6 +199,7 @@ from Bio._py3k import basestring
 
 __docformat__ = 'epytext en'
 
+import functools
 import sys
 import warnings
 
@@ -492,7 +493,7 @@ def index(filename, format=None, key_function=None, **kwargs):
 
 
 def index_db(index_filename, filenames=None, format=None,
-        key_function=None, **kwargs):
+        key_function=None, processes=None, update=False, **kwargs):
     """Indexes several search output files into an SQLite database.
 
      - index_filename - The SQLite filename.
@@ -504,6 +505,12 @@ def index_db(index_filename, filenames=None, format=None,
      - key_function - Optional callback function which when given a
                       QueryResult identifier string should return a unique
                       key for the dictionary.
+     - processes    - Optional number of worker processes to use when
+                      building a new index of several files (default None,
+                      meaning scan the files one by one in this process).
+     - update       - Boolean, if reloading an existing index should it be
+                      brought up to date with the given filenames (default
+                      False, meaning the filenames must match the index).
      - kwargs       - Format-specific keyword arguments.
 
     The `index_db` function is similar to `index` in that it indexes the start
@@ -537,6 +544,11 @@ def index_db(index_filename, filenames=None, format=None,
     of one thousand sequences each in order to run as ten separate BLAST jobs
     on a cluster. You could use `index_db` to index the ten BLAST output
     files together for seamless access to all the results as one dictionary.
+    When building such an index for the first time, the `processes` argument
+    can be used to scan the files in parallel worker processes. If you later
+    add more output files, or some are re-run, use `update=True` to index
+    only the new and changed files (a warning is given when reloading an
+    index where any of the files have changed).
 
     Note that ':memory:' rather than an index filename tells SQLite to hold
     the index database in memory. This is useful for quick tests, but using
@@ -554,16 +566,22 @@ def index_db(index_filename, filenames=None, format=None,
     repr = "SearchIO.index_db(%r, filenames=%r, format=%r, key_function=%r, ...)" \
                % (index_filename, filenames, format, key_function)
 
-    def proxy_factory(format, filename=None):
-        """Given a filename returns proxy object, else boolean if format OK."""
-        if filename:
-            return get_processor(format, _INDEXER_MAP)(filename, **kwargs)
-        else:
-            return format in _INDEXER_MAP
+    # using a partial rather than a closure so that it can be pickled
+    # and sent to worker processes when indexing in parallel
+    proxy_factory = functools.partial(_index_db_proxy_factory, kwargs)
 
     return _SQLiteManySeqFilesDict(index_filename, filenames,
                                    proxy_factory, format,
-                                   key_function, repr)
+                                   key_function, repr, processes=processes,
+                                   update=update)
+
+
+def _index_db_proxy_factory(kwargs, format, filename=None):
+    """Given a filename returns proxy object, else boolean if format OK (PRIVATE)."""
+    if filename:
+        return get_processor(format, _INDEXER_MAP)(filename, **kwargs)
+    else:
+        return format in _INDEXER_MAP
 
 
 def write(qresults, handle, format=None, **kwargs):
@@ -17,6 +17,7 @@ from Bio.Alphabet import single_letter_alphabet
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 from Bio.SeqIO.Interfaces import SequentialSequenceWriter
+from Bio.SeqIO._batch import _batch_iterator, _fasta_chunks
 
 
 def SimpleFastaParser(handle):
@@ -70,6 +71,30 @@ def SimpleFastaParser(handle):
     assert False, "Should not reach this line"
 
 
+def FastaBatchIterator(handle, batch_size=10000):
+    """Generator function to iterate over Fasta records in columnar batches.
+
+    Each batch is a SeqBatch object holding up to batch_size records (the
+    last may be smaller), with all the title lines and all the sequences
+    each joined into a single string plus arrays of offsets. This avoids
+    creating a tuple or SeqRecord per record, and with NumPy allows whole
+    batches to be filtered at once (see the SeqBatch class for details).
+    The file is read in large blocks which are split into records with
+    string methods, falling back on SimpleFastaParser for unusual files.
+
+    >>> with open("Fasta/dups.fasta") as handle:
+    ...     for batch in FastaBatchIterator(handle, batch_size=3):
+    ...         print("%i records, %i bases" % (len(batch), len(batch.seqs)))
+    3 records, 14 bases
+    2 records, 10 bases
+    >>> batch[0]
+    ('alpha (again - this is a duplicate entry to test the indexing code)', 'ACGTA')
+
+    """
+    return _batch_iterator(_fasta_chunks(handle, SimpleFastaParser),
+                           batch_size)
+
+
 def FastaIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
     """Generator function to iterate over Fasta records (as SeqRecord objects).
 
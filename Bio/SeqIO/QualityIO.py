@@ -369,9 +369,11 @@ from Bio.Alphabet import single_letter_alphabet
 from Bio.Seq import Seq, UnknownSeq
 from Bio.SeqRecord import SeqRecord
 from Bio.SeqIO.Interfaces import SequentialSequenceWriter
+from Bio.SeqIO._batch import _batch_iterator, _fastq_chunks
 from math import log
 import warnings
 from Bio import BiopythonWarning, BiopythonParserWarning
+from Bio._py3k import _as_bytes, _as_string
 
 
 # define score offsets. See discussion for differences between Sanger and
@@ -538,6 +540,63 @@ def _get_phred_quality(record):
                          "letter_annotations of SeqRecord (id=%s)."
                          % record.id)
 
+def _quality_table(mapping):
+    """Turn a quality to letter dict into a byte translation table (PRIVATE).
+
+    The table is indexed by the quality as a signed byte, so that negative
+    Solexa scores map to the end of the table (e.g. -5 is entry 251).
+    """
+    table = ["\0"] * 256
+    for q, letter in mapping.items():
+        table[q % 256] = letter
+    return _as_bytes("".join(table))
+
+
+def _array_quality_str(qualities, table, low, high, warning):
+    """Encode integer NumPy array qualities via a translation table (PRIVATE).
+
+    Returns None if the qualities are not a (non-empty) integer array, or
+    contain values below low, in which case the caller should fall back on
+    the general code. Values above high are truncated with a warning.
+    """
+    dtype = getattr(qualities, "dtype", None)
+    if dtype is None or dtype.kind not in "iu" or not len(qualities):
+        return None
+    if qualities.min() < low:
+        return None
+    if qualities.max() > high:
+        warnings.warn(warning, BiopythonWarning)
+        qualities = qualities.clip(low, high)
+    #Everything is now in the range -5 to 93, so fits in a signed byte
+    return _as_string(qualities.astype("int8").tobytes().translate(table))
+
+
+def _array_quality_decoder(offset, low, high):
+    """Returns a function decoding quality strings into NumPy arrays (PRIVATE).
+
+    The arrays have dtype uint8, or int8 if low is negative (as for Solexa
+    scores). Each string is range checked and decoded with a single array
+    operation, rather than a Python level loop over the letters.
+    """
+    try:
+        import numpy
+    except ImportError:
+        from Bio import MissingPythonDependencyError
+        raise MissingPythonDependencyError(
+            "Install NumPy if you want the qualities as arrays.")
+
+    def decode(quality_string):
+        codes = numpy.frombuffer(_as_bytes(quality_string), numpy.uint8)
+        if len(codes) and (codes.min() < low + offset
+                           or codes.max() > high + offset):
+            raise ValueError("Invalid character in quality string")
+        if low < 0:
+            #Safe as the ASCII codes are all under 128
+            codes = codes.view(numpy.int8)
+        return codes - offset
+    return decode
+
+
 #Only map 0 to 93, we need to give a warning on truncating at 93
 _phred_to_sanger_quality_str = dict((qp, chr(min(126, qp + SANGER_SCORE_OFFSET)))
                                     for qp in range(0, 93 + 1))
@@ -546,6 +605,8 @@ _solexa_to_sanger_quality_str = dict(
     (qs, chr(min(126, int(round(phred_quality_from_solexa(qs))) +
      SANGER_SCORE_OFFSET)))
     for qs in range(-5, 93 + 1))
+_phred_to_sanger_quality_table = _quality_table(_phred_to_sanger_quality_str)
+_solexa_to_sanger_quality_table = _quality_table(_solexa_to_sanger_quality_str)
 
 
 def _get_sanger_quality_str(record):
@@ -617,6 +678,12 @@ def _get_sanger_quality_str(record):
         #Fall back on solexa scores...
         pass
     else:
+        #Integer NumPy arrays can be done in one go:
+        qualities_str = _array_quality_str(
+            qualities, _phred_to_sanger_quality_table, 0, 93,
+            "Data loss - max PHRED quality 93 in Sanger FASTQ")
+        if qualities_str is not None:
+            return qualities_str
         #Try and use the precomputed mapping:
         try:
             return "".join(_phred_to_sanger_quality_str[qp]
@@ -639,6 +706,12 @@ def _get_sanger_quality_str(record):
         raise ValueError("No suitable quality scores found in "
                          "letter_annotations of SeqRecord (id=%s)."
                          % record.id)
+    #Integer NumPy arrays can be done in one go:
+    qualities_str = _array_quality_str(
+        qualities, _solexa_to_sanger_quality_table, -5, 93,
+        "Data loss - max PHRED quality 93 in Sanger FASTQ")
+    if qualities_str is not None:
+        return qualities_str
     #Try and use the precomputed mapping:
     try:
         return "".join(_solexa_to_sanger_quality_str[qs]
@@ -665,6 +738,8 @@ _phred_to_illumina_quality_str = dict((qp, chr(qp + SOLEXA_SCORE_OFFSET))
 _solexa_to_illumina_quality_str = dict(
     (qs, chr(int(round(phred_quality_from_solexa(qs))) + SOLEXA_SCORE_OFFSET))
     for qs in range(-5, 62 + 1))
+_phred_to_illumina_quality_table = _quality_table(_phred_to_illumina_quality_str)
+_solexa_to_illumina_quality_table = _quality_table(_solexa_to_illumina_quality_str)
 
 
 def _get_illumina_quality_str(record):
@@ -685,6 +760,12 @@ def _get_illumina_quality_str(record):
         #Fall back on solexa scores...
         pass
     else:
+        #Integer NumPy arrays can be done in one go:
+        qualities_str = _array_quality_str(
+            qualities, _phred_to_illumina_quality_table, 0, 62,
+            "Data loss - max PHRED quality 62 in Illumina FASTQ")
+        if qualities_str is not None:
+            return qualities_str
         #Try and use the precomputed mapping:
         try:
             return "".join(_phred_to_illumina_quality_str[qp]
@@ -707,6 +788,12 @@ def _get_illumina_quality_str(record):
         raise ValueError("No suitable quality scores found in "
                          "letter_annotations of SeqRecord (id=%s)."
                          % record.id)
+    #Integer NumPy arrays can be done in one go:
+    qualities_str = _array_quality_str(
+        qualities, _solexa_to_illumina_quality_table, -5, 62,
+        "Data loss - max PHRED quality 62 in Illumina FASTQ")
+    if qualities_str is not None:
+        return qualities_str
     #Try and use the precomputed mapping:
     try:
         return "".join(_solexa_to_illumina_quality_str[qs]
@@ -734,6 +821,8 @@ _phred_to_solexa_quality_str = dict(
     (qp, chr(min(126, int(round(solexa_quality_from_phred(qp))) +
      SOLEXA_SCORE_OFFSET)))
     for qp in range(0, 62 + 1))
+_solexa_to_solexa_quality_table = _quality_table(_solexa_to_solexa_quality_str)
+_phred_to_solexa_quality_table = _quality_table(_phred_to_solexa_quality_str)
 
 
 def _get_solexa_quality_str(record):
@@ -754,6 +843,12 @@ def _get_solexa_quality_str(record):
         #Fall back on PHRED scores...
         pass
     else:
+        #Integer NumPy arrays can be done in one go:
+        qualities_str = _array_quality_str(
+            qualities, _solexa_to_solexa_quality_table, -5, 62,
+            "Data loss - max Solexa quality 62 in Solexa FASTQ")
+        if qualities_str is not None:
+            return qualities_str
         #Try and use the precomputed mapping:
         try:
             return "".join(_solexa_to_solexa_quality_str[qs]
@@ -776,6 +871,12 @@ def _get_solexa_quality_str(record):
         raise ValueError("No suitable quality scores found in "
                          "letter_annotations of SeqRecord (id=%s)."
                          % record.id)
+    #Integer NumPy arrays can be done in one go:
+    qualities_str = _array_quality_str(
+        qualities, _phred_to_solexa_quality_table, 0, 62,
+        "Data loss - max Solexa quality 62 in Solexa FASTQ")
+    if qualities_str is not None:
+        return qualities_str
     #Try and use the precomputed mapping:
     try:
         return "".join(_phred_to_solexa_quality_str[qp]
@@ -954,10 +1055,45 @@ def FastqGeneralIterator(handle):
 
         #Return the record and then continue...
         yield (title_line, seq_string, quality_string)
-    raise StopIteration
 
 
-def FastqPhredIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
+def FastqBatchIterator(handle, batch_size=10000):
+    """Iterate over Fastq records in columnar batches (not as SeqRecord objects).
+
+    Each batch is a SeqBatch object holding up to batch_size records (the
+    last may be smaller). The title lines, sequences and quality strings
+    are each joined into a single string, with arrays of offsets for where
+    each record starts. The file is read in large blocks which are split
+    into four line records with string methods, falling back on
+    FastqGeneralIterator for any multi-line records. As with that function,
+    the quality strings are not decoded or checked.
+
+    This avoids creating a tuple or SeqRecord per read. For example, to
+    keep only the reads of at least 25bp from each batch:
+
+    >>> with open("Quality/example.fastq", "rU") as handle:
+    ...     for batch in FastqBatchIterator(handle, batch_size=2):
+    ...         good = batch.select([n >= 25 for n in batch.lengths()])
+    ...         print("%i of %i reads kept" % (len(good), len(batch)))
+    2 of 2 reads kept
+    1 of 1 reads kept
+
+    With NumPy you can go further and filter or trim whole batches at
+    once using the seq_array and qual_array methods, for example keeping
+    reads with a mean PHRED quality of at least 25::
+
+        starts = numpy.array(batch.seq_offsets[:-1])
+        totals = numpy.add.reduceat(batch.qual_array(), starts)
+        good = batch.select(totals >= 25 * numpy.array(batch.lengths()))
+
+    See the SeqBatch class for more details.
+    """
+    return _batch_iterator(_fastq_chunks(handle, FastqGeneralIterator),
+                           batch_size)
+
+
+def FastqPhredIterator(handle, alphabet=single_letter_alphabet, title2ids=None,
+                       quality_array=False):
     """Generator function to iterate over FASTQ records (as SeqRecord objects).
 
      - handle - input file
@@ -1020,6 +1156,20 @@ def FastqPhredIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
     >>> print(record.letter_annotations["phred_quality"])
     [26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 24, 26, 22, 26, 26, 13, 22, 26, 18, 24, 18, 18, 18, 18]
 
+    For large files, building these lists of integers dominates the run
+    time and memory usage. With quality_array=True the qualities are
+    instead decoded into a compact NumPy array (dtype uint8, or int8 for
+    the Solexa scores from FastqSolexaIterator) in one vectorised step::
+
+        records = FastqPhredIterator(handle, quality_array=True)
+
+    All the FASTQ writers accept integer arrays like this directly, and
+    convert them without looping over the bases in Python.
+
+    Note an array behaves differently from a list if you add two records
+    together (the scores would be summed, not concatenated), so you may
+    want to convert it using list(...) before doing this.
+
     """
     assert SANGER_SCORE_OFFSET == ord("!")
     #Originally, I used a list expression for each record:
@@ -1030,6 +1180,8 @@ def FastqPhredIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
     q_mapping = dict()
     for letter in range(0, 255):
         q_mapping[chr(letter)] = letter - SANGER_SCORE_OFFSET
+    if quality_array:
+        decode = _array_quality_decoder(SANGER_SCORE_OFFSET, 0, 93)
     for title_line, seq_string, quality_string in FastqGeneralIterator(handle):
         if title2ids:
             id, name, descr = title2ids(title_line)
@@ -1039,9 +1191,12 @@ def FastqPhredIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
             name = id
         record = SeqRecord(Seq(seq_string, alphabet),
                            id=id, name=name, description=descr)
-        qualities = [q_mapping[letter] for letter in quality_string]
-        if qualities and (min(qualities) < 0 or max(qualities) > 93):
-            raise ValueError("Invalid character in quality string")
+        if quality_array:
+            qualities = decode(quality_string)
+        else:
+            qualities = [q_mapping[letter] for letter in quality_string]
+            if qualities and (min(qualities) < 0 or max(qualities) > 93):
+                raise ValueError("Invalid character in quality string")
         #For speed, will now use a dirty trick to speed up assigning the
         #qualities. We do this to bypass the length check imposed by the
         #per-letter-annotations restricted dict (as this has already been
@@ -1052,7 +1207,8 @@ def FastqPhredIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
         yield record
 
 
-def FastqSolexaIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
+def FastqSolexaIterator(handle, alphabet=single_letter_alphabet, title2ids=None,
+                        quality_array=False):
     r"""Parsing old Solexa/Illumina FASTQ like files (which differ in the quality mapping).
 
     The optional arguments are the same as those for the FastqPhredIterator.
@@ -1189,6 +1345,8 @@ def FastqSolexaIterator(handle, alphabet=single_letter_alphabet, title2ids=None)
     q_mapping = dict()
     for letter in range(0, 255):
         q_mapping[chr(letter)] = letter - SOLEXA_SCORE_OFFSET
+    if quality_array:
+        decode = _array_quality_decoder(SOLEXA_SCORE_OFFSET, -5, 62)
     for title_line, seq_string, quality_string in FastqGeneralIterator(handle):
         if title2ids:
             id, name, descr = title_line
@@ -1198,10 +1356,13 @@ def FastqSolexaIterator(handle, alphabet=single_letter_alphabet, title2ids=None)
             name = id
         record = SeqRecord(Seq(seq_string, alphabet),
                            id=id, name=name, description=descr)
-        qualities = [q_mapping[letter] for letter in quality_string]
-        #DO NOT convert these into PHRED qualities automatically!
-        if qualities and (min(qualities) < -5 or max(qualities) > 62):
-            raise ValueError("Invalid character in quality string")
+        if quality_array:
+            qualities = decode(quality_string)
+        else:
+            qualities = [q_mapping[letter] for letter in quality_string]
+            #DO NOT convert these into PHRED qualities automatically!
+            if qualities and (min(qualities) < -5 or max(qualities) > 62):
+                raise ValueError("Invalid character in quality string")
         #Dirty trick to speed up this line:
         #record.letter_annotations["solexa_quality"] = qualities
         dict.__setitem__(record._per_letter_annotations,
@@ -1209,7 +1370,8 @@ def FastqSolexaIterator(handle, alphabet=single_letter_alphabet, title2ids=None)
         yield record
 
 
-def FastqIlluminaIterator(handle, alphabet=single_letter_alphabet, title2ids=None):
+def FastqIlluminaIterator(handle, alphabet=single_letter_alphabet, title2ids=None,
+                          quality_array=False):
     """Parse Illumina 1.3 to 1.7 FASTQ like files (which differ in the quality mapping).
 
     The optional arguments are the same as those for the FastqPhredIterator.
@@ -1241,6 +1403,8 @@ def FastqIlluminaIterator(handle, alphabet=single_letter_alphabet, title2ids=Non
     q_mapping = dict()
     for letter in range(0, 255):
         q_mapping[chr(letter)] = letter - SOLEXA_SCORE_OFFSET
+    if quality_array:
+        decode = _array_quality_decoder(SOLEXA_SCORE_OFFSET, 0, 62)
     for title_line, seq_string, quality_string in FastqGeneralIterator(handle):
         if title2ids:
             id, name, descr = title2ids(title_line)
@@ -1250,9 +1414,12 @@ def FastqIlluminaIterator(handle, alphabet=single_letter_alphabet, title2ids=Non
             name = id
         record = SeqRecord(Seq(seq_string, alphabet),
                            id=id, name=name, description=descr)
-        qualities = [q_mapping[letter] for letter in quality_string]
-        if qualities and (min(qualities) < 0 or max(qualities) > 62):
-            raise ValueError("Invalid character in quality string")
+        if quality_array:
+            qualities = decode(quality_string)
+        else:
+            qualities = [q_mapping[letter] for letter in quality_string]
+            if qualities and (min(qualities) < 0 or max(qualities) > 62):
+                raise ValueError("Invalid character in quality string")
         #Dirty trick to speed up this line:
         #record.letter_annotations["phred_quality"] = qualities
         dict.__setitem__(record._per_letter_annotations,
@@ -345,6 +345,7 @@ See also http://biopython.org/wiki/SeqIO_dev
 --Peter
 """
 
+import functools
 
 from Bio.File import as_handle
 from Bio.SeqRecord import SeqRecord
@@ -484,7 +485,7 @@ def write(sequences, handle, format):
     return count
 
 
-def parse(handle, format, alphabet=None):
+def parse(handle, format, alphabet=None, processes=None, ordered=True):
     r"""Turns a sequence file into an iterator returning SeqRecords.
 
      - handle   - handle to the file, or the filename as a string
@@ -493,6 +494,10 @@ def parse(handle, format, alphabet=None):
      - alphabet - optional Alphabet object, useful when the sequence type
                   cannot be automatically inferred from the file itself
                   (e.g. format="fasta" or "tab")
+     - processes - optional number of processes to parse the file with
+                  (default None, meaning parse in this process only).
+     - ordered  - when using processes, should the records be returned in
+                  the same order as in the file (default True).
 
     Typical usage, opening a file to read in, and looping over the record(s):
 
@@ -537,6 +542,26 @@ def parse(handle, format, alphabet=None):
 
     Use the Bio.SeqIO.read(...) function when you expect a single record
     only.
+
+    For large files in the formats supported by Bio.SeqIO.index (except
+    "ace", "sff", "sff-trim" and "uniprot-xml"), the parsing can be spread
+    over several processes. You must give a filename, which is scanned for
+    the record boundaries (as when building an index), and each chunk of
+    records is parsed in a separate process:
+
+    >>> for record in SeqIO.parse("GenBank/cor6_6.gb", "genbank", processes=2):
+    ...     print(record.id)
+    X55053.1
+    X62281.1
+    M81224.1
+    AJ237582.1
+    L31939.1
+    AF297471.1
+
+    Only a few chunks are queued ahead of the records being consumed, so the
+    memory use is bounded. Setting ordered=False returns each chunk of
+    records as soon as it is ready, which can be faster when the records
+    vary greatly in size.
     """
     #NOTE - The above docstring has some raw \n characters needed
     #for the StringIO example, hense the whole docstring is in raw
@@ -560,6 +585,11 @@ def parse(handle, format, alphabet=None):
                                      isinstance(alphabet, AlphabetEncoder)):
         raise ValueError("Invalid alphabet, %s" % repr(alphabet))
 
+    if processes is not None and processes > 1:
+        for r in _parse_parallel(handle, format, alphabet, processes, ordered):
+            yield r
+        return
+
     with as_handle(handle, mode) as fp:
         #Map the file format to a sequence iterator:
         if format in _FormatToIterator:
@@ -583,6 +613,142 @@ def parse(handle, format, alphabet=None):
             yield r
 
 
+#Formats which Bio.SeqIO.index supports, but where the raw records can't be
+#parsed on their own (binary, or need a file header):
+_ParallelUnsupported = frozenset(["ace", "sff", "sff-trim", "uniprot-xml"])
+#Target size in bytes of the chunks of records sent to each process:
+_PARALLEL_CHUNK_SIZE = 1000000
+
+
+def _parse_chunk(task):
+    """Parse a chunk of records from a file, used in a worker process (PRIVATE).
+
+    The task is a tuple of the filename, format, alphabet, and the offsets
+    of the start of the chunk and of the next chunk (None for the end of
+    the file). For BGZF files these are virtual offsets. Returns a list of
+    SeqRecord objects.
+    """
+    from Bio import bgzf
+    from Bio._py3k import _bytes_to_string, StringIO
+    from Bio.File import _open_for_random_access
+    filename, format, alphabet, start, stop = task
+    handle = _open_for_random_access(filename)
+    try:
+        handle.seek(start)
+        if isinstance(handle, bgzf.BgzfReader):
+            #Can't subtract virtual offsets, but can compare them
+            lines = []
+            while stop is None or handle.tell() < stop:
+                line = handle.readline()
+                if not line:
+                    break
+                lines.append(line)
+            data = b"".join(lines)
+        elif stop is None:
+            data = handle.read()
+        else:
+            data = handle.read(stop - start)
+    finally:
+        handle.close()
+    data = _bytes_to_string(data)
+    if "\r" in data:
+        #Mimic universal newlines mode
+        data = data.replace("\r\n", "\n").replace("\r", "\n")
+    return list(parse(StringIO(data), format, alphabet))
+
+
+def _parse_chunk_or_error(task):
+    """Parse a chunk of records, returning any exception raised (PRIVATE).
+
+    Returns a tuple of True and the list of SeqRecord objects, or of False
+    and the exception. This is used with an apply_async callback, which is
+    only called on success.
+    """
+    try:
+        return True, _parse_chunk(task)
+    except Exception as err:
+        return False, err
+
+
+def _parse_parallel(filename, format, alphabet, processes, ordered):
+    """Parse a file in chunks using a pool of processes (PRIVATE).
+
+    The record boundaries are found by the same code used by Bio.SeqIO.index,
+    and the records are then grouped into chunks of about _PARALLEL_CHUNK_SIZE
+    bytes. At most two chunks per process are queued at any one time, so if
+    the records are not being consumed the workers will soon stop. Unless
+    ordered, each chunk's results are put on a queue by a callback as soon
+    as it finishes.
+    """
+    from collections import deque
+    from multiprocessing import Pool
+    try:
+        from queue import Queue
+    except ImportError:
+        #Python 2
+        from Queue import Queue
+    from ._index import _FormatToRandomAccess  # Lazy import
+    if not isinstance(filename, basestring):
+        raise ValueError("Parsing with processes needs a filename, not a handle")
+    if format not in _FormatToRandomAccess or format in _ParallelUnsupported:
+        raise ValueError("Parsing format '%s' with processes is not supported"
+                         % format)
+
+    def chunks():
+        proxy = _FormatToRandomAccess[format](filename, format, alphabet,
+                                              use_mmap=True)
+        try:
+            start = None
+            size = 0
+            for key, offset, length in proxy:
+                if start is None:
+                    start = offset
+                elif size >= _PARALLEL_CHUNK_SIZE:
+                    yield (filename, format, alphabet, start, offset)
+                    start = offset
+                    size = 0
+                #Only used as a guide to the chunk size
+                size += length
+            if start is not None:
+                yield (filename, format, alphabet, start, None)
+        finally:
+            proxy._handle.close()
+
+    finished = Queue()
+
+    def submit(task):
+        if ordered:
+            return pool.apply_async(_parse_chunk, (task,))
+        return pool.apply_async(_parse_chunk_or_error, (task,),
+                                callback=finished.put)
+
+    def next_result(pending):
+        if ordered:
+            return pending.popleft().get()
+        #Take whichever chunk finishes first (the pending list is then
+        #only used to count the chunks not yet taken)
+        pending.popleft()
+        success, value = finished.get()
+        if not success:
+            raise value
+        return value
+
+    pool = Pool(processes)
+    try:
+        pending = deque()
+        for task in chunks():
+            pending.append(submit(task))
+            while len(pending) >= 2 * processes:
+                for record in next_result(pending):
+                    yield record
+        while pending:
+            for record in next_result(pending):
+                yield record
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def _force_alphabet(record_iterator, alphabet):
     """Iterate over records, over-riding the alphabet (PRIVATE)."""
     #Assume the alphabet argument has been pre-validated
@@ -718,7 +884,8 @@ def to_dict(sequences, key_function=None):
     return d
 
 
-def index(filename, format, alphabet=None, key_function=None):
+def index(filename, format, alphabet=None, key_function=None, compact=False,
+          use_mmap=False):
     """Indexes a sequence file and returns a dictionary like object.
 
      - filename - string giving name of file to be indexed
@@ -729,6 +896,9 @@ def index(filename, format, alphabet=None, key_function=None):
      - key_function - Optional callback function which when given a
                   SeqRecord identifier string should return a unique
                   key for the dictionary.
+     - compact  - Boolean, should the keys and offsets be held in packed
+                  arrays rather than a Python dictionary (default False).
+     - use_mmap - Boolean, should the file be memory mapped (default False).
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values:
@@ -821,6 +991,50 @@ def index(filename, format, alphabet=None, key_function=None):
     to be completely parsed while building the index. Right now this is
     usually avoided.
 
+    For very large files (e.g. hundreds of millions of short reads in
+    FASTQ format) the index itself can use a lot of memory, as by default
+    the keys and file offsets are held in a Python dictionary. With the
+    compact=True option they are instead packed into arrays, taking little
+    more memory than the keys themselves (at the cost of slightly slower
+    lookups). In this case the keys must be strings:
+
+    >>> compact = SeqIO.index("Quality/example.fastq", "fastq", compact=True)
+    >>> len(compact)
+    3
+    >>> print(compact["EAS54_6_R1_2_1_540_792"].seq)
+    TTGGCAGGCCAAGGCCGATGGATCA
+    >>> compact.close()
+
+    Large uncompressed files can also be memory mapped with use_mmap=True,
+    avoiding a system call for every line read. For the simpler formats
+    (e.g. "fasta" and "fastq") the records are then found by searching the
+    mapped data directly, and the get_raw method returns a zero-copy view
+    of the record (a memoryview on Python 3, or buffer on Python 2) rather
+    than a bytes string. These views must be released before the index is
+    closed:
+
+    >>> mapped = SeqIO.index("Quality/example.fastq", "fastq", use_mmap=True)
+    >>> raw = mapped.get_raw("EAS54_6_R1_2_1_540_792")
+    >>> print(bytes(raw).decode().split()[1])
+    TTGGCAGGCCAAGGCCGATGGATCA
+    >>> del raw
+    >>> mapped.close()
+
+    BGZF compressed files are never memory mapped.
+
+    If you want to fetch many records, the get_many method is faster than
+    looking them up one by one. It returns (key, record) pairs, reading the
+    records in the order they appear in the file to avoid random seeks:
+
+    >>> for key, record in records.get_many([(540, 792), (413, 324)]):
+    ...     print("%s %s" % (key, record.id))
+    (540, 792) EAS54_6_R1_2_1_540_792
+    (413, 324) EAS54_6_R1_2_1_413_324
+
+    By default the pairs are returned in the order the keys were given,
+    use file_order=True to get them in file order instead. There is also a
+    get_raw_many method, which works like the get_raw method.
+
     See also: Bio.SeqIO.index_db() and Bio.SeqIO.to_dict()
     """
     #Try and give helpful error messages:
@@ -845,12 +1059,14 @@ def index(filename, format, alphabet=None, key_function=None):
         raise ValueError("Unsupported format %r" % format)
     repr = "SeqIO.index(%r, %r, alphabet=%r, key_function=%r)" \
         % (filename, format, alphabet, key_function)
-    return _IndexedSeqFileDict(proxy_class(filename, format, alphabet),
-                               key_function, repr, "SeqRecord")
+    return _IndexedSeqFileDict(proxy_class(filename, format, alphabet,
+                                           use_mmap=use_mmap),
+                               key_function, repr, "SeqRecord",
+                               compact=compact)
 
 
 def index_db(index_filename, filenames=None, format=None, alphabet=None,
-             key_function=None):
+             key_function=None, processes=None, update=False):
     """Index several sequence files and return a dictionary like object.
 
     The index is stored in an SQLite database rather than in memory (as in the
@@ -868,6 +1084,12 @@ def index_db(index_filename, filenames=None, format=None, alphabet=None,
      - key_function - Optional callback function which when given a
                   SeqRecord identifier string should return a unique
                   key for the dictionary.
+     - processes - Optional number of worker processes to use when
+                  building a new index of several files (default None,
+                  meaning scan the files one by one in this process).
+     - update   - Boolean, if reloading an existing index should it be
+                  brought up to date with the given filenames (default
+                  False, meaning the filenames must match the index).
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values:
@@ -891,6 +1113,31 @@ def index_db(index_filename, filenames=None, format=None, alphabet=None,
 
     In this example the two files contain 85 and 10 records respectively.
 
+    When indexing a large collection of files for the first time, you can
+    use the processes argument to scan the files in parallel. Each file is
+    scanned by a separate worker process, and the offsets are then loaded
+    into the SQLite database in large transactions:
+
+    >>> records = SeqIO.index_db(idx_name, files, "fasta", generic_protein,
+    ...                          get_gi, processes=2)
+    >>> len(records)
+    95
+    >>> records["45478717"].id
+    'gi|45478717|ref|NP_995572.1|'
+
+    The size, modification time and a checksum of each file are recorded in
+    the index, and you will get a warning on reloading the index if any of
+    the files have changed. If you add files to (or remove files from) a
+    collection, or change existing files, use update=True to refresh the
+    index. Only the new and changed files are scanned, any files no longer
+    listed have their entries dropped, e.g.
+
+        records = SeqIO.index_db("reads.idx", filenames, "fastq", update=True)
+
+    If no filenames are given with update=True, the recorded files are
+    checked and any which have changed are re-indexed (and any which no
+    longer exist are dropped).
+
     BGZF compressed files are supported, and detected automatically. Ordinary
     GZIP compressed files are not supported.
 
@@ -914,22 +1161,27 @@ def index_db(index_filename, filenames=None, format=None, alphabet=None,
                                      isinstance(alphabet, AlphabetEncoder)):
         raise ValueError("Invalid alphabet, %s" % repr(alphabet))
 
-    #Map the file format to a sequence iterator:
-    from ._index import _FormatToRandomAccess  # Lazy import
     from Bio.File import _SQLiteManySeqFilesDict
     repr = "SeqIO.index_db(%r, filenames=%r, format=%r, alphabet=%r, key_function=%r)" \
                % (index_filename, filenames, format, alphabet, key_function)
 
-    def proxy_factory(format, filename=None):
-        """Given a filename returns proxy object, else boolean if format OK."""
-        if filename:
-            return _FormatToRandomAccess[format](filename, format, alphabet)
-        else:
-            return format in _FormatToRandomAccess
+    #Using a partial rather than a closure so that it can be pickled
+    #and sent to worker processes when indexing in parallel.
+    proxy_factory = functools.partial(_index_db_proxy_factory, alphabet)
 
     return _SQLiteManySeqFilesDict(index_filename, filenames,
                                    proxy_factory, format,
-                                   key_function, repr)
+                                   key_function, repr, processes=processes,
+                                   update=update)
+
+
+def _index_db_proxy_factory(alphabet, format, filename=None):
+    """Given a filename returns proxy object, else boolean if format OK (PRIVATE)."""
+    from ._index import _FormatToRandomAccess  # Lazy import
+    if filename:
+        return _FormatToRandomAccess[format](filename, format, alphabet)
+    else:
+        return format in _FormatToRandomAccess
 
 
 def convert(in_file, in_format, out_file, out_format, alphabet=None):
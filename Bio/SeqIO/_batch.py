@@ -0,0 +1,500 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Columnar batches of FASTA or FASTQ records (PRIVATE).
+
+You are not expected to access this module directly. Use the functions
+Bio.SeqIO.FastaIO.FastaBatchIterator and Bio.SeqIO.QualityIO.FastqBatchIterator
+which return SeqBatch objects.
+
+Rather than one tuple or SeqRecord per read, each batch holds all the title
+lines joined into one string, all the sequences joined into another (and for
+FASTQ, all the quality strings into a third), plus arrays of the offsets
+where each record starts. With NumPy these strings can be viewed as arrays
+without copying the data, so simple filters can be done for a whole batch
+at once rather than record by record.
+
+The files are read in large blocks of text, which are split into records
+and columns using string methods on the whole block (rather than reading
+one line at a time). Only the common simple layouts are handled this way,
+four line FASTQ records and FASTA files without tabs. Anything else (such
+as multi-line FASTQ, or text before the first record) is handed over to
+SimpleFastaParser or FastqGeneralIterator for the rest of the file, so the
+results and any errors are exactly the same as from those functions.
+"""
+
+from __future__ import print_function
+
+import operator
+from array import array
+from itertools import islice, repeat
+
+try:
+    from itertools import accumulate as _accumulate
+except ImportError:
+    #Python 2
+    _accumulate = None
+
+from Bio._py3k import _as_bytes, basestring, map, StringIO
+
+#Number of characters to read from the handle at a time
+_BLOCK_SIZE = 1 << 20
+
+#String methods applied to many records at once with map
+_partition_line = operator.methodcaller("partition", "\n")
+_first = operator.itemgetter(0)
+_last = operator.itemgetter(2)
+_rstrip = operator.methodcaller("rstrip")
+_remove_newlines = operator.methodcaller("replace", "\n", "")
+_remove_spaces = operator.methodcaller("replace", " ", "")
+_remove_returns = operator.methodcaller("replace", "\r", "")
+
+
+def _offsets(lengths):
+    """Returns an array of start offsets, with the total length last (PRIVATE).
+
+    The argument is an iterable of the lengths of the strings.
+    """
+    offsets = array("l", [0])
+    if _accumulate is not None:
+        offsets.fromlist(list(_accumulate(lengths)))
+        return offsets
+    total = 0
+    for length in lengths:
+        total += length
+        offsets.append(total)
+    return offsets
+
+
+def _numpy():
+    """Import NumPy, or raise MissingPythonDependencyError (PRIVATE)."""
+    try:
+        import numpy
+    except ImportError:
+        from Bio import MissingPythonDependencyError
+        raise MissingPythonDependencyError(
+            "Install NumPy if you want to use SeqBatch arrays.")
+    return numpy
+
+
+class SeqBatch(object):
+    """A block of FASTA or FASTQ records held as joined strings with offsets.
+
+    Attributes:
+
+     - titles - All the title lines (without the > or @) joined together.
+     - title_offsets - Array of len(batch) + 1 offsets into titles, so
+       record i has title titles[title_offsets[i]:title_offsets[i+1]]
+     - seqs - All the sequences joined together.
+     - seq_offsets - Array of len(batch) + 1 offsets into seqs.
+     - quals - All the quality strings joined together (using the same
+       offsets as the sequences), or None for FASTA.
+
+    Indexing or iterating over a batch gives the same string tuples as the
+    SimpleFastaParser or FastqGeneralIterator functions:
+
+    >>> batch = SeqBatch(["alpha", "beta"], ["ACGT", "CG"], ["IIII", "!!"])
+    >>> len(batch)
+    2
+    >>> batch[1]
+    ('beta', 'CG', '!!')
+    >>> print(batch.seqs)
+    ACGTCG
+    >>> list(batch.seq_offsets)
+    [0, 4, 6]
+    >>> list(batch.lengths())
+    [4, 2]
+
+    """
+    def __init__(self, titles, seqs, quals=None):
+        """Create a batch from lists of title, sequence and quality strings.
+
+         - titles - sequence of title line strings
+         - seqs - sequence of sequence strings
+         - quals - optional sequence of quality strings (for FASTQ)
+        """
+        if len(titles) != len(seqs):
+            raise ValueError("Got %i titles but %i sequences"
+                             % (len(titles), len(seqs)))
+        self.titles = "".join(titles)
+        self.title_offsets = _offsets(map(len, titles))
+        self.seqs = "".join(seqs)
+        self.seq_offsets = _offsets(map(len, seqs))
+        if quals is None:
+            self.quals = None
+        else:
+            quals = "".join(quals)
+            if len(quals) != len(self.seqs):
+                raise ValueError("Got %i letters of sequence but %i quality "
+                                 "scores" % (len(self.seqs), len(quals)))
+            self.quals = quals
+
+    @classmethod
+    def _from_joined(cls, titles, title_offsets, seqs, seq_offsets,
+                     quals=None):
+        """Create a batch from joined strings and offset arrays (PRIVATE)."""
+        batch = cls.__new__(cls)
+        batch.titles = titles
+        batch.title_offsets = title_offsets
+        batch.seqs = seqs
+        batch.seq_offsets = seq_offsets
+        batch.quals = quals
+        return batch
+
+    def __len__(self):
+        return len(self.seq_offsets) - 1
+
+    def __getitem__(self, index):
+        """Returns the string tuple for the given record."""
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("SeqBatch index out of range")
+        t_start, t_end = self.title_offsets[index:index + 2]
+        s_start, s_end = self.seq_offsets[index:index + 2]
+        if self.quals is None:
+            return self.titles[t_start:t_end], self.seqs[s_start:s_end]
+        return (self.titles[t_start:t_end], self.seqs[s_start:s_end],
+                self.quals[s_start:s_end])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def lengths(self):
+        """Returns an array of the sequence lengths."""
+        offsets = self.seq_offsets
+        return array("l", [offsets[i + 1] - offsets[i]
+                           for i in range(len(offsets) - 1)])
+
+    def select(self, keep):
+        """Returns a new batch containing only the selected records.
+
+        The argument can either be a list of record indices (in the order
+        wanted), or a list of booleans (one for each record, e.g. a NumPy
+        mask array) saying which records to keep:
+
+        >>> batch = SeqBatch(["alpha", "beta", "gamma"], ["ACGT", "CG", "T"])
+        >>> list(batch.select([True, False, True]))
+        [('alpha', 'ACGT'), ('gamma', 'T')]
+        >>> list(batch.select([1]))
+        [('beta', 'CG')]
+
+        """
+        dtype = getattr(keep, "dtype", None)
+        keep = list(keep)
+        if (dtype is not None and dtype.kind == "b") or \
+        (keep and all(isinstance(k, bool) for k in keep)):
+            if len(keep) != len(self):
+                raise ValueError("Got %i booleans for %i records"
+                                 % (len(keep), len(self)))
+            keep = [i for i, k in enumerate(keep) if k]
+        return self._subset(keep, None, None)
+
+    def trim(self, starts=0, ends=None):
+        """Returns a new batch with each record trimmed to seq[start:end].
+
+        The starts and ends can either be a single integer used for every
+        record, or one value per record (e.g. a NumPy array computed from
+        the qualities). As with Python slices, an end of None means the
+        end of the sequence. The qualities (if any) are trimmed to match:
+
+        >>> batch = SeqBatch(["alpha", "beta"], ["ACGTA", "CG"], ["IIII!", "I!"])
+        >>> list(batch.trim(ends=[4, 1]))
+        [('alpha', 'ACGT', 'IIII'), ('beta', 'C', 'I')]
+
+        """
+        count = len(self)
+        if isinstance(starts, int):
+            starts = [starts] * count
+        if ends is None or isinstance(ends, int):
+            ends = [ends] * count
+        if len(starts) != count or len(ends) != count:
+            raise ValueError("Need one start and end for each of the %i "
+                             "records" % count)
+        return self._subset(range(count), starts, ends)
+
+    def _subset(self, indices, starts, ends):
+        """Build a new batch from some records, optionally trimmed (PRIVATE)."""
+        titles = []
+        seqs = []
+        quals = None if self.quals is None else []
+        t_offsets = self.title_offsets
+        s_offsets = self.seq_offsets
+        for n, i in enumerate(indices):
+            titles.append(self.titles[t_offsets[i]:t_offsets[i + 1]])
+            s_start, s_end = s_offsets[i], s_offsets[i + 1]
+            if starts is not None:
+                #Apply slice semantics within this record
+                start, end = slice(starts[n], ends[n]).indices(s_end - s_start)[:2]
+                s_start, s_end = s_start + start, s_start + max(start, end)
+            seqs.append(self.seqs[s_start:s_end])
+            if quals is not None:
+                quals.append(self.quals[s_start:s_end])
+        return SeqBatch(titles, seqs, quals)
+
+    def seq_array(self):
+        """Returns the sequences as a NumPy uint8 array of ASCII codes.
+
+        Together with the seq_offsets, this allows vectorised operations,
+        such as counting the N characters in each record:
+
+        >>> import numpy
+        >>> batch = SeqBatch(["alpha", "beta"], ["ACNNT", "NG"])
+        >>> starts = numpy.array(batch.seq_offsets[:-1])
+        >>> list(numpy.add.reduceat(batch.seq_array() == ord("N"), starts))
+        [2, 1]
+
+        Note numpy.add.reduceat does not work as you might expect with
+        zero length sequences.
+        """
+        numpy = _numpy()
+        return numpy.frombuffer(_as_bytes(self.seqs), numpy.uint8)
+
+    def qual_array(self, offset=33):
+        """Returns the qualities as a NumPy uint8 array of scores.
+
+         - offset - the ASCII offset used to encode the scores, 33 for
+           standard Sanger FASTQ (the default), or 64 for old Solexa and
+           Illumina 1.3 to 1.7 FASTQ files.
+
+        This makes it easy to calculate the mean quality of each record:
+
+        >>> import numpy
+        >>> batch = SeqBatch(["alpha", "beta"], ["ACGT", "CG"], ["II55", "!!"])
+        >>> starts = numpy.array(batch.seq_offsets[:-1])
+        >>> totals = numpy.add.reduceat(batch.qual_array(), starts)
+        >>> list(totals / numpy.array(batch.lengths()))
+        [30.0, 0.0]
+
+        """
+        if self.quals is None:
+            raise ValueError("This batch has no quality scores")
+        numpy = _numpy()
+        codes = numpy.frombuffer(_as_bytes(self.quals), numpy.uint8)
+        if len(codes) and codes.min() < offset:
+            raise ValueError("Quality character below ASCII offset %i"
+                             % offset)
+        return codes - offset
+
+
+class _PrefixedHandle(object):
+    """Handle giving some text, and then the rest of another handle (PRIVATE).
+
+    This is used to pass the unparsed part of a block, followed by the rest
+    of the file, to the line based parsers. Only readline is supported.
+    """
+    def __init__(self, text, handle):
+        self._prefix = StringIO(text)
+        self._handle = handle
+
+    def readline(self):
+        if self._prefix is not None:
+            line = self._prefix.readline()
+            if line.endswith("\n"):
+                return line
+            #End of the prefix, which may have stopped part way into a line
+            self._prefix = None
+            return line + self._handle.readline()
+        return self._handle.readline()
+
+
+def _record_chunks(records, size=10000):
+    """Turn string tuples from a parser into chunks of records (PRIVATE).
+
+    See _batch_iterator for the chunks, which here hold size records.
+    """
+    records = iter(records)
+    while True:
+        columns = list(zip(*islice(records, size)))
+        if not columns:
+            return
+        chunk = []
+        for column in columns[:2]:
+            chunk.extend(["".join(column), list(map(len, column))])
+        chunk.append("".join(columns[2]) if len(columns) > 2 else None)
+        yield chunk
+
+
+def _read_text(handle, block_size):
+    """Read a block of text from the handle, rejecting binary (PRIVATE)."""
+    text = handle.read(block_size)
+    if not isinstance(text, basestring):
+        raise ValueError("Is this handle in binary mode not text mode?")
+    return text
+
+
+def _fasta_chunks(handle, parser, block_size=_BLOCK_SIZE):
+    """Chunks of records from blocks of a FASTA file (PRIVATE).
+
+    The parser (SimpleFastaParser) is used for the whole file if there is
+    any text before the first record.
+    """
+    text = _read_text(handle, block_size)
+    if not text:
+        return
+    if text[0] != ">":
+        for chunk in _record_chunks(parser(_PrefixedHandle(text, handle))):
+            yield chunk
+        return
+    pending = [text]
+    while True:
+        block = _read_text(handle, block_size)
+        if block:
+            #Look for the start of the last record in the new block
+            cut = block.rfind("\n>") + 1
+            if not cut and block[0] == ">" and pending[-1].endswith("\n"):
+                cut = 0
+            elif not cut:
+                pending.append(block)
+                continue
+            pending.append(block[:cut])
+            text = "".join(pending)
+            pending = [block[cut:]]
+        else:
+            text = "".join(pending)
+        #Complete records, each starting with ">", split up using map
+        #so that there is no Python code run for each record
+        records = list(map(_partition_line, text[1:].split("\n>")))
+        titles = list(map(_rstrip, map(_first, records)))
+        seqs = map(_last, records)
+        if "\t" in text or "\x0b" in text or "\x0c" in text:
+            #Need to remove trailing whitespace line by line
+            seqs = ["".join(line.rstrip() for line in seq.split("\n"))
+                    for seq in seqs]
+        else:
+            #As the line endings and any spaces are removed anyway,
+            #there is no need to split up the lines
+            seqs = list(map(_remove_newlines, seqs))
+        joined_seqs = "".join(seqs)
+        if " " in joined_seqs or "\r" in joined_seqs:
+            seqs = list(map(_remove_returns, map(_remove_spaces, seqs)))
+            joined_seqs = "".join(seqs)
+        yield ["".join(titles), list(map(len, titles)),
+               joined_seqs, list(map(len, seqs)), None]
+        if not block:
+            return
+
+
+def _fastq_chunks(handle, parser, block_size=_BLOCK_SIZE):
+    """Chunks of records from blocks of a FASTQ file (PRIVATE).
+
+    Blocks of complete four line records (title, sequence, plus line and
+    quality) are split up using string methods on the whole block. At the
+    first block not in this simple layout, the parser (FastqGeneralIterator)
+    is used for the rest of the file.
+    """
+    text = ""
+    eof = False
+    while not eof:
+        block = _read_text(handle, block_size)
+        eof = not block
+        text += block
+        if not text:
+            return
+        lines = text.split("\n")
+        if eof:
+            #Allow blank lines at the end of the file
+            while lines and not lines[-1]:
+                lines.pop()
+            rest = []
+        else:
+            #The last line may be incomplete
+            rest = lines[-1:]
+            del lines[-1:]
+        count = len(lines) // 4
+        rest = lines[4 * count:] + rest
+        titles = lines[0:4 * count:4]
+        seqs = lines[1:4 * count:4]
+        pluses = lines[2:4 * count:4]
+        quals = lines[3:4 * count:4]
+        joined_titles = "\n".join(titles)
+        joined_seqs = "".join(seqs)
+        joined_quals = "".join(quals)
+        seq_lengths = list(map(len, seqs))
+        if ("\n" + joined_titles).count("\n@") != count \
+        or seq_lengths != list(map(len, quals)) \
+        or (eof and rest) \
+        or "\r" in text or "\t" in text or "\x0b" in text \
+        or "\x0c" in text or " " in joined_seqs or " " in joined_quals \
+        or " \n" in joined_titles or joined_titles.endswith(" ") \
+        or (pluses.count("+") != count and
+            any(plus != "+" and (plus[:1] != "+" or plus[1:] != title[1:])
+                for title, plus in zip(titles, pluses))):
+            #Not the simple layout (or an error), use the line based parser
+            for chunk in _record_chunks(parser(_PrefixedHandle(text,
+                                                               handle))):
+                yield chunk
+            return
+        #Hold back the last record, as any following lines might belong to
+        #it, so that if the parser is needed it starts at a record boundary
+        done = count if eof else count - 1
+        if done > 0:
+            #Lengths of the titles without the @ characters
+            title_lengths = list(map(operator.sub,
+                                     map(len, titles[:done]), repeat(1)))
+            seq_lengths = seq_lengths[:done]
+            seq_end = sum(seq_lengths)
+            yield [joined_titles[1:].replace("\n@", "")[:sum(title_lengths)],
+                   title_lengths, joined_seqs[:seq_end], seq_lengths,
+                   joined_quals[:seq_end]]
+        text = "\n".join(lines[4 * max(done, 0):4 * count] + rest)
+
+
+def _batch_iterator(chunks, batch_size):
+    """Regroup chunks of records into SeqBatch objects (PRIVATE).
+
+    This is used by FastaBatchIterator and FastqBatchIterator, with the
+    chunks from _fasta_chunks or _fastq_chunks (one per block read). Each
+    chunk is a list of the joined titles, a list of their lengths, the
+    joined sequences, a list of their lengths, and the joined qualities
+    (or None). The offsets are only calculated once for each batch.
+    """
+    if batch_size < 1:
+        raise ValueError("Use a batch_size of at least one")
+    pending = []
+    wanted = batch_size
+    for titles, title_lengths, seqs, seq_lengths, quals in chunks:
+        #Take the records from this chunk, starting with record i at
+        #title_start and seq_start
+        i = title_start = seq_start = 0
+        count = len(seq_lengths)
+        while count - i >= wanted:
+            title_end = title_start + sum(title_lengths[i:i + wanted])
+            seq_end = seq_start + sum(seq_lengths[i:i + wanted])
+            pending.append((titles[title_start:title_end],
+                            title_lengths[i:i + wanted],
+                            seqs[seq_start:seq_end],
+                            seq_lengths[i:i + wanted],
+                            None if quals is None
+                            else quals[seq_start:seq_end]))
+            yield _join_chunks(pending)
+            pending = []
+            i += wanted
+            title_start, seq_start = title_end, seq_end
+            wanted = batch_size
+        if i < count:
+            pending.append((titles[title_start:], title_lengths[i:],
+                            seqs[seq_start:], seq_lengths[i:],
+                            None if quals is None else quals[seq_start:]))
+            wanted -= count - i
+    if pending:
+        yield _join_chunks(pending)
+
+
+def _join_chunks(chunks):
+    """Make a SeqBatch from a list of chunks of records (PRIVATE)."""
+    title_lengths = []
+    seq_lengths = []
+    for chunk in chunks:
+        title_lengths.extend(chunk[1])
+        seq_lengths.extend(chunk[3])
+    if chunks[0][4] is None:
+        quals = None
+    else:
+        quals = "".join(chunk[4] for chunk in chunks)
+    return SeqBatch._from_joined("".join(chunk[0] for chunk in chunks),
+                                 _offsets(title_lengths),
+                                 "".join(chunk[2] for chunk in chunks),
+                                 _offsets(seq_lengths), quals)
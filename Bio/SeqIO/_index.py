@@ -33,11 +33,14 @@ from Bio import SeqIO
 from Bio import Alphabet
 from Bio import bgzf
 from Bio.File import _IndexedSeqFileProxy, _open_for_random_access
+from Bio.File import _MmapHandle
 
 
 class SeqFileRandomAccess(_IndexedSeqFileProxy):
-    def __init__(self, filename, format, alphabet):
-        self._handle = _open_for_random_access(filename)
+    def __init__(self, filename, format, alphabet, use_mmap=False):
+        self._handle = _open_for_random_access(filename, use_mmap)
+        #If memory mapped, some subclasses can scan the data directly
+        self._mmap = isinstance(self._handle, _MmapHandle)
         self._alphabet = alphabet
         self._format = format
         #Load the parser class/function once an avoid the dict lookup in each
@@ -62,7 +65,11 @@ class SeqFileRandomAccess(_IndexedSeqFileProxy):
     def get(self, offset):
         """Returns SeqRecord."""
         #Should be overridden for binary file formats etc:
-        return self._parse(StringIO(_bytes_to_string(self.get_raw(offset))))
+        raw = self.get_raw(offset)
+        if not isinstance(raw, bytes):
+            #Zero-copy view of a memory mapped file
+            raw = bytes(raw)
+        return self._parse(StringIO(_bytes_to_string(raw)))
 
 
 ####################
@@ -74,8 +81,9 @@ class SeqFileRandomAccess(_IndexedSeqFileProxy):
 # number of flows.
 class SffRandomAccess(SeqFileRandomAccess):
     """Random access to a Standard Flowgram Format (SFF) file."""
-    def __init__(self, filename, format, alphabet):
-        SeqFileRandomAccess.__init__(self, filename, format, alphabet)
+    def __init__(self, filename, format, alphabet, use_mmap=False):
+        SeqFileRandomAccess.__init__(self, filename, format, alphabet,
+                                     use_mmap)
         header_length, index_offset, index_length, number_of_reads, \
             self._flows_per_read, self._flow_chars, self._key_sequence \
             = SeqIO.SffIO._sff_file_header(self._handle)
@@ -165,8 +173,9 @@ class SffTrimedRandomAccess(SffRandomAccess):
 ###################
 
 class SequentialSeqFileRandomAccess(SeqFileRandomAccess):
-    def __init__(self, filename, format, alphabet):
-        SeqFileRandomAccess.__init__(self, filename, format, alphabet)
+    def __init__(self, filename, format, alphabet, use_mmap=False):
+        SeqFileRandomAccess.__init__(self, filename, format, alphabet,
+                                     use_mmap)
         marker = {"ace": "CO ",
                   "embl": "ID ",
                   "fasta": ">",
@@ -182,9 +191,18 @@ class SequentialSeqFileRandomAccess(SeqFileRandomAccess):
                   }[format]
         self._marker = marker
         self._marker_re = re.compile(_as_bytes("^%s" % marker))
+        #Can search a memory mapped file for the literal marker bytes,
+        #(but not for PIR where the marker is a regular expression)
+        self._mmap_marker = None
+        if self._mmap and "." not in marker:
+            self._mmap_marker = _as_bytes("\n" + marker)
 
     def __iter__(self):
         """Returns (id,offset) tuples."""
+        if self._mmap_marker:
+            for values in self._iter_mmap():
+                yield values
+            return
         marker_offset = len(self._marker)
         marker_re = self._marker_re
         handle = self._handle
@@ -213,9 +231,51 @@ class SequentialSeqFileRandomAccess(SeqFileRandomAccess):
                     length += len(line)
         assert not line, repr(line)
 
+    def _iter_mmap(self):
+        """Returns (id,offset) tuples, using the memory mapped data (PRIVATE).
+
+        Rather than reading line by line, bytes.find style searching is
+        used to jump from one record marker to the next.
+        """
+        data = self._handle
+        marker = self._mmap_marker  # Includes leading newline
+        marker_offset = len(marker) - 1
+        newline = marker[:1]
+        #Skip any header before first record
+        if data[:marker_offset] == marker[1:]:
+            start_offset = 0
+        else:
+            start_offset = data.find(marker)
+            if start_offset == -1:
+                return
+            start_offset += 1
+        size = len(data)
+        while start_offset != -1:
+            end_of_line = data.find(newline, start_offset)
+            if end_of_line == -1:
+                end_of_line = size
+            #Here we can assume the record.id is the first word after the
+            #marker, as in the __iter__ method.
+            id = data[start_offset + marker_offset:end_of_line].strip().split(None, 1)[0]
+            end_offset = data.find(marker, start_offset)
+            if end_offset == -1:
+                yield _bytes_to_string(id), start_offset, size - start_offset
+                break
+            end_offset += 1
+            yield _bytes_to_string(id), start_offset, end_offset - start_offset
+            start_offset = end_offset
+
     def get_raw(self, offset):
         """Similar to the get method, but returns the record as a raw string."""
         #For non-trivial file formats this must be over-ridden in the subclass
+        if self._mmap_marker:
+            #Zero-copy view up to the start of the next record
+            end_offset = self._handle.find(self._mmap_marker, offset)
+            if end_offset == -1:
+                end_offset = len(self._handle)
+            else:
+                end_offset += 1
+            return self._handle.view(offset, end_offset)
         handle = self._handle
         marker_re = self._marker_re
         handle.seek(offset)
@@ -443,8 +503,9 @@ class UniprotRandomAccess(SequentialSeqFileRandomAccess):
 
 class IntelliGeneticsRandomAccess(SeqFileRandomAccess):
     """Random access to a IntelliGenetics file."""
-    def __init__(self, filename, format, alphabet):
-        SeqFileRandomAccess.__init__(self, filename, format, alphabet)
+    def __init__(self, filename, format, alphabet, use_mmap=False):
+        SeqFileRandomAccess.__init__(self, filename, format, alphabet,
+                                     use_mmap)
         self._marker_re = re.compile(_as_bytes("^;"))
 
     def __iter__(self):
@@ -527,6 +588,10 @@ class FastqRandomAccess(SeqFileRandomAccess):
     Note this will cope with line-wrapped FASTQ files.
     """
     def __iter__(self):
+        if self._mmap:
+            for values in self._iter_mmap():
+                yield values
+            return
         handle = self._handle
         handle.seek(0)
         id = None
@@ -575,8 +640,78 @@ class FastqRandomAccess(SeqFileRandomAccess):
             start_offset = end_offset
         #print("EOF")
 
+    def _mmap_record_end(self, start_offset):
+        """Returns (id, end offset) for a record in the mapped data (PRIVATE).
+
+        Uses find on the memory mapped data to jump from line to line,
+        without needing a string object for each whole line.
+        """
+        data = self._handle
+        find = data.find
+        newline = _as_bytes("\n")
+        plus_char = _as_bytes("+")
+        if data[start_offset:start_offset + 1] != _as_bytes("@"):
+            end_of_line = find(newline, start_offset)
+            raise ValueError("Problem with FASTQ @ line:\n%s"
+                             % repr(data[start_offset:end_of_line + 1]))
+        end_of_line = find(newline, start_offset)
+        #Try the common case of four lines per record first
+        if end_of_line != -1:
+            end_of_seq = find(newline, end_of_line + 1)
+            if end_of_seq != -1 and \
+            data[end_of_seq + 1:end_of_seq + 2] == plus_char:
+                end_of_plus = find(newline, end_of_seq + 1)
+                if end_of_plus != -1:
+                    end_offset = find(newline, end_of_plus + 1)
+                    if end_offset != -1 and \
+                    end_offset - end_of_plus == end_of_seq - end_of_line:
+                        id = data[start_offset + 1:end_of_line].split(None, 1)[0]
+                        return id, end_offset + 1
+        #Otherwise may be line wrapped, or missing the final new line
+        size = len(data)
+        if end_of_line == -1:
+            end_of_line = size
+        id = data[start_offset + 1:end_of_line].rstrip().split(None, 1)[0]
+        #Find the seq line(s)
+        seq_len = 0
+        offset = end_of_line + 1
+        while True:
+            if offset >= size:
+                raise ValueError("Premature end of file in seq section")
+            end_of_line = data.find(newline, offset)
+            if end_of_line == -1:
+                end_of_line = size
+            if data[offset:offset + 1] == plus_char:
+                offset = end_of_line + 1
+                break
+            seq_len += len(data[offset:end_of_line].strip())
+            offset = end_of_line + 1
+        #Find the qual line(s)
+        qual_len = 0
+        while qual_len < seq_len and offset < size:
+            end_of_line = data.find(newline, offset)
+            if end_of_line == -1:
+                end_of_line = size
+            qual_len += len(data[offset:end_of_line].strip())
+            offset = end_of_line + 1
+        if seq_len != qual_len:
+            raise ValueError("Problem with quality section")
+        return id, min(offset, size)
+
+    def _iter_mmap(self):
+        """Returns (id,offset) tuples, using the memory mapped data (PRIVATE)."""
+        start_offset = 0
+        size = len(self._handle)
+        while start_offset < size:
+            id, end_offset = self._mmap_record_end(start_offset)
+            yield _bytes_to_string(id), start_offset, end_offset - start_offset
+            start_offset = end_offset
+
     def get_raw(self, offset):
         """Similar to the get method, but returns the record as a raw string."""
+        if self._mmap:
+            #Zero-copy view of the record
+            return self._handle.view(offset, self._mmap_record_end(offset)[1])
         #TODO - Refactor this and the __init__ method to reduce code duplication?
         handle = self._handle
         handle.seek(offset)
@@ -230,9 +230,14 @@ from __future__ import print_function
 import sys # to detect when under Python 2
 import zlib
 import struct
+from bisect import bisect_right
+from collections import deque
+from multiprocessing.pool import ThreadPool
 
 from Bio._py3k import _as_bytes, _as_string
 from Bio._py3k import open as _open
+from Bio._py3k import basestring
+from Bio._py3k import OrderedDict
 
 #For Python 2 can just use: _bgzf_magic = '\x1f\x8b\x08\x04'
 #but need to use bytes on Python 3
@@ -242,12 +247,16 @@ _bgzf_eof = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00
 _bytes_BC = b"BC"
 
 
-def open(filename, mode="rb"):
-    """Open a BGZF file for reading, writing or appending."""
+def open(filename, mode="rb", threads=None):
+    """Open a BGZF file for reading, writing or appending.
+
+    The optional threads argument is passed to BgzfReader or BgzfWriter,
+    use more than one thread to (de)compress blocks in parallel.
+    """
     if "r" in mode.lower():
-        return BgzfReader(filename, mode)
+        return BgzfReader(filename, mode, threads=threads)
     elif "w" in mode.lower() or "a" in mode.lower():
-        return BgzfWriter(filename, mode)
+        return BgzfWriter(filename, mode, threads=threads)
     else:
         raise ValueError("Bad mode %r" % mode)
 
@@ -395,8 +404,91 @@ def BgzfBlocks(handle):
         data_start += data_len
 
 
+def make_gzi_index(handle):
+    """Scan a BGZF file and return its block index as used in .gzi files.
+
+    Returns a list of (compressed offset, uncompressed offset) tuples
+    giving the start of each block after the first (which always starts
+    at zero). As in samtools' bgzip, there is an entry for the end of
+    every non-empty block, so the final entry gives the total length of
+    the decompressed data. The blocks are read but not decompressed,
+    since the uncompressed length is recorded in each block's footer.
+
+    >>> try:
+    ...     from __builtin__ import open # Python 2
+    ... except ImportError:
+    ...     from builtins import open # Python 3
+    ...
+    >>> handle = open("SamBam/ex1.bam", "rb")
+    >>> index = make_gzi_index(handle)
+    >>> handle.close()
+    >>> len(index)
+    7
+    >>> index[0]
+    (18239, 65536)
+    >>> index[-1]
+    (124556, 456614)
+
+    """
+    index = []
+    data_start = 0
+    while True:
+        start_offset = handle.tell()
+        try:
+            block_size, deflated, expected_crc, expected_size = \
+                _read_bgzf_block(handle)
+        except StopIteration:
+            break
+        if expected_size:
+            data_start += expected_size
+            index.append((start_offset + block_size, data_start))
+    return index
+
+
+def write_gzi(handle, index):
+    """Write a BGZF block index to a handle in the samtools .gzi format.
+
+    The handle must be opened in binary mode. The format is a little
+    endian unsigned 64-bit count of entries, followed by that many pairs
+    of unsigned 64-bit compressed and uncompressed offsets.
+    """
+    handle.write(struct.pack("<Q", len(index)))
+    for compressed, uncompressed in index:
+        handle.write(struct.pack("<QQ", compressed, uncompressed))
+
+
+def read_gzi(handle):
+    """Read a BGZF block index from a handle in the samtools .gzi format.
+
+    Returns a list of (compressed offset, uncompressed offset) tuples,
+    the reverse of write_gzi. The handle must be opened in binary mode.
+    """
+    data = handle.read(8)
+    if len(data) != 8:
+        raise ValueError("Truncated .gzi file, missing entry count")
+    count = struct.unpack("<Q", data)[0]
+    data = handle.read(16 * count)
+    if len(data) != 16 * count:
+        raise ValueError("Truncated .gzi file, expected %i entries" % count)
+    values = struct.unpack("<%iQ" % (2 * count), data)
+    return list(zip(values[0::2], values[1::2]))
+
+
 def _load_bgzf_block(handle, text_mode=False):
     """Internal function to load the next BGZF function (PRIVATE)."""
+    block_size, deflated, expected_crc, expected_size = _read_bgzf_block(handle)
+    return block_size, _decompress_bgzf_block(deflated, expected_crc,
+                                              expected_size, text_mode)
+
+
+def _read_bgzf_block(handle):
+    """Internal function to read the next raw BGZF block (PRIVATE).
+
+    Returns the block size, the still compressed deflate payload, the
+    expected CRC (as bytes) and the expected uncompressed length. This
+    is the I/O half of _load_bgzf_block, split out so the decompression
+    can be done in a worker thread.
+    """
     magic = handle.read(4)
     if not magic:
         #End of file
@@ -423,10 +515,21 @@ def _load_bgzf_block(handle, text_mode=False):
     assert block_size is not None, "Missing BC, this isn't a BGZF file!"
     #Now comes the compressed data, CRC, and length of uncompressed data.
     deflate_size = block_size - 1 - extra_len - 19
-    d = zlib.decompressobj(-15)  # Negative window size means no headers
-    data = d.decompress(handle.read(deflate_size)) + d.flush()
+    deflated = handle.read(deflate_size)
     expected_crc = handle.read(4)
     expected_size = struct.unpack("<I", handle.read(4))[0]
+    return block_size, deflated, expected_crc, expected_size
+
+
+def _decompress_bgzf_block(deflated, expected_crc, expected_size,
+                           text_mode=False):
+    """Internal function to decompress and check a BGZF payload (PRIVATE).
+
+    No file handle is involved, and zlib releases the GIL, so this can
+    be run in a thread pool.
+    """
+    d = zlib.decompressobj(-15)  # Negative window size means no headers
+    data = d.decompress(deflated) + d.flush()
     assert expected_size == len(data), \
            "Decompressed to %i, not %i" % (len(data), expected_size)
     #Should cope with a mix of Python platforms...
@@ -438,9 +541,40 @@ def _load_bgzf_block(handle, text_mode=False):
     assert expected_crc == crc, \
            "CRC is %s, not %s" % (crc, expected_crc)
     if text_mode:
-        return block_size, _as_string(data)
+        return _as_string(data)
     else:
-        return block_size, data
+        return data
+
+
+def _compress_bgzf_block(block, compresslevel=6):
+    """Internal function to compress data into a complete BGZF block (PRIVATE).
+
+    Returns the bytes to write to disk, header and footer included. Like
+    _decompress_bgzf_block this does no I/O so can be run in a thread pool.
+    """
+    assert len(block) <= 65536
+    #Giving a negative window bits means no gzip/zlib headers, -15 used in samtools
+    c = zlib.compressobj(compresslevel,
+                         zlib.DEFLATED,
+                         -15,
+                         zlib.DEF_MEM_LEVEL,
+                         0)
+    compressed = c.compress(block) + c.flush()
+    del c
+    assert len(compressed) < 65536, "TODO - Didn't compress enough, try less data in this block"
+    bsize = struct.pack("<H", len(compressed)+25)  # includes -1
+    #Should cope with a mix of Python platforms...
+    crc = struct.pack("<I", zlib.crc32(block) & 0xffffffff)
+    uncompressed_length = struct.pack("<I", len(block))
+    #Fixed 16 bytes,
+    # gzip magic bytes (4) mod time (4),
+    # gzip flag (1), os (1), extra length which is six (2),
+    # sub field which is BC (2), sub field length of two (2),
+    #Variable data,
+    #2 bytes: block length as BC sub field (2)
+    #X bytes: the data
+    #8 bytes: crc (4), uncompressed data length (4)
+    return _bgzf_header + bsize + compressed + crc + uncompressed_length
 
 
 class BgzfReader(object):
@@ -510,13 +644,42 @@ class BgzfReader(object):
     block can be up to 64kb, the default cache could take up to 6MB of
     RAM. The cache is not important for reading through the file in one
     pass, but is important for improving performance of random access.
+    When the cache is full, the least recently used block is discarded.
+
+    The threads argument (default None, meaning a single thread) can be
+    used to decompress blocks ahead of the current position in a pool
+    of threads, which speeds up reading through large files in one pass:
+
+    >>> handle = BgzfReader("SamBam/ex1.bam", "rb", threads=2)
+    >>> data = handle.read(65540)
+    >>> handle.tell()
+    1195311108
+    >>> handle.close()
+
+    The virtual offsets are unchanged. Remember to close the handle so
+    the threads are shut down.
+
+    If you know a position in the decompressed data, the block index
+    (as in samtools' .gzi files) can be used to jump straight there.
+    It is built by scanning the block headers the first time it is
+    needed, or can be loaded from a .gzi file using the gzi argument:
+
+    >>> handle = BgzfReader("SamBam/ex1.bam", "rb")
+    >>> handle.seek_uncompressed(65536)
+    1195311104
+    >>> handle.read(4) == data[-4:]
+    True
+    >>> handle.close()
     """
 
-    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100):
+    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100,
+                 threads=None, gzi=None):
         #TODO - Assuming we can seek, check for 28 bytes EOF empty block
         #and if missing warn about possible truncation (as in samtools)?
         if max_cache < 1:
             raise ValueError("Use max_cache with a minimum of 1")
+        if threads is not None and threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         #Must open the BGZF file in binary mode, but we may want to
         #treat the contents as either text or binary (unicode or
         #bytes under Python 3)
@@ -536,11 +699,77 @@ class BgzfReader(object):
             self._newline = b"\n"
         self._handle = handle
         self.max_cache = max_cache
-        self._buffers = {}
+        self._buffers = OrderedDict()
         self._block_start_offset = None
         self._block_raw_length = None
+        self.threads = threads
+        #Read ahead blocks being decompressed, keyed by raw start offset,
+        #values are (AsyncResult, raw block size) tuples:
+        self._read_ahead = {}
+        self._read_ahead_offset = None
+        if threads is not None and threads > 1:
+            self._pool = ThreadPool(threads)
+        else:
+            self._pool = None
+        self._gzi_compressed = None
+        self._gzi_uncompressed = None
+        if gzi is not None:
+            if isinstance(gzi, basestring):
+                with _open(gzi, "rb") as gzi_handle:
+                    gzi = read_gzi(gzi_handle)
+            self._set_gzi(gzi)
         self._load_block(handle.tell())
 
+    def _set_gzi(self, index):
+        """Store a .gzi style block index as two sorted lists (PRIVATE)."""
+        self._gzi_compressed = [0] + [c for c, u in index]
+        self._gzi_uncompressed = [0] + [u for c, u in index]
+
+    def gzi_index(self):
+        """Return the block index as a list of (compressed, uncompressed) offsets.
+
+        This is the index given via the gzi argument, or if none was
+        given, one built by scanning the block headers (which is then
+        kept for later use). See make_gzi_index for the details.
+        """
+        if self._gzi_compressed is None:
+            handle = self._handle
+            handle.seek(0)
+            self._set_gzi(make_gzi_index(handle))
+        return list(zip(self._gzi_compressed[1:], self._gzi_uncompressed[1:]))
+
+    def save_gzi(self, filename):
+        """Save the block index to a samtools compatible .gzi file."""
+        index = self.gzi_index()
+        with _open(filename, "wb") as handle:
+            write_gzi(handle, index)
+
+    def virtual_offset(self, uncompressed_offset):
+        """Convert an offset in the decompressed data into a virtual offset.
+
+        This uses the block index (see gzi_index), so does not need
+        to decompress anything.
+        """
+        if self._gzi_compressed is None:
+            self.gzi_index()
+        uncompressed = self._gzi_uncompressed
+        if uncompressed_offset < 0 or uncompressed_offset > uncompressed[-1]:
+            raise ValueError("Uncompressed offset %i outside data of length %i"
+                             % (uncompressed_offset, uncompressed[-1]))
+        #With empty blocks there can be repeated uncompressed offsets,
+        #bisect_right picks the last (the block actually holding the data)
+        i = bisect_right(uncompressed, uncompressed_offset) - 1
+        return make_virtual_offset(self._gzi_compressed[i],
+                                   uncompressed_offset - uncompressed[i])
+
+    def seek_uncompressed(self, uncompressed_offset):
+        """Seek to an offset in the decompressed data, returns the virtual offset.
+
+        Uses the block index (see gzi_index) to jump straight to the
+        right block.
+        """
+        return self.seek(self.virtual_offset(uncompressed_offset))
+
     def _load_block(self, start_offset=None):
         if start_offset is None:
             #If the file is being read sequentially, then _handle.tell()
@@ -551,34 +780,90 @@ class BgzfReader(object):
             self._within_block_offset = 0
             return
         elif start_offset in self._buffers:
-            #Already in cache
-            self._buffer, self._block_raw_length = self._buffers[start_offset]
+            #Already in cache, move to the end as the most recently used
+            self._buffer, self._block_raw_length = \
+                self._buffers.pop(start_offset)
+            self._buffers[start_offset] = self._buffer, self._block_raw_length
             self._within_block_offset = 0
             self._block_start_offset = start_offset
             return
         #Must hit the disk... first check cache limits,
         while len(self._buffers) >= self.max_cache:
-            #TODO - Implemente LRU cache removal?
-            self._buffers.popitem()
+            #Discard the least recently used block
+            self._buffers.popitem(last=False)
         #Now load the block
-        handle = self._handle
-        if start_offset is not None:
-            handle.seek(start_offset)
-        self._block_start_offset = handle.tell()
-        try:
-            block_size, self._buffer = _load_bgzf_block(handle, self._text)
-        except StopIteration:
-            #EOF
-            block_size = 0
-            if self._text:
-                self._buffer = ""
-            else:
-                self._buffer = b""
+        if self._pool is not None:
+            self._block_start_offset = start_offset
+            block_size, self._buffer = self._load_block_threaded(start_offset)
+        else:
+            handle = self._handle
+            if start_offset is not None:
+                handle.seek(start_offset)
+            self._block_start_offset = handle.tell()
+            try:
+                block_size, self._buffer = _load_bgzf_block(handle, self._text)
+            except StopIteration:
+                #EOF
+                block_size = 0
+                if self._text:
+                    self._buffer = ""
+                else:
+                    self._buffer = b""
         self._within_block_offset = 0
         self._block_raw_length = block_size
         #Finally save the block in our cache,
         self._buffers[self._block_start_offset] = self._buffer, block_size
 
+    def _load_block_threaded(self, start_offset):
+        """Get a block from the read ahead queue, reading ahead as needed (PRIVATE).
+
+        Returns the raw block size and the decompressed data, which is
+        empty at EOF.
+        """
+        read_ahead = self._read_ahead
+        if start_offset not in read_ahead:
+            #Random access, any outstanding read ahead is not wanted
+            read_ahead.clear()
+            self._read_ahead_offset = start_offset
+            self._fill_read_ahead()
+        if start_offset not in read_ahead:
+            #EOF
+            if self._text:
+                return 0, ""
+            else:
+                return 0, b""
+        result, block_size = read_ahead.pop(start_offset)
+        #Keep the pool busy while the caller works through this block
+        self._fill_read_ahead()
+        return block_size, result.get()
+
+    def _fill_read_ahead(self):
+        """Read raw blocks and queue them for decompression (PRIVATE).
+
+        The file is only touched from the calling thread, the pool only
+        does the decompression. At most twice as many blocks as threads
+        are queued at once.
+        """
+        read_ahead = self._read_ahead
+        offset = self._read_ahead_offset
+        handle = self._handle
+        if offset is not None:
+            handle.seek(offset)
+        while offset is not None and len(read_ahead) < 2 * self.threads:
+            try:
+                block_size, deflated, expected_crc, expected_size = \
+                    _read_bgzf_block(handle)
+            except StopIteration:
+                #EOF
+                offset = None
+                break
+            read_ahead[offset] = (self._pool.apply_async(
+                _decompress_bgzf_block,
+                (deflated, expected_crc, expected_size, self._text)),
+                block_size)
+            offset += block_size
+        self._read_ahead_offset = offset
+
     def tell(self):
         """Returns a 64-bit unsigned BGZF virtual offset."""
         if 0 < self._within_block_offset == len(self._buffer):
@@ -691,6 +976,11 @@ class BgzfReader(object):
         self._buffer = None
         self._block_start_offset = None
         self._buffers = None
+        self._read_ahead = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
 
     def seekable(self):
         return True
@@ -703,8 +993,18 @@ class BgzfReader(object):
 
 
 class BgzfWriter(object):
+    """BGZF writer, acts like a write only handle but tell differs.
+
+    With threads greater than one, each full 64kb block is handed to a
+    pool of threads for compression (zlib releases the GIL) while the
+    caller carries on writing. Blocks are still written in order and
+    are byte for byte identical to the single threaded output.
+    """
 
-    def __init__(self, filename=None, mode="w", fileobj=None, compresslevel=6):
+    def __init__(self, filename=None, mode="w", fileobj=None, compresslevel=6,
+                 threads=None):
+        if threads is not None and threads < 1:
+            raise ValueError("Use threads with a minimum of 1")
         if fileobj:
             assert filename is None
             handle = fileobj
@@ -720,39 +1020,32 @@ class BgzfWriter(object):
         self._handle = handle
         self._buffer = b""
         self.compresslevel = compresslevel
+        self.threads = threads
+        self._pending = deque()
+        if threads is not None and threads > 1:
+            self._pool = ThreadPool(threads)
+        else:
+            self._pool = None
 
     def _write_block(self, block):
         #print("Saving %i bytes" % len(block))
-        start_offset = self._handle.tell()
-        assert len(block) <= 65536
-        #Giving a negative window bits means no gzip/zlib headers, -15 used in samtools
-        c = zlib.compressobj(self.compresslevel,
-                             zlib.DEFLATED,
-                             -15,
-                             zlib.DEF_MEM_LEVEL,
-                             0)
-        compressed = c.compress(block) + c.flush()
-        del c
-        assert len(compressed) < 65536, "TODO - Didn't compress enough, try less data in this block"
-        crc = zlib.crc32(block)
-        #Should cope with a mix of Python platforms...
-        if crc < 0:
-            crc = struct.pack("<i", crc)
-        else:
-            crc = struct.pack("<I", crc)
-        bsize = struct.pack("<H", len(compressed)+25)  # includes -1
-        crc = struct.pack("<I", zlib.crc32(block) & 0xffffffff)
-        uncompressed_length = struct.pack("<I", len(block))
-        #Fixed 16 bytes,
-        # gzip magic bytes (4) mod time (4),
-        # gzip flag (1), os (1), extra length which is six (2),
-        # sub field which is BC (2), sub field length of two (2),
-        #Variable data,
-        #2 bytes: block length as BC sub field (2)
-        #X bytes: the data
-        #8 bytes: crc (4), uncompressed data length (4)
-        data = _bgzf_header + bsize + compressed + crc + uncompressed_length
-        self._handle.write(data)
+        if self._pool is None:
+            self._handle.write(_compress_bgzf_block(block, self.compresslevel))
+            return
+        #Queue the block for compression, then write out any finished
+        #blocks in order (waiting if too many are outstanding).
+        pending = self._pending
+        pending.append(self._pool.apply_async(_compress_bgzf_block,
+                                              (block, self.compresslevel)))
+        while len(pending) > 2 * self.threads or \
+        (pending and pending[0].ready()):
+            self._handle.write(pending.popleft().get())
+
+    def _write_pending(self):
+        """Write out all queued compressed blocks, in order (PRIVATE)."""
+        pending = self._pending
+        while pending:
+            self._handle.write(pending.popleft().get())
 
     def write(self, data):
         #TODO - Check bytes vs unicode
@@ -776,12 +1069,18 @@ class BgzfWriter(object):
             self._buffer = self._buffer[65535:]
         self._write_block(self._buffer)
         self._buffer = b""
+        self._write_pending()
         self._handle.flush()
 
     def close(self):
         """Flush data, write 28 bytes empty BGZF EOF marker, and close the BGZF file."""
         if self._buffer:
             self.flush()
+        self._write_pending()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
         #samtools will look for a magic EOF marker, just a 28 byte empty BGZF block,
         #and if it is missing warns the BAM file may be truncated. In addition to
         #samtools writing this block, so too does bgzip - so we should too.
@@ -790,7 +1089,12 @@ class BgzfWriter(object):
         self._handle.close()
 
     def tell(self):
-        """Returns a BGZF 64-bit virtual offset."""
+        """Returns a BGZF 64-bit virtual offset.
+
+        When using threads, this first waits for any blocks still being
+        compressed to be written, so the offset is exact.
+        """
+        self._write_pending()
         return make_virtual_offset(self._handle.tell(), len(self._buffer))
 
     def seekable(self):
@@ -139,12 +139,45 @@ static void IndexList_extend(struct IndexList *il1, struct IndexList *il2)
     } */
 
 
+/* A precompiled match function (pairwise2._table_match) has a
+ * score_table attribute, a string of 256 x 256 C doubles indexed by
+ * the character codes.  Return a new reference to the string, and
+ * point score_table at its contents, or return NULL if there is no
+ * usable table.
+ */
+static PyObject *_get_score_table(PyObject *py_match_fn,
+                                  const char **score_table)
+{
+    PyObject *py_table;
+
+    *score_table = NULL;
+    if(!(py_table = PyObject_GetAttrString(py_match_fn, "score_table"))) {
+        PyErr_Clear();
+        return NULL;
+    }
+#if PY_MAJOR_VERSION >= 3
+    if(PyBytes_Check(py_table) &&
+       PyBytes_GET_SIZE(py_table) == 256*256*sizeof(double))
+        *score_table = PyBytes_AS_STRING(py_table);
+#else
+    if(PyString_Check(py_table) &&
+       PyString_GET_SIZE(py_table) == 256*256*sizeof(double))
+        *score_table = PyString_AS_STRING(py_table);
+#endif
+    if(!*score_table) {
+        Py_DECREF(py_table);
+        return NULL;
+    }
+    return py_table;
+}
+
 double _get_match_score(PyObject *py_sequenceA, PyObject *py_sequenceB,
                         PyObject *py_match_fn, int i, int j,
                         char *sequenceA, char *sequenceB,
                         int use_sequence_cstring,
                         double match, double mismatch,
-                        int use_match_mismatch_scores)
+                        int use_match_mismatch_scores,
+                        const char *score_table)
 {
     PyObject *py_A=NULL,
         *py_B=NULL;
@@ -155,6 +188,17 @@ double _get_match_score(PyObject *py_sequenceA, PyObject *py_sequenceB,
         score = (sequenceA[i] == sequenceB[j]) ? match : mismatch;
         return score;
     }
+    if(use_sequence_cstring && score_table) {
+        /* The string need not be aligned for doubles, so copy. */
+        memcpy((void *)&score,
+               score_table + ((unsigned char)sequenceA[i]*256 +
+                              (unsigned char)sequenceB[j])*sizeof(double),
+               sizeof(double));
+        /* A pair without a score is NaN, so let the Python function
+           raise the error. */
+        if(score == score)
+            return score;
+    }
     /* Calculate the match score. */
     if(!(py_A = PySequence_GetItem(py_sequenceA, i)))
         goto _get_match_score_cleanup;
@@ -221,6 +265,8 @@ static PyObject *cpairwise2__make_score_matrix_fast(
     int align_globally, score_only;
 
     PyObject *py_match=NULL, *py_mismatch=NULL;
+    PyObject *py_score_table=NULL;
+    const char *score_table=NULL;
     double first_A_gap, first_B_gap;
     double match, mismatch;
     int use_match_mismatch_scores;
@@ -302,6 +348,8 @@ cleanup_after_py_match_fn:
     if(py_mismatch) {
         Py_DECREF(py_mismatch);
     }
+    if(!use_match_mismatch_scores)
+        py_score_table = _get_score_table(py_match_fn, &score_table);
 
     /* Cache some commonly used gap penalties */
     first_A_gap = calc_affine_penalty(1, open_A, extend_A,
@@ -330,7 +378,8 @@ cleanup_after_py_match_fn:
                                         sequenceA, sequenceB,
                                         use_sequence_cstring,
                                         match, mismatch,
-                                        use_match_mismatch_scores);
+                                        use_match_mismatch_scores,
+                                        score_table);
         if(score==-1.0 && PyErr_Occurred())
             goto _cleanup_make_score_matrix_fast;
         if(penalize_end_gaps_B)
@@ -344,7 +393,8 @@ cleanup_after_py_match_fn:
                                         sequenceA, sequenceB,
                                         use_sequence_cstring,
                                         match, mismatch,
-                                        use_match_mismatch_scores);
+                                        use_match_mismatch_scores,
+                                        score_table);
         if(score==-1.0 && PyErr_Occurred())
             goto _cleanup_make_score_matrix_fast;
         if(penalize_end_gaps_A)
@@ -410,7 +460,8 @@ cleanup_after_py_match_fn:
                                            sequenceA, sequenceB,
                                            use_sequence_cstring,
                                            match, mismatch,
-                                           use_match_mismatch_scores);
+                                           use_match_mismatch_scores,
+                                        score_table);
             if(delta_score==-1.0 && PyErr_Occurred())
                 goto _cleanup_make_score_matrix_fast;
             score = best_score + delta_score;
@@ -550,6 +601,293 @@ cleanup_after_py_match_fn:
     if(py_trace_matrix) {
         Py_DECREF(py_trace_matrix);
     }
+    Py_XDECREF(py_score_table);
+#if PY_MAJOR_VERSION >= 3
+    if (py_bytesA != NULL && py_bytesA != py_sequenceA) Py_DECREF(py_bytesA);
+    if (py_bytesB != NULL && py_bytesB != py_sequenceB) Py_DECREF(py_bytesB);
+#endif
+
+    return py_retval;
+}
+
+static double _get_end_gap_penalty(PyObject *py_gap_fn, int index, int length)
+{
+    PyObject *py_result;
+    double penalty;
+
+    if(!(py_result = PyObject_CallFunction(py_gap_fn, "ii", index, length)))
+        return -1.0;
+    penalty = PyFloat_AsDouble(py_result);
+    Py_DECREF(py_result);
+    return penalty;
+}
+
+/* This is a port of _score_only_fast in pairwise2.  Only the previous
+ * row of the score matrix and the column caches are kept, so the
+ * memory needed is proportional to the length of sequenceB.  Please
+ * see there for algorithm documentation.
+ */
+static PyObject *cpairwise2__score_only_fast(
+    PyObject *self, PyObject *args)
+{
+    int row, col, start, stop;
+
+    PyObject *py_sequenceA, *py_sequenceB, *py_match_fn;
+    PyObject *py_gap_A_fn, *py_gap_B_fn, *py_band;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *py_bytesA, *py_bytesB;
+#endif
+    char *sequenceA=NULL, *sequenceB=NULL;
+    int use_sequence_cstring;
+    double open_A, extend_A, open_B, extend_B;
+    int penalize_extend_when_opening, penalize_end_gaps_A, penalize_end_gaps_B;
+    int align_globally;
+
+    PyObject *py_match=NULL, *py_mismatch=NULL;
+    PyObject *py_score_table=NULL;
+    const char *score_table=NULL;
+    double first_A_gap, first_B_gap;
+    double match, mismatch;
+    int use_match_mismatch_scores;
+    int lenA, lenB;
+    long band, low, high;
+
+    double *prev_row = NULL, *this_row = NULL, *swap_row;
+    double *col_cache = NULL;
+    char *col_cache_used = NULL;
+    double best_score = 0;
+    int have_best_score = 0;
+
+    PyObject *py_retval = NULL;
+
+    if(!PyArg_ParseTuple(args, "OOOOOddddi(ii)iO", &py_sequenceA,
+                         &py_sequenceB, &py_match_fn,
+                         &py_gap_A_fn, &py_gap_B_fn,
+                         &open_A, &extend_A, &open_B, &extend_B,
+                         &penalize_extend_when_opening,
+                         &penalize_end_gaps_A, &penalize_end_gaps_B,
+                         &align_globally, &py_band))
+        return NULL;
+    if(!PySequence_Check(py_sequenceA) || !PySequence_Check(py_sequenceB)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "py_sequenceA and py_sequenceB should be sequences.");
+        return NULL;
+    }
+    if(!PyCallable_Check(py_match_fn)) {
+        PyErr_SetString(PyExc_TypeError, "py_match_fn must be callable.");
+        return NULL;
+    }
+    lenA = PySequence_Length(py_sequenceA);
+    lenB = PySequence_Length(py_sequenceB);
+    if(lenA < 0 || lenB < 0)
+        return NULL;
+
+    /* Work out which diagonals (col - row) are inside the band, as in
+       _band_limits. */
+    if(py_band == Py_None) {
+        low = 1 - lenA;
+        high = lenB - 1;
+    }
+    else {
+        band = PyLong_AsLong(py_band);
+        if(band==-1 && PyErr_Occurred())
+            return NULL;
+        if(band < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "The band width should be a non-negative integer.");
+            return NULL;
+        }
+        low = ((lenB < lenA) ? lenB - lenA : 0) - band;
+        high = ((lenB > lenA) ? lenB - lenA : 0) + band;
+    }
+
+#if PY_MAJOR_VERSION < 3
+    use_sequence_cstring = 0;
+    if(PyString_Check(py_sequenceA) && PyString_Check(py_sequenceB)) {
+        sequenceA = PyString_AS_STRING(py_sequenceA);
+        sequenceB = PyString_AS_STRING(py_sequenceB);
+        use_sequence_cstring = 1;
+    }
+#else
+    py_bytesA = _create_bytes_object(py_sequenceA);
+    py_bytesB = _create_bytes_object(py_sequenceB);
+    if (py_bytesA && py_bytesB) {
+        sequenceA = PyBytes_AS_STRING(py_bytesA);
+        sequenceB = PyBytes_AS_STRING(py_bytesB);
+        use_sequence_cstring = 1;
+    }
+    else {
+        if (py_bytesA != NULL && py_bytesA != py_sequenceA) Py_DECREF(py_bytesA);
+        if (py_bytesB != NULL && py_bytesB != py_sequenceB) Py_DECREF(py_bytesB);
+        py_bytesA = py_bytesB = NULL;
+        use_sequence_cstring = 0;
+    }
+#endif
+
+    /* Use the match and mismatch scores of an identity_match directly,
+       as in _make_score_matrix_fast. */
+    match = mismatch = 0;
+    use_match_mismatch_scores = 0;
+    if(!(py_match = PyObject_GetAttrString(py_match_fn, "match")))
+        goto cleanup_after_py_match_fn;
+    match = PyFloat_AsDouble(py_match);
+    if(match==-1.0 && PyErr_Occurred())
+        goto cleanup_after_py_match_fn;
+    if(!(py_mismatch = PyObject_GetAttrString(py_match_fn, "mismatch")))
+        goto cleanup_after_py_match_fn;
+    mismatch = PyFloat_AsDouble(py_mismatch);
+    if(mismatch==-1.0 && PyErr_Occurred())
+        goto cleanup_after_py_match_fn;
+    use_match_mismatch_scores = 1;
+cleanup_after_py_match_fn:
+    if(PyErr_Occurred())
+        PyErr_Clear();
+    if(py_match) {
+        Py_DECREF(py_match);
+    }
+    if(py_mismatch) {
+        Py_DECREF(py_mismatch);
+    }
+    if(!use_match_mismatch_scores)
+        py_score_table = _get_score_table(py_match_fn, &score_table);
+
+    first_A_gap = calc_affine_penalty(1, open_A, extend_A,
+                                      penalize_extend_when_opening);
+    first_B_gap = calc_affine_penalty(1, open_B, extend_B,
+                                      penalize_extend_when_opening);
+
+    prev_row = malloc(lenB*sizeof(*prev_row));
+    this_row = malloc(lenB*sizeof(*this_row));
+    col_cache = malloc(lenB*sizeof(*col_cache));
+    col_cache_used = malloc(lenB*sizeof(*col_cache_used));
+    if(!prev_row || !this_row || !col_cache || !col_cache_used) {
+        PyErr_SetString(PyExc_MemoryError, "Out of memory");
+        goto _cleanup_score_only_fast;
+    }
+    memset((void *)col_cache_used, 0, lenB*sizeof(*col_cache_used));
+
+    for(row=0; row<lenA; row++) {
+        double row_cache = 0;
+        int row_cache_used = 0;
+
+        start = (row + low > 0) ? row + low : 0;
+        stop = (row + high + 1 < lenB) ? row + high + 1 : lenB;
+        for(col=start; col<stop; col++) {
+            double score, delta_score;
+
+            delta_score = _get_match_score(py_sequenceA, py_sequenceB,
+                                           py_match_fn, row, col,
+                                           sequenceA, sequenceB,
+                                           use_sequence_cstring,
+                                           match, mismatch,
+                                           use_match_mismatch_scores,
+                                        score_table);
+            if(delta_score==-1.0 && PyErr_Occurred())
+                goto _cleanup_score_only_fast;
+            if(!row || !col) {
+                /* The top and left borders of the score matrix. */
+                score = delta_score;
+                if(!col && penalize_end_gaps_B)
+                    score += calc_affine_penalty(row, open_B, extend_B,
+                                                 penalize_extend_when_opening);
+                else if(!row && penalize_end_gaps_A)
+                    score += calc_affine_penalty(col, open_A, extend_A,
+                                                 penalize_extend_when_opening);
+            }
+            else {
+                double nogap_score, row_score, col_score, best;
+                double open_score, extend_score;
+
+                nogap_score = prev_row[col-1];
+                if(row_cache_used)
+                    row_score = row_cache;
+                else
+                    row_score = nogap_score-1;
+                if(row > 1 && col_cache_used[col-1])
+                    col_score = col_cache[col-1];
+                else
+                    col_score = nogap_score-1;
+                best = (row_score > col_score) ? row_score : col_score;
+                if(nogap_score > best)
+                    best = nogap_score;
+                score = best + delta_score;
+                if(!align_globally && score < 0)
+                    score = 0;
+
+                /* Update the cached column and row scores. */
+                open_score = nogap_score + first_B_gap;
+                if(!col_cache_used[col-1]) {
+                    col_cache[col-1] = open_score;
+                    col_cache_used[col-1] = 1;
+                }
+                else {
+                    extend_score = col_cache[col-1] + extend_B;
+                    if(rint(extend_score) > rint(open_score))
+                        col_cache[col-1] = extend_score;
+                    else
+                        col_cache[col-1] = open_score;
+                }
+                open_score = nogap_score + first_A_gap;
+                if(!row_cache_used) {
+                    row_cache = open_score;
+                    row_cache_used = 1;
+                }
+                else {
+                    extend_score = row_cache + extend_A;
+                    if(rint(extend_score) > rint(open_score))
+                        row_cache = extend_score;
+                    else
+                        row_cache = open_score;
+                }
+            }
+            this_row[col] = score;
+
+            /* Is this a better place to start the traceback? */
+            if(align_globally) {
+                double penalty;
+                if(col == lenB-1) {
+                    if(penalize_end_gaps_B) {
+                        penalty = _get_end_gap_penalty(py_gap_B_fn, lenB,
+                                                       lenA-row-1);
+                        if(penalty==-1.0 && PyErr_Occurred())
+                            goto _cleanup_score_only_fast;
+                        score += penalty;
+                    }
+                }
+                else if(row == lenA-1) {
+                    if(penalize_end_gaps_A) {
+                        penalty = _get_end_gap_penalty(py_gap_A_fn, lenA,
+                                                       lenB-col-1);
+                        if(penalty==-1.0 && PyErr_Occurred())
+                            goto _cleanup_score_only_fast;
+                        score += penalty;
+                    }
+                }
+                else
+                    continue;
+            }
+            if(!have_best_score || score > best_score) {
+                best_score = score;
+                have_best_score = 1;
+            }
+        }
+        swap_row = prev_row;
+        prev_row = this_row;
+        this_row = swap_row;
+    }
+
+    py_retval = PyFloat_FromDouble(best_score);
+
+ _cleanup_score_only_fast:
+    if(prev_row)
+        free(prev_row);
+    if(this_row)
+        free(this_row);
+    if(col_cache)
+        free(col_cache);
+    if(col_cache_used)
+        free(col_cache_used);
+    Py_XDECREF(py_score_table);
 #if PY_MAJOR_VERSION >= 3
     if (py_bytesA != NULL && py_bytesA != py_sequenceA) Py_DECREF(py_bytesA);
     if (py_bytesB != NULL && py_bytesB != py_sequenceB) Py_DECREF(py_bytesB);
@@ -583,6 +921,8 @@ static PyObject *cpairwise2_rint(
 static PyMethodDef cpairwise2Methods[] = {
     {"_make_score_matrix_fast",
      (PyCFunction)cpairwise2__make_score_matrix_fast, METH_VARARGS, ""},
+    {"_score_only_fast",
+     (PyCFunction)cpairwise2__score_only_fast, METH_VARARGS, ""},
     {"rint", (PyCFunction)cpairwise2_rint, METH_VARARGS|METH_KEYWORDS, ""},
     {NULL, NULL, 0, NULL}
 };
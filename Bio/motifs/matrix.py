@@ -9,6 +9,7 @@ and position-specific scoring matrices.
 import math
 
 from Bio._py3k import range
+from Bio._py3k import _as_bytes
 
 from Bio.Seq import Seq
 from Bio.Alphabet import IUPAC
@@ -362,26 +363,13 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
         #by assuming upper case?
         sequence = str(sequence)
         m = self.length
-        n = len(sequence)
 
-        scores = []
         # check if the fast C code can be used
         try:
             import _pwm
         except ImportError:
             # use the slower Python code otherwise
-            #The C code handles mixed case so Python version must too:
-            sequence = sequence.upper()
-            for i in range(n-m+1):
-                score = 0.0
-                for position in range(m):
-                    letter = sequence[i+position]
-                    try:
-                        score += self[letter][position]
-                    except KeyError:
-                        score = _nan
-                        break
-                scores.append(score)
+            scores = self._calculate_python(sequence)
         else:
             # get the log-odds matrix into a proper shape
             # (each row contains sorted (ACGT) log-odds values)
@@ -392,24 +380,118 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
         else:
             return scores
 
-    def search(self, sequence, threshold=0.0, both=True):
-        """
-        a generator function, returning found hits in a given sequence with the pwm score higher than the threshold
+    def _calculate_python(self, sequence):
+        """Returns a list of the scores at each position (PRIVATE).
+
+        This is the pure Python fallback used when NumPy is not available.
+        Windows with a letter other than A, C, G or T score NaN.
         """
+        #The C code handles mixed case so Python version must too:
         sequence = sequence.upper()
+        m = self.length
+        scores = []
+        for i in range(len(sequence)-m+1):
+            score = 0.0
+            for position in range(m):
+                letter = sequence[i+position]
+                try:
+                    score += self[letter][position]
+                except KeyError:
+                    score = _nan
+                    break
+            scores.append(score)
+        return scores
+
+    def _calculate_codes(self, codes, numpy):
+        """Returns an array of the scores at each position (PRIVATE).
+
+        The sequence is given as a NumPy array of letter codes, with 0 to 3
+        for A, C, G and T, and 4 for anything else (which gives a score of
+        NaN). Rather than looping over the windows, each position of the
+        motif is added for all the windows at once. The sums are done in
+        the same order and precision as the _pwm C code, and likewise are
+        returned as 32-bit floats.
+        """
+        m = self.length
+        count = len(codes) - m + 1
+        matrix = numpy.array([[self[letter][i] for letter in "ACGT"] + [_nan]
+                              for i in range(m)])
+        scores = numpy.zeros(count)
+        for position in range(m):
+            scores += matrix[position].take(codes[position:position+count])
+        return scores.astype(numpy.float32)
+
+    def search(self, sequence, threshold=0.0, both=True, chunksize=1000000):
+        """Find hits with PSSM score above given threshold.
+
+        A generator function, returning found hits in the given sequence
+        (a Seq object with a DNA alphabet, or a string) as tuples of the
+        position and score, for each window with a score higher than the
+        threshold. If both is True (default), the reverse strand is also
+        searched, and these hits are given as negative positions following
+        the Python convention for negative indices (i.e. the position minus
+        the length of the sequence).
+
+        Windows containing a letter other than A, C, G or T (in upper or
+        lower case), such as N or another ambiguous base, are skipped.
+
+        If NumPy is available, the sequence is converted into an array of
+        letter codes and scored for both strands at once, otherwise the
+        (much slower) pure Python code is used. Long sequences are scanned
+        in pieces of chunksize letters to limit the memory needed.
+        """
+        if not isinstance(self.alphabet, IUPAC.IUPACUnambiguousDNA):
+            raise ValueError("PSSM has wrong alphabet: %s - Use only with DNA motifs" \
+                                 % self.alphabet)
+        alphabet = getattr(sequence, "alphabet", None)
+        if alphabet is not None \
+        and not isinstance(alphabet, IUPAC.IUPACAmbiguousDNA):
+            raise ValueError("Sequence has wrong alphabet: %r - Use only with DNA sequences" \
+                                 % alphabet)
+        if chunksize < 1:
+            raise ValueError("The chunksize should be a positive integer")
+        sequence = str(sequence)
         n = len(sequence)
         m = self.length
+        matrices = [self]
         if both:
-            rc = self.reverse_complement()
-        for position in range(0, n-m+1):
-            s = sequence[position:position+m]
-            score = self.calculate(s)
-            if score > threshold:
-                yield (position, score)
-            if both:
-                score = rc.calculate(s)
-                if score > threshold:
-                    yield (position-n, score)
+            matrices.append(self.reverse_complement())
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        else:
+            lookup = numpy.zeros(256, numpy.uint8)
+            lookup[:] = 4
+            for code, letter in enumerate("ACGT"):
+                lookup[ord(letter)] = code
+                lookup[ord(letter.lower())] = code
+        for start in range(0, n-m+1, chunksize):
+            #Successive chunks overlap by m-1 letters
+            chunk = sequence[start:start+chunksize+m-1]
+            if numpy is None:
+                scores = [pssm._calculate_python(chunk) for pssm in matrices]
+                hits = [(i, strand) for i in range(len(scores[0]))
+                        for strand in range(len(matrices))
+                        if scores[strand][i] > threshold]
+            else:
+                codes = lookup.take(numpy.frombuffer(_as_bytes(chunk),
+                                                     numpy.uint8))
+                scores = [pssm._calculate_codes(codes, numpy)
+                          for pssm in matrices]
+                #Merge the hits on each strand in order of position,
+                #with the forward strand first (NaN never passes):
+                with numpy.errstate(invalid="ignore"):
+                    keys = numpy.concatenate(
+                        [numpy.flatnonzero(strand_scores > threshold) * 2 + strand
+                         for strand, strand_scores in enumerate(scores)])
+                keys.sort()
+                hits = [(int(key) // 2, int(key) % 2) for key in keys]
+            for i, strand in hits:
+                if strand:
+                    yield (start+i-n, scores[strand][i])
+                else:
+                    yield (start+i, scores[strand][i])
 
     @property
     def max(self):
@@ -534,8 +616,12 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
         denominator = math.sqrt((sxx-sx*sx)*(syy-sy*sy))
         return numerator/denominator
 
-    def distribution(self, background=None, precision=10**3):
-        """calculate the distribution of the scores at the given precision."""
+    def distribution(self, background=None, precision=10**3, cache=None):
+        """calculate the distribution of the scores at the given precision.
+
+        If cache is the name of a directory, the distribution is saved
+        there, and loaded from there next time (see ScoreDistribution).
+        """
         from .thresholds import ScoreDistribution
         if background is None:
             background = dict.fromkeys(self._letters, 1.0)
@@ -544,4 +630,5 @@ class PositionSpecificScoringMatrix(GenericPositionMatrix):
         total = sum(background.values())
         for letter in self._letters:
             background[letter] /= total
-        return ScoreDistribution(precision=precision, pssm=self, background=background)
+        return ScoreDistribution(precision=precision, pssm=self,
+                                 background=background, cache=cache)
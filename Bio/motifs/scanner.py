@@ -0,0 +1,284 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Scanning many DNA sequences with many motifs at once.
+
+The MotifScanner class takes a collection of motifs (for example all the
+JASPAR profiles), and finds their hits in a stream of SeqRecord objects,
+such as those from Bio.SeqIO.parse. The position-specific scoring matrices
+of all the motifs (and their reverse complements) are stacked into a single
+NumPy array, so that each sequence is scored against every motif in one
+pass rather than looping over the motifs in Python.
+
+>>> from Bio import motifs, SeqIO
+>>> from Bio.motifs.scanner import MotifScanner
+>>> with open("motifs/SRF.pfm") as handle:
+...     srf = motifs.read(handle, "pfm")
+>>> with open("motifs/REB1.pfm") as handle:
+...     reb1 = motifs.read(handle, "pfm")
+>>> srf.pseudocounts = reb1.pseudocounts = 0.25
+>>> scanner = MotifScanner({"SRF": srf, "REB1": reb1}, threshold=3.0)
+>>> records = SeqIO.parse("Fasta/f002", "fasta")
+>>> for motif_id, record_id, position, strand, score in scanner.scan(records):
+...     print("%s %s %i %i %0.2f" % (motif_id, record_id, position, strand, score))
+REB1 gi|1348917|gb|G26685|G26685 107 1 3.79
+SRF gi|1592936|gb|G29385|G29385 129 1 7.39
+
+Rather than one threshold for all the motifs, you can give a false positive
+rate, and the score threshold for each motif is then worked out from its
+score distribution (see Bio.motifs.thresholds).
+"""
+
+from __future__ import print_function
+
+from Bio._py3k import _as_bytes
+from Bio.Alphabet import IUPAC
+
+
+#Number of scores (motifs times positions) worked out at once
+_SCAN_CELLS = 2 ** 22
+
+#Number of records sent to a worker process at a time
+_SCAN_CHUNK_SIZE = 100
+
+#Cache of the score thresholds for a given false positive rate
+_threshold_cache = {}
+
+
+def _numpy():
+    """Import NumPy, or raise MissingPythonDependencyError (PRIVATE)."""
+    try:
+        import numpy
+    except ImportError:
+        from Bio import MissingPythonDependencyError
+        raise MissingPythonDependencyError(
+            "Install NumPy if you want to use the MotifScanner.")
+    return numpy
+
+
+def _fpr_threshold(pssm, background, fpr, precision, cache=None):
+    """Score threshold for a PSSM with the given false positive rate (PRIVATE).
+
+    This uses the ScoreDistribution from Bio.motifs.thresholds, which is
+    slow to compute, so the results are cached using the matrix values and
+    the background as the key (and optionally on disk, see the cache
+    argument of the ScoreDistribution).
+    """
+    letters = sorted(pssm.alphabet.letters)
+    key = (tuple(tuple(pssm[letter]) for letter in letters),
+           tuple(background[letter] for letter in letters),
+           fpr, precision)
+    try:
+        return _threshold_cache[key]
+    except KeyError:
+        pass
+    distribution = pssm.distribution(background=background,
+                                     precision=precision, cache=cache)
+    threshold = distribution.threshold_pvalue(fpr)
+    _threshold_cache[key] = threshold
+    return threshold
+
+
+class MotifScanner(object):
+    """Find the hits of many DNA motifs in many sequences.
+
+    Attributes:
+
+     - ids - List of the motif identifiers, as used in the hits.
+     - thresholds - List of the score threshold for each motif.
+     - both - Are both strands searched?
+
+    """
+    def __init__(self, motifs, threshold=0.0, fpr=None, precision=10**3,
+                 both=True, cache=None):
+        """Create a scanner for the given motifs.
+
+         - motifs - Either a dictionary of Motif objects keyed by identifier,
+           or a list of Motif objects. For a list, the identifier is taken
+           from the motif's matrix_id (for JASPAR motifs) or name if set,
+           or is otherwise the index of the motif in the list.
+         - threshold - Hits must score higher than this (default 0.0).
+         - fpr - Optional false positive rate. If given, the threshold for
+           each motif is instead calculated from its score distribution
+           (see Bio.motifs.thresholds) using the motif's background. This
+           needs the pseudocounts of the motifs to be set, and is cached.
+         - precision - Precision of the score distributions.
+         - cache - Optional directory name where the score distributions
+           are saved, so they need not be calculated again next time.
+         - both - Search both strands (default) or just the forward strand.
+
+        The motifs' pseudocounts and background are used to calculate their
+        position-specific scoring matrices, exactly as for motif.pssm.
+        """
+        numpy = _numpy()
+        if isinstance(motifs, dict):
+            ids = sorted(motifs)
+            motifs = [motifs[key] for key in ids]
+        else:
+            motifs = list(motifs)
+            ids = []
+            for index, motif in enumerate(motifs):
+                key = getattr(motif, "matrix_id", None)
+                if key is None or key == "None":
+                    key = motif.name
+                if key is None or key in ("", "None"):
+                    key = index
+                ids.append(key)
+        if not motifs:
+            raise ValueError("No motifs given")
+        self.ids = ids
+        self.both = both
+        self.thresholds = []
+        pssms = []
+        for motif in motifs:
+            pssm = motif.pssm
+            if not isinstance(pssm.alphabet, IUPAC.IUPACUnambiguousDNA):
+                raise ValueError("Motif has wrong alphabet: %s - Use only with DNA motifs"
+                                 % pssm.alphabet)
+            if fpr is None:
+                self.thresholds.append(threshold)
+            else:
+                self.thresholds.append(_fpr_threshold(pssm, motif.background,
+                                                      fpr, precision, cache))
+            pssms.append(pssm)
+            if both:
+                pssms.append(pssm.reverse_complement())
+        self._min_length = min(pssm.length for pssm in pssms)
+        self._max_length = max(pssm.length for pssm in pssms)
+        #The stacked matrix has one row per motif position, one column
+        #per (strand of) motif, and one entry per letter code.  The codes
+        #0 to 3 are A, C, G, T, 4 is anything else (giving NaN), and 5
+        #is used as padding after the end of the sequence.  Shorter
+        #motifs are padded with positions scoring zero for any code.
+        weights = numpy.zeros((self._max_length, len(pssms), 6))
+        for column, pssm in enumerate(pssms):
+            for position in range(pssm.length):
+                for code, letter in enumerate("ACGT"):
+                    weights[position, column, code] = pssm[letter][position]
+                weights[position, column, 4:] = numpy.nan
+        self._weights = weights
+        self._limits = numpy.repeat(numpy.array(self.thresholds,
+                                                numpy.float32),
+                                    2 if both else 1)
+        lookup = numpy.zeros(256, numpy.uint8)
+        lookup[:] = 4
+        for code, letter in enumerate("ACGT"):
+            lookup[ord(letter)] = code
+            lookup[ord(letter.lower())] = code
+        self._lookup = lookup
+
+    def search(self, sequence):
+        """Find the motif hits in a single sequence.
+
+        Returns a list of (motif id, position, strand, score) tuples for
+        the windows scoring higher than the motif's threshold, sorted by
+        position. The position is always counted on the forward strand
+        (from zero), with a strand of 1 or -1 for a hit of the motif or
+        its reverse complement. The scores are the same as those from
+        the search method of the motif's PSSM. Windows containing letters
+        other than A, C, G or T (such as N) are skipped.
+        """
+        numpy = _numpy()
+        weights = self._weights
+        limits = self._limits
+        columns = weights.shape[1]
+        extra = self._max_length - 1
+        strands = 2 if self.both else 1
+        codes = self._lookup.take(numpy.frombuffer(_as_bytes(str(sequence)),
+                                                   numpy.uint8))
+        n = len(codes)
+        chunksize = max(1, _SCAN_CELLS // columns)
+        hits = []
+        for start in range(0, n - self._min_length + 1, chunksize):
+            count = min(chunksize, n - self._min_length + 1 - start)
+            piece = codes[start:start+count+extra]
+            if len(piece) < count + extra:
+                padding = numpy.zeros(count + extra - len(piece), numpy.uint8)
+                padding[:] = 5
+                piece = numpy.concatenate([piece, padding])
+            scores = numpy.zeros((columns, count))
+            for position in range(self._max_length):
+                scores += weights[position][:, piece[position:position+count]]
+            #Round to 32-bit floats like the PSSM search method
+            scores = scores.astype(numpy.float32)
+            with numpy.errstate(invalid="ignore"):
+                offsets, rows = numpy.nonzero((scores > limits[:, None]).T)
+            for offset, row in zip(offsets, rows):
+                motif_id = self.ids[row // strands]
+                strand = -1 if row % strands else 1
+                hits.append((motif_id, start + int(offset), strand,
+                             float(scores[row, offset])))
+        return hits
+
+    def scan(self, records, processes=None):
+        """Find the motif hits in SeqRecord objects, returning an iterator.
+
+        The records can be any iterable of SeqRecord objects, for example
+        from Bio.SeqIO.parse. This returns an iterator giving tuples of
+        (motif id, record id, position, strand, score) for each hit in
+        turn, in the order of the records and then as for the search
+        method.
+
+        If processes is more than one, the records are shared between a
+        pool of worker processes, with at most two batches of records per
+        process queued at a time. The hits are still returned in order.
+        """
+        if processes is not None and processes > 1:
+            return _scan_parallel(self, records, processes)
+        return self._scan(records)
+
+    def _scan(self, records):
+        """Find the motif hits in SeqRecord objects (PRIVATE)."""
+        for record in records:
+            for motif_id, position, strand, score in self.search(record.seq):
+                yield motif_id, record.id, position, strand, score
+
+
+_worker_scanner = None   # the MotifScanner in a worker process
+
+
+def _init_scan_worker(scanner):
+    """Store the scanner once per worker process (PRIVATE)."""
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _scan_chunk(chunk):
+    """Scan a list of (record id, sequence string) pairs (PRIVATE)."""
+    hits = []
+    for record_id, sequence in chunk:
+        for motif_id, position, strand, score in _worker_scanner.search(sequence):
+            hits.append((motif_id, record_id, position, strand, score))
+    return hits
+
+
+def _scan_parallel(scanner, records, processes):
+    """Share out the records between a pool of processes (PRIVATE)."""
+    from collections import deque
+    from itertools import islice
+    from multiprocessing import Pool
+
+    records = iter(records)
+    pool = Pool(processes, _init_scan_worker, (scanner,))
+    try:
+        pending = deque()
+        while True:
+            chunk = [(record.id, str(record.seq))
+                     for record in islice(records, _SCAN_CHUNK_SIZE)]
+            if not chunk:
+                break
+            pending.append(pool.apply_async(_scan_chunk, (chunk,)))
+            while len(pending) >= 2 * processes:
+                for hit in pending.popleft().get():
+                    yield hit
+        while pending:
+            for hit in pending.popleft().get():
+                yield hit
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+if __name__ == "__main__":
+    from Bio._utils import run_doctest
+    run_doctest()
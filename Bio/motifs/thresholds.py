@@ -4,17 +4,56 @@
 # license.  Please see the LICENSE file that should have been included
 # as part of this package.
 """Approximate calculation of appropriate thresholds for motif finding
+
+The score distribution of a PSSM is built up one motif position at a time,
+shifting the current distribution by the score of each letter. If NumPy is
+available, each position is done as a handful of array operations rather
+than a Python loop over every point of the distribution.
+
+As working out the distributions for a large motif library can still take
+a while, they can be saved in a cache directory (keyed by the matrix
+values, background and precision) and reused next time.
 """
 
+import hashlib
+import json
+import os
+import tempfile
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#Version of the cache file contents, change this if the format changes
+_CACHE_VERSION = 1
+
 
 class ScoreDistribution(object):
     """ Class representing approximate score distribution for a given motif.
 
     Utilizes a dynamic programming approch to calculate the distribution of
     scores with a predefined precision. Provides a number of methods for calculating
-    thresholds for motif occurences.
+    thresholds for motif occurences, and for the p-value of a given score.
     """
-    def __init__(self, motif=None, precision=10**3, pssm=None, background=None):
+    def __init__(self, motif=None, precision=10**3, pssm=None, background=None,
+                 cache=None):
+        """Calculate the score distribution.
+
+        The optional cache argument is the name of a directory used to
+        store the distributions calculated from a PSSM. If a matching
+        distribution (same matrix, background and precision) is found
+        there, it is loaded instead of being calculated again.
+        """
+        self._bg_tail = None
+        filename = None
+        if cache is not None and pssm is not None:
+            filename = os.path.join(cache, _cache_key(pssm, background,
+                                                      precision) + ".json")
+            if self._load(filename):
+                return
         if pssm is None:
             self.min_score = min(0.0, motif.min_score())
             self.interval = max(0.0, motif.max_score())-self.min_score
@@ -33,6 +72,8 @@ class ScoreDistribution(object):
         if pssm is None:
             for lo, mo in zip(motif.log_odds(), motif.pwm()):
                 self.modify(lo, mo, motif.background)
+        elif numpy is not None:
+            self._convolve(pssm, background)
         else:
             for position in range(pssm.length):
                 mo_new=[0.0]*self.n_points
@@ -47,6 +88,8 @@ class ScoreDistribution(object):
                         bg_new[self._add(i, d)]+=self.bg_density[i]*bg
                 self.mo_density=mo_new
                 self.bg_density=bg_new
+        if filename is not None:
+            self._save(filename)
 
     def _index_diff(self,x,y=0.0):
         return int((x-y+0.5*self.step)//self.step)
@@ -54,6 +97,75 @@ class ScoreDistribution(object):
     def _add(self, i, j):
         return max(0, min(self.n_points-1, i+j))
 
+    def _convolve(self, pssm, background):
+        """Build the densities using NumPy arrays (PRIVATE).
+
+        This gives the same result as the pure Python loops, with the
+        motif and background densities shifted together as one array.
+        """
+        n = self.n_points
+        density = numpy.array([self.mo_density, self.bg_density])
+        for position in range(pssm.length):
+            new = numpy.zeros((2, n))
+            for letter, score in pssm[:, position].items():
+                bg = background[letter]
+                weights = numpy.array([[pow(2, score) * bg], [bg]])
+                new += _shift(density, self._index_diff(score)) * weights
+            density = new
+        self.mo_density = density[0]
+        self.bg_density = density[1]
+
+    def _load(self, filename):
+        """Load the distribution from a cache file, if present (PRIVATE)."""
+        try:
+            with open(filename) as handle:
+                data = json.load(handle)
+        except (IOError, OSError, ValueError):
+            return False
+        if data.get("version") != _CACHE_VERSION:
+            return False
+        self.min_score = data["min_score"]
+        self.interval = data["interval"]
+        self.n_points = data["n_points"]
+        self.step = data["step"]
+        self.ic = data["ic"]
+        if numpy is None:
+            self.mo_density = data["mo_density"]
+            self.bg_density = data["bg_density"]
+        else:
+            self.mo_density = numpy.array(data["mo_density"])
+            self.bg_density = numpy.array(data["bg_density"])
+        return True
+
+    def _save(self, filename):
+        """Save the distribution to a cache file (PRIVATE).
+
+        The file is written under a temporary name and then renamed, so
+        other processes sharing the cache never see a partial file.
+        """
+        directory = os.path.dirname(filename)
+        try:
+            os.makedirs(directory)
+        except OSError:
+            if not os.path.isdir(directory):
+                raise
+        data = {"version": _CACHE_VERSION,
+                "min_score": self.min_score,
+                "interval": self.interval,
+                "n_points": self.n_points,
+                "step": self.step,
+                "ic": self.ic,
+                "mo_density": [float(p) for p in self.mo_density],
+                "bg_density": [float(p) for p in self.bg_density]}
+        handle, temp = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(handle, "w") as handle:
+                json.dump(data, handle)
+            os.rename(temp, filename)
+        except OSError:
+            #e.g. on Windows if another process saved it first
+            os.remove(temp)
+
     def modify(self, scores, mo_probs, bg_probs):
         mo_new=[0.0]*self.n_points
         bg_new=[0.0]*self.n_points
@@ -64,6 +176,46 @@ class ScoreDistribution(object):
                 bg_new[self._add(i, d)]+=self.bg_density[i]*bg_probs[k]
         self.mo_density=mo_new
         self.bg_density=bg_new
+        self._bg_tail = None
+
+    def _tail(self):
+        """Background probability of each score or higher (PRIVATE).
+
+        Returns a list in ascending order, so entry k is the probability
+        of the score at point n_points-1-k or higher.
+        """
+        if self._bg_tail is None:
+            tail = []
+            prob = 0.0
+            for p in reversed(self.bg_density):
+                prob += p
+                tail.append(float(prob))
+            self._bg_tail = tail
+        return self._bg_tail
+
+    def pvalue(self, score):
+        """Approximate p-value of a log-odds score.
+
+        This is the probability of a score at least this high in a
+        background generated sequence, using the point of the
+        distribution nearest to the score.
+        """
+        i = self._index_diff(score, self.min_score)
+        if i <= 0:
+            i = 0
+        elif i >= self.n_points:
+            return 0.0
+        return self._tail()[self.n_points-1-i]
+
+    def threshold_pvalue(self, pvalue):
+        """Approximate the log-odds threshold for the given p-value.
+
+        This gives the same result as threshold_fpr, but using a binary
+        search, so it is faster when looking up many thresholds.
+        """
+        k = bisect_left(self._tail(), pvalue)
+        i = max(0, self.n_points-1-k)
+        return self.min_score+i*self.step
 
     def threshold_fpr(self, fpr):
         """
@@ -111,3 +263,37 @@ class ScoreDistribution(object):
         are not directly comparable.
         """
         return self.threshold_fpr(fpr=2**-self.ic)
+
+
+def _shift(density, d):
+    """Shift the densities by d points, piling up the overflow at the ends (PRIVATE).
+
+    This matches the clamping done by ScoreDistribution._add.
+    """
+    n = density.shape[-1]
+    shifted = numpy.zeros(density.shape)
+    if d >= n:
+        shifted[..., -1] = density.sum(axis=-1)
+    elif d <= -n:
+        shifted[..., 0] = density.sum(axis=-1)
+    elif d > 0:
+        shifted[..., d:] = density[..., :n-d]
+        shifted[..., -1] += density[..., n-d:].sum(axis=-1)
+    elif d < 0:
+        shifted[..., :n+d] = density[..., -d:]
+        shifted[..., 0] += density[..., :-d].sum(axis=-1)
+    else:
+        shifted[...] = density
+    return shifted
+
+
+def _cache_key(pssm, background, precision):
+    """Key for the cache file of a score distribution (PRIVATE).
+
+    This is a hash of the matrix values, background and precision.
+    """
+    letters = sorted(pssm.alphabet.letters)
+    values = [_CACHE_VERSION, precision, letters,
+              [[repr(float(x)) for x in pssm[letter]] for letter in letters],
+              [repr(float(background[letter])) for letter in letters]]
+    return hashlib.sha1(json.dumps(values).encode("ascii")).hexdigest()
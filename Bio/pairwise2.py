@@ -124,6 +124,19 @@ Biopython ( Bio.SubsMat -> MatrixInfo ).
       Score=13
     <BLANKLINE>
 
+To screen one sequence against many others, each alignment function
+has a batch method taking the query and an iterable of targets in place
+of the two sequences.  This returns an iterator with the result of each
+alignment in turn, and avoids repeating the set up for every target:
+
+    >>> targets = ["EVL", "KEVLA", "PPP"]
+    >>> for score in pairwise2.align.localds.batch(
+    ...         "KEVLA", targets, matrix, -10, -1, score_only=True):
+    ...     print("%0.1f" % score)
+    13.0
+    22.0
+    0.0
+
 To see a description of the parameters for a function, please look at
 the docstring for the function via the help function, e.g.
 type help(pairwise2.align.localds) at the Python prompt.
@@ -147,12 +160,27 @@ type help(pairwise2.align.localds) at the Python prompt.
 #   For debugging.
 # - score_only: boolean
 #   Only get the best score, don't recover any alignments.  The return
-#   value of the function is the score.
+#   value of the function is the score.  With affine gap penalties
+#   (i.e. unless callback gap functions or force_generic are used),
+#   only one row of the score matrix is kept, so the memory needed
+#   grows with the length of the shorter sequence only.
 # - one_alignment_only: boolean
 #   Only recover one alignment.
+# - band: integer
+#   Only consider alignments that stay within this many positions of
+#   the diagonal of the score matrix.  The band is widened by the
+#   difference in length of the two sequences, so that a global
+#   alignment is always possible.  With affine gap penalties only the
+#   cells inside the band are stored, so long, similar sequences can
+#   be aligned in time and memory proportional to their length times
+#   the band width.  By default (None) the whole matrix is used.
 
 from __future__ import print_function
 
+from array import array
+
+from Bio._py3k import basestring
+
 MAX_ALIGNMENTS = 1000   # maximum alignments recovered in traceback
 
 
@@ -295,7 +323,8 @@ alignment occurs.
                 ('gap_char', '-'),
                 ('force_generic', 0),
                 ('score_only', 0),
-                ('one_alignment_only', 0)
+                ('one_alignment_only', 0),
+                ('band', None),
                 ]
             for name, default in default_params:
                 keywds[name] = keywds.get(name, default)
@@ -312,31 +341,141 @@ alignment occurs.
             keywds = self.decode(*args, **keywds)
             return _align(**keywds)
 
+        def batch(self, sequenceA, targets, *args, **keywds):
+            """Align one sequence against each of many targets.
+
+            The arguments are as for the alignment function itself,
+            except that the second sequence is replaced by an iterable
+            of target sequences.  This returns an iterator giving, for
+            each target in turn, what the alignment function would have
+            returned (so the best score if score_only is set, else the
+            list of alignments).  The arguments are only decoded once,
+            and a match_dict is turned into a lookup table which the C
+            code can use without calling back into Python.
+
+            Set processes to a number greater than one to share the
+            targets between a pool of worker processes, in which case the
+            match and gap functions must be picklable (so callback
+            functions defined with lambda cannot be used).  The results
+            are still returned in the order of the targets.
+            """
+            processes = keywds.pop('processes', None)
+            keywds = self.decode(sequenceA, None, *args, **keywds)
+            if isinstance(keywds['match_fn'], dictionary_match):
+                match_fn = keywds['match_fn']
+                keywds['match_fn'] = _table_match(match_fn.score_dict,
+                                                  match_fn.symmetric)
+            if processes is not None and processes > 1:
+                return _align_batch_parallel(keywds, targets, processes)
+            return _align_batch(keywds, targets)
+
     def __getattr__(self, attr):
         return self.alignment_function(attr)
 align = align()
 
 
+_BATCH_CHUNK_SIZE = 100   # targets sent to a worker process at a time
+
+
+def _align_batch(keywds, targets):
+    # Align sequenceA from the decoded keywds against each target.
+    for target in targets:
+        keywds['sequenceB'] = target
+        yield _align(**keywds)
+
+
+_batch_keywds = None   # decoded alignment arguments in a worker process
+
+
+def _init_batch_worker(keywds):
+    # Store the decoded arguments once per worker process, rather than
+    # sending them (with any lookup table) with every chunk of targets.
+    global _batch_keywds
+    _batch_keywds = keywds
+
+
+def _align_batch_chunk(targets):
+    # Align a list of targets in a worker process.
+    return list(_align_batch(_batch_keywds, targets))
+
+
+def _align_batch_parallel(keywds, targets, processes):
+    # Share the targets between a pool of processes in chunks of
+    # _BATCH_CHUNK_SIZE.  At most two chunks per process are queued at
+    # any one time, so the targets are only read as they are needed.
+    from collections import deque
+    from itertools import islice
+    from multiprocessing import Pool
+
+    targets = iter(targets)
+    pool = Pool(processes, _init_batch_worker, (keywds,))
+    try:
+        pending = deque()
+        while True:
+            chunk = list(islice(targets, _BATCH_CHUNK_SIZE))
+            if not chunk:
+                break
+            pending.append(pool.apply_async(_align_batch_chunk, (chunk,)))
+            while len(pending) >= 2 * processes:
+                for result in pending.popleft().get():
+                    yield result
+        while pending:
+            for result in pending.popleft().get():
+                yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def _align(sequenceA, sequenceB, match_fn, gap_A_fn, gap_B_fn,
            penalize_extend_when_opening, penalize_end_gaps,
            align_globally, gap_char, force_generic, score_only,
-           one_alignment_only):
+           one_alignment_only, band=None):
     if not sequenceA or not sequenceB:
         return []
+    if band is not None and band < 0:
+        raise ValueError("The band width should be a non-negative integer.")
 
     if (not force_generic) and isinstance(gap_A_fn, affine_penalty) \
     and isinstance(gap_B_fn, affine_penalty):
         open_A, extend_A = gap_A_fn.open, gap_A_fn.extend
         open_B, extend_B = gap_B_fn.open, gap_B_fn.extend
-        x = _make_score_matrix_fast(
-            sequenceA, sequenceB, match_fn, open_A, extend_A, open_B, extend_B,
-            penalize_extend_when_opening, penalize_end_gaps, align_globally,
-            score_only)
+        if score_only:
+            # Only a row of the score matrix is kept, so make the
+            # shorter sequence run across the columns.  Transposing the
+            # matrix swaps the roles of the gap penalties too.
+            if len(sequenceB) > len(sequenceA):
+                sequenceA, sequenceB = sequenceB, sequenceA
+                gap_A_fn, gap_B_fn = gap_B_fn, gap_A_fn
+                open_A, extend_A, open_B, extend_B = \
+                        open_B, extend_B, open_A, extend_A
+                penalize_end_gaps = (penalize_end_gaps[1],
+                                     penalize_end_gaps[0])
+                if isinstance(match_fn, _table_match):
+                    match_fn = match_fn.transposed()
+                elif not isinstance(match_fn, identity_match):
+                    unswapped_fn = match_fn
+                    match_fn = lambda charB, charA: unswapped_fn(charA, charB)
+            return _score_only_fast(
+                sequenceA, sequenceB, match_fn, gap_A_fn, gap_B_fn,
+                open_A, extend_A, open_B, extend_B,
+                penalize_extend_when_opening, penalize_end_gaps,
+                align_globally, band)
+        if band is None:
+            x = _make_score_matrix_fast(
+                sequenceA, sequenceB, match_fn, open_A, extend_A, open_B,
+                extend_B, penalize_extend_when_opening, penalize_end_gaps,
+                align_globally, score_only)
+        else:
+            x = _make_score_matrix_banded(
+                sequenceA, sequenceB, match_fn, open_A, extend_A, open_B,
+                extend_B, penalize_extend_when_opening, penalize_end_gaps,
+                align_globally, band)
     else:
         x = _make_score_matrix_generic(
             sequenceA, sequenceB, match_fn, gap_A_fn, gap_B_fn,
             penalize_extend_when_opening, penalize_end_gaps, align_globally,
-            score_only)
+            score_only, band)
     score_matrix, trace_matrix = x
 
     #print("SCORE %s" % print_matrix(score_matrix))
@@ -375,23 +514,30 @@ def _align(sequenceA, sequenceB, match_fn, gap_A_fn, gap_B_fn,
 def _make_score_matrix_generic(
         sequenceA, sequenceB, match_fn, gap_A_fn, gap_B_fn,
         penalize_extend_when_opening, penalize_end_gaps, align_globally,
-        score_only):
+        score_only, band=None):
     # This is an implementation of the Needleman-Wunsch dynamic
     # programming algorithm for aligning sequences.
 
     # Create the score and traceback matrices.  These should be in the
     # shape:
     # sequenceA (down) x sequenceB (across)
+    # With a band, each row only holds the cells inside the band.
     lenA, lenB = len(sequenceA), len(sequenceB)
+    low, high = _band_limits(lenA, lenB, band)
     score_matrix, trace_matrix = [], []
     for i in range(lenA):
-        score_matrix.append([None] * lenB)
-        trace_matrix.append([[None]] * lenB)
+        if band is None:
+            score_matrix.append([None] * lenB)
+            trace_matrix.append([[None]] * lenB)
+        else:
+            start, stop = max(0, i + low), min(lenB, i + high + 1)
+            score_matrix.append(_BandedRow(start, stop, lenB))
+            trace_matrix.append(_BandedRow(start, stop, lenB, [None]))
 
     # The top and left borders of the matrices are special cases
     # because there are no previously aligned characters.  To simplify
     # the main loop, handle these separately.
-    for i in range(lenA):
+    for i in range(min(lenA, 1 - low)):
         # Align the first residue in sequenceB to the ith residue in
         # sequence A.  This is like opening up i gaps at the beginning
         # of sequence B.
@@ -399,7 +545,7 @@ def _make_score_matrix_generic(
         if penalize_end_gaps[1]:
             score += gap_B_fn(0, i)
         score_matrix[i][0] = score
-    for i in range(1, lenB):
+    for i in range(1, min(lenB, high + 1)):
         score = match_fn(sequenceA[0], sequenceB[i])
         if penalize_end_gaps[0]:
             score += gap_A_fn(0, i)
@@ -412,8 +558,10 @@ def _make_score_matrix_generic(
     #    1) extending a previous alignment without gaps
     #    2) adding a gap in sequenceA
     #    3) adding a gap in sequenceB
+    # Only cells inside the band (the whole matrix if there is no
+    # band) are filled in or used as a starting point for a gap.
     for row in range(1, lenA):
-        for col in range(1, lenB):
+        for col in range(max(1, row + low), min(lenB, row + high + 1)):
             # First, calculate the score that would occur by extending
             # the alignment without gaps.
             best_score = score_matrix[row-1][col-1]
@@ -425,7 +573,7 @@ def _make_score_matrix_generic(
             # previous row.  Each column represents a different
             # character to align from, and thus a different length
             # gap.
-            for i in range(0, col-1):
+            for i in range(max(0, row - 1 + low), col-1):
                 score = score_matrix[row-1][i] + gap_A_fn(row, col-1-i)
                 score_rint = rint(score)
                 if score_rint == best_score_rint:
@@ -436,7 +584,7 @@ def _make_score_matrix_generic(
                     best_indexes = [(row-1, i)]
 
             # Try to find a better score by opening gaps in sequenceB.
-            for i in range(0, row-1):
+            for i in range(max(0, col - 1 - high), row-1):
                 score = score_matrix[i][col-1] + gap_B_fn(col, row-1-i)
                 score_rint = rint(score)
                 if score_rint == best_score_rint:
@@ -593,6 +741,239 @@ def _make_score_matrix_fast(
     return score_matrix, trace_matrix
 
 
+def _band_limits(lenA, lenB, band):
+    # Return the lowest and highest diagonal (col - row) of the score
+    # matrix inside the band.  The band is widened by the difference
+    # in the sequence lengths, so that both corners of the matrix are
+    # always inside it.  Without a band, every diagonal is included.
+    if band is None:
+        return 1 - lenA, lenB - 1
+    return min(0, lenB - lenA) - band, max(0, lenB - lenA) + band
+
+
+class _BandedRow(object):
+    """Row of a banded score or traceback matrix (PRIVATE).
+
+    Only the cells in columns start to stop-1 are stored.  Looking up
+    any other column returns None.
+    """
+    __slots__ = ["start", "values", "length"]
+
+    def __init__(self, start, stop, length, fill=None):
+        self.start = start
+        self.values = [fill] * (stop - start)
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, col):
+        i = col - self.start
+        if 0 <= i < len(self.values):
+            return self.values[i]
+        return None
+
+    def __setitem__(self, col, value):
+        self.values[col - self.start] = value
+
+
+def _make_score_matrix_banded(
+        sequenceA, sequenceB, match_fn, open_A, extend_A, open_B, extend_B,
+        penalize_extend_when_opening, penalize_end_gaps,
+        align_globally, band):
+    # This is the same algorithm as _make_score_matrix_fast, but only
+    # the cells inside the band are calculated and stored.  See there
+    # for the details.  Both the score and traceback matrices are
+    # lists of _BandedRow objects.
+    first_A_gap = calc_affine_penalty(1, open_A, extend_A,
+                                      penalize_extend_when_opening)
+    first_B_gap = calc_affine_penalty(1, open_B, extend_B,
+                                      penalize_extend_when_opening)
+    lenA, lenB = len(sequenceA), len(sequenceB)
+    low, high = _band_limits(lenA, lenB, band)
+    score_matrix, trace_matrix = [], []
+
+    # The best score and indexes for a gap in sequenceB ending in each
+    # column, or None before the band reaches that column.  The row
+    # cache only concerns the previous row, so is reset on each row.
+    col_cache_score, col_cache_index = [None]*lenB, [None]*lenB
+
+    for row in range(lenA):
+        start, stop = max(0, row + low), min(lenB, row + high + 1)
+        scores = _BandedRow(start, stop, lenB)
+        traces = _BandedRow(start, stop, lenB, [None])
+        score_matrix.append(scores)
+        trace_matrix.append(traces)
+        row_cache_score, row_cache_index = None, None
+        for col in range(start, stop):
+            if not row or not col:
+                # The top and left borders, as in _make_score_matrix_fast.
+                score = match_fn(sequenceA[row], sequenceB[col])
+                if not col and penalize_end_gaps[1]:
+                    score += calc_affine_penalty(
+                        row, open_B, extend_B, penalize_extend_when_opening)
+                elif not row and penalize_end_gaps[0]:
+                    score += calc_affine_penalty(
+                        col, open_A, extend_A, penalize_extend_when_opening)
+                scores[col] = score
+                continue
+
+            # The previous cell on the diagonal is always in the band.
+            nogap_score = prev_scores[col-1]
+            if row_cache_score is not None:
+                row_score = row_cache_score
+            else:
+                row_score = nogap_score - 1   # Make sure it's not the best.
+            if row > 1 and col_cache_score[col-1] is not None:
+                col_score = col_cache_score[col-1]
+            else:
+                col_score = nogap_score - 1
+
+            best_score = max(nogap_score, row_score, col_score)
+            best_score_rint = rint(best_score)
+            best_index = []
+            if best_score_rint == rint(nogap_score):
+                best_index.append((row-1, col-1))
+            if best_score_rint == rint(row_score):
+                best_index.extend(row_cache_index)
+            if best_score_rint == rint(col_score):
+                best_index.extend(col_cache_index[col-1])
+
+            score = best_score + match_fn(sequenceA[row], sequenceB[col])
+            if not align_globally and score < 0:
+                scores[col] = 0
+            else:
+                scores[col] = score
+            traces[col] = best_index
+
+            # Update the cached column and row scores, starting a new
+            # cache the first time a column or row is seen.
+            open_score = nogap_score + first_B_gap
+            if col_cache_score[col-1] is None:
+                col_cache_score[col-1] = open_score
+                col_cache_index[col-1] = [(row-1, col-1)]
+            else:
+                extend_score = col_cache_score[col-1] + extend_B
+                open_score_rint, extend_score_rint = \
+                                 rint(open_score), rint(extend_score)
+                if open_score_rint > extend_score_rint:
+                    col_cache_score[col-1] = open_score
+                    col_cache_index[col-1] = [(row-1, col-1)]
+                elif extend_score_rint > open_score_rint:
+                    col_cache_score[col-1] = extend_score
+                else:
+                    col_cache_score[col-1] = open_score
+                    if (row-1, col-1) not in col_cache_index[col-1]:
+                        col_cache_index[col-1] = col_cache_index[col-1] + \
+                                                 [(row-1, col-1)]
+
+            open_score = nogap_score + first_A_gap
+            if row_cache_score is None:
+                row_cache_score = open_score
+                row_cache_index = [(row-1, col-1)]
+            else:
+                extend_score = row_cache_score + extend_A
+                open_score_rint, extend_score_rint = \
+                                 rint(open_score), rint(extend_score)
+                if open_score_rint > extend_score_rint:
+                    row_cache_score = open_score
+                    row_cache_index = [(row-1, col-1)]
+                elif extend_score_rint > open_score_rint:
+                    row_cache_score = extend_score
+                else:
+                    row_cache_score = open_score
+                    if (row-1, col-1) not in row_cache_index:
+                        row_cache_index = row_cache_index + [(row-1, col-1)]
+        prev_scores = scores
+
+    return score_matrix, trace_matrix
+
+
+def _score_only_fast(sequenceA, sequenceB, match_fn, gap_A_fn, gap_B_fn,
+                     open_A, extend_A, open_B, extend_B,
+                     penalize_extend_when_opening, penalize_end_gaps,
+                     align_globally, band):
+    # Return the best score, using the same recurrence as
+    # _make_score_matrix_fast (or _make_score_matrix_banded) but
+    # without keeping the matrices.  Only the previous row of scores
+    # and the column caches are needed to fill in a row, so the memory
+    # used is proportional to the length of sequenceB.  The best
+    # starting point is tracked as the rows are filled in, following
+    # _find_global_start and _find_local_start.
+    first_A_gap = calc_affine_penalty(1, open_A, extend_A,
+                                      penalize_extend_when_opening)
+    first_B_gap = calc_affine_penalty(1, open_B, extend_B,
+                                      penalize_extend_when_opening)
+    lenA, lenB = len(sequenceA), len(sequenceB)
+    low, high = _band_limits(lenA, lenB, band)
+    prev_row, this_row = [None]*lenB, [None]*lenB
+    col_cache = [None]*lenB
+    best_score = None
+
+    for row in range(lenA):
+        row_cache = None
+        for col in range(max(0, row + low), min(lenB, row + high + 1)):
+            if not row or not col:
+                score = match_fn(sequenceA[row], sequenceB[col])
+                if not col and penalize_end_gaps[1]:
+                    score += calc_affine_penalty(
+                        row, open_B, extend_B, penalize_extend_when_opening)
+                elif not row and penalize_end_gaps[0]:
+                    score += calc_affine_penalty(
+                        col, open_A, extend_A, penalize_extend_when_opening)
+            else:
+                nogap_score = prev_row[col-1]
+                if row_cache is not None:
+                    row_score = row_cache
+                else:
+                    row_score = nogap_score - 1
+                if row > 1 and col_cache[col-1] is not None:
+                    col_score = col_cache[col-1]
+                else:
+                    col_score = nogap_score - 1
+                score = max(nogap_score, row_score, col_score) + \
+                        match_fn(sequenceA[row], sequenceB[col])
+                if not align_globally and score < 0:
+                    score = 0
+
+                # Update the caches, as in _make_score_matrix_fast.
+                open_score = nogap_score + first_B_gap
+                if col_cache[col-1] is None:
+                    col_cache[col-1] = open_score
+                else:
+                    extend_score = col_cache[col-1] + extend_B
+                    if rint(extend_score) > rint(open_score):
+                        col_cache[col-1] = extend_score
+                    else:
+                        col_cache[col-1] = open_score
+                open_score = nogap_score + first_A_gap
+                if row_cache is None:
+                    row_cache = open_score
+                else:
+                    extend_score = row_cache + extend_A
+                    if rint(extend_score) > rint(open_score):
+                        row_cache = extend_score
+                    else:
+                        row_cache = open_score
+            this_row[col] = score
+
+            # Is this a better place to start the traceback?
+            if align_globally:
+                if col == lenB - 1:
+                    if penalize_end_gaps[1]:
+                        score += gap_B_fn(lenB, lenA-row-1)
+                elif row == lenA - 1:
+                    if penalize_end_gaps[0]:
+                        score += gap_A_fn(lenA, lenB-col-1)
+                else:
+                    continue
+            if best_score is None or score > best_score:
+                best_score = score
+        prev_row, this_row = this_row, prev_row
+
+    return best_score
+
+
 def _recover_alignments(sequenceA, sequenceB, starts,
                         score_matrix, trace_matrix, align_globally,
                         gap_char, one_alignment_only):
@@ -691,12 +1072,17 @@ def _find_global_start(sequenceA, sequenceB,
     for row in range(nrows):
         # Find the score, penalizing end gaps if necessary.
         score = score_matrix[row][ncols-1]
+        if score is None:
+            # Outside the band
+            continue
         if penalize_end_gaps[1]:
             score += gap_B_fn(ncols, nrows-row-1)
         positions.append((score, (row, ncols-1)))
     # Search all columns in the last row.
     for col in range(ncols-1):
         score = score_matrix[nrows-1][col]
+        if score is None:
+            continue
         if penalize_end_gaps[0]:
             score += gap_A_fn(nrows, ncols-col-1)
         positions.append((score, (nrows-1, col)))
@@ -710,7 +1096,8 @@ def _find_local_start(score_matrix):
     for row in range(nrows):
         for col in range(ncols):
             score = score_matrix[row][col]
-            positions.append((score, (row, col)))
+            if score is not None:
+                positions.append((score, (row, col)))
     return positions
 
 
@@ -817,6 +1204,49 @@ class dictionary_match:
         return self.score_dict[(charA, charB)]
 
 
+class _table_match(object):
+    """Match function using a precompiled lookup table (PRIVATE).
+
+    This gives the same scores as a dictionary_match, but the pairs are
+    stored both ways round so each score needs only one lookup.  The
+    scores for pairs of single characters are also held in score_table,
+    a string of 256 x 256 C doubles indexed by the character codes
+    (NaN where the pair has no score), which the C code reads directly.
+    """
+    def __init__(self, score_dict, symmetric=1):
+        scores = {}
+        if symmetric:
+            for (charA, charB), score in score_dict.items():
+                scores[(charB, charA)] = score
+        scores.update(score_dict)
+        self.scores = scores
+        table = array("d", [float("nan")]) * (256 * 256)
+        for (charA, charB), score in scores.items():
+            if isinstance(charA, basestring) and len(charA) == 1 \
+            and isinstance(charB, basestring) and len(charB) == 1 \
+            and ord(charA) < 256 and ord(charB) < 256:
+                table[ord(charA) * 256 + ord(charB)] = score
+        try:
+            self.score_table = table.tobytes()
+        except AttributeError:
+            # Python 2
+            self.score_table = table.tostring()
+        self._transposed = None
+
+    def __call__(self, charA, charB):
+        return self.scores[(charA, charB)]
+
+    def transposed(self):
+        # Return the match function with the residues the other way
+        # round, built once and then cached.
+        if self._transposed is None:
+            scores = dict(((charB, charA), score) for (charA, charB), score
+                          in self.scores.items())
+            self._transposed = _table_match(scores, symmetric=0)
+            self._transposed._transposed = self
+        return self._transposed
+
+
 class affine_penalty:
     """affine_penalty(open, extend[, penalize_extend_when_opening]) -> gap_fn
 
@@ -881,6 +1311,12 @@ try:
     from cpairwise2 import rint, _make_score_matrix_fast
 except ImportError:
     pass
+# The score only function was added to the C code later, so look for
+# it separately in case of an older compiled module.
+try:
+    from cpairwise2 import _score_only_fast
+except ImportError:
+    pass
 
 
 def _test():
@@ -131,7 +131,9 @@ DOCTEST_MODULES = [
 if is_numpy():
     DOCTEST_MODULES.extend(["Bio.Statistics.lowess",
                             "Bio.PDB.Polypeptide",
-                            "Bio.PDB.Selection"
+                            "Bio.PDB.Selection",
+                            "Bio.SeqIO._batch",
+                            "Bio.motifs.scanner",
                             ])
 
 
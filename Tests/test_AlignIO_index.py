@@ -0,0 +1,170 @@
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Unit tests for Bio.AlignIO.index(...), index_db() and parse_rows()."""
+
+try:
+    import sqlite3
+except ImportError:
+    #Try and run what tests we can on Python 2.4 or Jython
+    #where we don't expect this to be installed.
+    sqlite3 = None
+
+import os
+import unittest
+import tempfile
+
+from Bio._py3k import _bytes_to_string, StringIO
+
+from Bio import AlignIO
+from Bio.Alphabet import generic_dna, generic_protein
+
+
+class IndexTests(unittest.TestCase):
+    """Check index and index_db give the same alignments as parse."""
+
+    def setUp(self):
+        self.filenames = []
+
+    def tearDown(self):
+        for filename in self.filenames:
+            os.remove(filename)
+
+    def concatenate(self, filenames):
+        """Write a temporary file holding several alignments."""
+        handle, filename = tempfile.mkstemp()
+        os.close(handle)
+        self.filenames.append(filename)
+        with open(filename, "w") as out_handle:
+            for name in filenames:
+                with open(name) as handle:
+                    out_handle.write(handle.read())
+        return filename
+
+    def check(self, filename, format, keys, alphabet=None):
+        alignments = list(AlignIO.parse(filename, format, alphabet=alphabet))
+        index = AlignIO.index(filename, format, alphabet)
+        self.assertEqual(sorted(index), sorted(keys))
+        self.assertEqual(len(index), len(alignments))
+        for key, alignment in zip(keys, alignments):
+            self.assertTrue(key in index)
+            self.assertEqual(index[key].format("fasta"),
+                             alignment.format("fasta"))
+            raw = _bytes_to_string(index.get_raw(key))
+            self.assertEqual(AlignIO.read(StringIO(raw), format, alphabet=alphabet).format("fasta"),
+                             alignment.format("fasta"))
+        self.assertEqual(index.get("missing"), None)
+        index.close()
+        if sqlite3:
+            index = AlignIO.index_db(":memory:", [filename], format, alphabet)
+            self.assertEqual(sorted(index), sorted(keys))
+            for key, alignment in zip(keys, alignments):
+                self.assertEqual(index[key].format("fasta"),
+                                 alignment.format("fasta"))
+            index.close()
+
+    def test_stockholm(self):
+        """Index concatenated Stockholm alignments by accession or identifier."""
+        filename = self.concatenate(["Stockholm/funny.sth",
+                                     "Stockholm/simple.sth"])
+        self.check(filename, "stockholm", ["PF00571", "1"])
+        index = AlignIO.index(filename, "stockholm", generic_protein)
+        self.assertEqual(index["PF00571"].annotations,
+                         {"accession": "PF00571", "id": "CBS"})
+        self.assertEqual(str(index["1"][0].seq.alphabet), "ProteinAlphabet()")
+        index.close()
+
+    def test_stockholm_key_function(self):
+        """Index a Stockholm file with a key function."""
+        index = AlignIO.index("Stockholm/funny.sth", "stockholm",
+                              key_function=lambda key: key.lower())
+        self.assertEqual(list(index), ["pf00571"])
+        self.assertEqual(len(index["pf00571"]), 6)
+        index.close()
+
+    def test_clustal(self):
+        """Index concatenated Clustal alignments by number."""
+        filename = self.concatenate(["Clustalw/opuntia.aln",
+                                     "Clustalw/cw02.aln",
+                                     "Clustalw/protein.aln"])
+        self.check(filename, "clustal", ["0", "1", "2"])
+
+    def test_phylip(self):
+        """Index concatenated PHYLIP alignments by number."""
+        filename = self.concatenate(["Phylip/interlaced.phy",
+                                     "Phylip/interlaced2.phy"])
+        self.check(filename, "phylip", ["0", "1"])
+        filename = self.concatenate(["Phylip/sequential.phy",
+                                     "Phylip/sequential2.phy"])
+        self.check(filename, "phylip-sequential", ["0", "1"], generic_dna)
+
+    def test_unsupported(self):
+        """Check unsupported formats are rejected."""
+        self.assertRaises(ValueError, AlignIO.index,
+                          "Emboss/needle.txt", "emboss")
+        self.assertRaises(ValueError, AlignIO.index,
+                          "Stockholm/funny.sth", "Stockholm")
+
+
+class RowTests(unittest.TestCase):
+    """Check parse_rows gives the same records as read."""
+
+    def compare(self, rows, alignment):
+        rows = list(rows)
+        self.assertEqual(len(rows), len(alignment))
+        for row, record in zip(rows, alignment):
+            self.assertEqual(row.id, record.id)
+            self.assertEqual(row.description, record.description)
+            self.assertEqual(str(row.seq), str(record.seq))
+            self.assertEqual(row.annotations, record.annotations)
+            self.assertEqual(row.letter_annotations, record.letter_annotations)
+
+    def test_stockholm(self):
+        """Read the rows of a Stockholm file one at a time."""
+        filename = "Stockholm/funny.sth"
+        self.compare(AlignIO.parse_rows(filename, "stockholm", generic_protein),
+                     AlignIO.read(filename, "stockholm", alphabet=generic_protein))
+
+    def test_stockholm_interleaved(self):
+        """Interleaved Stockholm files can't be read one row at a time."""
+        rows = AlignIO.parse_rows("Stockholm/simple.sth", "stockholm")
+        self.assertRaises(ValueError, list, rows)
+
+    def test_successive(self):
+        """Read the rows of successive alignments from one handle."""
+        for filename, format in [("Stockholm/funny.sth", "stockholm"),
+                                 ("Phylip/sequential2.phy", "phylip-sequential")]:
+            with open(filename) as handle:
+                data = handle.read()
+            handle = StringIO(data + "\n" + data)
+            alignment = AlignIO.read(filename, format)
+            self.compare(AlignIO.parse_rows(handle, format), alignment)
+            self.compare(AlignIO.parse_rows(handle, format), alignment)
+            self.assertEqual(list(AlignIO.parse_rows(handle, format)), [])
+
+    def test_phylip_sequential(self):
+        """Read the rows of a sequential PHYLIP file one at a time."""
+        filename = "Phylip/sequential.phy"
+        self.compare(AlignIO.parse_rows(filename, "phylip-sequential"),
+                     AlignIO.read(filename, "phylip-sequential"))
+
+    def test_fasta(self):
+        """Read the rows of a FASTA alignment, checking the lengths."""
+        filename = "Quality/example.fasta"
+        self.compare(AlignIO.parse_rows(filename, "fasta"),
+                     AlignIO.read(filename, "fasta"))
+        rows = AlignIO.parse_rows("Fasta/f002", "fasta")
+        self.assertRaises(ValueError, list, rows)
+
+    def test_interleaved(self):
+        """Interleaved formats can't be read one row at a time."""
+        for filename, format in [("Clustalw/opuntia.aln", "clustal"),
+                                 ("Phylip/interlaced.phy", "phylip")]:
+            rows = AlignIO.parse_rows(filename, format)
+            self.assertRaises(ValueError, list, rows)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity = 2)
+    unittest.main(testRunner=runner)
@@ -92,3 +92,31 @@ class AsHandleTestCase(unittest.TestCase):
         s = StringIO()
         with File.as_handle(s) as handle:
             self.assertEqual(s, handle)
+
+
+class CompactOffsetDictTestCase(unittest.TestCase):
+
+    def test_many_keys(self):
+        "Test _CompactOffsetDict growing its hash table"
+        offsets = File._CompactOffsetDict()
+        keys = ["read_%i" % i for i in range(1000)]
+        for i, key in enumerate(keys):
+            offsets[key] = 100 * i
+        self.assertEqual(1000, len(offsets))
+        self.assertEqual(keys, list(offsets))
+        for i, key in enumerate(keys):
+            self.assertTrue(key in offsets)
+            self.assertEqual(100 * i, offsets[key])
+        self.assertFalse("read_1000" in offsets)
+        self.assertFalse(None in offsets)
+        self.assertRaises(KeyError, offsets.__getitem__, "read_1000")
+        self.assertRaises(ValueError, offsets.__setitem__, "read_1", 0)
+        self.assertRaises(TypeError, offsets.__setitem__, 1, 0)
+
+    def test_large_offsets(self):
+        "Test _CompactOffsetDict with offsets beyond 4GB"
+        offsets = File._CompactOffsetDict()
+        offsets["small"] = 1
+        offsets["large"] = 2 ** 40
+        self.assertEqual(1, offsets["small"])
+        self.assertEqual(2 ** 40, offsets["large"])
@@ -8,6 +8,9 @@ from __future__ import print_function
 
 import unittest
 import math
+import itertools
+import copy
+import random
 
 # biopython
 from Bio import Alphabet
@@ -19,6 +22,13 @@ from Bio.HMM import MarkovModel
 from Bio.HMM import DynamicProgramming
 from Bio.HMM import Trainer
 
+from Bio import MissingPythonDependencyError
+try:
+    from Bio.HMM import Compiled
+except MissingPythonDependencyError:
+    #NumPy is not installed
+    Compiled = None
+
 
 # create some simple alphabets
 class NumberAlphabet(Alphabet.Alphabet):
@@ -355,6 +365,20 @@ class HiddenMarkovModelTest(unittest.TestCase):
         test_assertion("log probability of most probable path",
                        prob, expected_prob)
 
+    def test_viterbi_ties(self):
+        """Test which of several equally probable paths viterbi picks.
+        """
+        self.mm_builder.set_initial_probabilities({'1': 0.5, '2': 0.5})
+        self.mm_builder.allow_all_transitions()
+        self.mm_builder.set_equal_probabilities()
+        mm = self.mm_builder.get_markov_model()
+        for emissions, expected in [("A", "2"), ("AB", "12"),
+                                    ("ABBA", "1112")]:
+            seq, prob = mm.viterbi(Seq(emissions, LetterAlphabet()),
+                                   NumberAlphabet())
+            self.assertEqual(str(seq), expected)
+            self.assertAlmostEqual(prob, len(emissions) * math.log(1.0 / 16))
+
 
 class ScaledDPAlgorithmsTest(unittest.TestCase):
     def setUp(self):
@@ -428,6 +452,234 @@ class AbstractTrainerTest(unittest.TestCase):
         assert abs(expected_log_prob - log_prob) < 0.1, \
           "Bad probability calculated: %s" % log_prob
 
+class DiceRollAlphabet(Alphabet.Alphabet):
+    letters = ['1', '2', '3', '4', '5', '6']
+
+
+class DiceTypeAlphabet(Alphabet.Alphabet):
+    letters = ['F', 'L']
+
+
+class BaumWelchCasinoTest(unittest.TestCase):
+    """Pin the Baum-Welch estimates for the occasionally dishonest casino.
+    """
+    def setUp(self):
+        mm_builder = MarkovModel.MarkovModelBuilder(DiceTypeAlphabet(),
+                                                    DiceRollAlphabet())
+        mm_builder.set_initial_probabilities({'F': 0.5, 'L': 0.5})
+        mm_builder.allow_all_transitions()
+        mm_builder.set_transition_score('F', 'F', 0.8)
+        mm_builder.set_transition_score('F', 'L', 0.2)
+        mm_builder.set_transition_score('L', 'F', 0.3)
+        mm_builder.set_transition_score('L', 'L', 0.7)
+        for roll in DiceRollAlphabet.letters:
+            mm_builder.set_emission_score('F', roll, 1.0 / 6)
+            mm_builder.set_emission_score('L', roll,
+                                          0.5 if roll == '6' else 0.1)
+        self.mm = mm_builder.get_markov_model()
+        # rolls from the fair and loaded dice (using random() only, which
+        # gives the same numbers on all versions of Python)
+        rand = random.Random(3)
+        rolls = []
+        state = 'F'
+        for i in range(300):
+            if state == 'F':
+                rolls.append("123456"[int(rand.random() * 6)])
+                if rand.random() < 0.05:
+                    state = 'L'
+            else:
+                rolls.append("1234566666"[int(rand.random() * 10)])
+                if rand.random() < 0.1:
+                    state = 'F'
+        self.training_seqs = [Trainer.TrainingSequence(
+            Seq("".join(rolls), DiceRollAlphabet()),
+            Seq("", DiceTypeAlphabet()))]
+
+    def _train(self, *args):
+        trainer = Trainer.BaumWelchTrainer(self.mm)
+        return trainer.train(self.training_seqs,
+                             lambda change, iterations: iterations >= 3,
+                             *args)
+
+    def _check(self, trained, expected):
+        for key, value in zip([('F', 'F'), ('F', 'L'), ('L', 'F'), ('L', 'L')],
+                              expected[:4]):
+            self.assertAlmostEqual(trained.transition_prob[key], value, 5)
+        for key, value in zip([('F', '6'), ('L', '6'), ('L', '1')],
+                              expected[4:]):
+            self.assertAlmostEqual(trained.emission_prob[key], value, 5)
+
+    def test_default(self):
+        """The default Baum-Welch training uses ScaledDPAlgorithms.
+        """
+        self._check(self._train(), [0.731329, 0.268671, 0.247121, 0.752879,
+                                    0.108226, 0.347095, 0.113840])
+
+    def test_scaled(self):
+        """Baum-Welch training with ScaledDPAlgorithms.
+        """
+        self._check(self._train(DynamicProgramming.ScaledDPAlgorithms),
+                    [0.731329, 0.268671, 0.247121, 0.752879,
+                     0.108226, 0.347095, 0.113840])
+
+    def test_compiled(self):
+        """Baum-Welch training with a CompiledMarkovModel.
+        """
+        if Compiled is None:
+            return
+        self._check(self._train(Compiled.CompiledMarkovModel),
+                    [0.781957, 0.218043, 0.287819, 0.712181,
+                     0.178136, 0.455551, 0.084076])
+
+
+class CompiledMarkovModelTest(unittest.TestCase):
+    def setUp(self):
+        mm_builder = MarkovModel.MarkovModelBuilder(NumberAlphabet(),
+                                                    LetterAlphabet())
+        mm_builder.set_initial_probabilities({'1': 0.4, '2': 0.6})
+        mm_builder.allow_all_transitions()
+        mm_builder.set_transition_score('1', '1', 0.35)
+        mm_builder.set_transition_score('1', '2', 0.65)
+        mm_builder.set_transition_score('2', '1', 0.45)
+        mm_builder.set_transition_score('2', '2', 0.55)
+        mm_builder.set_emission_score('1', 'A', 0.45)
+        mm_builder.set_emission_score('1', 'B', 0.55)
+        mm_builder.set_emission_score('2', 'A', 0.75)
+        mm_builder.set_emission_score('2', 'B', 0.25)
+        self.mm = mm_builder.get_markov_model()
+        self.compiled = Compiled.CompiledMarkovModel(self.mm,
+                                                     NumberAlphabet(),
+                                                     LetterAlphabet())
+
+    def _paths(self, emissions):
+        """Return (state path, probability) for every path, by brute force.
+        """
+        mm = self.mm
+        for path in itertools.product(NumberAlphabet.letters,
+                                      repeat=len(emissions)):
+            prob = mm.initial_prob[path[0]] * \
+                mm.emission_prob[(path[0], emissions[0])]
+            for i in range(1, len(emissions)):
+                prob *= mm.transition_prob[(path[i - 1], path[i])] * \
+                    mm.emission_prob[(path[i], emissions[i])]
+            yield path, prob
+
+    def test_encode(self):
+        """Coding emissions as integers.
+        """
+        self.assertEqual(list(self.compiled.encode("ABBA")), [0, 1, 1, 0])
+        self.assertEqual(list(self.compiled.encode(Seq("BA"))), [1, 0])
+        self.assertEqual(list(self.compiled.encode(['B', 'B'])), [1, 1])
+        self.assertRaises(ValueError, self.compiled.encode, "ABC")
+        self.assertRaises(ValueError, self.compiled.encode, ['A', 'C'])
+        self.assertRaises(ValueError, self.compiled.forward, "")
+
+    def test_forward_backward(self):
+        """Compare the forward, backward and posterior values to brute force.
+        """
+        for emissions in ["A", "BA", "ABB", "BBAB"]:
+            paths = list(self._paths(emissions))
+            total = sum(prob for path, prob in paths)
+            forward, scales, log_prob = self.compiled.forward(emissions)
+            self.assertAlmostEqual(log_prob, math.log(total))
+            self.assertAlmostEqual(self.compiled.log_probability(emissions),
+                                   math.log(total))
+            posterior = self.compiled.posterior(emissions)
+            for i in range(len(emissions)):
+                for k, state in enumerate(NumberAlphabet.letters):
+                    expected = sum(prob for path, prob in paths
+                                   if path[i] == state) / total
+                    self.assertAlmostEqual(posterior[i, k], expected)
+            path, probs = self.compiled.posterior_decode(emissions,
+                                                         NumberAlphabet())
+            self.assertEqual(len(path), len(emissions))
+            self.assertEqual(list(probs), list(posterior.max(axis=1)))
+
+    def test_expected_counts(self):
+        """Compare the expected Baum-Welch counts to brute force.
+        """
+        emissions = "BABBA"
+        paths = list(self._paths(emissions))
+        total = sum(prob for path, prob in paths)
+        transitions, letters, log_prob = \
+            self.compiled.expected_counts(emissions)
+        for k, first in enumerate(NumberAlphabet.letters):
+            for l, second in enumerate(NumberAlphabet.letters):
+                expected = sum(prob * sum(1 for i in range(len(path) - 1)
+                                          if path[i:i + 2] == (first, second))
+                               for path, prob in paths) / total
+                self.assertAlmostEqual(transitions[k, l], expected)
+            for b, letter in enumerate(LetterAlphabet.letters):
+                expected = sum(prob * sum(1 for i in range(len(path))
+                                          if path[i] == first and
+                                          emissions[i] == letter)
+                               for path, prob in paths) / total
+                self.assertAlmostEqual(letters[k, b], expected)
+
+    def test_viterbi(self):
+        """Check the Viterbi path matches the pure Python implementation.
+        """
+        for emissions in ["A", "AB", "BBABAAB", "ABABBBBBAA"]:
+            seq, prob = self.compiled.viterbi(emissions, NumberAlphabet())
+            expected = self.mm.viterbi(emissions, NumberAlphabet())
+            self.assertEqual(str(seq), str(expected[0]))
+            self.assertAlmostEqual(prob, expected[1])
+            best = max(self._paths(emissions), key=lambda item: item[1])
+            self.assertEqual(str(seq), "".join(best[0]))
+
+    def test_baum_welch(self):
+        """Check Baum-Welch training improves the likelihood.
+        """
+        emissions = [Seq("ABBBBBAABBABBBBAAAAB", LetterAlphabet()),
+                     Seq("BBBABBA", LetterAlphabet())]
+        training_seqs = [Trainer.TrainingSequence(seq,
+                                                  Seq("", NumberAlphabet()))
+                         for seq in emissions]
+        before = sum(self.compiled.log_probability(seq) for seq in emissions)
+        trainer = Trainer.BaumWelchTrainer(self.mm)
+        trained = trainer.train(training_seqs,
+                                lambda change, iterations: iterations >= 5,
+                                Compiled.CompiledMarkovModel)
+        compiled = Compiled.CompiledMarkovModel(trained, NumberAlphabet(),
+                                                LetterAlphabet())
+        after = sum(compiled.log_probability(seq) for seq in emissions)
+        self.assertTrue(after > before)
+        for state in NumberAlphabet.letters:
+            self.assertAlmostEqual(sum(trained.transition_prob[(state, other)]
+                                       for other in NumberAlphabet.letters),
+                                   1.0)
+
+    def test_baum_welch_processes(self):
+        """Check parallel Baum-Welch training matches training in series.
+        """
+        rand = random.Random(7)
+        training_seqs = [Trainer.TrainingSequence(
+                             Seq("".join(rand.choice("AB") for i
+                                         in range(rand.randint(1, 30))),
+                                 LetterAlphabet()),
+                             Seq("", NumberAlphabet()))
+                         for j in range(250)]
+        results = []
+        for processes in (None, 2):
+            progress = []
+            trainer = Trainer.BaumWelchTrainer(copy.deepcopy(self.mm))
+            trained = trainer.train(training_seqs,
+                                    lambda change, iterations: iterations >= 4,
+                                    Compiled.CompiledMarkovModel,
+                                    processes=processes,
+                                    update_fn=lambda i, llik:
+                                        progress.append((i, llik)))
+            self.assertEqual([i for i, llik in progress], [1, 2, 3, 4])
+            results.append((progress, trained.transition_prob,
+                            trained.emission_prob))
+        self.assertEqual(results[0], results[1])
+        self.assertRaises(ValueError, Trainer.BaumWelchTrainer(self.mm).train,
+                          training_seqs, lambda change, iterations: True,
+                          DynamicProgramming.ScaledDPAlgorithms, 2)
+
+if Compiled is None:
+    del CompiledMarkovModelTest
+
 # run the tests
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity = 2)
@@ -3,7 +3,7 @@
 # as part of this package.
 
 try:
-    from numpy import array
+    from numpy import array, allclose
     from numpy import random  # missing in PyPy's micronumpy
 except ImportError:
     from Bio import MissingPythonDependencyError
@@ -151,6 +151,60 @@ class TestMarkovModel(unittest.TestCase):
         self.assertAlmostEqual(markov_model.p_emission[1][1], 1.0)
         self.assertAlmostEqual(markov_model.p_emission[1][2], 0.0)
 
+    def test_baum_welch_processes(self):
+        states = ["CP", "IP"]
+        alphabet = ["cola", "ice_t", "lem"]
+        p_initial = [1.0, 0.0000001]
+        p_transition = [[0.7, 0.3],
+                        [0.5, 0.5]]
+        p_emission = [[0.6, 0.1, 0.3],
+                      [0.1, 0.7, 0.2]]
+        N, M = len(states), len(alphabet)
+        # With one output, adding up the counts gives the same result
+        # as updating the parameters after each output.
+        x = MarkovModel._baum_welch(N, M, [(2, 1, 0)],
+                                    p_initial=p_initial,
+                                    p_transition=p_transition,
+                                    p_emission=p_emission,
+                                    batch=True)
+        p_initial2, p_transition2, p_emission2 = x
+        self.assertAlmostEqual(p_initial2[0], 1.0, places=4)
+        self.assertAlmostEqual(p_transition2[0][0], 0.02460365, places=4)
+        self.assertAlmostEqual(p_transition2[1][0], 1.0, places=4)
+        self.assertAlmostEqual(p_emission2[0][2], 0.5)
+        self.assertAlmostEqual(p_emission2[1][1], 1.0)
+        # The result should not depend on the number of processes.
+        outputs = [random.randint(0, M, random.randint(1, 8))
+                   for i in range(150)]
+        results = []
+        for processes in (None, 1, 2):
+            progress = []
+            random.seed(0)
+            markov_model = MarkovModel.train_bw(
+                states, alphabet, [[alphabet[k] for k in output]
+                                   for output in outputs],
+                pseudo_transition=array([[1.0, 1.0], [1.0, 1.0]]),
+                update_fn=lambda i, llik: progress.append((i, llik)),
+                batch=True, processes=processes)
+            self.assertEqual([i for i, llik in progress],
+                             list(range(len(progress))))
+            results.append((progress,
+                            markov_model.p_initial.tolist(),
+                            markov_model.p_transition.tolist(),
+                            markov_model.p_emission.tolist()))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        # Only batch re-estimation updates the initial probabilities.
+        for batch in (False, True):
+            p_initial2 = MarkovModel._baum_welch(
+                N, M, [(2, 1, 0), (1, 1, 2)],
+                p_initial=[0.5, 0.5], p_transition=p_transition,
+                p_emission=p_emission, batch=batch)[0]
+            self.assertEqual(not batch, allclose(p_initial2, [0.5, 0.5]))
+        # Several processes are only used for batch re-estimation.
+        self.assertRaises(ValueError, MarkovModel.train_bw, states, alphabet,
+                          [["cola"]], processes=2)
+
     # Do some tests from the topcoder competition.
 
     def test_topcoder1(self):
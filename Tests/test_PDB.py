@@ -35,6 +35,7 @@ from Bio.PDB import HSExposureCA, HSExposureCB, ExposureCN
 from Bio.PDB.PDBExceptions import PDBConstructionException, PDBConstructionWarning
 from Bio.PDB import rotmat, Vector
 from Bio.PDB import Residue, Atom
+from Bio.PDB import Superimposer
 from Bio.PDB import make_dssp_dict
 from Bio.PDB.NACCESS import process_asa_data, process_rsa_data
 
@@ -1030,6 +1031,154 @@ class TransformTests(unittest.TestCase):
                 self.assertAlmostEqual(newpos[i], newpos_check[i])
 
 
+class PackedTransformTests(TransformTests):
+    """Transform entities after packing their coordinates."""
+
+    def setUp(self):
+        TransformTests.setUp(self)
+        self.coords = self.s.pack_coords()
+
+
+class PackedCoordsTests(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter('ignore', PDBConstructionWarning)
+        self.s = PDBParser(PERMISSIVE=True).get_structure(
+            'X', "PDB/a_structure.pdb")
+        warnings.filters.pop(0)
+        self.atoms = []
+        for chain in self.s.get_chains():
+            for residue in chain:
+                if residue.is_disordered() == 2:
+                    residues = residue.disordered_get_list()
+                else:
+                    residues = [residue]
+                for r in residues:
+                    self.atoms.extend(r.get_unpacked_list())
+
+    def test_pack(self):
+        """Pack the coordinates of a structure into one array."""
+        expected = numpy.array([atom.get_coord() for atom in self.atoms])
+        self.assertEqual(self.s.get_coord_array().shape, (len(self.atoms), 3))
+        coords = self.s.pack_coords()
+        self.assertEqual(coords.shape, (len(self.atoms), 3))
+        self.assertTrue(numpy.allclose(coords, expected))
+        self.s.get_coord_array()[0] = (7.0, 8.0, 9.0)
+        self.assertEqual(list(coords[0]), [7.0, 8.0, 9.0])
+        atom = self.atoms[5]
+        self.assertTrue(numpy.allclose(atom.get_coord(), expected[5]))
+        atom.set_coord(numpy.array((1.0, 2.0, 3.0), "f"))
+        self.assertEqual(list(coords[5]), [1.0, 2.0, 3.0])
+        coords[5] = (4.0, 5.0, 6.0)
+        self.assertEqual(list(atom.get_coord()), [4.0, 5.0, 6.0])
+        residue = atom.get_parent()
+        self.assertEqual(len(residue.get_coord_array()),
+                         len(residue.get_unpacked_list()))
+        copied = self.s.copy()
+        copied.transform(numpy.identity(3), numpy.array((1.0, 0.0, 0.0)))
+        self.assertEqual(list(atom.get_coord()), [4.0, 5.0, 6.0])
+
+    def test_center_of_mass(self):
+        """Center of mass of packed and unpacked entities."""
+        chain = self.s[0].get_list()[0]
+        atoms = [a for a in self.atoms if a.get_parent().get_parent() is chain]
+        centroid = numpy.mean([a.get_coord() for a in atoms], axis=0)
+        self.assertTrue(numpy.allclose(chain.center_of_mass(geometric=True),
+                                       centroid))
+        unpacked = chain.center_of_mass()
+        self.s.pack_coords()
+        self.assertTrue(numpy.allclose(chain.center_of_mass(), unpacked))
+        residue = chain.get_list()[0]
+        atom = residue.get_list()[0]
+        total = sum(a.mass for a in residue)
+        expected = sum(a.mass * a.get_coord() for a in residue) / total
+        self.assertTrue(numpy.allclose(residue.center_of_mass(), expected))
+
+    def test_add_after_pack(self):
+        """Add an atom after packing the coordinates."""
+        self.s.pack_coords()
+        residue = self.s[0].get_list()[0].get_list()[0]
+        atom = Atom.Atom("XX", numpy.array((0.0, 0.0, 0.0), "f"), 0.0, 1.0,
+                         " ", " XX ", 0, "C")
+        residue.add(atom)
+        residue.transform(numpy.identity(3), numpy.array((1.0, 1.0, 1.0), "f"))
+        self.assertEqual(list(atom.get_coord()), [1.0, 1.0, 1.0])
+        self.assertEqual(len(self.s.get_coord_array()), len(self.atoms) + 1)
+
+    def test_no_atom_arrays(self):
+        """Packed atoms keep no coordinate array of their own."""
+        s = PDBParser(PERMISSIVE=True).get_structure("X", "PDB/1A8O.pdb")
+        atoms = list(s.get_atoms())
+        expected = [atom.get_coord().tolist() for atom in atoms]
+        s.pack_coords()
+        for atom, coord in zip(atoms, expected):
+            self.assertFalse("_coord" in atom.__dict__)
+            self.assertTrue(numpy.allclose(atom.get_coord(), coord))
+        copied = atoms[0].copy()
+        self.assertTrue("_coord" in copied.__dict__)
+        self.assertTrue(copied._coord_array is None)
+        copied.set_coord(numpy.array((1.0, 2.0, 3.0), "f"))
+        self.assertTrue(numpy.allclose(atoms[0].get_coord(), expected[0]))
+
+    def test_pack_child_after_parent(self):
+        """Pack a residue after packing the whole structure."""
+        self.s.pack_coords()
+        residue = self.s[0].get_list()[0].get_list()[0]
+        residue.pack_coords()
+        before = numpy.array([a.get_coord() for a in self.atoms])
+        self.s.transform(numpy.identity(3), numpy.array((1.0, 0.0, 0.0)))
+        after = numpy.array([a.get_coord() for a in self.atoms])
+        self.assertTrue(numpy.allclose(after - before, (1.0, 0.0, 0.0)))
+
+    def test_disordered_transform(self):
+        """Packed and unpacked transforms move every alternative location."""
+        rot = rotmat(Vector(1, 3, 5), Vector(1, 0, 0))
+        tran = numpy.array((2.4, 0, 1), "f")
+        before = self.s.get_coord_array()
+        expected = numpy.dot(before, rot) + tran
+        warnings.simplefilter('ignore', PDBConstructionWarning)
+        packed = PDBParser(PERMISSIVE=True).get_structure(
+            'X', "PDB/a_structure.pdb")
+        warnings.filters.pop(0)
+        packed.pack_coords()
+        self.s.transform(rot, tran)
+        packed.transform(rot, tran)
+        self.assertTrue(numpy.allclose(self.s.get_coord_array(), expected,
+                                       atol=1e-3))
+        self.assertTrue(numpy.allclose(packed.get_coord_array(), expected,
+                                       atol=1e-3))
+        #Superimposer.apply, on the disordered atoms only
+        sup = Superimposer()
+        sup.rotran = (rot, tran)
+        for structure in [self.s, packed]:
+            disordered = [a for a in structure.get_atoms()
+                          if a.is_disordered() == 2]
+            self.assertTrue(disordered)
+            atoms = [atom for a in disordered
+                     for atom in a.disordered_get_list()]
+            before = numpy.array([atom.get_coord() for atom in atoms])
+            sup.apply(disordered)
+            after = numpy.array([atom.get_coord() for atom in atoms])
+            self.assertTrue(numpy.allclose(after, numpy.dot(before, rot) + tran,
+                                           atol=1e-3))
+
+    def test_superimposer(self):
+        """Superimpose packed atoms."""
+        fixed = [a for a in self.s.get_atoms() if a.get_id() == "CA"]
+        moving_structure = self.s.copy()
+        moving_structure.transform(rotmat(Vector(1, 3, 5), Vector(1, 0, 0)),
+                                   numpy.array((2.4, 0, 1), "f"))
+        moving_structure.pack_coords()
+        moving = [a for a in moving_structure.get_atoms() if a.get_id() == "CA"]
+        sup = Superimposer()
+        sup.set_atoms(fixed, moving)
+        self.assertAlmostEqual(sup.rms, 0.0, places=3)
+        sup.apply(list(moving_structure.get_atoms()))
+        for a, b in zip(self.s.get_atoms(), moving_structure.get_atoms()):
+            self.assertTrue(numpy.allclose(a.get_coord(), b.get_coord(),
+                                           atol=1e-3))
+
+
 class CopyTests(unittest.TestCase):
 
     def setUp(self):
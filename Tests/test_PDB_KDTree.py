@@ -12,6 +12,7 @@
 import unittest
 
 try:
+    import numpy
     from numpy import array
     from numpy.random import random
 except ImportError:
@@ -56,6 +57,95 @@ class NeighborTest(unittest.TestCase):
         self.assertEqual([], ns.search(x, 5.0, "S"))
 
 
+class RandomAtom(object):
+    def __init__(self, coord):
+        self.coord = coord
+
+    def get_coord(self):
+        return self.coord
+
+
+class BatchNeighborTest(unittest.TestCase):
+    def setUp(self):
+        state = numpy.random.RandomState(0)
+        self.coords = 30 * state.random_sample((500, 3))
+        self.centers = 40 * state.random_sample((50, 3)) - 5
+        self.atoms = [RandomAtom(coord) for coord in self.coords]
+
+    def distances(self, box=None):
+        diff = self.centers[:, None, :] - self.coords[None, :, :]
+        if box is not None:
+            diff -= box * numpy.round(diff / box)
+        return numpy.sqrt((diff * diff).sum(axis=-1))
+
+    def check_centers(self, ns, distances, radius):
+        indices, offsets = ns.search_centers(self.centers, radius)
+        radii = ns.get_centers_radii()
+        self.assertEqual(len(offsets), len(self.centers) + 1)
+        self.assertEqual(offsets[-1], len(indices))
+        self.assertEqual(len(radii), len(indices))
+        for i, row in enumerate(distances):
+            found = list(indices[offsets[i]:offsets[i + 1]])
+            self.assertEqual(found, sorted(found))
+            expected = numpy.nonzero(row <= radius)[0]
+            #Allow for single precision rounding at the radius
+            for j in set(expected).symmetric_difference(found):
+                self.assertAlmostEqual(row[j], radius, places=4)
+            for j, r in zip(found, radii[offsets[i]:offsets[i + 1]]):
+                self.assertAlmostEqual(row[j], r, places=4)
+
+    def check_nearest(self, ns, distances, k):
+        indices, radii = ns.search_nearest(self.centers, k)
+        self.assertEqual(indices.shape, (len(self.centers), k))
+        self.assertEqual(radii.shape, (len(self.centers), k))
+        expected = numpy.sort(distances, axis=1)[:, :k]
+        self.assertTrue(numpy.allclose(radii, expected, atol=1e-4))
+        for i, row in enumerate(indices):
+            self.assertEqual(len(set(row)), k)
+            self.assertTrue(numpy.allclose(distances[i, row], radii[i],
+                                           atol=1e-4))
+
+    def test_search_centers(self):
+        """NeighborSearch: Search many centers at once."""
+        ns = NeighborSearch(self.atoms)
+        distances = self.distances()
+        for radius in (1.0, 5.0):
+            self.check_centers(ns, distances, radius)
+        indices, offsets = ns.search_centers(self.centers[:1], 5.0)
+        expected = sorted(self.atoms.index(atom)
+                          for atom in ns.search(self.centers[0], 5.0))
+        self.assertEqual(list(indices), expected)
+        indices, offsets = ns.search_centers(numpy.zeros((0, 3)), 5.0)
+        self.assertEqual(list(offsets), [0])
+        self.assertEqual(len(indices), 0)
+
+    def test_search_nearest(self):
+        """NeighborSearch: Find the nearest atoms to many centers."""
+        ns = NeighborSearch(self.atoms)
+        distances = self.distances()
+        for k in (1, 7):
+            self.check_nearest(ns, distances, k)
+        indices, radii = ns.search_nearest(self.centers[:2], len(self.atoms))
+        self.assertEqual(sorted(indices[0]), list(range(len(self.atoms))))
+        self.assertRaises(ValueError, ns.search_nearest, self.centers,
+                          len(self.atoms) + 1)
+
+    def test_periodic(self):
+        """NeighborSearch: Batch searches in a periodic box."""
+        box = array([30.0, 32.0, 28.0])
+        ns = NeighborSearch(self.atoms, box=box)
+        distances = self.distances(box)
+        for radius in (2.0, 15.0):
+            self.check_centers(ns, distances, radius)
+        self.check_nearest(ns, distances, 5)
+        pairs = ns.search_all(2.0)
+        self.assertEqual(len(pairs), len(set(pairs)))
+        diff = self.coords[:, None, :] - self.coords[None, :, :]
+        diff -= box * numpy.round(diff / box)
+        expected = numpy.triu((diff * diff).sum(axis=-1) <= 4.0, 1).sum()
+        self.assertEqual(len(pairs), expected)
+
+
 if __name__ == '__main__':
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
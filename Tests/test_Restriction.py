@@ -6,10 +6,16 @@
 """Testing code for Restriction enzyme classes of Biopython.
 """
 
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 
+import Bio
 from Bio.Restriction import *
 from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
 from Bio.Alphabet.IUPAC import IUPACAmbiguousDNA
 
 
@@ -114,6 +120,112 @@ class RestrictionBatches(unittest.TestCase):
         self.assertEqual(hits[EcoRV], [8])
         self.assertEqual(hits[EcoRI], [16])
 
+    def test_large_batch_search(self):
+        """Searching with a large batch in one pass over the sequence.
+        """
+        #Includes ambiguous and non-palindromic sites, and N
+        seq = Seq("ACCNGAATTCGATATCTGAAGAAAAGCCAGGTCTTCAGGCCNNNNNGGCCTTG"
+                  "CTTCAGAAGACGGATCCGAGACCTCGGT", IUPACAmbiguousDNA())
+        batch = RestrictionBatch([EcoRI, EcoRV, KpnI, Acc65I, AcuI, BsaI,
+                                  BbvCI, SfiI, BamHI, EcoRII, MboI, NotI])
+        for linear in (True, False):
+            hits = batch.search(seq, linear)
+            self.assertEqual(set(hits), set(batch))
+            for enzyme in batch:
+                self.assertEqual(hits[enzyme], enzyme.search(seq, linear))
+        self.assertEqual(hits[EcoRI], [6])
+        self.assertEqual(hits[AcuI], [19, 38, 40])
+        self.assertEqual(hits[NotI], [])
+        #KpnI site split between the end and the start
+        self.assertEqual(hits[KpnI], [3])
+        self.assertEqual(hits[Acc65I], [80])
+        self.assertEqual(batch.search(seq)[KpnI], [])
+        #All the enzymes
+        hits = AllEnzymes.search(seq, linear=False)
+        for enzyme in AllEnzymes:
+            self.assertEqual(hits[enzyme], enzyme.search(seq, linear=False))
+
+    def test_search_records(self):
+        """Searching many records, with and without a process pool.
+        """
+        records = [SeqRecord(Seq("AAAA" + EcoRV.site + "AAAA" + EcoRI.site
+                                 + "AAAA", IUPACAmbiguousDNA()), id="alpha"),
+                   SeqRecord(Seq("ACGT", IUPACAmbiguousDNA()), id="beta"),
+                   SeqRecord(Seq("TTCAAAA" + KpnI.site + "AAGAA",
+                                 IUPACAmbiguousDNA()), id="gamma")]
+        batch = RestrictionBatch([EcoRI, KpnI])
+        for linear in (True, False):
+            results = list(batch.search_records(records, linear))
+            self.assertEqual([r[0] for r in results],
+                             ["alpha", "beta", "gamma"])
+            for record, (record_id, hits, sizes) in zip(records, results):
+                self.assertEqual(hits, {EcoRI: EcoRI.search(record.seq, linear),
+                                        KpnI: KpnI.search(record.seq, linear)})
+                self.assertEqual(sum(sizes), len(record))
+            self.assertEqual(list(batch.search_records(iter(records), linear,
+                                                       processes=2)),
+                             results)
+        self.assertEqual(results[0][2], [24])
+        self.assertEqual(results[1][2], [4])
+        #Circular, so EcoRI cuts across the origin of gamma
+        self.assertEqual(results[2][1], {EcoRI: [17], KpnI: [13]})
+        self.assertEqual(results[2][2], [14, 4])
+        linear = list(batch.search_records(records))
+        self.assertEqual(linear[0][2], [15, 9])
+        self.assertEqual(linear[0][2],
+                         [len(f) for f in EcoRI.catalyse(records[0].seq)])
+        self.assertEqual(linear[2][2], [12, 6])
+
+
+class EnzymeTable(unittest.TestCase):
+    """Tests for the enzyme table and creating the enzymes when needed.
+    """
+    def test_table(self):
+        """The compact table matches the enzyme dictionary.
+        """
+        from Bio.Restriction import Restriction_Dictionary, Restriction_Table
+        from Bio.Restriction._Update.TableCompiler import check_table
+        self.assertTrue(check_table(Restriction_Dictionary.rest_dict,
+                                    Restriction_Dictionary.typedict,
+                                    Restriction_Table))
+        self.assertEqual(Restriction_Dictionary.suppliers,
+                         dict((k, (n, list(e))) for k, (n, e)
+                              in Restriction_Table.suppliers.items()))
+        self.assertEqual(len(AllEnzymes), len(Restriction_Table.enzymes))
+
+    def test_lazy_import(self):
+        """Importing an enzyme only creates that enzyme.
+        """
+        code = ("from Bio.Restriction import EcoRI, RestrictionBatch; "
+                "from Bio.Restriction import Restriction; "
+                "print(sorted(Restriction._enzymes)); "
+                "RestrictionBatch(['KpnI']); "
+                "print(sorted(Restriction._enzymes))")
+        #Run in a new process, using this copy of Biopython
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.dirname(os.path.dirname(
+            os.path.abspath(Bio.__file__)))
+        child = subprocess.Popen([sys.executable, "-c", code],
+                                 stdout=subprocess.PIPE, env=env,
+                                 universal_newlines=True)
+        output = child.communicate()[0]
+        self.assertEqual(output.split("\n"),
+                         ["['EcoRI']", "['EcoRI', 'KpnI']", ""])
+
+    def test_lookup(self):
+        """Enzymes are the same however they are found.
+        """
+        from Bio import Restriction as package
+        from Bio.Restriction import Restriction
+        self.assertTrue(Restriction.NotI is package.NotI)
+        self.assertTrue(RestrictionBatch().format("NotI") is NotI)
+        self.assertTrue(pickle.loads(pickle.dumps(NotI)) is NotI)
+        self.assertTrue("NotI" in dir(package))
+        self.assertRaises(AttributeError, getattr, package, "FooI")
+        self.assertRaises(ValueError, RestrictionBatch, ["FooI"])
+        self.assertTrue(isinstance(AllEnzymes, RestrictionBatch))
+        self.assertEqual(len(AllEnzymes), len(CommOnly) + len(NonComm))
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity = 2)
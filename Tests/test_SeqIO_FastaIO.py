@@ -11,6 +11,7 @@ from Bio._py3k import StringIO
 
 from Bio import SeqIO
 from Bio.SeqIO.FastaIO import FastaIterator
+from Bio.SeqIO.FastaIO import FastaBatchIterator, SimpleFastaParser
 from Bio.Alphabet import generic_protein, generic_nucleotide, generic_dna
 
 
@@ -176,6 +177,67 @@ for filename in multi_amino_files:
     setattr(TitleFunctions, "test_mutli_pro_%s"%name, funct(filename))
     del funct
 
+
+class BatchTests(unittest.TestCase):
+
+    def check_batches(self, filename):
+        with open(filename) as handle:
+            expected = list(SimpleFastaParser(handle))
+        for batch_size in [1, 2, 3, 10000]:
+            with open(filename) as handle:
+                batches = list(FastaBatchIterator(handle, batch_size))
+            self.assertTrue(all(len(b) <= batch_size for b in batches))
+            records = [values for batch in batches for values in batch]
+            self.assertEqual(expected, records)
+            for batch in batches:
+                self.assertEqual(batch.quals, None)
+                self.assertEqual(batch.seqs, "".join(s for t, s in batch))
+                self.assertEqual(list(batch.lengths()),
+                                 [len(s) for t, s in batch])
+
+    def test_dups(self):
+        """Batches from Fasta/dups.fasta"""
+        self.check_batches("Fasta/dups.fasta")
+
+    def test_multi(self):
+        """Batches from Fasta/f002"""
+        self.check_batches("Fasta/f002")
+
+    def test_blocks(self):
+        """Batches from small blocks of text"""
+        from Bio.SeqIO import _batch
+        for text in [">alpha\nAC GT\n\n>beta \r\nAC\r\nG\n",
+                     "comment\n>alpha\nACGT\n",
+                     ">alpha\nAC\tGT\t\n>beta\n>gamma\nT"]:
+            expected = list(SimpleFastaParser(StringIO(text)))
+            for block_size in [1, 2, 5, 100]:
+                chunks = _batch._fasta_chunks(StringIO(text),
+                                              SimpleFastaParser, block_size)
+                records = [values for batch in _batch._batch_iterator(chunks, 2)
+                           for values in batch]
+                self.assertEqual(expected, records)
+
+    def test_empty(self):
+        """Batches from an empty file"""
+        self.assertEqual([], list(FastaBatchIterator(StringIO(""))))
+
+    def test_select_trim(self):
+        """Selecting and trimming batches"""
+        with open("Fasta/dups.fasta") as handle:
+            batch = next(FastaBatchIterator(handle))
+        self.assertEqual([t for t, s in batch.select([4, 0])],
+                         ["delta", "alpha"])
+        self.assertEqual([t for t, s in batch.select([True, False] * 2 + [False])],
+                         ["alpha", "gamma"])
+        self.assertRaises(ValueError, batch.select, [True, False])
+        trimmed = batch.trim(1, -1)
+        self.assertEqual([s for t, s in trimmed], [s[1:-1] for t, s in batch])
+        self.assertEqual(trimmed.titles, batch.titles)
+        trimmed = batch.trim(ends=list(range(5)))
+        self.assertEqual([s for t, s in trimmed],
+                         [s[:i] for i, (t, s) in enumerate(batch)])
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity = 2)
     unittest.main(testRunner=runner)
@@ -23,6 +23,12 @@ from Bio.Seq import Seq, UnknownSeq, MutableSeq
 from Bio.SeqRecord import SeqRecord
 from Bio.Data.IUPACData import ambiguous_dna_letters, ambiguous_rna_letters
 
+try:
+    import numpy
+except ImportError:
+    #Optional, only used for the quality array tests
+    numpy = None
+
 BINARY_FORMATS = ["sff", "sff-trim"]
 
 
@@ -722,6 +728,156 @@ class MappingTests(unittest.TestCase):
                          expected_phred)
 
 
+
+class TestBatches(unittest.TestCase):
+    """Check FastqBatchIterator agrees with FastqGeneralIterator."""
+
+    def check(self, filename):
+        with open(filename, "rU") as handle:
+            expected = list(QualityIO.FastqGeneralIterator(handle))
+        for batch_size in [1, 2, 10000]:
+            with open(filename, "rU") as handle:
+                batches = list(QualityIO.FastqBatchIterator(handle, batch_size))
+            self.assertEqual(sum(len(b) for b in batches), len(expected))
+            self.assertEqual(expected,
+                             [values for batch in batches for values in batch])
+            for batch in batches:
+                self.assertEqual(batch.quals, "".join(q for t, s, q in batch))
+
+    def test_example(self):
+        """Batches from example.fastq"""
+        self.check(os.path.join("Quality", "example.fastq"))
+
+    def test_tricky(self):
+        """Batches from tricky.fastq (multi-line records)"""
+        self.check(os.path.join("Quality", "tricky.fastq"))
+
+    def test_blocks(self):
+        """Batches from small blocks, including multi-line and bad records"""
+        from Bio.SeqIO import _batch
+        for name in ["example.fastq", "tricky.fastq", "error_double_qual.fastq",
+                     "error_diff_ids.fastq", "error_trunc_at_qual.fastq"]:
+            filename = os.path.join("Quality", name)
+            with open(filename, "rU") as handle:
+                try:
+                    expected = list(QualityIO.FastqGeneralIterator(handle))
+                except ValueError:
+                    expected = ValueError
+            for block_size in [1, 7, 100]:
+                with open(filename, "rU") as handle:
+                    chunks = _batch._fastq_chunks(
+                        handle, QualityIO.FastqGeneralIterator, block_size)
+                    try:
+                        records = [values for batch
+                                   in _batch._batch_iterator(chunks, 2)
+                                   for values in batch]
+                    except ValueError:
+                        records = ValueError
+                self.assertEqual(expected, records, name)
+
+    def test_bad_batch_size(self):
+        """Batches need a positive batch size"""
+        batches = QualityIO.FastqBatchIterator(StringIO(""), 0)
+        self.assertRaises(ValueError, next, batches)
+
+    def test_arrays(self):
+        """Batch sequence and quality arrays"""
+        if numpy is None:
+            return
+        filename = os.path.join("Quality", "example.fastq")
+        with open(filename, "rU") as handle:
+            batch = next(QualityIO.FastqBatchIterator(handle))
+        with open(filename, "rU") as handle:
+            records = list(SeqIO.parse(handle, "fastq"))
+        quals = batch.qual_array()
+        self.assertEqual(quals.tolist(),
+                         sum((r.letter_annotations["phred_quality"]
+                              for r in records), []))
+        self.assertEqual(batch.seq_array().tobytes(),
+                         "".join(str(r.seq) for r in records).encode("ascii"))
+        self.assertRaises(ValueError, batch.qual_array, 64)
+
+
+class TestQualityArrays(unittest.TestCase):
+    """Check quality_array=True and the writers accepting NumPy arrays."""
+
+    iterators = {"fastq": QualityIO.FastqPhredIterator,
+                 "fastq-sanger": QualityIO.FastqPhredIterator,
+                 "fastq-solexa": QualityIO.FastqSolexaIterator,
+                 "fastq-illumina": QualityIO.FastqIlluminaIterator}
+
+    def check(self, filename, format):
+        with open(filename, "rU") as handle:
+            old = list(SeqIO.parse(handle, format))
+        with open(filename, "rU") as handle:
+            new = list(self.iterators[format](handle, quality_array=True))
+        self.assertEqual(len(old), len(new))
+        for old_r, new_r in zip(old, new):
+            self.assertEqual(old_r.id, new_r.id)
+            self.assertEqual(str(old_r.seq), str(new_r.seq))
+            for key, old_q in old_r.letter_annotations.items():
+                new_q = new_r.letter_annotations[key]
+                self.assertTrue(isinstance(new_q, numpy.ndarray))
+                if key == "solexa_quality":
+                    self.assertEqual(new_q.dtype, numpy.int8)
+                else:
+                    self.assertEqual(new_q.dtype, numpy.uint8)
+                self.assertEqual(old_q, new_q.tolist())
+        #Writing from the arrays must match writing from the lists
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonWarning)
+            for out_format in ["fastq", "fastq-illumina", "fastq-solexa", "qual"]:
+                old_handle = StringIO()
+                SeqIO.write(old, old_handle, out_format)
+                new_handle = StringIO()
+                SeqIO.write(new, new_handle, out_format)
+                self.assertEqual(old_handle.getvalue(), new_handle.getvalue(),
+                                 "%s to %s" % (filename, out_format))
+
+    def test_example(self):
+        """Quality arrays from example.fastq"""
+        self.check(os.path.join("Quality", "example.fastq"), "fastq")
+
+    def test_sanger_93(self):
+        """Quality arrays from sanger_93.fastq (truncated on output)"""
+        self.check(os.path.join("Quality", "sanger_93.fastq"), "fastq")
+
+    def test_sanger_faked(self):
+        """Quality arrays from sanger_faked.fastq"""
+        self.check(os.path.join("Quality", "sanger_faked.fastq"), "fastq-sanger")
+
+    def test_solexa_faked(self):
+        """Quality arrays from solexa_faked.fastq"""
+        self.check(os.path.join("Quality", "solexa_faked.fastq"), "fastq-solexa")
+
+    def test_illumina_faked(self):
+        """Quality arrays from illumina_faked.fastq"""
+        self.check(os.path.join("Quality", "illumina_faked.fastq"), "fastq-illumina")
+
+    def test_invalid(self):
+        """Quality arrays reject invalid characters"""
+        handle = StringIO("@Test\nACGT\n+\nII I\n")
+        records = QualityIO.FastqPhredIterator(handle, quality_array=True)
+        self.assertRaises(ValueError, next, records)
+        handle = StringIO("@Test\nACGT\n+\n;;;:\n")
+        records = QualityIO.FastqIlluminaIterator(handle, quality_array=True)
+        self.assertRaises(ValueError, next, records)
+
+    def test_truncation_warning(self):
+        """Writing integer arrays above the maximum gives a warning"""
+        record = SeqRecord(Seq("ACGT"), id="Test",
+                           letter_annotations={"phred_quality":
+                                               numpy.array([0, 40, 93, 100])})
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always", BiopythonWarning)
+            self.assertEqual(record.format("fastq"), "@Test <unknown description>\nACGT\n+\n!I~~\n")
+            self.assertEqual(len(w), 1)
+
+if numpy is None:
+    #NumPy is optional, so skip these tests
+    del TestQualityArrays
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity = 2)
     unittest.main(testRunner=runner)
@@ -120,6 +120,16 @@ class IndexDictTests(unittest.TestCase):
         rec_dict.close()
         del rec_dict
 
+        rec_dict = SeqIO.index(filename, format, alphabet, compact=True)
+        self.check_dict_methods(rec_dict, id_list, id_list)
+        rec_dict.close()
+        del rec_dict
+
+        rec_dict = SeqIO.index(filename, format, alphabet, use_mmap=True)
+        self.check_dict_methods(rec_dict, id_list, id_list)
+        rec_dict.close()
+        del rec_dict
+
         if not sqlite3:
             return
 
@@ -183,6 +193,12 @@ class IndexDictTests(unittest.TestCase):
         rec_dict.close()
         del rec_dict
 
+        rec_dict = SeqIO.index(filename, format, alphabet, add_prefix,
+                               compact=True)
+        self.check_dict_methods(rec_dict, key_list, id_list)
+        rec_dict.close()
+        del rec_dict
+
         if not sqlite3:
             return
 
@@ -239,8 +255,17 @@ class IndexDictTests(unittest.TestCase):
             self.assertTrue(key in rec_dict)
             self.assertEqual(id, rec_dict[key].id)
             self.assertEqual(id, rec_dict.get(key).id)
+        #Check batch retrieval, in the order requested and in file order
+        many = list(rec_dict.get_many(keys))
+        self.assertEqual(keys, [key for key, rec in many])
+        self.assertEqual(ids, [rec.id for key, rec in many])
+        many = list(rec_dict.get_many(reversed(keys), file_order=True))
+        self.assertEqual(sorted(keys), sorted(key for key, rec in many))
+        for key, rec in many:
+            self.assertEqual(ids[keys.index(key)], rec.id)
         #Check non-existant keys,
         assert chr(0) not in keys, "Bad example in test"
+        self.assertRaises(KeyError, list, rec_dict.get_many(keys + [chr(0)]))
         try:
             rec = rec_dict[chr(0)]
             raise ValueError("Accessing a non-existent key should fail")
@@ -248,6 +273,11 @@ class IndexDictTests(unittest.TestCase):
             pass
         self.assertEqual(rec_dict.get(chr(0)), None)
         self.assertEqual(rec_dict.get(chr(0), chr(1)), chr(1))
+        #Keys which are not strings are simply missing
+        for key in [5, None]:
+            self.assertFalse(key in rec_dict)
+            self.assertRaises(KeyError, rec_dict.__getitem__, key)
+            self.assertEqual(rec_dict.get(key), None)
         if hasattr(dict, "iteritems"):
             #Python 2.x
             for key, rec in rec_dict.items():
@@ -348,6 +378,25 @@ class IndexDictTests(unittest.TestCase):
             else:
                 rec2 = SeqIO.read(handle, format, alphabet)
             self.assertEqual(True, compare_record(rec1, rec2))
+        #Check batch retrieval of the raw records
+        self.assertEqual([(key, rec_dict.get_raw(key)) for key in id_list],
+                         list(rec_dict.get_raw_many(id_list)))
+        #Check memory mapped raw records (may be zero-copy views)
+        if format in ["sff"]:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', BiopythonParserWarning)
+                mapped = SeqIO.index(filename, format, alphabet,
+                                     key_function=lambda x: x.lower(),
+                                     use_mmap=True)
+        else:
+            mapped = SeqIO.index(filename, format, alphabet,
+                                 key_function=lambda x: x.lower(),
+                                 use_mmap=True)
+        for key in id_list:
+            raw = mapped.get_raw(key)
+            self.assertEqual(rec_dict.get_raw(key), bytes(raw))
+            del raw
+        mapped.close()
         rec_dict.close()
         del rec_dict
 
@@ -357,6 +406,131 @@ class IndexDictTests(unittest.TestCase):
             self.assertRaises(ValueError, SeqIO.index_db, ":memory:",
                               ["Fasta/dups.fasta"], "fasta")
 
+        def test_duplicates_index_db_processes(self):
+            """Index files with duplicate identifers in parallel with Bio.SeqIO.index_db()"""
+            self.assertRaises(ValueError, SeqIO.index_db, ":memory:",
+                              ["Fasta/dups.fasta", "Fasta/f002"], "fasta",
+                              processes=2)
+
+        def test_index_db_processes(self):
+            """Index several files in parallel with Bio.SeqIO.index_db()"""
+            files = ["GenBank/NC_000932.faa", "GenBank/NC_005816.faa",
+                     "SwissProt/multi_ex.fasta"]
+            serial = SeqIO.index_db(":memory:", files, "fasta",
+                                    key_function=add_prefix)
+            os.remove(self.index_tmp)
+            parallel = SeqIO.index_db(self.index_tmp, files, "fasta",
+                                      key_function=add_prefix, processes=2)
+            self.assertEqual(len(serial), len(parallel))
+            self.assertEqual(sorted(serial.keys()), sorted(parallel.keys()))
+            for key in serial:
+                self.assertEqual(serial.get_raw(key), parallel.get_raw(key))
+                self.assertEqual(serial[key].id, parallel[key].id)
+            self.assertEqual(serial._filenames, parallel._filenames)
+            serial.close()
+            parallel.close()
+            parallel._con.close()  # hack for PyPy
+            #Reload it...
+            parallel = SeqIO.index_db(self.index_tmp, files,
+                                      key_function=add_prefix)
+            self.assertEqual(len(serial), len(parallel))
+            parallel.close()
+            parallel._con.close()  # hack for PyPy
+
+        def test_index_db_update(self):
+            """Update an index after adding, changing and removing files"""
+            tmp_dir = tempfile.mkdtemp()
+            names = []
+            for i, source in enumerate(["GenBank/NC_000932.faa",
+                                        "GenBank/NC_005816.faa",
+                                        "Fasta/f002"]):
+                names.append(os.path.join(tmp_dir, "%i.fasta" % i))
+                with open(source, "rb") as in_handle:
+                    with open(names[-1], "wb") as out_handle:
+                        out_handle.write(in_handle.read())
+            os.remove(self.index_tmp)
+            try:
+                d = SeqIO.index_db(self.index_tmp, names[:2], "fasta")
+                self.assertEqual(95, len(d))
+                d.close()
+                d._con.close()  # hack for PyPy
+                #Add a file, and drop one
+                d = SeqIO.index_db(self.index_tmp, names[1:], "fasta",
+                                   update=True)
+                self.assertEqual(10 + 3, len(d))
+                self.assertEqual(names[1:], d._filenames)
+                self.assertTrue("gi|45478717|ref|NP_995572.1|" in d)
+                self.assertFalse("gi|7525076|ref|NP_051101.1|" in d)
+                self.assertEqual("gi|1348917|gb|G26685|G26685", d["gi|1348917|gb|G26685|G26685"].id)
+                d.close()
+                d._con.close()  # hack for PyPy
+                #Change a file, a warning unless updating
+                with open(names[1], "ab") as handle:
+                    handle.write(_as_bytes(">extra\nACGT\n"))
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter("always")
+                    d = SeqIO.index_db(self.index_tmp, names[1:], "fasta")
+                    self.assertEqual(1, len(w))
+                self.assertEqual(13, len(d))
+                d.close()
+                d._con.close()  # hack for PyPy
+                d = SeqIO.index_db(self.index_tmp, update=True)
+                self.assertEqual(14, len(d))
+                self.assertEqual("ACGT", str(d["extra"].seq))
+                d.close()
+                d._con.close()  # hack for PyPy
+                #Duplicate keys leave the index untouched
+                self.assertRaises(ValueError, SeqIO.index_db, self.index_tmp,
+                                  names[1:] + [names[1]], "fasta", update=True)
+                d = SeqIO.index_db(self.index_tmp, names[1:], "fasta")
+                self.assertEqual(14, len(d))
+                d.close()
+                d._con.close()  # hack for PyPy
+            finally:
+                for name in names:
+                    os.remove(name)
+                os.rmdir(tmp_dir)
+
+    def parallel_check(self, filename, format, alphabet, comp):
+        """Check SeqIO.parse with processes matches plain parsing."""
+        if comp:
+            h = gzip_open(filename, format)
+            expected = list(SeqIO.parse(h, format, alphabet))
+            h.close()
+        else:
+            expected = list(SeqIO.parse(filename, format, alphabet))
+        expected = [(r.id, str(r.seq), r.letter_annotations) for r in expected]
+        old_size = SeqIO._PARALLEL_CHUNK_SIZE
+        try:
+            for size in [old_size, 1]:
+                #A size of 1 means one record per chunk
+                SeqIO._PARALLEL_CHUNK_SIZE = size
+                records = [(r.id, str(r.seq), r.letter_annotations) for r in
+                           SeqIO.parse(filename, format, alphabet, processes=2)]
+                self.assertEqual(expected, records)
+                records = [(r.id, str(r.seq), r.letter_annotations) for r in
+                           SeqIO.parse(filename, format, alphabet, processes=3,
+                                       ordered=False)]
+                self.assertEqual(sorted(expected), sorted(records))
+        finally:
+            SeqIO._PARALLEL_CHUNK_SIZE = old_size
+
+    def test_parallel_errors(self):
+        """Parsing with processes needs a filename and suitable format"""
+        handle = open("Fasta/dups.fasta")
+        self.assertRaises(ValueError, list,
+                          SeqIO.parse(handle, "fasta", processes=2))
+        handle.close()
+        self.assertRaises(ValueError, list,
+                          SeqIO.parse("SwissProt/multi_ex.xml", "uniprot-xml",
+                                      processes=2))
+        #Errors parsing a chunk are raised in this process
+        for ordered in [True, False]:
+            self.assertRaises(ValueError, list,
+                              SeqIO.parse("Quality/error_diff_ids.fastq",
+                                          "fastq", processes=2,
+                                          ordered=ordered))
+
     def test_duplicates_index(self):
         """Index file with duplicate identifers with Bio.SeqIO.index()"""
         self.assertRaises(ValueError, SeqIO.index, "Fasta/dups.fasta", "fasta")
@@ -455,6 +629,18 @@ for filename, format, alphabet in tests:
                 funct(filename, format, alphabet, comp))
         del funct
 
+        if format in SeqIO._ParallelUnsupported:
+            continue
+
+        def funct(fn, fmt, alpha, c):
+            f = lambda x : x.parallel_check(fn, fmt, alpha, c)
+            f.__doc__ = "Parse %s file %s with processes" % (fmt, fn)
+            return f
+        setattr(IndexDictTests, "test_%s_%s_parallel"
+                    % (format, filename.replace("/", "_").replace(".", "_")),
+                funct(filename, format, alphabet, comp))
+        del funct
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity = 2)
     unittest.main(testRunner=runner)
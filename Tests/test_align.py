@@ -168,6 +168,87 @@ print(alignment.format("fasta"))
 print("As Clustal:")
 print(alignment.format("clustal"))
 
+#Check the NumPy column counts give the same summaries as the loops
+if AlignInfo.numpy is not None:
+    def summaries(alignment, e_freq_table=None):
+        info = AlignInfo.SummaryInfo(alignment)
+        pssm = info.pos_specific_score_matrix(chars_to_ignore=['N'])
+        return (str(info.dumb_consensus(ambiguous="N", threshold=0.6)),
+                str(info.gap_consensus(require_multiple=1)),
+                [(pssm.get_residue(i), pssm[i]) for i in range(len(pssm.pssm))],
+                round(info.information_content(chars_to_ignore=['N']), 8),
+                round(info.information_content(3, 40, e_freq_table, 10,
+                                               chars_to_ignore=['N']), 8),
+                sorted((k, round(v, 8)) for k, v in info.ic_vector.items()))
+
+    alignment = AlignIO.read(os.path.join(os.curdir, 'Clustalw', 'opuntia.aln'),
+                             'clustal', alphabet=Alphabet.Gapped(IUPAC.unambiguous_dna))
+    alignment.append(SeqRecord(Seq("N" * 20 + "-" * 136, alignment._alphabet),
+                               id="partial", annotations={"weight": 0.5}))
+    alignment[0].annotations["weight"] = 2.5
+    codes = alignment.get_char_array()
+    assert codes.shape == (len(alignment), alignment.get_alignment_length())
+    assert "".join(map(chr, codes[-1, :21])) == "N" * 20 + "-"
+    assert "".join(map(chr, codes[1])) == str(alignment[1].seq)
+    for table in [None, e_freq_table]:
+        expected = summaries(alignment, table)
+        AlignInfo.numpy, numpy = None, AlignInfo.numpy
+        try:
+            assert summaries(alignment, table) == expected
+        finally:
+            AlignInfo.numpy = numpy
+
+    #Check the ArrayAlignment matches the MultipleSeqAlignment
+    import tempfile
+    from Bio.Align import ArrayAlignment
+    handle, filename = tempfile.mkstemp()
+    os.close(handle)
+    array_align = ArrayAlignment.from_records(iter(alignment), filename=filename)
+    assert isinstance(array_align.get_char_array(), numpy.memmap)
+    assert summaries(array_align, e_freq_table) == expected
+    assert array_align.format("fasta") == alignment.format("fasta")
+    assert str(array_align) == str(alignment)
+    assert array_align[-1].annotations["weight"] == 0.5
+    assert array_align[:, 7] == alignment[:, 7]
+    assert array_align[2:5, -3] == alignment[2:5, -3]
+    assert array_align[3, 9] == alignment[3, 9]
+    assert str(array_align[3, 5:9].seq) == str(alignment[3, 5:9].seq)
+    sub_align = array_align[1::2, 20:30]
+    assert isinstance(sub_align, ArrayAlignment)
+    assert sub_align.format("fasta") == alignment[1::2, 20:30].format("fasta")
+    #The sub-alignment is a view of the same letters
+    assert numpy.may_share_memory(sub_align.get_char_array(),
+                                  array_align.get_char_array())
+    sub_align.sort(key=lambda record: str(record.seq))
+    alignment.sort(key=lambda record: str(record.seq))
+    array_align.sort(key=lambda record: str(record.seq))
+    assert array_align.format("fasta") == alignment.format("fasta")
+    array_align.extend(alignment[:2])
+    array_align.append(alignment[0])
+    assert len(array_align) == len(alignment) + 3
+    assert array_align[-1].id == alignment[0].id
+    assert str(array_align[-2].seq) == str(alignment[1].seq)
+    try:
+        array_align.append(alignment[0, :10])
+        assert False, "Should reject a shorter sequence"
+    except ValueError:
+        pass
+    del array_align, sub_align
+    os.remove(filename)
+
+    #Editing the records changes the summaries of an existing SummaryInfo
+    info = AlignInfo.SummaryInfo(alignment)
+    before = summaries(alignment)
+    info.pos_specific_score_matrix(chars_to_ignore=['N'])
+    alignment[0].annotations["weight"] = 7.0
+    alignment[1].seq = Seq("T" * alignment.get_alignment_length(),
+                           alignment._alphabet)
+    assert summaries(alignment) != before
+    assert str(info.pos_specific_score_matrix(chars_to_ignore=['N'])) == \
+        str(AlignInfo.SummaryInfo(alignment).pos_specific_score_matrix(
+            chars_to_ignore=['N']))
+    del alignment, codes, numpy, info, before
+
 """
 # test to find a position in an original sequence given a
 # column position in an alignment
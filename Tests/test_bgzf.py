@@ -51,12 +51,12 @@ class BgzfTests(unittest.TestCase):
         if os.path.isfile(self.temp_file):
             os.remove(self.temp_file)
 
-    def rewrite(self, compressed_input_file, output_file):
+    def rewrite(self, compressed_input_file, output_file, threads=None):
         h = gzip.open(compressed_input_file, "rb")
         data = h.read()
         h.close()
 
-        h = bgzf.BgzfWriter(output_file, "wb")
+        h = bgzf.BgzfWriter(output_file, "wb", threads=threads)
         h.write(data)
         self.assertFalse(h.seekable())
         self.assertFalse(h.isatty())
@@ -97,7 +97,7 @@ class BgzfTests(unittest.TestCase):
         self.assertEqual(len(old), len(new))
         self.assertEqual(old, new)
 
-    def check_by_line(self, old_file, new_file, old_gzip=False):
+    def check_by_line(self, old_file, new_file, old_gzip=False, threads=None):
         for mode in ["r", "rb"]:
             if old_gzip:
                 h = gzip.open(old_file, mode)
@@ -113,7 +113,8 @@ class BgzfTests(unittest.TestCase):
             h.close()
 
             for cache in [1, 10]:
-                h = bgzf.BgzfReader(new_file, mode, max_cache=cache)
+                h = bgzf.BgzfReader(new_file, mode, max_cache=cache,
+                                    threads=threads)
                 if "b" in mode:
                     new = _empty_bytes_string.join(line for line in h)
                 else:
@@ -161,7 +162,7 @@ class BgzfTests(unittest.TestCase):
                                  "%r vs %r, mode %r" % (old[:10], new[:10], mode))
                 self.assertEqual(old, new)
 
-    def check_random(self, filename):
+    def check_random(self, filename, threads=None):
         """Check BGZF random access by reading blocks in forward & reverse order"""
         h = gzip.open(filename, "rb")
         old = h.read()
@@ -173,7 +174,7 @@ class BgzfTests(unittest.TestCase):
 
         #Forward
         new = _empty_bytes_string
-        h = bgzf.BgzfReader(filename, "rb")
+        h = bgzf.BgzfReader(filename, "rb", threads=threads)
         self.assertTrue(h.seekable())
         self.assertFalse(h.isatty())
         self.assertEqual(h.fileno(), h._handle.fileno())
@@ -190,7 +191,7 @@ class BgzfTests(unittest.TestCase):
 
         #Reverse
         new = _empty_bytes_string
-        h = bgzf.BgzfReader(filename, "rb")
+        h = bgzf.BgzfReader(filename, "rb", threads=threads)
         for start, raw_len, data_start, data_len in blocks[::-1]:
             h.seek(bgzf.make_virtual_offset(start, 0))
             data = h.read(data_len)
@@ -203,7 +204,7 @@ class BgzfTests(unittest.TestCase):
 
         #Jump back - non-sequential seeking
         if len(blocks) >= 3:
-            h = bgzf.BgzfReader(filename, "rb", max_cache = 1)
+            h = bgzf.BgzfReader(filename, "rb", max_cache = 1, threads=threads)
             #Seek to a late block in the file,
             #half way into the third last block
             start, raw_len, data_start, data_len = blocks[-3]
@@ -236,7 +237,7 @@ class BgzfTests(unittest.TestCase):
                 real_offset = data_start + within_offset
                 v_offsets.append((voffset, real_offset))
         shuffle(v_offsets)
-        h = bgzf.BgzfReader(filename, "rb", max_cache = 1)
+        h = bgzf.BgzfReader(filename, "rb", max_cache = 1, threads=threads)
         for voffset, real_offset in v_offsets:
             h.seek(0)
             self.assertTrue(voffset >= 0 and real_offset >= 0)
@@ -247,6 +248,71 @@ class BgzfTests(unittest.TestCase):
             self.assertEqual(h.tell(), voffset)
         h.close()
 
+    def check_gzi(self, filename):
+        """Check the .gzi block index against BgzfBlocks and gzip"""
+        h = gzip.open(filename, "rb")
+        old = h.read()
+        h.close()
+
+        h = open(filename, "rb")
+        blocks = list(bgzf.BgzfBlocks(h))
+        h.seek(0)
+        index = bgzf.make_gzi_index(h)
+        h.close()
+        expected = [(start + raw_len, data_start + data_len)
+                    for start, raw_len, data_start, data_len in blocks
+                    if data_len]
+        self.assertEqual(index, expected)
+        self.assertEqual(index[-1][1], len(old))
+
+        #Round trip via a .gzi file
+        h = open(self.temp_file, "wb")
+        bgzf.write_gzi(h, index)
+        h.close()
+        self.assertEqual(os.path.getsize(self.temp_file), 8 + 16 * len(index))
+        h = open(self.temp_file, "rb")
+        self.assertEqual(bgzf.read_gzi(h), index)
+        h.close()
+
+        offsets = [0, 1, len(old) // 3, len(old) - 1, len(old)]
+        offsets.extend(u for c, u in index)
+        for gzi in [None, self.temp_file, index]:
+            h = bgzf.BgzfReader(filename, "rb", max_cache=1, gzi=gzi)
+            self.assertEqual(h.gzi_index(), index)
+            shuffle(offsets)
+            for offset in offsets:
+                voffset = h.seek_uncompressed(offset)
+                self.assertEqual(voffset, h.virtual_offset(offset))
+                self.assertEqual(h.read(100), old[offset:offset + 100])
+            self.assertRaises(ValueError, h.virtual_offset, -1)
+            self.assertRaises(ValueError, h.virtual_offset, len(old) + 1)
+            h.close()
+
+    def test_gzi_bam_ex1(self):
+        """Check .gzi block index of SamBam/ex1.bam"""
+        self.check_gzi("SamBam/ex1.bam")
+
+    def test_gzi_example_fastq(self):
+        """Check .gzi block index of Quality/example.fastq.bgz"""
+        self.check_gzi("Quality/example.fastq.bgz")
+
+    def test_gzi_example_gb(self):
+        """Check .gzi block index of GenBank/NC_000932.gb.bgz"""
+        self.check_gzi("GenBank/NC_000932.gb.bgz")
+
+    def test_lru_cache(self):
+        """Check least recently used BGZF blocks are dropped from the cache"""
+        h = open("SamBam/ex1.bam", "rb")
+        starts = [values[0] for values in bgzf.BgzfBlocks(h)]
+        h.close()
+        h = bgzf.BgzfReader("SamBam/ex1.bam", "rb", max_cache=2)
+        h.seek(bgzf.make_virtual_offset(starts[1], 0))
+        #Touch the first block again, so the second is the oldest
+        h.seek(bgzf.make_virtual_offset(starts[0], 0))
+        h.seek(bgzf.make_virtual_offset(starts[2], 0))
+        self.assertEqual(list(h._buffers), [starts[0], starts[2]])
+        h.close()
+
     def test_random_bam_ex1(self):
         """Check random access to SamBam/ex1.bam"""
         self.check_random("SamBam/ex1.bam")
@@ -275,6 +341,14 @@ class BgzfTests(unittest.TestCase):
         """Check random access to GenBank/cor6_6.gb.bgz"""
         self.check_random("GenBank/cor6_6.gb.bgz")
 
+    def test_random_threads_bam_ex1(self):
+        """Check random access to SamBam/ex1.bam using threads"""
+        self.check_random("SamBam/ex1.bam", threads=3)
+
+    def test_random_threads_example_cor6(self):
+        """Check random access to GenBank/cor6_6.gb.bgz using threads"""
+        self.check_random("GenBank/cor6_6.gb.bgz", threads=2)
+
     def test_text_wnts_xml(self):
         """Check text mode access to Blast/wnts.xml.bgz"""
         self.check_text("Blast/wnts.xml", "Blast/wnts.xml.bgz")
@@ -303,6 +377,11 @@ class BgzfTests(unittest.TestCase):
         self.check_by_line("GenBank/NC_000932.gb", "GenBank/NC_000932.gb.bgz")
         self.check_by_char("GenBank/NC_000932.gb", "GenBank/NC_000932.gb.bgz")
 
+    def test_iter_threads_example_gb(self):
+        """Check iteration over GenBank/NC_000932.gb.bgz using threads"""
+        self.check_by_line("GenBank/NC_000932.gb", "GenBank/NC_000932.gb.bgz",
+                           threads=4)
+
     def test_bam_ex1(self):
         """Reproduce BGZF compression for BAM file"""
         temp_file = self.temp_file
@@ -319,6 +398,12 @@ class BgzfTests(unittest.TestCase):
         """Check iteration over SamBam/ex1.bam"""
         self.check_by_char("SamBam/ex1.bam", "SamBam/ex1.bam", True)
 
+    def test_threads_bam_ex1(self):
+        """Reproduce BGZF compression for BAM file using threads"""
+        temp_file = self.temp_file
+        self.rewrite("SamBam/ex1.bam", temp_file, threads=3)
+        self.check_blocks("SamBam/ex1.bam", temp_file)
+
     def test_example_fastq(self):
         """Reproduce BGZF compression for a FASTQ file"""
         temp_file = self.temp_file
@@ -345,9 +430,16 @@ class BgzfTests(unittest.TestCase):
 
     def test_write_tell(self):
         """Check offset works during BGZF writing"""
+        self.check_write_tell()
+
+    def test_write_tell_threads(self):
+        """Check offset works during BGZF writing using threads"""
+        self.check_write_tell(threads=2)
+
+    def check_write_tell(self, threads=None):
         temp_file = self.temp_file
 
-        h = bgzf.open(temp_file, "w") #Text mode!
+        h = bgzf.open(temp_file, "w", threads=threads) #Text mode!
         #When opening new file, offset should be 0
         self.assertEqual(h.tell(), 0)
         
@@ -380,7 +472,7 @@ class BgzfTests(unittest.TestCase):
         
         h.close()
 
-        h = bgzf.open(temp_file, "r") #Text mode!
+        h = bgzf.open(temp_file, "r", threads=threads) #Text mode!
 
         h.seek(offset) #i.e. End of first BGZF block
         self.assertEqual(offset1, h.tell()) #Note *not* seek offset
@@ -5,12 +5,20 @@
 # as part of this package.
 
 import os
+import shutil
+import tempfile
 import unittest
 
 from Bio.Alphabet import IUPAC
 from Bio import motifs
 from Bio.motifs.matrix import _isnan
 from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class MotifTestsBasic(unittest.TestCase):
@@ -1659,6 +1667,181 @@ class MotifTestPWM(unittest.TestCase):
         self.assertAlmostEqual(result[5], -25.18009186, places=5)
         self.assertTrue(_isnan(result[6]), "Expected nan, not %r" % result[6])
 
+    def test_search(self):
+        """Test searching with a PSSM on both strands."""
+        pssm = self.m.counts.normalize(pseudocounts=0.25).log_odds()
+        seq = Seq("ACGTGTGCGTAGTGCGTGCCCATATATGGTTCCATAAATGGGCA"
+                  "GCCCATNTATGGgcccttatatgg", IUPAC.ambiguous_dna)
+        n = len(seq)
+        rc = pssm.reverse_complement()
+        expected = []
+        for position in range(n - pssm.length + 1):
+            window = str(seq[position:position + pssm.length]).upper()
+            if "N" in window:
+                continue
+            window = Seq(window, self.m.alphabet)
+            for score, hit in [(pssm.calculate(window), position),
+                               (rc.calculate(window), position - n)]:
+                if score > 5.0:
+                    expected.append((hit, score))
+        self.assertEqual([e[0] for e in expected], [17, -49, 29, -37, 56])
+        for chunksize in [1, 5, 1000]:
+            hits = list(pssm.search(seq, threshold=5.0, chunksize=chunksize))
+            self.assertEqual([h[0] for h in hits], [e[0] for e in expected])
+            for (position, score), (pos, expected_score) in zip(hits, expected):
+                self.assertAlmostEqual(score, expected_score, places=5)
+        hits = list(pssm.search(str(seq), threshold=5.0, both=False))
+        self.assertEqual([h[0] for h in hits],
+                         [e[0] for e in expected if e[0] >= 0])
+
+    def test_search_wrong_alphabet(self):
+        """Test searching a protein sequence with a PSSM fails."""
+        pssm = self.m.counts.normalize(pseudocounts=0.25).log_odds()
+        seq = Seq("ACGTGTGCGTAGTGCGT", IUPAC.protein)
+        self.assertRaises(ValueError, list, pssm.search(seq))
+
+
+class ScoreDistributionTests(unittest.TestCase):
+    def setUp(self):
+        with open("motifs/SRF.pfm") as handle:
+            motif = motifs.read(handle, "pfm")
+        motif.pseudocounts = 0.25
+        self.background = {"A": 0.3, "C": 0.2, "G": 0.2, "T": 0.3}
+        self.pssm = motif.pssm
+
+    def test_numpy(self):
+        """Test the NumPy and pure Python distributions agree."""
+        from Bio.motifs import thresholds
+        if thresholds.numpy is None:
+            return
+        fast = self.pssm.distribution(self.background, precision=100)
+        try:
+            thresholds.numpy = None
+            slow = self.pssm.distribution(self.background, precision=100)
+        finally:
+            thresholds.numpy = numpy
+        self.assertEqual(fast.n_points, slow.n_points)
+        for a, b in zip(fast.mo_density, slow.mo_density):
+            self.assertAlmostEqual(a, b, places=12)
+        for a, b in zip(fast.bg_density, slow.bg_density):
+            self.assertAlmostEqual(a, b, places=12)
+        self.assertAlmostEqual(fast.threshold_fpr(0.01),
+                               slow.threshold_fpr(0.01))
+
+    def test_pvalue(self):
+        """Test p-values and thresholds from the score distribution."""
+        distribution = self.pssm.distribution(self.background)
+        for pvalue in [0.5, 0.1, 0.01, 1e-4, 1e-6]:
+            threshold = distribution.threshold_pvalue(pvalue)
+            self.assertEqual(threshold, distribution.threshold_fpr(pvalue))
+            self.assertTrue(distribution.pvalue(threshold) >= pvalue)
+            self.assertTrue(distribution.pvalue(threshold + distribution.step)
+                            < pvalue)
+        self.assertAlmostEqual(distribution.pvalue(self.pssm.min - 1), 1.0)
+        self.assertEqual(distribution.pvalue(self.pssm.max + 1), 0.0)
+
+    def test_cache(self):
+        """Test saving and loading the score distribution."""
+        cache = tempfile.mkdtemp()
+        try:
+            first = self.pssm.distribution(self.background, cache=cache)
+            self.assertEqual(len(os.listdir(cache)), 1)
+            second = self.pssm.distribution(self.background, cache=cache)
+            self.assertEqual(list(first.bg_density), list(second.bg_density))
+            self.assertEqual(list(first.mo_density), list(second.mo_density))
+            self.assertEqual(first.threshold_patser(),
+                             second.threshold_patser())
+            #A different background needs a different distribution
+            self.pssm.distribution(cache=cache)
+            self.assertEqual(len(os.listdir(cache)), 2)
+        finally:
+            shutil.rmtree(cache)
+
+
+class MotifScannerTests(unittest.TestCase):
+    def setUp(self):
+        from Bio.motifs.scanner import MotifScanner
+        self.MotifScanner = MotifScanner
+        self.motifs = []
+        for filename in ["motifs/SRF.pfm", "motifs/REB1.pfm"]:
+            with open(filename) as handle:
+                motif = motifs.read(handle, "pfm")
+            motif.pseudocounts = 0.25
+            self.motifs.append(motif)
+        motif = motifs.read(open("motifs/Arnt.sites"), "sites")
+        motif.pseudocounts = 0.5
+        motif.background = 0.4
+        self.motifs.append(motif)
+        self.seq = Seq("ACGTGTGCGTAGTGCGTGCCCATATATGGTTCCATAAATGGGCACACGTGA"
+                       "GCCCATNTATGGgcccttatatggGTTACCCGGNCCGGGTAACCACGTG",
+                       IUPAC.ambiguous_dna)
+
+    def expected_hits(self, threshold, both=True):
+        n = len(self.seq)
+        hits = []
+        for index, motif in enumerate(self.motifs):
+            for position, score in motif.pssm.search(self.seq, threshold,
+                                                     both):
+                if position < 0:
+                    hits.append((position + n, index, 1, -1, score))
+                else:
+                    hits.append((position, index, 0, 1, score))
+        hits.sort()
+        return [(index, position, strand, score)
+                for position, index, order, strand, score in hits]
+
+    def test_search(self):
+        """Test the scanner gives the same hits as each PSSM."""
+        from Bio.motifs import scanner
+        for threshold in [-5.0, 0.0, 5.0]:
+            for both in [True, False]:
+                expected = self.expected_hits(threshold, both)
+                self.assertTrue(expected)
+                motif_scanner = self.MotifScanner(self.motifs, threshold,
+                                                  both=both)
+                self.assertEqual(motif_scanner.ids, [0, 1, 2])
+                self.assertEqual(motif_scanner.search(self.seq), expected)
+                #Try scanning in very small pieces
+                cells = scanner._SCAN_CELLS
+                try:
+                    scanner._SCAN_CELLS = 5
+                    self.assertEqual(motif_scanner.search(self.seq), expected)
+                finally:
+                    scanner._SCAN_CELLS = cells
+
+    def test_scan(self):
+        """Test scanning records, with and without a process pool."""
+        motif_scanner = self.MotifScanner({"SRF": self.motifs[0],
+                                           "REB1": self.motifs[1],
+                                           "Arnt": self.motifs[2]}, 2.0)
+        self.assertEqual(motif_scanner.ids, ["Arnt", "REB1", "SRF"])
+        records = [SeqRecord(self.seq, id="alpha"),
+                   SeqRecord(Seq("ACGT"), id="beta"),
+                   SeqRecord(self.seq[10:], id="gamma")]
+        hits = list(motif_scanner.scan(records))
+        self.assertEqual(set(hit[1] for hit in hits), set(["alpha", "gamma"]))
+        self.assertEqual([hit[2:4] for hit in hits if hit[0] == "SRF"],
+                         [(17, 1), (19, -1), (29, 1), (31, -1), (63, 1),
+                          (65, -1), (7, 1), (9, -1), (19, 1), (21, -1),
+                          (53, 1), (55, -1)])
+        #The last record is the first with ten letters removed
+        self.assertEqual([(m, "gamma", p - 10, strand, score)
+                          for m, r, p, strand, score in hits if p >= 10
+                          and r == "alpha"],
+                         [hit for hit in hits if hit[1] == "gamma"])
+        self.assertEqual(list(motif_scanner.scan(iter(records), processes=2)),
+                         hits)
+
+    def test_fpr(self):
+        """Test thresholds from the score distribution."""
+        motif_scanner = self.MotifScanner(self.motifs, fpr=0.01)
+        for motif, threshold in zip(self.motifs, motif_scanner.thresholds):
+            distribution = motif.pssm.distribution(background=motif.background)
+            self.assertAlmostEqual(threshold, distribution.threshold_fpr(0.01))
+
+if numpy is None:
+    del MotifScannerTests
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity = 2)
@@ -428,6 +428,145 @@ AAAABBBAAAACCCCCCCCCCCCCCAAAABBBAAAA
 """)
 
 
+class TestPairwiseScoreOnly(unittest.TestCase):
+    """Check the linear memory score only code gives the full matrix score."""
+
+    def check(self, function, seqA, seqB, *args, **keywds):
+        aligns = function(seqA, seqB, *args, **keywds)
+        score = function(seqA, seqB, *args, score_only=True, **keywds)
+        self.assertAlmostEqual(score, max(a[2] for a in aligns))
+        # Try both ways round, as only the shorter sequence is stored
+        for a, b in [(seqA, seqB), (seqB, seqA)]:
+            # The generic code builds the whole matrix
+            generic = function(a, b, *args, score_only=True,
+                               force_generic=True, **keywds)
+            score = function(a, b, *args, score_only=True, **keywds)
+            self.assertAlmostEqual(score, generic)
+
+    def test_globalxx(self):
+        self.check(pairwise2.align.globalxx, "GAACT", "GAT")
+
+    def test_localms(self):
+        self.check(pairwise2.align.localms, "AxBxCCDzz", "zABCCz",
+                   2, -1, -1.5, -0.2)
+
+    def test_globalds_end_gaps(self):
+        match_dict = {("A", "A"): 1.5, ("A", "T"): 0.5, ("T", "A"): -1,
+                      ("T", "T"): 1.0}
+        self.check(pairwise2.align.globalds, "ATAAT", "TAT", match_dict,
+                   -1, -0.1, penalize_end_gaps=(False, True))
+        self.check(pairwise2.align.globalds, "ATAAT", "TAT", match_dict,
+                   -1, -0.1, penalize_extend_when_opening=True)
+
+    def test_globalmd(self):
+        self.check(pairwise2.align.globalmd, "GAACTTTTGCA", "GATTCA",
+                   2, -1, -3, -0.1, -1, -0.5)
+
+    def test_lists(self):
+        self.check(pairwise2.align.globalms, ["Gly", "Ala", "Thr"],
+                   ["Gly", "Thr"], 1, 0, -0.5, -0.1, gap_char=["-"])
+
+
+class TestPairwiseBanded(unittest.TestCase):
+    """Check alignments restricted to a band around the diagonal."""
+
+    seqA = "AAAAAAAAAACCCCCCCCCC"
+    seqB = "CCCCCCCCCCAAAAAAAAAA"
+
+    def test_wide_band(self):
+        """A band covering the whole matrix makes no difference."""
+        for function, args in [(pairwise2.align.globalms, (2, -1, -2, -0.5)),
+                               (pairwise2.align.localms, (2, -1, -2, -0.5)),
+                               (pairwise2.align.globalxx, ())]:
+            full = sorted(function("GAACTTGCA", "GATCAGC", *args))
+            banded = sorted(function("GAACTTGCA", "GATCAGC", *args, band=9))
+            self.assertEqual(full, banded)
+            generic = sorted(function("GAACTTGCA", "GATCAGC", *args, band=9,
+                                      force_generic=True))
+            self.assertEqual(full, generic)
+
+    def test_narrow_band(self):
+        """A narrow band stops the shifted alignment being found."""
+        aligns = pairwise2.align.localms(self.seqA, self.seqB, 1, -1, -1, -1)
+        self.assertEqual(aligns[0][2], 10)
+        for force_generic in [False, True]:
+            aligns = pairwise2.align.localms(self.seqA, self.seqB, 1, -1,
+                                             -1, -1, band=3,
+                                             force_generic=force_generic)
+            for seq1, seq2, score, begin, end in aligns:
+                self.assertEqual(score, 3)
+                self.assertTrue(seq1.count("-") <= 3)
+                self.assertTrue(seq2.count("-") <= 3)
+            score = pairwise2.align.localms(self.seqA, self.seqB, 1, -1,
+                                            -1, -1, band=3, score_only=True,
+                                            force_generic=force_generic)
+            self.assertEqual(score, 3)
+
+    def test_band_widened(self):
+        """A zero band still allows a global alignment of different lengths."""
+        aligns = pairwise2.align.globalms("ACCGGT", "ACGT", 1, 0, -1, 0,
+                                          band=0)
+        self.assertTrue(aligns)
+        for seq1, seq2, score, begin, end in aligns:
+            self.assertEqual(seq1, "ACCGGT")
+            self.assertEqual(seq2.replace("-", ""), "ACGT")
+            self.assertEqual(score, 3)
+        score = pairwise2.align.globalms("ACCGGT", "ACGT", 1, 0, -1, 0,
+                                         band=0, score_only=True)
+        self.assertEqual(score, 3)
+
+    def test_negative_band(self):
+        self.assertRaises(ValueError, pairwise2.align.globalxx,
+                          "ACGT", "ACGT", band=-1)
+
+
+class TestPairwiseBatch(unittest.TestCase):
+    """Check aligning one sequence against many targets."""
+
+    match_dict = {("A", "A"): 1.5, ("A", "T"): 0.5, ("T", "A"): -1,
+                  ("T", "T"): 1.0}
+    targets = ["TAT", "ATAATTTA", "", "A", "TTTTAAAATTTT"]
+
+    def check(self, function, *args, **keywds):
+        expected = [function("ATAAT", t, *args, **keywds)
+                    for t in self.targets]
+        batch = function.batch("ATAAT", iter(self.targets), *args, **keywds)
+        self.assertEqual(list(batch), expected)
+        batch = function.batch("ATAAT", self.targets, processes=2,
+                               *args, **keywds)
+        self.assertEqual(list(batch), expected)
+
+    def test_localds(self):
+        self.check(pairwise2.align.localds, self.match_dict, -1, -0.1)
+
+    def test_globalds_score_only(self):
+        self.check(pairwise2.align.globalds, self.match_dict, -1, -0.1,
+                   score_only=True)
+
+    def test_globalms(self):
+        self.check(pairwise2.align.globalms, 1, -1, -0.5, -0.1,
+                   one_alignment_only=True)
+
+    def test_missing_pair(self):
+        batch = pairwise2.align.globalds.batch("ATAAT", ["TAG"],
+                                               self.match_dict, -1, -0.1)
+        self.assertRaises(KeyError, list, batch)
+
+    def test_table_match(self):
+        """The lookup table follows dictionary_match's symmetric rule."""
+        for symmetric in [0, 1]:
+            old = pairwise2.dictionary_match(self.match_dict, symmetric)
+            new = pairwise2._table_match(self.match_dict, symmetric)
+            for pair in [("A", "A"), ("A", "T"), ("T", "A"), ("A", "C")]:
+                try:
+                    expected = old(*pair)
+                except KeyError:
+                    self.assertRaises(KeyError, new, *pair)
+                else:
+                    self.assertEqual(new(*pair), expected)
+                    self.assertEqual(new.transposed()(*pair[::-1]), expected)
+
+
 if __name__ == '__main__':
     runner = unittest.TextTestRunner(verbosity = 2)
     unittest.main(testRunner=runner)